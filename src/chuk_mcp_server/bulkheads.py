@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/bulkheads.py
+"""
+Bulkheads - per-tool concurrency limits with bounded wait queues.
+
+A tool declared with ``@tool(max_concurrency=N, queue_size=M, queue_timeout=s)``
+runs at most ``N`` calls at once.  Up to ``M`` further calls wait in FIFO
+order (unbounded when ``queue_size`` is None, none when 0); a call that finds
+the queue full, or waits longer than ``queue_timeout`` seconds, fails fast
+with :class:`~chuk_mcp_server.types.errors.ToolBusyError` instead of tying up
+a connection slot.  One slow tool can then no longer starve the others.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any
+
+from .types.errors import ToolBusyError
+
+logger = logging.getLogger(__name__)
+
+
+def validate_concurrency_limits(
+    max_concurrency: int | None, queue_size: int | None, queue_timeout: float | None
+) -> None:
+    """Validate ``@tool`` concurrency settings.
+
+    Raises:
+        ValueError: On non-positive limits, or queue settings without ``max_concurrency``.
+    """
+    if max_concurrency is None:
+        if queue_size is not None or queue_timeout is not None:
+            raise ValueError("queue_size and queue_timeout require max_concurrency")
+        return
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if queue_size is not None and queue_size < 0:
+        raise ValueError("queue_size must be 0 or greater")
+    if queue_timeout is not None and queue_timeout <= 0:
+        raise ValueError("queue_timeout must be positive")
+
+
+class ToolBulkhead:
+    """Concurrency limit plus bounded FIFO wait queue for one tool.
+
+    Slots are handed directly from a finishing call to the oldest waiter, so
+    a newly arriving call can never overtake the queue.  All bookkeeping runs
+    on the event loop.
+    """
+
+    def __init__(
+        self,
+        tool_name: str,
+        max_concurrency: int,
+        queue_size: int | None = None,
+        queue_timeout: float | None = None,
+    ) -> None:
+        validate_concurrency_limits(max_concurrency, queue_size, queue_timeout)
+        self.tool_name = tool_name
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._peak_waiting = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    @property
+    def limits(self) -> tuple[int, int | None, float | None]:
+        return self.max_concurrency, self.queue_size, self.queue_timeout
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self) -> None:
+        """Wait for a slot.
+
+        Raises:
+            ToolBusyError: If the queue is full or ``queue_timeout`` expires.
+        """
+        if self._active < self.max_concurrency and not self.waiting:
+            self._active += 1
+            self._admitted += 1
+            return
+
+        if self.queue_size is not None and self.waiting >= self.queue_size:
+            self._rejected += 1
+            raise self._busy("queue_full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._peak_waiting = max(self._peak_waiting, self.waiting)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except TimeoutError:
+            # A slot handed over just as the timer fired is still ours
+            if waiter.done() and not waiter.cancelled():
+                self._admitted += 1
+                return
+            waiter.cancel()
+            self._timed_out += 1
+            raise self._busy("queue_timeout") from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        self._admitted += 1
+
+    def release(self) -> None:
+        """Free a slot, handing it to the oldest live waiter if there is one."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _busy(self, reason: str) -> ToolBusyError:
+        logger.debug(f"Tool {self.tool_name} rejected call ({reason})")
+        return ToolBusyError(
+            self.tool_name,
+            reason,
+            {
+                "max_concurrency": self.max_concurrency,
+                "queue_size": self.queue_size,
+                "queue_timeout": self.queue_timeout,
+                "active": self._active,
+                "waiting": self.waiting,
+            },
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get limits and current load for monitoring."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "queue_size": self.queue_size,
+            "queue_timeout": self.queue_timeout,
+            "active": self._active,
+            "waiting": self.waiting,
+            "peak_waiting": self._peak_waiting,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+        }
+
+
+__all__ = ["ToolBulkhead", "validate_concurrency_limits"]
@@ -28,6 +28,7 @@ from chuk_mcp_server.constants import (
     JsonRpcError,
     McpMethod,
 )
+from chuk_mcp_server.types.serialization import serialize_mcp_response
 
 from . import CloudAdapter, cloud_adapter
 
@@ -190,7 +191,7 @@ class GCFAdapter(CloudAdapter):
             headers[HEADER_MCP_SESSION_ID] = session_id
 
         if response_data:
-            body: str = orjson.dumps(response_data).decode()
+            body: str = serialize_mcp_response(response_data).decode()
             return (body, 200, headers)
         else:
             return ('{"status":"ok"}', 200, headers)
@@ -130,6 +130,9 @@ ENV_USE_STDIO = "USE_STDIO"
 ENV_MCP_SERVER_NAME = "MCP_SERVER_NAME"
 ENV_MCP_SERVER_VERSION = "MCP_SERVER_VERSION"
 ENV_PORT = "PORT"
+ENV_MCP_SESSION_STORE = "MCP_SESSION_STORE"
+ENV_MCP_NOTIFICATION_BUS = "MCP_NOTIFICATION_BUS"
+ENV_MCP_SSE_EVENT_LOG = "MCP_SSE_EVENT_LOG"
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +188,7 @@ KEY_OPEN_WORLD_HINT = "openWorldHint"
 # ---------------------------------------------------------------------------
 MCP_ERROR_RESOURCE_NOT_FOUND = -32002
 MCP_ERROR_URL_ELICITATION_REQUIRED = -32042
+MCP_ERROR_TOOL_BUSY = -32003  # Tool concurrency limit reached and its wait queue is full
 
 
 # ---------------------------------------------------------------------------
@@ -227,6 +231,76 @@ DEFAULT_RATE_LIMIT_RPS = 100.0
 DEFAULT_RATE_LIMIT_BURST = 200.0
 
 
+# ---------------------------------------------------------------------------
+# Handler execution (where synchronous tool/resource/prompt handlers run)
+# ---------------------------------------------------------------------------
+EXECUTOR_INLINE = "inline"  # Call directly on the event loop
+EXECUTOR_THREAD = "thread"  # Offload to the bounded handler thread pool
+EXECUTOR_PROCESS = "process"  # Run in a warm worker process (CPU-bound, module-level sync functions)
+EXECUTOR_POLICIES = frozenset({EXECUTOR_INLINE, EXECUTOR_THREAD, EXECUTOR_PROCESS})
+DEFAULT_EXECUTOR_POLICY = EXECUTOR_INLINE
+DEFAULT_THREAD_POOL_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+THREAD_POOL_NAME_PREFIX = "chuk-mcp-handler"
+DEFAULT_PROCESS_POOL_WORKERS = os.cpu_count() or 1
+PROCESS_POOL_NAME_PREFIX = "chuk-mcp-worker"
+PROCESS_WORKER_JOIN_TIMEOUT = 2.0  # Seconds to wait for a worker to exit on shutdown
+
+
+# ---------------------------------------------------------------------------
+# Tool result cache
+# ---------------------------------------------------------------------------
+CACHE_SCOPE_GLOBAL = "global"  # One entry shared by every caller
+CACHE_SCOPE_SESSION = "session"  # Entries keyed per MCP session
+CACHE_SCOPE_USER = "user"  # Entries keyed per authenticated user
+CACHE_SCOPES = frozenset({CACHE_SCOPE_GLOBAL, CACHE_SCOPE_SESSION, CACHE_SCOPE_USER})
+DEFAULT_TOOL_CACHE_MAX_ENTRIES = 1024  # Per tool
+DEFAULT_TOOL_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Across all tools
+DEFAULT_RESOURCE_CACHE_MAX_BYTES = 128 * 1024 * 1024  # Across all cached resource content
+RESOURCE_CACHE_COMPRESS_LEVEL = 1  # zlib level: cheap, still shrinks JSON several-fold
+DEFAULT_MOUNT_REFRESH_INTERVAL = 2.0  # Seconds between mtime rescans of a mounted directory
+
+
+# ---------------------------------------------------------------------------
+# Notification routing (streamable-HTTP GET streams)
+# ---------------------------------------------------------------------------
+DEFAULT_NOTIFICATION_QUEUE_SIZE = 1024  # Undelivered messages per stream before new ones are dropped
+NOTIFICATION_BUS_CHANNEL = "chuk-mcp:notifications"  # Pub/sub channel shared by every worker
+NOTIFICATION_BUS_MAX_DATAGRAM = 65536  # Largest event a Unix-socket bus sends or receives
+NOTIFICATION_BUS_PUBLISH_QUEUE_SIZE = 1024  # Events a Redis bus buffers for its publisher thread before dropping
+DEFAULT_SSE_BUFFER_SIZE = 100  # Events kept per session for Last-Event-ID replay
+DEFAULT_SSE_BUFFER_MAX_BYTES = 64 * 1024 * 1024  # Across all sessions' replay buffers
+SSE_EVENT_OVERHEAD = 64  # Bytes charged per buffered event on top of its payload
+DEFAULT_SSE_LOG_RETENTION = 3600.0  # Seconds events stay replayable in a durable event log
+
+
+# ---------------------------------------------------------------------------
+# Background maintenance
+# ---------------------------------------------------------------------------
+DEFAULT_MAINTENANCE_INTERVAL = 60.0  # Seconds between sweeps of sessions, buckets, tasks and caches
+DEFAULT_SESSION_MAX_AGE = 3600  # Seconds of inactivity before a session (and its rate-limit bucket) expires
+DEFAULT_TASK_RETENTION = 3600.0  # Seconds a completed/failed/cancelled task stays queryable
+DEFAULT_VIEW_DATA_TTL = 300.0  # Seconds tool output waits for its view's SSR resources/read
+
+
+# ---------------------------------------------------------------------------
+# Shared session store (sessions visible to every worker)
+# ---------------------------------------------------------------------------
+DEFAULT_SESSION_TOUCH_INTERVAL = 5.0  # Min seconds between last-activity writes to the store per session
+SESSION_STORE_KEY_PREFIX = "chuk-mcp:session:"  # Key prefix for sessions in a RESP (Redis) store
+DEFAULT_RESP_PORT = 6379
+DEFAULT_RESP_TIMEOUT = 5.0  # Seconds to connect to / wait on a RESP server
+
+
+# ---------------------------------------------------------------------------
+# Multi-worker HTTP (prefork supervisor)
+# ---------------------------------------------------------------------------
+DEFAULT_WORKER_STATS_INTERVAL = 2.0  # Seconds between worker stats reports (and pod totals pushed back)
+DEFAULT_WORKER_SHUTDOWN_TIMEOUT = 30.0  # Seconds a stopping worker gets before SIGKILL
+WORKER_MIN_UPTIME = 5.0  # A worker exiting sooner counts as a crash loop and restarts with backoff
+WORKER_RESTART_DELAY = 0.5  # First backoff delay (doubles per consecutive quick crash)
+WORKER_RESTART_MAX_DELAY = 30.0
+
+
 # ---------------------------------------------------------------------------
 # Timeout defaults (seconds) — override via environment variables
 # ---------------------------------------------------------------------------
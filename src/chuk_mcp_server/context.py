@@ -29,6 +29,7 @@ _progress_notify_fn: ContextVar[Callable[..., Any] | None] = ContextVar("progres
 _roots_fn: ContextVar[Callable[..., Any] | None] = ContextVar("roots_fn", default=None)
 _log_fn: ContextVar[Callable[..., Any] | None] = ContextVar("log_fn", default=None)
 _resource_links: ContextVar[list[dict[str, Any]] | None] = ContextVar("resource_links", default=None)
+_outbound_channel: ContextVar[Callable[..., Any] | None] = ContextVar("outbound_channel", default=None)
 
 
 # ============================================================================
@@ -283,6 +284,7 @@ def clear_all() -> None:
     _roots_fn.set(None)
     _log_fn.set(None)
     _resource_links.set(None)
+    _outbound_channel.set(None)
 
 
 def get_current_context() -> dict[str, Any]:
@@ -413,6 +415,36 @@ def set_roots_fn(fn: Callable[..., Any] | None) -> None:
     _roots_fn.set(fn)
 
 
+# ============================================================================
+# Outbound Channel Context Functions
+# ============================================================================
+
+
+def get_outbound_channel() -> Callable[..., Any] | None:
+    """
+    Get the server-to-client channel bound to the current request.
+
+    Returns:
+        Async callable that delivers a JSON-RPC message to the client (and
+        returns the client's response for requests), or None if unbound
+    """
+    return _outbound_channel.get()
+
+
+def set_outbound_channel(fn: Callable[..., Any] | None) -> None:
+    """
+    Bind the server-to-client channel for the current request.
+
+    Called by transports that multiplex requests (streamable HTTP) so that
+    sampling, elicitation, roots, progress and log messages from concurrent
+    tool calls each reach the stream of the request that sent them.
+
+    Args:
+        fn: Async callable that delivers a message to the client
+    """
+    _outbound_channel.set(fn)
+
+
 # ============================================================================
 # Server-to-Client API Functions
 # ============================================================================
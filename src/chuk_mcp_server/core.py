@@ -5,6 +5,7 @@ Core - Main ChukMCP Server class with modular smart configuration
 """
 
 import logging
+import os
 import sys
 from collections.abc import Callable
 from typing import Any
@@ -20,6 +21,15 @@ from .constants import (
     ATTR_MCP_TOOL,
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_PLAIN,
+    DEFAULT_EXECUTOR_POLICY,
+    DEFAULT_MAINTENANCE_INTERVAL,
+    DEFAULT_MOUNT_REFRESH_INTERVAL,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SESSION_MAX_AGE,
+    DEFAULT_TASK_RETENTION,
+    ENV_MCP_NOTIFICATION_BUS,
+    ENV_MCP_SESSION_STORE,
+    ENV_MCP_SSE_EVENT_LOG,
     MCP_APPS_UI_CSP,
     MCP_APPS_UI_KEY,
     MCP_APPS_UI_PERMISSIONS,
@@ -34,10 +44,19 @@ from .decorators import (
     get_global_resources,
     get_global_tools,
 )
+from .directory_mounts import DirectoryMount
 from .endpoint_registry import http_endpoint_registry
 from .http_server import create_server
 from .mcp_registry import mcp_registry
-from .protocol import MCPProtocolHandler
+from .protocol import (
+    MCPProtocolHandler,
+    NotificationBus,
+    SessionStore,
+    SSEEventBuffer,
+    create_event_buffer,
+    create_notification_bus,
+    create_session_store,
+)
 from .proxy import ProxyManager
 from .startup import print_smart_config, print_startup_info
 from .stdio_transport import StdioSyncTransport
@@ -101,6 +120,25 @@ class ChukMCPServer:
         proxy_config: dict[str, Any] | None = None,
         # Tool modules configuration
         tool_modules_config: dict[str, Any] | None = None,
+        # List pagination
+        page_size: int | None = None,
+        # Sync handler execution
+        executor: str | None = None,
+        executor_workers: int | None = None,
+        process_workers: int | None = None,
+        # Tool result cache
+        tool_cache_ttl: float | None = None,
+        tool_cache_max_bytes: int | None = None,
+        resource_cache_max_bytes: int | None = None,
+        resource_cache_compress_min_bytes: int | None = None,
+        # Background maintenance
+        maintenance_interval: float | None = None,
+        session_max_age: int | None = None,
+        task_retention: float | None = None,
+        # Sessions shared between workers
+        session_store: SessionStore | str | None = None,
+        notification_bus: NotificationBus | str | None = None,
+        sse_event_log: SSEEventBuffer | str | None = None,
         **kwargs,  # noqa: ARG002
     ):
         """
@@ -123,6 +161,36 @@ class ChukMCPServer:
             transport: Transport mode ('http' or 'stdio') (auto-detected if None)
             proxy_config: Configuration for multi-server proxy
             tool_modules_config: Configuration for loading tool modules
+            page_size: Items per page for tools/resources/prompts list methods (default 100)
+            executor: Default executor for sync handlers: 'inline' (default) or 'thread'.
+                Individual tools/resources/prompts can override with ``executor=...``,
+                including ``executor="process"`` for CPU-bound module-level functions.
+            executor_workers: Max threads in the handler thread pool (default: min(32, CPUs + 4))
+            process_workers: Worker processes for ``executor="process"`` handlers (default: CPU count)
+            tool_cache_ttl: Cache results of tools annotated read-only or idempotent for this many
+                seconds (default: only tools with their own ``cache_ttl`` are cached)
+            tool_cache_max_bytes: Byte budget for all cached tool results (default: 64 MiB)
+            resource_cache_max_bytes: Byte budget for all cached resource content, shared
+                process-wide (default: 128 MiB)
+            resource_cache_compress_min_bytes: zlib-compress cached resource content at least
+                this large (default: no compression)
+            maintenance_interval: Seconds between background sweeps of idle sessions, rate-limit
+                buckets, finished tasks and expired cache entries (default 60; 0 disables)
+            session_max_age: Seconds of inactivity before a session expires (default 3600)
+            task_retention: Seconds finished tasks stay queryable via tasks/get (default 3600)
+            session_store: Where sessions live so any worker can serve them: a SessionStore or
+                a URL (``memory://``, ``sqlite:///sessions.db``, ``redis://host:6379/0``).
+                Defaults to ``$MCP_SESSION_STORE``; without one, sessions are process-local
+                and HTTP runs a single worker.
+            notification_bus: How resource-updated and list_changed notifications reach clients
+                whose streams another worker holds: a NotificationBus or a URL (``memory://``,
+                ``unix:///run/chuk-mcp``, ``redis://host:6379/0``). Defaults to
+                ``$MCP_NOTIFICATION_BUS``; without one, notifications stay in the worker
+                that sent them.
+            sse_event_log: Where events are kept for ``Last-Event-ID`` replay: an SSEEventBuffer
+                or a URL (``memory://``, or ``sqlite:///events.db`` for a durable log any worker
+                can replay from, across restarts). Defaults to ``$MCP_SSE_EVENT_LOG``; without
+                one, events are buffered in process memory.
             **kwargs: Additional keyword arguments
         """
         # Initialize the modular smart configuration system
@@ -175,9 +243,39 @@ class ChukMCPServer:
         if website_url is not None:
             extra_server_info["websiteUrl"] = website_url
 
+        # Shared session store (required to run more than one HTTP worker)
+        if session_store is None:
+            session_store = os.environ.get(ENV_MCP_SESSION_STORE) or None
+        if isinstance(session_store, str):
+            session_store = create_session_store(session_store, ttl=session_max_age or DEFAULT_SESSION_MAX_AGE)
+        if notification_bus is None:
+            notification_bus = os.environ.get(ENV_MCP_NOTIFICATION_BUS) or None
+        if isinstance(notification_bus, str):
+            notification_bus = create_notification_bus(notification_bus)
+        if sse_event_log is None:
+            sse_event_log = os.environ.get(ENV_MCP_SSE_EVENT_LOG) or None
+        if isinstance(sse_event_log, str):
+            sse_event_log = create_event_buffer(sse_event_log)
+
         # Create protocol handler with direct chuk_mcp types
         self.protocol = MCPProtocolHandler(
-            self.server_info, self.capabilities, extra_server_info=extra_server_info or None
+            self.server_info,
+            self.capabilities,
+            extra_server_info=extra_server_info or None,
+            page_size=page_size or DEFAULT_PAGE_SIZE,
+            executor=executor or DEFAULT_EXECUTOR_POLICY,
+            executor_workers=executor_workers,
+            process_workers=process_workers,
+            tool_cache_ttl=tool_cache_ttl,
+            tool_cache_max_bytes=tool_cache_max_bytes,
+            resource_cache_max_bytes=resource_cache_max_bytes,
+            resource_cache_compress_min_bytes=resource_cache_compress_min_bytes,
+            maintenance_interval=DEFAULT_MAINTENANCE_INTERVAL if maintenance_interval is None else maintenance_interval,
+            session_max_age=session_max_age or DEFAULT_SESSION_MAX_AGE,
+            task_retention=DEFAULT_TASK_RETENTION if task_retention is None else task_retention,
+            session_store=session_store,
+            notification_bus=notification_bus,
+            sse_events=sse_event_log,
         )
 
         # Component registry for dual-registration (protocol + mcp_registry)
@@ -261,9 +359,25 @@ class ChukMCPServer:
             def advanced_tool(data: dict) -> dict:
                 return {"processed": data}
 
-            @mcp.tool(read_only_hint=True, idempotent_hint=True)
+            @mcp.tool(read_only_hint=True, idempotent_hint=True)  # identical concurrent calls share one run
             def safe_lookup(key: str) -> str:
                 return db[key]
+
+            @mcp.tool(executor="thread")  # blocking client call, run off the event loop
+            def fetch_report(report_id: str) -> dict:
+                return client.get_report(report_id)
+
+            @mcp.tool(executor="process")  # CPU-bound, runs in a warm worker process
+            def score(document: str) -> float:
+                return expensive_scoring(document)
+
+            @mcp.tool(max_concurrency=4, queue_size=16, queue_timeout=5.0)  # bulkhead a slow tool
+            def search_index(query: str) -> list:
+                return index.search(query)
+
+            @mcp.tool(cache_ttl=30, cache_scope="user")  # reuse results for 30s per user
+            def lookup_account(account_id: str) -> dict:
+                return crm.get_account(account_id)
         """
 
         def decorator(func: Callable) -> Callable:
@@ -271,7 +385,7 @@ class ChukMCPServer:
             tool_name = name or func.__name__
             tool_description = description or func.__doc__ or f"Execute {tool_name}"
 
-            # Extract annotation, output_schema, and icons kwargs
+            # Extract annotation, output_schema, icons, executor, concurrency, cache and coalescing kwargs
             annotation_kwargs = {}
             for key in (
                 "read_only_hint",
@@ -281,6 +395,14 @@ class ChukMCPServer:
                 "output_schema",
                 "icons",
                 "meta",
+                "executor",
+                "max_concurrency",
+                "queue_size",
+                "queue_timeout",
+                "cache_ttl",
+                "cache_max_entries",
+                "cache_scope",
+                "coalesce",
             ):
                 if key in kwargs:
                     annotation_kwargs[key] = kwargs.pop(key)
@@ -408,6 +530,12 @@ class ChukMCPServer:
             @mcp.resource("config://settings")
             def get_settings() -> dict:
                 return {"app": "my_app"}
+
+            # Cache for 60s; serve stale content for 30s more while one refresh runs,
+            # and for up to 10 minutes if the refresh fails
+            @mcp.resource("data://report", cache_ttl=60, stale_while_revalidate=30, stale_if_error=600)
+            async def get_report() -> dict:
+                return await build_report()
         """
 
         def decorator(func: Callable) -> Callable:
@@ -416,10 +544,11 @@ class ChukMCPServer:
             resource_description = description or func.__doc__ or f"Resource: {uri}"
             resource_mime_type = mime_type or CONTENT_TYPE_JSON  # Simple default
 
-            # Extract icons kwarg for resource handler
+            # Extract icons/executor/caching kwargs for resource handler
             handler_kwargs = {}
-            if "icons" in kwargs:
-                handler_kwargs["icons"] = kwargs.pop("icons")
+            for key in ("icons", "executor", "cache_ttl", "stale_while_revalidate", "stale_if_error"):
+                if key in kwargs:
+                    handler_kwargs[key] = kwargs.pop(key)
 
             # Create resource handler from function
             resource_handler = ResourceHandler.from_function(
@@ -470,10 +599,11 @@ class ChukMCPServer:
         """
 
         def decorator(func: Callable) -> Callable:
-            # Extract icons kwarg for template handler
+            # Extract icons/executor kwargs for template handler
             handler_kwargs = {}
-            if "icons" in kwargs:
-                handler_kwargs["icons"] = kwargs.pop("icons")
+            for key in ("icons", "executor"):
+                if key in kwargs:
+                    handler_kwargs[key] = kwargs.pop(key)
 
             template_handler = ResourceTemplateHandler.from_function(
                 uri_template=uri_template,
@@ -514,10 +644,11 @@ class ChukMCPServer:
             prompt_name = name or func.__name__
             prompt_description = description or func.__doc__ or f"Prompt: {prompt_name}"
 
-            # Extract icons kwarg for prompt handler
+            # Extract icons/executor kwargs for prompt handler
             handler_kwargs = {}
-            if "icons" in kwargs:
-                handler_kwargs["icons"] = kwargs.pop("icons")
+            for key in ("icons", "executor"):
+                if key in kwargs:
+                    handler_kwargs[key] = kwargs.pop(key)
 
             # Create prompt handler from function
             prompt_handler = PromptHandler.from_function(
@@ -614,6 +745,40 @@ class ChukMCPServer:
         """
         self.composition.mount(server, prefix, as_proxy)
 
+    def mount_directory(
+        self,
+        uri_prefix: str,
+        path: str | os.PathLike[str],
+        pattern: str = "**/*",
+        mime_map: dict[str, str] | None = None,
+        refresh_interval: float = DEFAULT_MOUNT_REFRESH_INTERVAL,
+    ) -> DirectoryMount:
+        """
+        Serve a directory tree as resources.
+
+        Files matching ``pattern`` become ``<uri_prefix>/<relative path>``
+        resources without a handler per file.  The file index is built on first
+        use and rescanned (incrementally, by directory mtime) at most every
+        ``refresh_interval`` seconds; reads happen off the event loop and are
+        cached per file mtime.
+
+        Args:
+            uri_prefix: URI prefix for the files, e.g. ``"file:///docs"``
+            path: Directory to serve
+            pattern: Glob over relative paths (``**`` spans directories)
+            mime_map: File extension to MIME type overrides, e.g. ``{".mdx": "text/markdown"}``
+            refresh_interval: Minimum seconds between rescans
+
+        Returns:
+            The DirectoryMount (see ``get_stats()``)
+
+        Example:
+            mcp.mount_directory("file:///docs", "./docs", pattern="**/*.md")
+        """
+        mount = DirectoryMount(uri_prefix, path, pattern=pattern, mime_map=mime_map, refresh_interval=refresh_interval)
+        self.protocol.add_directory_mount(mount)
+        return mount
+
     def load_module(self, module_config: dict[str, Any]) -> dict[str, list[str]]:
         """
         Load Python modules with tools.
@@ -818,6 +983,14 @@ class ChukMCPServer:
         self._components.clear_prompts()
         logger.info("Cleared all prompts")
 
+    def invalidate_tool_cache(self, tool_name: str | None = None, arguments: dict[str, Any] | None = None) -> int:
+        """Drop cached tool results (all, one tool's, or one tool's for specific arguments).
+
+        Returns:
+            Number of cache entries removed
+        """
+        return self.protocol.invalidate_tool_cache(tool_name, arguments)
+
     def clear_endpoints(self):
         """Clear all custom HTTP endpoints."""
         http_endpoint_registry.clear_endpoints()
@@ -862,6 +1035,7 @@ class ChukMCPServer:
         post_register_hook=None,
         reload: bool = False,
         inspect: bool = False,
+        workers: int | None = None,
     ):
         """
         Run the MCP server with modular smart defaults.
@@ -875,6 +1049,8 @@ class ChukMCPServer:
             post_register_hook: Optional callback to register additional endpoints after default endpoints
             reload: Enable hot reload (auto-restart on file changes, HTTP mode only)
             inspect: Open MCP Inspector in browser after starting (HTTP mode only)
+            workers: HTTP worker processes (uses smart default if None; more than one
+                requires a shared ``session_store``)
         """
         # Set logging level FIRST, before any other operations
         import os
@@ -931,6 +1107,7 @@ class ChukMCPServer:
             # Run in stdio mode
             from .stdio_transport import run_stdio_server
 
+            self.protocol.warm_up()
             run_stdio_server(self.protocol)
         else:
             # HTTP mode - logging already set at start of run()
@@ -973,7 +1150,7 @@ class ChukMCPServer:
             if getattr(self, "_should_print_config", True):
                 self._print_startup_info(final_host, final_port, final_debug, actual_log_level=app_log_level)
 
-            # Create HTTP server
+            # Create HTTP server (it pre-forks process workers in whichever process serves)
             if self._server is None:
                 self._server = create_server(self.protocol, post_register_hook=post_register_hook)
 
@@ -1001,6 +1178,7 @@ class ChukMCPServer:
                     debug=final_debug,
                     log_level=log_level,
                     reload=reload,
+                    workers=workers or self.smart_workers,
                 )
             except KeyboardInterrupt:
                 logger.info("\n👋 Server shutting down gracefully...")
@@ -1036,6 +1214,7 @@ class ChukMCPServer:
         self._should_print_config = False
 
         # Create and run STDIO transport
+        self.protocol.warm_up()
         transport = StdioSyncTransport(self.protocol)
 
         logger.info(f"🚀 Starting {self.server_info.name} over STDIO transport")
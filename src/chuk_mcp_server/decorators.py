@@ -93,6 +93,14 @@ def tool(
     output_schema: dict[str, Any] | None = None,
     icons: list[dict[str, Any]] | None = None,
     meta: dict[str, Any] | None = None,
+    executor: str | None = None,
+    max_concurrency: int | None = None,
+    queue_size: int | None = None,
+    queue_timeout: float | None = None,
+    cache_ttl: float | None = None,
+    cache_max_entries: int | None = None,
+    cache_scope: str | None = None,
+    coalesce: bool | None = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator to register a function as an MCP tool.
@@ -113,6 +121,22 @@ def tool(
         @tool(meta={"ui": {"resourceUri": "https://example.com/view"}})
         async def show_view() -> dict:
             return {"type": "chart", "data": [...]}
+
+        @tool(executor="thread")  # sync handler runs on the handler thread pool
+        def fetch_report(report_id: str) -> dict:
+            return client.get_report(report_id)
+
+        @tool(max_concurrency=4, queue_size=16, queue_timeout=5.0)  # at most 4 at once, 16 waiting
+        async def search_index(query: str) -> list:
+            return await index.search(query)
+
+        @tool(read_only_hint=True, cache_ttl=30)  # identical calls within 30s reuse the result
+        def lookup(key: str) -> str:
+            return backend.get(key)
+
+        @tool(read_only_hint=True, coalesce=False)  # every call must hit the backend
+        def live_quote(symbol: str) -> float:
+            return exchange.quote(symbol)
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -128,6 +152,14 @@ def tool(
             output_schema=output_schema,
             icons=icons,
             meta=meta,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            queue_size=queue_size,
+            queue_timeout=queue_timeout,
+            cache_ttl=cache_ttl,
+            cache_max_entries=cache_max_entries,
+            cache_scope=cache_scope,
+            coalesce=coalesce,
         )
 
         # Register globally
@@ -257,6 +289,10 @@ def resource(
     description: str | None = None,
     mime_type: str = CONTENT_TYPE_PLAIN,
     icons: list[dict[str, Any]] | None = None,
+    executor: str | None = None,
+    cache_ttl: int | None = None,
+    stale_while_revalidate: float | None = None,
+    stale_if_error: float | None = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator to register a function as an MCP resource.
@@ -269,12 +305,25 @@ def resource(
         @resource("file://readme", mime_type="text/markdown")
         def get_readme() -> str:
             return "# My Application\\n\\nThis is awesome!"
+
+        @resource("data://report", cache_ttl=60, stale_while_revalidate=30)
+        async def get_report() -> dict:
+            return await build_report()
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         # Create resource from function
         mcp_resource = ResourceHandler.from_function(
-            uri=uri, func=func, name=name, description=description, mime_type=mime_type, icons=icons
+            uri=uri,
+            func=func,
+            name=name,
+            description=description,
+            mime_type=mime_type,
+            icons=icons,
+            executor=executor,
+            cache_ttl=cache_ttl,
+            stale_while_revalidate=stale_while_revalidate,
+            stale_if_error=stale_if_error,
         )
 
         # Register globally
@@ -302,6 +351,7 @@ def prompt(
     name: str | None = None,
     description: str | None = None,
     icons: list[dict[str, Any]] | None = None,
+    executor: str | None = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator to register a function as an MCP prompt.
@@ -318,7 +368,9 @@ def prompt(
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         # Create prompt from function
-        mcp_prompt = PromptHandler.from_function(func, name=name, description=description, icons=icons)
+        mcp_prompt = PromptHandler.from_function(
+            func, name=name, description=description, icons=icons, executor=executor
+        )
 
         # Register globally
         with _registry_lock:
@@ -355,6 +407,7 @@ def resource_template(
     description: str | None = None,
     mime_type: str | None = None,
     icons: list[dict[str, Any]] | None = None,
+    executor: str | None = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator to register a function as an MCP resource template (RFC 6570).
@@ -382,6 +435,7 @@ def resource_template(
             description=description,
             mime_type=mime_type,
             icons=icons,
+            executor=executor,
         )
 
         # Register globally
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/directory_mounts.py
+"""
+Directory mounts - expose a directory tree as MCP resources.
+
+``mcp.mount_directory("file:///docs", "./docs", pattern="**/*.md")`` serves
+every matching file as ``file:///docs/<relative path>`` without creating a
+handler object per file.  The mount keeps a lazily built index of relative
+paths:
+
+- The first ``resources/list`` or ``resources/read`` scans the tree.
+- Later accesses rescan at most every ``refresh_interval`` seconds, and a
+  rescan only lists directories whose mtime changed (adding, removing or
+  renaming a file changes its directory's mtime), so an unchanged tree costs
+  one ``stat`` per directory.
+- Content changes are picked up on read: files are read off the event loop
+  and cached in the shared ResourceCache per mtime and size.
+
+Text files (by MIME type) are served as ``text``, everything else as a
+base64 ``blob``.
+"""
+
+import logging
+import mimetypes
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote, unquote
+
+import orjson
+
+from .constants import DEFAULT_MOUNT_REFRESH_INTERVAL, EXECUTOR_THREAD
+from .executors import run_sync_handler
+from .singleflight import SingleFlight
+from .types.resources import read_file_blob, read_file_text
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MIME_TYPE = "application/octet-stream"
+_TEXT_MIME_SUFFIXES = ("json", "xml", "yaml", "javascript", "toml", "csv")
+
+
+def _class_body(body: str) -> str:
+    # Escape only what is special inside a regex class, so ranges (``a-c``) keep working
+    return re.sub(r"([\\\]^])", r"\\\1", body)
+
+
+def glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a glob over ``/``-separated relative paths.
+
+    ``**`` spans directories (``**/`` also matches none), ``*`` and ``?``
+    stay within one path segment, ``[...]`` is a character class (ranges
+    like ``[a-c]`` included, ``[!...]`` negates it).
+    """
+    parts: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and (end := pattern.find("]", i + 2)) != -1:
+            body = pattern[i + 1 : end]
+            parts.append(f"[^/{_class_body(body[1:])}]" if body.startswith("!") else f"[{_class_body(body)}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(parts))
+
+
+def is_text_mime_type(mime_type: str) -> bool:
+    """Whether content of this MIME type is served as ``text`` rather than a ``blob``."""
+    return mime_type.startswith("text/") or mime_type.endswith(_TEXT_MIME_SUFFIXES)
+
+
+@dataclass(frozen=True, slots=True)
+class _DirListing:
+    mtime_ns: int
+    files: tuple[str, ...]
+    subdirs: tuple[str, ...]
+
+
+def _scan(root: str, previous: dict[str, _DirListing]) -> tuple[dict[str, _DirListing], bool]:
+    """Walk ``root``, re-listing only directories whose mtime changed.
+
+    Returns the new listings (keyed by relative directory, ``""`` for the
+    root, otherwise ending in ``/``) and whether anything changed.  Symlinks
+    are never listed, so a link cannot expose anything outside ``root``.
+    """
+    listings: dict[str, _DirListing] = {}
+    changed = False
+    pending = [""]
+    while pending:
+        rel_dir = pending.pop()
+        abs_dir = os.path.join(root, rel_dir) if rel_dir else root
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+        except OSError:
+            changed = True
+            continue
+        listing = previous.get(rel_dir)
+        if listing is None or listing.mtime_ns != mtime_ns:
+            files: list[str] = []
+            subdirs: list[str] = []
+            try:
+                with os.scandir(abs_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry.name)
+            except OSError as e:
+                logger.debug(f"Cannot list {abs_dir}: {e}")
+            listing = _DirListing(mtime_ns, tuple(files), tuple(subdirs))
+            changed = True
+        listings[rel_dir] = listing
+        pending.extend(f"{rel_dir}{name}/" for name in listing.subdirs)
+    # A directory that disappeared changes its parent's mtime, but check the count too
+    return listings, changed or len(listings) != len(previous)
+
+
+def _resolve_within(root: str, rel_path: str) -> str | None:
+    """The real path of ``root/rel_path``, or ``None`` if symlinks take it outside ``root``."""
+    path = os.path.realpath(os.path.join(root, rel_path))
+    return path if path.startswith(root.rstrip(os.sep) + os.sep) else None
+
+
+class DirectoryMount:
+    """A directory tree served as resources under ``uri_prefix``."""
+
+    def __init__(
+        self,
+        uri_prefix: str,
+        path: str | os.PathLike[str],
+        pattern: str = "**/*",
+        mime_map: dict[str, str] | None = None,
+        refresh_interval: float = DEFAULT_MOUNT_REFRESH_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            uri_prefix: URI prefix, e.g. ``"file:///docs"``; files become ``<prefix>/<relative path>``
+            path: Directory to serve
+            pattern: Glob over relative paths selecting the files to serve
+            mime_map: File extension (``".md"``) to MIME type overrides
+            refresh_interval: Minimum seconds between rescans (0 rescans on every access)
+
+        Raises:
+            ValueError: If ``path`` is not a directory or ``refresh_interval`` is negative.
+        """
+        root = Path(path).resolve()
+        if not root.is_dir():
+            raise ValueError(f"Cannot mount '{path}': not a directory")
+        if refresh_interval < 0:
+            raise ValueError("refresh_interval must be non-negative")
+        self.uri_prefix = uri_prefix.rstrip("/")
+        self.root = str(root)
+        self.pattern = pattern
+        self.mime_map = {ext.lower(): mime for ext, mime in (mime_map or {}).items()}
+        self.refresh_interval = refresh_interval
+        self.generation = 0  # Bumped whenever the set of served files changes
+
+        self._regex = glob_to_regex(pattern)
+        self._listings: dict[str, _DirListing] = {}
+        self._items: dict[str, bytes] = {}  # Relative path -> pre-serialized resources/list entry
+        self._order: tuple[str, ...] = ()  # Sorted relative paths
+        self._scanned_at: float | None = None
+        self._scans = SingleFlight()
+        self._scan_count = 0
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def mime_type_for(self, rel_path: str) -> str:
+        ext = os.path.splitext(rel_path)[1].lower()
+        return self.mime_map.get(ext) or mimetypes.guess_type(rel_path)[0] or _DEFAULT_MIME_TYPE
+
+    def uri_for(self, rel_path: str) -> str:
+        return f"{self.uri_prefix}/{quote(rel_path, safe='/')}"
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Rescan the tree if the refresh interval has passed; returns whether the index changed."""
+        now = time.monotonic()
+        if not force and self._scanned_at is not None and now - self._scanned_at < self.refresh_interval:
+            return False
+        changed: bool = await self._scans.run("scan", self._rescan)
+        return changed
+
+    async def _rescan(self) -> bool:
+        listings, changed = await run_sync_handler(_scan, EXECUTOR_THREAD, self.root, self._listings)
+        self._listings = listings
+        self._scanned_at = time.monotonic()
+        self._scan_count += 1
+        if not changed:
+            return False
+
+        paths = sorted(
+            rel
+            for rel_dir, listing in listings.items()
+            for name in listing.files
+            if self._regex.fullmatch(rel := rel_dir + name)
+        )
+        if tuple(paths) == self._order:
+            return False
+        items = {}
+        for rel in paths:
+            item = self._items.get(rel)
+            if item is None:
+                item = orjson.dumps({"uri": self.uri_for(rel), "name": rel, "mimeType": self.mime_type_for(rel)})
+            items[rel] = item
+        self._items = items
+        self._order = tuple(paths)
+        self.generation += 1
+        logger.debug(f"Mounted {self.uri_prefix}: {len(paths)} files (generation {self.generation})")
+        return True
+
+    def item_bytes(self) -> list[bytes]:
+        """Pre-serialized ``resources/list`` entries for the current index, in path order."""
+        return [self._items[rel] for rel in self._order]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def relative_path(self, uri: str) -> str | None:
+        """The relative path ``uri`` names under this mount, or ``None`` if it is outside it."""
+        if not uri.startswith(self.uri_prefix + "/"):
+            return None
+        return unquote(uri[len(self.uri_prefix) + 1 :])
+
+    async def read(self, uri: str) -> tuple[str, str] | None:
+        """Read a mounted file as ``(content, mime type)``; ``None`` if ``uri`` is not in the index.
+
+        Only indexed paths are served, so ``..`` and paths outside the
+        pattern never reach the filesystem.  The path is resolved again before
+        reading, so a file replaced by a symlink since the last scan is refused.
+        """
+        rel = self.relative_path(uri)
+        if rel is None:
+            return None
+        await self.refresh()
+        if rel not in self._items:
+            return None
+        path = await run_sync_handler(_resolve_within, EXECUTOR_THREAD, self.root, rel)
+        if path is None:
+            logger.warning(f"Refusing to serve {uri}: it resolves outside {self.root}")
+            return None
+        mime_type = self.mime_type_for(rel)
+        if is_text_mime_type(mime_type):
+            return await read_file_text(path), mime_type
+        return await read_file_blob(path), mime_type
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index size and scan metrics."""
+        return {
+            "uri_prefix": self.uri_prefix,
+            "root": self.root,
+            "pattern": self.pattern,
+            "files": len(self._order),
+            "directories": len(self._listings),
+            "generation": self.generation,
+            "scans": self._scan_count,
+        }
+
+
+__all__ = ["DirectoryMount", "glob_to_regex", "is_text_mime_type"]
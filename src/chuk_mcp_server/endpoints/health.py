@@ -6,6 +6,7 @@ Provides three health endpoints:
 - /health       - Basic liveness probe (ultra-fast)
 - /health/ready - Readiness probe (checks that tools are registered)
 - /health/detailed - Detailed health with session count, tool count, etc.
+  (plus pod-wide totals when running several workers)
 """
 
 import time
@@ -79,12 +80,16 @@ async def handle_health_detailed(_request: Request) -> Response:
         prompt_count = len(protocol.prompts)
         session_count = len(protocol.session_manager.sessions)
         in_flight_requests = len(protocol._in_flight_requests)
+        process_pool = protocol._executor.process_pool.get_stats()
+        workers = protocol.worker_channel.pod if protocol.worker_channel is not None else None
     else:
         tool_count = 0
         resource_count = 0
         prompt_count = 0
         session_count = 0
         in_flight_requests = 0
+        process_pool = None
+        workers = None
 
     response_data = {
         "status": STATUS_HEALTHY,
@@ -96,6 +101,8 @@ async def handle_health_detailed(_request: Request) -> Response:
         "prompts": prompt_count,
         "sessions": session_count,
         "in_flight_requests": in_flight_requests,
+        "process_pool": process_pool,
+        "workers": workers,  # Pod summary: counters summed over every worker, shared backends once (multi-worker mode)
     }
 
     body: bytes = orjson.dumps(response_data)
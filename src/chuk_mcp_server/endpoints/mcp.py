@@ -21,7 +21,9 @@ from starlette.responses import Response, StreamingResponse
 
 # chuk_mcp_server - Fix import path
 from ..constants import HTTP_CLIENT_RESPONSE_TIMEOUT, JSONRPC_KEY, KEY_ID, KEY_METHOD, KEY_PARAMS, McpMethod
+from ..context import set_outbound_channel
 from ..protocol import MCPProtocolHandler
+from ..types.serialization import serialize_mcp_response
 from .constants import (
     BEARER_PREFIX,
     CONNECTION_KEEP_ALIVE,
@@ -63,8 +65,6 @@ class MCPEndpoint:
         self.protocol = protocol_handler
         # Pending server-to-client requests awaiting responses via /mcp/respond
         self._pending_requests: dict[str, asyncio.Future[dict[str, Any]]] = {}
-        # Active GET SSE streams per session (streamable-http)
-        self._get_streams: dict[str, asyncio.Queue[Any]] = {}
 
     def _get_protocol_version(self, session_id: str | None) -> str:
         """Get the negotiated protocol version for a session."""
@@ -102,7 +102,7 @@ class MCPEndpoint:
             return self._error_response(None, JsonRpcErrorCode.INVALID_REQUEST, "Missing session ID")
 
         protocol_version = self._get_protocol_version(session_id)
-        terminated = self.protocol.terminate_session(session_id)
+        terminated = await self.protocol.terminate_session_async(session_id)
         if not terminated:
             return self._error_response(
                 None,
@@ -134,17 +134,14 @@ class MCPEndpoint:
         last_event_id = request.headers.get(HEADER_LAST_EVENT_ID.lower())
         accept_header = request.headers.get(HEADER_ACCEPT, "")
 
-        # SSE resumption: replay missed events
-        if last_event_id and session_id:
-            missed = self.protocol.get_missed_events(session_id, last_event_id)
+        # SSE resumption: replay missed events (buffered as ready-made frames)
+        if last_event_id and last_event_id.isdigit() and session_id:
+            missed = await self.protocol.get_missed_frames_async(session_id, int(last_event_id))
             if missed is not None:
 
                 async def _replay_stream():
-                    for event_id, data in missed:
-                        data_str: str = orjson.dumps(data).decode()
-                        yield f"id: {event_id}\r\n"
-                        yield f"data: {data_str}\r\n"
-                        yield SSE_LINE_END
+                    for frame in missed:
+                        yield frame
 
                 return StreamingResponse(
                     _replay_stream(),
@@ -153,7 +150,7 @@ class MCPEndpoint:
 
         # Streamable-HTTP: open persistent SSE stream for server-to-client messages
         if CONTENT_TYPE_SSE in accept_header and session_id:
-            session = self.protocol.session_manager.get_session(session_id)
+            session = await self.protocol.session_manager.get_session_async(session_id)
             if not session:
                 return self._error_response(
                     None,
@@ -185,23 +182,28 @@ class MCPEndpoint:
     async def _get_stream_generator(self, session_id: str):
         """Long-lived SSE generator for streamable-http GET streams.
 
-        Keeps the connection open so the server can push notifications
-        and requests to the client at any time.
+        Keeps the connection open so the server can push notifications to
+        the client at any time.  Messages arrive pre-serialized and already
+        buffered from the protocol's notification router, and carry their
+        ``id:`` so the client can resume with ``Last-Event-ID``.
         """
-        queue: asyncio.Queue[Any] = asyncio.Queue()
-        self._get_streams[session_id] = queue
+        router = self.protocol.notifications
+        queue = router.open_stream(session_id)
         try:
             while True:
                 item = await queue.get()
                 if item is None:
-                    # Shutdown signal
+                    # Stream replaced or session terminated
                     break
-                for line in self._emit_sse_event(SSE_EVENT_MESSAGE, item, session_id):
-                    yield line
+                event_id, body = item
+                yield SSE_EVENT_MESSAGE
+                yield f"id: {event_id}\r\n"
+                yield f"data: {body.decode()}\r\n"
+                yield SSE_LINE_END
         except asyncio.CancelledError:
             pass
         finally:
-            self._get_streams.pop(session_id, None)
+            router.close_stream(session_id, queue)
 
     async def _handle_post(self, request: Request) -> Response:
         """Handle POST request - process MCP protocol messages."""
@@ -313,7 +315,7 @@ class MCPEndpoint:
         if new_session_id:
             headers[HEADER_MCP_SESSION_ID] = new_session_id
 
-        body: bytes = orjson.dumps(response)
+        body: bytes = serialize_mcp_response(response)
         return Response(body, media_type=CONTENT_TYPE_JSON, headers=headers)
 
     async def handle_respond(self, request: Request) -> Response:
@@ -392,7 +394,7 @@ class MCPEndpoint:
         if method == McpMethod.INITIALIZE:
             client_info = request_data.get(KEY_PARAMS, {}).get("clientInfo", {})
             protocol_version = request_data.get(KEY_PARAMS, {}).get("protocolVersion", MCP_PROTOCOL_VERSION)
-            created_session_id = self.protocol.session_manager.create_session(client_info, protocol_version)
+            created_session_id = await self.protocol.session_manager.create_session_async(client_info, protocol_version)
             logger.info(f"Created SSE session: {created_session_id[:8]}...")
 
         effective_session = created_session_id or session_id
@@ -401,7 +403,7 @@ class MCPEndpoint:
             headers=self._sse_headers(effective_session),
         )
 
-    def _emit_sse_event(self, event_type: str, data: dict[str, Any], session_id: str | None) -> tuple[str, ...]:
+    async def _emit_sse_event(self, event_type: str, data: dict[str, Any], session_id: str | None) -> tuple[str, ...]:
         """Build SSE event lines.
 
         Events are buffered internally for Last-Event-ID resumability but
@@ -410,11 +412,10 @@ class MCPEndpoint:
         include ``id:`` so clients can resume correctly.
         """
         lines: list[str] = [event_type]
+        body = serialize_mcp_response(data)
         if session_id:
-            event_id = self.protocol.next_sse_event_id(session_id)
-            self.protocol.buffer_sse_event(session_id, event_id, data)
-        data_str: str = orjson.dumps(data).decode()
-        lines.append(f"data: {data_str}\r\n")
+            await self.protocol.record_sse_event(session_id, body)
+        lines.append(f"data: {body.decode()}\r\n")
         lines.append(SSE_LINE_END)
         return tuple(lines)
 
@@ -441,8 +442,8 @@ class MCPEndpoint:
                 return await self._send_to_client_http(request, sse_queue)
 
             async def _execute() -> None:
-                prev_send = self.protocol._send_to_client
-                self.protocol._send_to_client = _send_fn
+                # Runs in its own task, so the channel is bound to this request only
+                set_outbound_channel(_send_fn)
                 try:
                     response, _ = await self.protocol.handle_request(request_data, session_id, oauth_token)
                     await sse_queue.put(("_final_", response))
@@ -456,8 +457,6 @@ class MCPEndpoint:
                         },
                     }
                     await sse_queue.put(("_final_", error_response))
-                finally:
-                    self.protocol._send_to_client = prev_send
 
             task = asyncio.create_task(_execute())
 
@@ -468,12 +467,12 @@ class MCPEndpoint:
                         # Final response from tool execution
                         response = item[1]
                         if response:
-                            for line in self._emit_sse_event(SSE_EVENT_MESSAGE, response, session_id):
+                            for line in await self._emit_sse_event(SSE_EVENT_MESSAGE, response, session_id):
                                 yield line
                         break
                     else:
                         # Server-to-client request or notification
-                        for line in self._emit_sse_event("event: server_request\r\n", item, session_id):
+                        for line in await self._emit_sse_event("event: server_request\r\n", item, session_id):
                             yield line
             finally:
                 if not task.done():
@@ -487,7 +486,7 @@ class MCPEndpoint:
 
                 if response:
                     logger.debug(f"Streaming SSE response for {method}")
-                    for line in self._emit_sse_event(SSE_EVENT_MESSAGE, response, session_id):
+                    for line in await self._emit_sse_event(SSE_EVENT_MESSAGE, response, session_id):
                         yield line
 
             except Exception as e:
@@ -500,7 +499,7 @@ class MCPEndpoint:
                         "message": "Internal server error",
                     },
                 }
-                for line in self._emit_sse_event(SSE_EVENT_ERROR, error_response, session_id):
+                for line in await self._emit_sse_event(SSE_EVENT_ERROR, error_response, session_id):
                     yield line
 
     def _sse_headers(self, session_id: str | None) -> dict[str, str]:
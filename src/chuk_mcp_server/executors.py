@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/executors.py
+"""
+Handler executors - where synchronous tool, resource and prompt handlers run.
+
+Async handlers always run on the event loop.  Synchronous handlers follow an
+executor policy: ``"inline"`` calls them directly (cheapest, but a blocking
+call stalls every session on the worker), ``"thread"`` offloads them to a
+bounded, named thread pool with the caller's contextvars (session, user,
+progress token, ...) propagated, and ``"process"`` runs CPU-bound handlers in
+a warm pool of pre-forked worker processes, sidestepping the GIL.
+
+Process workers receive the handler by reference (module and qualified name)
+plus the pickled, already-validated arguments.  Each worker has its own pipe,
+so cancelling a running call (``notifications/cancelled``, ``tasks/cancel``)
+terminates and replaces just that worker.
+
+The policy is a server-wide default on ``HandlerExecutor`` that individual
+handlers can override (``@tool(executor="thread")``).  The protocol handler
+installs its executor for the duration of each request; code running outside
+a request falls back to a shared module-level executor.
+"""
+
+import asyncio
+import contextvars
+import importlib
+import inspect
+import logging
+import multiprocessing
+import os
+import signal
+import struct
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from multiprocessing.reduction import ForkingPickler
+from typing import Any
+
+from .constants import (
+    DEFAULT_EXECUTOR_POLICY,
+    DEFAULT_PROCESS_POOL_WORKERS,
+    DEFAULT_THREAD_POOL_WORKERS,
+    EXECUTOR_INLINE,
+    EXECUTOR_POLICIES,
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    PROCESS_POOL_NAME_PREFIX,
+    PROCESS_WORKER_JOIN_TIMEOUT,
+    THREAD_POOL_NAME_PREFIX,
+)
+
+logger = logging.getLogger(__name__)
+
+FunctionReference = tuple[str, str]
+
+
+def validate_executor_policy(policy: str | None, handler: Callable[..., Any] | None = None) -> str | None:
+    """Validate an executor policy name (``None`` means "use the server default").
+
+    When ``handler`` is given and the policy is ``"process"``, also check that
+    the handler can run in a worker process.
+    """
+    if policy is not None and policy not in EXECUTOR_POLICIES:
+        raise ValueError(f"Invalid executor '{policy}': must be one of {sorted(EXECUTOR_POLICIES)}")
+    if policy == EXECUTOR_PROCESS and handler is not None:
+        if inspect.iscoroutinefunction(handler) or inspect.isasyncgenfunction(handler):
+            raise ValueError(f"executor='process' requires a synchronous function, got async '{handler.__name__}'")
+        function_reference(handler)
+    return policy
+
+
+# ============================================================================
+# Process pool
+# ============================================================================
+
+
+def function_reference(func: Callable[..., Any]) -> FunctionReference:
+    """Return the importable ``(module, qualname)`` a worker process uses to find ``func``.
+
+    Raises:
+        ValueError: For lambdas, closures and other functions without an importable name.
+    """
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        raise ValueError(f"executor='process' requires a module-level function, got {qualname or func!r}")
+    return module, qualname
+
+
+def resolve_function_reference(ref: FunctionReference) -> Callable[..., Any]:
+    """Import the function named by a :func:`function_reference`."""
+    module_name, qualname = ref
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target  # type: ignore[no-any-return]
+
+
+def _process_worker_main(conn: Connection) -> None:
+    """Worker loop: resolve each handler by reference, call it, send back ``(ok, value)``."""
+    # Ctrl+C reaches the whole process group; the parent decides when workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    handlers: dict[FunctionReference, Callable[..., Any]] = {}
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+        ref, args, kwargs = request
+        try:
+            func = handlers.get(ref)
+            if func is None:
+                func = handlers[ref] = resolve_function_reference(ref)
+            outcome: tuple[bool, Any] = (True, func(*args, **kwargs))
+        except Exception as e:
+            outcome = (False, e)
+        try:
+            conn.send(outcome)
+        except Exception as e:
+            # Unpicklable result or exception; send() pickles before writing, so the pipe is intact
+            conn.send((False, RuntimeError(f"Handler outcome could not be returned from worker: {e}")))
+
+
+def _default_start_method() -> str | None:
+    # Pre-fork where it is safe (Linux); elsewhere use the platform default
+    if sys.platform.startswith("linux") and "fork" in multiprocessing.get_all_start_methods():
+        return "fork"
+    return None
+
+
+def _mark_ready(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+# Pipe I/O from the event loop.  The parent writes and reads the framing of
+# multiprocessing.Connection itself (a signed 4-byte length, or -1 and an
+# 8-byte length), so workers keep using plain send()/recv().  Windows pipes
+# have no pollable descriptor; there the blocking calls run on a thread.
+_NONBLOCKING_PIPES = sys.platform != "win32"
+_FRAME_LENGTH = struct.Struct("!i")
+_FRAME_LONG_LENGTH = struct.Struct("!Q")
+_PIPE_READ_SIZE = 1 << 20
+
+
+async def _fd_ready(add: Callable[..., None], remove: Callable[[int], Any], fd: int) -> None:
+    """Wait until ``fd`` is readable (``loop.add_reader``) or writable (``loop.add_writer``)."""
+    ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    add(fd, _mark_ready, ready)
+    try:
+        await ready
+    finally:
+        remove(fd)
+
+
+async def _write_frame(fd: int, payload: bytes) -> None:
+    """Write one Connection frame to a non-blocking pipe, as fast as the reader drains it."""
+    loop = asyncio.get_running_loop()
+    if len(payload) > 0x7FFFFFFF:
+        header = _FRAME_LENGTH.pack(-1) + _FRAME_LONG_LENGTH.pack(len(payload))
+    else:
+        header = _FRAME_LENGTH.pack(len(payload))
+    for data in (memoryview(header), memoryview(payload)):
+        while data:
+            try:
+                data = data[os.write(fd, data) :]
+            except BlockingIOError:
+                await _fd_ready(loop.add_writer, loop.remove_writer, fd)
+
+
+async def _read_exactly(fd: int, size: int) -> bytes:
+    loop = asyncio.get_running_loop()
+    chunks: list[bytes] = []
+    while size:
+        try:
+            chunk = os.read(fd, min(size, _PIPE_READ_SIZE))
+        except BlockingIOError:
+            await _fd_ready(loop.add_reader, loop.remove_reader, fd)
+            continue
+        if not chunk:
+            raise EOFError("worker pipe closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+async def _read_frame(fd: int) -> bytes:
+    """Read one Connection frame from a non-blocking pipe, waiting on the event loop for each part."""
+    (size,) = _FRAME_LENGTH.unpack(await _read_exactly(fd, _FRAME_LENGTH.size))
+    if size == -1:
+        (size,) = _FRAME_LONG_LENGTH.unpack(await _read_exactly(fd, _FRAME_LONG_LENGTH.size))
+    return await _read_exactly(fd, size)
+
+
+@dataclass(eq=False)
+class _ProcessWorker:
+    process: BaseProcess
+    conn: Connection
+
+
+class ProcessWorkerPool:
+    """Warm pool of worker processes, one call per worker at a time.
+
+    Workers are started together on :meth:`start` (or first use) and kept
+    alive between calls.  Callers beyond ``max_workers`` wait in FIFO order.
+    A call cancelled while queued just leaves the queue; one cancelled while
+    running terminates its worker, which is immediately replaced.  Workers
+    found dead are replaced the same way and counted in ``restarts``.
+
+    Everything happens on the event loop: the parent's pipe ends are
+    non-blocking, and a call is written and its outcome read a chunk at a
+    time as the pipe allows (``loop.add_writer``/``add_reader``), so neither
+    a long-running handler nor a result larger than the pipe buffer ties up
+    a thread or stalls the loop.  On Windows the blocking pipe calls run on
+    the default thread pool.
+    """
+
+    def __init__(self, max_workers: int | None = None, start_method: str | None = None) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers or DEFAULT_PROCESS_POOL_WORKERS
+        self._context = multiprocessing.get_context(start_method or _default_start_method())
+        self._workers: list[_ProcessWorker] = []
+        self._idle: deque[_ProcessWorker] = deque()
+        self._waiters: deque[asyncio.Future[_ProcessWorker]] = deque()
+        self._spawned = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._restarts = 0
+        self._peak_queued = 0
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start all workers (no-op if already running)."""
+        if self._workers:
+            return
+        for _ in range(self.max_workers):
+            self._idle.append(self._spawn())
+        logger.debug(f"Started handler process pool ({self.max_workers} workers)")
+
+    def _spawn(self) -> _ProcessWorker:
+        self._spawned += 1
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(  # type: ignore[attr-defined]
+            target=_process_worker_main,
+            args=(child_conn,),
+            name=f"{PROCESS_POOL_NAME_PREFIX}-{self._spawned}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        if _NONBLOCKING_PIPES:
+            os.set_blocking(parent_conn.fileno(), False)
+        worker = _ProcessWorker(process=process, conn=parent_conn)
+        self._workers.append(worker)
+        return worker
+
+    def _replace(self, worker: _ProcessWorker) -> _ProcessWorker:
+        """Terminate ``worker`` and spawn its replacement.
+
+        The pipe is left to be closed by garbage collection, so a Windows
+        reader thread still blocked on it never sees its descriptor reused.
+        """
+        if worker in self._workers:
+            self._workers.remove(worker)
+        if worker.process.is_alive():
+            worker.process.terminate()
+        self._restarts += 1
+        return self._spawn()
+
+    async def _acquire(self) -> _ProcessWorker:
+        self.start()
+        if self._idle:
+            worker = self._idle.popleft()
+        else:
+            waiter: asyncio.Future[_ProcessWorker] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self._peak_queued = max(self._peak_queued, self.queue_depth)
+            try:
+                worker = await waiter
+            except asyncio.CancelledError:
+                # Handed a worker just as we were cancelled: pass it on
+                if waiter.done() and not waiter.cancelled():
+                    self._release(waiter.result())
+                raise
+        if not worker.process.is_alive():
+            logger.warning(f"Process worker {worker.process.name} died while idle; replacing it")
+            worker = self._replace(worker)
+        return worker
+
+    def _release(self, worker: _ProcessWorker) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(worker)
+                return
+        self._idle.append(worker)
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def run(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Run ``func(*args, **kwargs)`` in a worker process and return its result."""
+        ref = function_reference(func)
+        worker = await self._acquire()
+        self._submitted += 1
+        try:
+            # A copy: the pickler's view must not outlive its buffer in this frame (tracebacks, cycles)
+            payload = bytes(ForkingPickler.dumps((ref, args, kwargs)))
+        except Exception:
+            # Unpicklable arguments: nothing was written, the worker is still clean
+            self._failed += 1
+            self._release(worker)
+            raise
+
+        try:
+            await self._send(worker.conn, payload)
+            ok, value = await self._receive(worker.conn)
+        except asyncio.CancelledError:
+            self._cancelled += 1
+            logger.debug(f"Cancelled {ref[1]} in {worker.process.name}; replacing worker")
+            self._release(self._replace(worker))
+            raise
+        except (EOFError, OSError) as e:
+            self._failed += 1
+            self._release(self._replace(worker))
+            raise RuntimeError(f"Process worker exited while running '{ref[1]}'") from e
+        except Exception as e:
+            # The outcome arrived but could not be unpickled
+            self._failed += 1
+            self._release(worker)
+            raise RuntimeError(f"Could not receive result of '{ref[1]}' from worker: {e}") from e
+
+        self._release(worker)
+        if not ok:
+            self._failed += 1
+            raise value
+        self._completed += 1
+        return value
+
+    @staticmethod
+    async def _send(conn: Connection, payload: bytes) -> None:
+        """Write a pickled call to a worker."""
+        if not _NONBLOCKING_PIPES:
+            await asyncio.get_running_loop().run_in_executor(None, conn.send_bytes, payload)
+            return
+        await _write_frame(conn.fileno(), payload)
+
+    @staticmethod
+    async def _receive(conn: Connection) -> Any:
+        """Read a worker's pickled outcome."""
+        if not _NONBLOCKING_PIPES:
+            return await asyncio.get_running_loop().run_in_executor(None, conn.recv)
+        return ForkingPickler.loads(await _read_frame(conn.fileno()))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get worker health and throughput metrics."""
+        return {
+            "max_workers": self.max_workers,
+            "started": self.started,
+            "alive": sum(1 for worker in self._workers if worker.process.is_alive()),
+            "busy": len(self._workers) - len(self._idle),
+            "pids": [worker.process.pid for worker in self._workers],
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self._peak_queued,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "cancelled": self._cancelled,
+            "restarts": self._restarts,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all workers (the pool restarts on next use)."""
+        workers, self._workers = self._workers, []
+        idle = set(self._idle)
+        self._idle.clear()
+        for worker in workers:
+            if worker in idle:
+                try:
+                    worker.conn.send(None)
+                except OSError:
+                    worker.process.terminate()
+            else:
+                worker.process.terminate()
+        if wait:
+            for worker in workers:
+                worker.process.join(PROCESS_WORKER_JOIN_TIMEOUT)
+                if worker.process.is_alive():
+                    worker.process.kill()
+
+
+# ============================================================================
+# Handler executor
+# ============================================================================
+
+
+class HandlerExecutor:
+    """Runs synchronous handlers inline, on a bounded thread pool, or in worker processes.
+
+    Both pools are started lazily on first offload, so servers that never use
+    them pay nothing (the process pool can be warmed up front with
+    :meth:`start_process_pool`).  Queue depth (submitted but not yet started),
+    active workers and completion counts are tracked for monitoring.
+    """
+
+    def __init__(
+        self,
+        default_policy: str = DEFAULT_EXECUTOR_POLICY,
+        max_workers: int | None = None,
+        thread_name_prefix: str = THREAD_POOL_NAME_PREFIX,
+        process_workers: int | None = None,
+    ) -> None:
+        validate_executor_policy(default_policy)
+        if default_policy == EXECUTOR_PROCESS:
+            raise ValueError("executor='process' must be set per handler, not as the server default")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.process_pool = ProcessWorkerPool(max_workers=process_workers)
+        self.default_policy = default_policy
+        self.max_workers = max_workers or DEFAULT_THREAD_POOL_WORKERS
+        self.thread_name_prefix = thread_name_prefix
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._peak_queued = 0
+        self._completed = 0
+        self._failed = 0
+
+    def resolve(self, policy: str | None) -> str:
+        """Resolve a handler's policy override against the server default."""
+        return policy or self.default_policy
+
+    async def run(self, func: Callable[..., Any], policy: str | None, /, *args: Any, **kwargs: Any) -> Any:
+        """Call a synchronous handler according to its (resolved) policy."""
+        resolved = self.resolve(policy)
+        if resolved == EXECUTOR_THREAD:
+            return await self.run_in_thread(func, *args, **kwargs)
+        if resolved == EXECUTOR_PROCESS:
+            return await self.process_pool.run(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    async def run_in_thread(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` on the handler thread pool with the caller's contextvars."""
+        ctx = contextvars.copy_context()
+        call = partial(ctx.run, func, *args, **kwargs)
+
+        # Per-call state, guarded by the lock: "started" once a worker picks it up,
+        # "abandoned" if the caller was cancelled while it was still queued.
+        state = {"started": False, "abandoned": False}
+
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+        def _work() -> Any:
+            with self._lock:
+                state["started"] = True
+                if not state["abandoned"]:
+                    self._queued -= 1
+                self._active += 1
+            try:
+                result = call()
+            except BaseException:
+                with self._lock:
+                    self._active -= 1
+                    self._failed += 1
+                raise
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+            return result
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_pool(), _work)
+        except asyncio.CancelledError:
+            # A started thread runs to completion; a queued one no longer counts as waiting
+            with self._lock:
+                if not state["started"]:
+                    state["abandoned"] = True
+                    self._queued -= 1
+            raise
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix
+                    )
+                    logger.debug(f"Started handler thread pool ({self.max_workers} workers)")
+        return self._pool
+
+    def start_process_pool(self) -> None:
+        """Pre-fork the process pool so the first ``"process"`` call finds warm workers."""
+        self.process_pool.start()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get executor metrics for monitoring."""
+        with self._lock:
+            return {
+                "default_policy": self.default_policy,
+                "max_workers": self.max_workers,
+                "started": self._pool is not None,
+                "queue_depth": self._queued,
+                "peak_queue_depth": self._peak_queued,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "process_pool": self.process_pool.get_stats(),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the thread and process pools (new ones are started on next use)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+        self.process_pool.shutdown(wait=wait)
+
+
+# ============================================================================
+# Current executor
+# ============================================================================
+
+_default_executor = HandlerExecutor(default_policy=EXECUTOR_INLINE)
+_current_executor: ContextVar[HandlerExecutor | None] = ContextVar("handler_executor", default=None)
+
+
+def get_handler_executor() -> HandlerExecutor:
+    """Get the executor for the current request (or the shared default)."""
+    return _current_executor.get() or _default_executor
+
+
+def set_handler_executor(executor: HandlerExecutor | None) -> None:
+    """Install the executor used by handlers in the current context."""
+    _current_executor.set(executor)
+
+
+async def run_sync_handler(func: Callable[..., Any], policy: str | None, /, *args: Any, **kwargs: Any) -> Any:
+    """Run a synchronous handler under the current executor."""
+    return await get_handler_executor().run(func, policy, *args, **kwargs)
+
+
+__all__ = [
+    "HandlerExecutor",
+    "ProcessWorkerPool",
+    "function_reference",
+    "get_handler_executor",
+    "run_sync_handler",
+    "set_handler_executor",
+    "validate_executor_policy",
+]
@@ -5,7 +5,13 @@ HTTP Server with systematic performance bottleneck fixes
 Target: Break through the 3,600 RPS ceiling
 """
 
+import contextlib
+import functools
 import logging
+import os
+import socket
+from collections.abc import AsyncIterator
+from typing import Any
 
 import uvicorn
 from starlette.applications import Starlette
@@ -31,6 +37,7 @@ from .endpoints import (
 from .middlewares import ContextMiddleware
 from .openapi import generate_openapi_spec
 from .protocol import MCPProtocolHandler
+from .supervisor import WorkerChannel, WorkerSupervisor
 
 logger = logging.getLogger(__name__)
 
@@ -163,8 +170,28 @@ class HTTPServer:
             routes=routes,
             middleware=middleware,
             exception_handlers={Exception: self._global_exception_handler},
+            lifespan=self._lifespan,
         )
 
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, app: Starlette) -> AsyncIterator[None]:  # noqa: ARG002
+        """Run background maintenance, the notification bus and (in a worker) stats reporting while serving."""
+        channel = self.protocol.worker_channel
+        bus = self.protocol.notification_bus
+        self.protocol.maintenance.start()
+        if bus is not None:
+            await bus.start(self.protocol.deliver_bus_event)
+        if channel is not None:
+            channel.start()
+        try:
+            yield
+        finally:
+            if channel is not None:
+                await channel.stop()
+            if bus is not None:
+                await bus.stop()
+            await self.protocol.maintenance.stop()
+
     async def _global_exception_handler(self, request: Request, exc: Exception) -> Response:
         """Minimal exception handler."""
         logger.error(f"Exception in {request.method} {request.url.path}: {exc}")
@@ -177,6 +204,7 @@ class HTTPServer:
         debug: bool = False,
         log_level: str = "warning",
         reload: bool = False,
+        workers: int = 1,
     ):
         """Run with maximum performance configuration to break bottlenecks.
 
@@ -186,11 +214,12 @@ class HTTPServer:
             debug: Enable debug mode (more verbose logging)
             log_level: Logging level for application logs (debug, info, warning, error, critical)
             reload: Enable hot reload (auto-restart on file changes)
+            workers: Worker processes sharing the listening socket. More than one
+                needs sessions in a shared store; otherwise one worker is run.
         """
 
         # Logging is already configured in core.py before this is called
         # Just determine the uvicorn log level based on the passed log_level
-        import os
         import sys
 
         # If debug is explicitly set to True, override log_level
@@ -234,6 +263,8 @@ class HTTPServer:
         if reload:
             uvicorn_config["reload"] = True
 
+        workers = self._resolve_workers(workers, reload)
+
         # Add uvloop only on non-Windows platforms (uvloop doesn't support Windows)
         if sys.platform != "win32":
             try:
@@ -249,13 +280,54 @@ class HTTPServer:
             uvicorn_config.pop("http", None)
 
         try:
-            uvicorn.run(**uvicorn_config)
+            if workers > 1:
+                self._run_workers(uvicorn_config, workers)
+            else:
+                # Pre-fork process workers now that every handler is registered
+                self.protocol.warm_up()
+                uvicorn.run(**uvicorn_config)
         except KeyboardInterrupt:
             logger.info("\n👋 Server shutting down gracefully...")
         except Exception as e:
             logger.error(f"❌ Server startup error: {e}")
             raise
 
+    def _resolve_workers(self, workers: int, reload: bool) -> int:
+        """Number of worker processes that can actually be run."""
+        if workers <= 1:
+            return 1
+        if reload or not hasattr(os, "fork"):
+            logger.info("Running a single worker (multiple workers need fork and no hot reload)")
+            return 1
+        if not self.protocol.session_manager.shared:
+            logger.info(
+                f"Running a single worker instead of {workers}: sessions are process-local "
+                "(configure a shared session_store to use more)"
+            )
+            return 1
+        return workers
+
+    def _run_workers(self, uvicorn_config: dict[str, Any], workers: int) -> None:
+        """Serve from ``workers`` supervised worker processes (see :mod:`.supervisor`)."""
+        # Handler thread/process pools must belong to the worker using them: start them after the fork
+        self.protocol._executor.shutdown()
+        supervisor = WorkerSupervisor(
+            functools.partial(self._serve_worker, uvicorn_config),
+            workers,
+            host=uvicorn_config["host"],
+            port=uvicorn_config["port"],
+            backlog=uvicorn_config["backlog"],
+        )
+        supervisor.run()
+
+    def _serve_worker(
+        self, uvicorn_config: dict[str, Any], sockets: list[socket.socket], channel: socket.socket
+    ) -> None:
+        """Body of one forked worker: report to the supervisor and serve until stopped."""
+        self.protocol.warm_up()
+        self.protocol.worker_channel = WorkerChannel(channel, self.protocol.worker_snapshot)
+        uvicorn.Server(uvicorn.Config(**uvicorn_config)).run(sockets=sockets)
+
 
 # Factory function
 def create_server(protocol_handler: MCPProtocolHandler, post_register_hook=None) -> HTTPServer:
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/maintenance.py
+"""
+Maintenance - periodic background sweeps of per-process state.
+
+Long-lived servers accumulate state that request handling never removes on
+its own: idle sessions, rate-limiter buckets, finished tasks, expired cache
+entries.  :class:`MaintenanceTask` runs a set of named steps every
+``interval`` seconds in one asyncio task, which the HTTP server starts and
+stops with its lifespan.
+
+Each step is a plain function returning how many items it removed; a step
+that raises is logged and counted without stopping the others.  Steps that
+do blocking I/O (e.g. compacting a database) are registered with
+``blocking=True`` and run in a worker thread by the background task.  Per-step
+timings and totals are reported by :meth:`MaintenanceTask.get_stats`.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .constants import DEFAULT_MAINTENANCE_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _StepStats:
+    runs: int = 0
+    errors: int = 0
+    removed: int = 0
+    last_removed: int = 0
+    last_ms: float = 0.0
+    total_ms: float = 0.0
+
+
+class MaintenanceTask:
+    """Runs registered cleanup steps periodically in the background."""
+
+    def __init__(self, interval: float = DEFAULT_MAINTENANCE_INTERVAL) -> None:
+        """
+        Args:
+            interval: Seconds between sweeps (0 disables the background task;
+                :meth:`run_once` still works)
+
+        Raises:
+            ValueError: If ``interval`` is negative.
+        """
+        if interval < 0:
+            raise ValueError("interval must be non-negative")
+        self.interval = interval
+        self._steps: dict[str, Callable[[], int]] = {}
+        self._blocking: set[str] = set()
+        self._stats: dict[str, _StepStats] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._runs = 0
+        self._last_run_at: float | None = None
+        self._last_ms = 0.0
+
+    def add_step(self, name: str, step: Callable[[], int], *, blocking: bool = False) -> None:
+        """Register a step; it returns the number of items it removed.
+
+        A ``blocking`` step runs in a worker thread when swept in the
+        background, so it must not touch state the event loop mutates.
+        """
+        self._steps[name] = step
+        if blocking:
+            self._blocking.add(name)
+        else:
+            self._blocking.discard(name)
+        self._stats.setdefault(name, _StepStats())
+
+    # ------------------------------------------------------------------
+    # Sweeping
+    # ------------------------------------------------------------------
+
+    def run_once(self) -> dict[str, int]:
+        """Run every step now, inline; returns the items removed per step."""
+        started = time.perf_counter()
+        removed = {name: self._run_step(name, step) for name, step in self._steps.items()}
+        self._finish(started, removed)
+        return removed
+
+    async def run_once_async(self) -> dict[str, int]:
+        """Run every step now, blocking ones in a worker thread; returns the items removed per step."""
+        started = time.perf_counter()
+        removed: dict[str, int] = {}
+        for name, step in list(self._steps.items()):
+            if name in self._blocking:
+                removed[name] = await asyncio.to_thread(self._run_step, name, step)
+            else:
+                removed[name] = self._run_step(name, step)
+        self._finish(started, removed)
+        return removed
+
+    def _run_step(self, name: str, step: Callable[[], int]) -> int:
+        stats = self._stats[name]
+        step_started = time.perf_counter()
+        try:
+            count = step()
+        except Exception as e:
+            stats.errors += 1
+            logger.warning(f"Maintenance step {name} failed: {e}")
+            count = 0
+        elapsed_ms = (time.perf_counter() - step_started) * 1000
+        stats.runs += 1
+        stats.removed += count
+        stats.last_removed = count
+        stats.last_ms = elapsed_ms
+        stats.total_ms += elapsed_ms
+        return count
+
+    def _finish(self, started: float, removed: dict[str, int]) -> None:
+        self._runs += 1
+        self._last_run_at = time.time()
+        self._last_ms = (time.perf_counter() - started) * 1000
+        if any(removed.values()):
+            logger.debug(f"Maintenance removed {removed} in {self._last_ms:.1f}ms")
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.run_once_async()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background task (no-op if disabled or already running)."""
+        if self.interval == 0 or self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._loop())
+        logger.debug(f"Maintenance task started (every {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get sweep timings and per-step totals."""
+        return {
+            "interval": self.interval,
+            "running": self.running,
+            "runs": self._runs,
+            "last_run_at": self._last_run_at,
+            "last_ms": round(self._last_ms, 3),
+            "steps": {
+                name: {
+                    "runs": stats.runs,
+                    "errors": stats.errors,
+                    "removed": stats.removed,
+                    "last_removed": stats.last_removed,
+                    "last_ms": round(stats.last_ms, 3),
+                    "total_ms": round(stats.total_ms, 3),
+                }
+                for name, stats in self._stats.items()
+            },
+        }
+
+
+__all__ = ["MaintenanceTask"]
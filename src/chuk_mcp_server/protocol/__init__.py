@@ -5,12 +5,38 @@ MCP protocol package.
 
 Re-exports MCPProtocolHandler and SessionManager for backward compatibility.
 All existing imports from ``chuk_mcp_server.protocol`` continue to work.
+Session stores (for sharing sessions between workers), notification
+buses (for reaching the streams other workers hold) and SSE event buffers
+(for Last-Event-ID replay, optionally durable) are exported too.
 """
 
+from .bus import InProcessBus, NotificationBus, RedisBus, UnixSocketBus, create_notification_bus
+from .event_log import SQLiteEventLog, create_event_buffer
+from .events import SSEEventBuffer
 from .handler import MCPProtocolHandler
 from .session_manager import SessionManager
+from .session_store import (
+    MemorySessionStore,
+    RedisSessionStore,
+    SessionStore,
+    SQLiteSessionStore,
+    create_session_store,
+)
 
 __all__ = [
+    "InProcessBus",
     "MCPProtocolHandler",
+    "MemorySessionStore",
+    "NotificationBus",
+    "RedisBus",
+    "RedisSessionStore",
+    "SQLiteEventLog",
+    "SQLiteSessionStore",
+    "SSEEventBuffer",
     "SessionManager",
+    "SessionStore",
+    "UnixSocketBus",
+    "create_event_buffer",
+    "create_notification_bus",
+    "create_session_store",
 ]
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/protocol/bus.py
+"""
+Notification bus - fans server-initiated notifications out to every worker.
+
+With several workers a client's GET stream is held by one of them, while
+the code that changes a resource (or the tool list) may run in another.
+The handler delivers each notification to its own streams and publishes a
+small event on the bus; every other worker receives it and delivers it to
+the streams it holds.
+
+Events are plain dicts: ``{"uri": ...}`` for ``notifications/resources/updated``
+and ``{"method": ...}`` for the parameterless ``list_changed`` notifications.
+Session events keep every worker's subscription index in step, since the
+worker serving ``resources/subscribe`` is rarely the one holding the stream:
+``{"session": ..., "subscribe": uri}`` (or ``"unsubscribe"``) and
+``{"session": ..., "terminated": true}``.
+A publisher never receives its own events.  Delivery is best effort - an
+event published while a worker is restarting is not replayed to it.
+
+Backends:
+
+- :class:`InProcessBus` - buses created with the same name in one process
+  (several handlers or servers in one interpreter, tests).
+- :class:`UnixSocketBus` - the workers of one host, over datagram sockets
+  in a shared directory.
+- :class:`RedisBus` - any server speaking the Redis protocol, across hosts.
+
+:func:`create_notification_bus` builds one from a URL (``memory://name``,
+``unix:///run/chuk-mcp``, ``redis://host:6379/0``).
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+import orjson
+
+from ..constants import (
+    NOTIFICATION_BUS_CHANNEL,
+    NOTIFICATION_BUS_MAX_DATAGRAM,
+    NOTIFICATION_BUS_PUBLISH_QUEUE_SIZE,
+    WORKER_RESTART_MAX_DELAY,
+)
+from ..resp import RespClient, RespSubscription
+
+logger = logging.getLogger(__name__)
+
+#: Called on the event loop with each event published by another worker
+Deliver = Callable[[dict[str, Any]], None]
+
+
+class NotificationBus(ABC):
+    """Publish/subscribe channel between the workers of one server."""
+
+    def __init__(self) -> None:
+        self.origin = uuid.uuid4().hex
+        self._deliver: Deliver | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._published = 0
+        self._received = 0
+        self._errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._deliver is not None
+
+    async def start(self, deliver: Deliver) -> None:
+        """Start receiving; ``deliver`` runs on the current event loop."""
+        # New identity per start: prefork workers all inherit the supervisor's bus object
+        self.origin = uuid.uuid4().hex
+        self._loop = asyncio.get_running_loop()
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        """Stop receiving and release connections."""
+        self._deliver = None
+
+    @abstractmethod
+    def publish(self, event: dict[str, Any]) -> None:
+        """Send ``event`` to every other worker (never blocks on delivery)."""
+
+    def _receive(self, event: dict[str, Any]) -> None:
+        """Hand an incoming event to the handler (on the event loop)."""
+        if self._deliver is None:
+            return
+        self._received += 1
+        try:
+            self._deliver(event)
+        except Exception as e:
+            self._errors += 1
+            logger.warning(f"Notification bus delivery failed for {event}: {e}")
+
+    def _encode(self, event: dict[str, Any]) -> bytes:
+        return orjson.dumps({"origin": self.origin, "event": event})
+
+    def _decode(self, data: bytes) -> dict[str, Any] | None:
+        """Unwrap an envelope; None for our own events and garbage."""
+        try:
+            envelope = orjson.loads(data)
+            if envelope["origin"] == self.origin:
+                return None
+            event: dict[str, Any] = envelope["event"]
+            return event
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            self._errors += 1
+            return None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get bus metrics."""
+        return {
+            "backend": type(self).__name__,
+            "running": self.running,
+            "published": self._published,
+            "received": self._received,
+            "errors": self._errors,
+        }
+
+
+class InProcessBus(NotificationBus):
+    """Connects the buses created with the same ``name`` in this process."""
+
+    _groups: ClassVar[dict[str, "weakref.WeakSet[InProcessBus]"]] = {}
+
+    def __init__(self, name: str = "default") -> None:
+        super().__init__()
+        self.name = name
+        self._groups.setdefault(name, weakref.WeakSet()).add(self)
+
+    def publish(self, event: dict[str, Any]) -> None:
+        self._published += 1
+        for peer in list(self._groups[self.name]):
+            if peer is self or peer._loop is None or peer._deliver is None:
+                continue
+            # Peers may run on other loops (or threads)
+            with contextlib.suppress(RuntimeError):  # Peer's loop already closed
+                peer._loop.call_soon_threadsafe(peer._receive, dict(event))
+
+    def get_stats(self) -> dict[str, Any]:
+        return {**super().get_stats(), "name": self.name, "peers": len(self._groups[self.name]) - 1}
+
+
+class UnixSocketBus(NotificationBus):
+    """Workers of one host exchanging datagrams through a shared directory.
+
+    Each worker binds ``<directory>/<pid>-<id>.sock``; publishing sends
+    one datagram to every other socket there.  Sockets left behind by dead
+    workers are removed by the first publisher that finds them refusing.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Args:
+            directory: Directory shared by the workers (created if missing)
+        """
+        super().__init__()
+        self.directory = directory
+        self._sock: socket.socket | None = None
+        self._path: str | None = None
+        self._dropped = 0
+        self._stale = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        await super().start(deliver)
+        os.makedirs(self.directory, exist_ok=True)
+        self._path = os.path.join(self.directory, f"{os.getpid()}-{self.origin[:12]}.sock")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(self._path)
+        self._sock = sock
+        asyncio.get_running_loop().add_reader(sock.fileno(), self._on_readable)
+
+    async def stop(self) -> None:
+        await super().stop()
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            if self._loop is not None:
+                self._loop.remove_reader(sock.fileno())
+            sock.close()
+        if self._path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._path)
+            self._path = None
+
+    def _on_readable(self) -> None:
+        while self._sock is not None:
+            try:
+                data = self._sock.recv(NOTIFICATION_BUS_MAX_DATAGRAM)
+            except (BlockingIOError, InterruptedError):
+                return
+            event = self._decode(data)
+            if event is not None:
+                self._receive(event)
+
+    def _peers(self) -> list[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [
+            os.path.join(self.directory, name)
+            for name in names
+            if name.endswith(".sock") and os.path.join(self.directory, name) != self._path
+        ]
+
+    def publish(self, event: dict[str, Any]) -> None:
+        data = self._encode(event)
+        if len(data) > NOTIFICATION_BUS_MAX_DATAGRAM:
+            logger.warning(f"Notification bus event too large ({len(data)} bytes), not published")
+            self._errors += 1
+            return
+        self._published += 1
+        sender = self._sock or socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sender.setblocking(False)
+        try:
+            for path in self._peers():
+                try:
+                    sender.sendto(data, path)
+                except BlockingIOError:
+                    self._dropped += 1  # Receiver's queue is full
+                except (ConnectionRefusedError, FileNotFoundError):
+                    self._stale += 1  # Its worker is gone
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(path)
+                except OSError as e:
+                    self._errors += 1
+                    logger.debug(f"Notification bus send to {path} failed: {e}")
+        finally:
+            if sender is not self._sock:
+                sender.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **super().get_stats(),
+            "directory": self.directory,
+            "peers": len(self._peers()),
+            "dropped": self._dropped,
+            "stale_removed": self._stale,
+        }
+
+
+class RedisBus(NotificationBus):
+    """Pub/sub over a Redis-protocol server, shared across hosts.
+
+    :meth:`publish` only enqueues the event; a publisher thread sends each
+    as one ``PUBLISH`` on the command connection, so a slow or unreachable
+    server never stalls the event loop (events beyond a bounded backlog are
+    dropped and counted).  Events are received on a dedicated subscribed
+    connection read by a daemon thread and handed to the event loop; a lost
+    connection is re-established with backoff (events published meanwhile
+    are missed).
+    """
+
+    def __init__(self, client: RespClient, channel: str = NOTIFICATION_BUS_CHANNEL) -> None:
+        """
+        Args:
+            client: Connection to the server (the subscription opens its own)
+            channel: Pub/sub channel shared by the workers
+        """
+        super().__init__()
+        self.client = client
+        self.channel = channel
+        self._subscription: RespSubscription | None = None
+        self._thread: threading.Thread | None = None
+        self._outbox: queue.Queue[bytes | None] = queue.Queue(maxsize=NOTIFICATION_BUS_PUBLISH_QUEUE_SIZE)
+        self._publisher: threading.Thread | None = None
+        self._reconnects = 0
+        self._dropped = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        await super().start(deliver)
+        # Subscribe before returning so nothing published after start() is missed
+        self._subscription = await asyncio.to_thread(self.client.subscribe, self.channel)
+        self._thread = threading.Thread(target=self._listen, name="mcp-notification-bus", daemon=True)
+        self._thread.start()
+        self._outbox = queue.Queue(maxsize=NOTIFICATION_BUS_PUBLISH_QUEUE_SIZE)
+        self._publisher = threading.Thread(
+            target=self._send_published, args=(self._outbox,), name="mcp-notification-bus-publisher", daemon=True
+        )
+        self._publisher.start()
+
+    async def stop(self) -> None:
+        await super().stop()
+        subscription, self._subscription = self._subscription, None
+        if subscription is not None:
+            subscription.close()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            await asyncio.to_thread(thread.join, 1.0)
+        publisher, self._publisher = self._publisher, None
+        if publisher is not None:
+            with contextlib.suppress(queue.Full):
+                self._outbox.put_nowait(None)  # Sent after what is already queued
+            await asyncio.to_thread(publisher.join, 1.0)
+        self.client.close()
+
+    def _listen(self) -> None:
+        """Read the subscription until stopped (runs in its own thread)."""
+        delay = 0.1
+        while self.running:
+            subscription = self._subscription
+            try:
+                if subscription is None:
+                    subscription = self._subscription = self.client.subscribe(self.channel)
+                    self._reconnects += 1
+                for _, data in subscription:
+                    delay = 0.1
+                    if self._loop is not None:
+                        self._loop.call_soon_threadsafe(self._on_message, data)
+            except (OSError, ValueError) as e:  # ValueError: stream closed under us
+                if not self.running:
+                    return
+                logger.warning(f"Notification bus subscription lost ({e}), reconnecting in {delay:.1f}s")
+                if self._subscription is subscription:
+                    self._subscription = None
+                time.sleep(delay)
+                delay = min(delay * 2, WORKER_RESTART_MAX_DELAY)
+            except RuntimeError:  # Event loop closed
+                return
+
+    def _on_message(self, data: bytes) -> None:
+        event = self._decode(data)
+        if event is not None:
+            self._receive(event)
+
+    def publish(self, event: dict[str, Any]) -> None:
+        if self._publisher is None:
+            self._dropped += 1
+            return
+        try:
+            self._outbox.put_nowait(self._encode(event))
+        except queue.Full:
+            self._dropped += 1
+            logger.warning("Notification bus publish backlog full, event dropped")
+            return
+        self._published += 1
+
+    def _send_published(self, outbox: "queue.Queue[bytes | None]") -> None:
+        """Send queued events until the stop sentinel (runs in its own thread)."""
+        while (data := outbox.get()) is not None:
+            try:
+                self.client.execute("PUBLISH", self.channel, data)
+            except Exception as e:
+                self._errors += 1
+                logger.warning(f"Notification bus publish failed: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **super().get_stats(),
+            "server": f"{self.client.host}:{self.client.port}",
+            "channel": self.channel,
+            "reconnects": self._reconnects,
+            "publish_backlog": self._outbox.qsize(),
+            "dropped": self._dropped,
+        }
+
+
+def create_notification_bus(url: str) -> NotificationBus:
+    """Create a notification bus from a URL.
+
+    Args:
+        url: ``memory://[name]``, ``unix:///path/to/directory`` or
+            ``redis://[:password@]host[:port][/db]``
+
+    Raises:
+        ValueError: If the URL scheme is not supported.
+    """
+    scheme, _, rest = url.partition("://")
+    if scheme == "memory":
+        return InProcessBus(rest or "default")
+    if scheme == "unix":
+        if not rest.startswith("/"):
+            raise ValueError(f"Unix notification bus needs an absolute directory: {url!r}")
+        return UnixSocketBus(rest)
+    if scheme == "redis":
+        return RedisBus(RespClient.from_url(url))
+    raise ValueError(f"Unsupported notification bus URL: {url!r}")
+
+
+__all__ = [
+    "InProcessBus",
+    "NotificationBus",
+    "RedisBus",
+    "UnixSocketBus",
+    "create_notification_bus",
+]
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/protocol/event_log.py
+"""
+Durable SSE event log - Last-Event-ID replay across restarts and workers.
+
+:class:`SSEEventBuffer` keeps replay buffers in process memory, so a client
+reconnecting after a deploy, or landing on another worker, has nothing to
+resume from.  :class:`SQLiteEventLog` has the same interface but appends
+every event to a SQLite database shared by the workers of a host:
+
+- Event IDs come from a per-session counter in the database, so they keep
+  increasing across workers and restarts and a client's ``Last-Event-ID``
+  stays meaningful wherever it reconnects.
+- A broadcast is logged in one transaction (:meth:`SQLiteEventLog.append`),
+  which the notification router runs off the event loop; the handler runs
+  replay and deletion off the loop too.
+- The event count in the stats is kept by triggers, never counted.
+- Replay is an indexed range read of ``(session_id, event_id)``.
+- Events older than the retention window, and beyond the per-session
+  limit, are removed by :meth:`SQLiteEventLog.compact` (a background
+  maintenance step), which also checkpoints the WAL.
+
+Losing a worker (eviction, restart) keeps its sessions' events; only
+terminating a session deletes them.
+
+:func:`create_event_buffer` builds a buffer from a URL (``memory://`` or
+``sqlite:///events.db`` relative, ``sqlite:////var/lib/mcp/events.db``
+absolute).
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from ..constants import DEFAULT_SSE_BUFFER_SIZE, DEFAULT_SSE_LOG_RETENTION
+from ..types.serialization import serialize_mcp_response
+from .events import SSEEventBuffer
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sse_events ("
+    " session_id TEXT NOT NULL, event_id INTEGER NOT NULL, payload BLOB NOT NULL, created_at REAL NOT NULL,"
+    " PRIMARY KEY (session_id, event_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS sse_events_created_at ON sse_events (created_at)",
+    "CREATE TABLE IF NOT EXISTS sse_counters (session_id TEXT PRIMARY KEY, last_id INTEGER NOT NULL, updated_at REAL NOT NULL)",
+    # Event count kept by triggers, so stats never scan the log (seeded once for logs predating it)
+    "CREATE TABLE IF NOT EXISTS sse_totals (id INTEGER PRIMARY KEY CHECK (id = 0), events INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO sse_totals (id, events) SELECT 0, COUNT(*) FROM sse_events "
+    "WHERE NOT EXISTS (SELECT 1 FROM sse_totals)",
+    "CREATE TRIGGER IF NOT EXISTS sse_events_added AFTER INSERT ON sse_events "
+    "BEGIN UPDATE sse_totals SET events = events + 1 WHERE id = 0; END",
+    "CREATE TRIGGER IF NOT EXISTS sse_events_removed AFTER DELETE ON sse_events "
+    "BEGIN UPDATE sse_totals SET events = events - 1 WHERE id = 0; END",
+)
+
+# Allocating event IDs: one upsert bumps each session's counter and returns it
+_ALLOCATE = "INSERT INTO sse_counters (session_id, last_id, updated_at) VALUES "
+_ROW = "(?, 1, ?)"
+_RETURNING = (
+    " ON CONFLICT (session_id) DO UPDATE SET last_id = last_id + 1, updated_at = excluded.updated_at"
+    " RETURNING session_id, last_id"
+)
+_ALLOCATE_ROWS = 500  # Sessions per upsert, well within SQLite's bound-parameter limit
+_INSERT_EVENT = "INSERT OR REPLACE INTO sse_events (session_id, event_id, payload, created_at) VALUES (?, ?, ?, ?)"
+
+
+class SQLiteEventLog(SSEEventBuffer):
+    """Append-only SSE event log in SQLite, shared by the workers of one host."""
+
+    durable = True
+
+    def __init__(
+        self,
+        path: str,
+        retention: float = DEFAULT_SSE_LOG_RETENTION,
+        max_buffer_size: int = DEFAULT_SSE_BUFFER_SIZE,
+    ) -> None:
+        """
+        Args:
+            path: Database file (created if missing)
+            retention: Seconds an event stays replayable
+            max_buffer_size: Events kept per session (older ones are compacted away)
+        """
+        super().__init__(max_buffer_size=max_buffer_size)
+        self.path = path
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._appended = 0
+        self._replayed = 0
+        self._compacted = 0
+        self._db()  # Create the schema now so configuration errors surface early
+
+    def _db(self) -> sqlite3.Connection:
+        """This process's connection (reopened after fork: connections must not cross it)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA recursive_triggers=ON")  # Rows replaced by INSERT OR REPLACE fire the delete trigger
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    # ------------------------------------------------------------------
+    # SSEEventBuffer interface
+    # ------------------------------------------------------------------
+
+    def next_event_id(self, session_id: str) -> int:
+        """Get next SSE event ID for a session (unique across workers and restarts)."""
+        with self._lock:
+            ((_, event_id),) = self._db().execute(_ALLOCATE + _ROW + _RETURNING, (session_id, time.time())).fetchall()
+        self._counters[session_id] = event_id  # Marks the session as streaming from this process
+        return int(event_id)
+
+    def buffer_event(self, session_id: str, event_id: int, data: dict[str, Any] | bytes) -> None:
+        """Append an SSE event to the log."""
+        payload = data if isinstance(data, bytes) else serialize_mcp_response(data)
+        with self._lock:
+            self._db().execute(_INSERT_EVENT, (session_id, event_id, payload, time.time()))
+        self._appended += 1
+
+    def append(self, session_ids: Iterable[str], payload: bytes) -> dict[str, int]:
+        """Log ``payload`` for every session in one transaction; returns the event ID assigned per session.
+
+        The IDs of a whole broadcast are allocated by one multi-row upsert
+        and the events written by one batched insert.  Blocking: the
+        notification router calls this from a worker thread.
+        """
+        targets = list(dict.fromkeys(session_ids))
+        if not targets:
+            return {}
+        now = time.time()
+        event_ids: dict[str, int] = {}
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                for start in range(0, len(targets), _ALLOCATE_ROWS):
+                    chunk = targets[start : start + _ALLOCATE_ROWS]
+                    rows = _ALLOCATE + ", ".join([_ROW] * len(chunk)) + _RETURNING
+                    event_ids.update(db.execute(rows, [v for sid in chunk for v in (sid, now)]).fetchall())
+                db.executemany(_INSERT_EVENT, [(sid, event_ids[sid], payload, now) for sid in targets])
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        self._counters.update(event_ids)
+        self._appended += len(targets)
+        return event_ids
+
+    def get_missed_payloads(self, session_id: str, last_event_id: int) -> list[tuple[int, bytes]]:
+        """Get serialized events after the given event ID, from whichever worker logged them."""
+        with self._lock:
+            rows = (
+                self._db()
+                .execute(
+                    "SELECT event_id, payload FROM sse_events WHERE session_id = ? AND event_id > ? AND created_at >= ? "
+                    "ORDER BY event_id",
+                    (session_id, last_event_id, time.time() - self.retention),
+                )
+                .fetchall()
+            )
+        self._replayed += len(rows)
+        return [(event_id, bytes(payload)) for event_id, payload in rows]
+
+    def cleanup_session(self, session_id: str) -> None:
+        """Forget a session locally; its logged events stay replayable by any worker."""
+        self._counters.pop(session_id, None)
+
+    def delete_session(self, session_id: str) -> None:
+        """Delete a terminated session's events and counter."""
+        self.cleanup_session(session_id)
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM sse_events WHERE session_id = ?", (session_id,))
+            db.execute("DELETE FROM sse_counters WHERE session_id = ?", (session_id,))
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def compact(self) -> int:
+        """Remove expired and surplus events; returns how many were removed."""
+        cutoff = time.time() - self.retention
+        with self._lock:
+            db = self._db()
+            removed = db.execute("DELETE FROM sse_events WHERE created_at < ?", (cutoff,)).rowcount
+            # Beyond the per-session limit (IDs are dense, so the newest N are above last_id - N)
+            removed += db.execute(
+                "DELETE FROM sse_events WHERE EXISTS (SELECT 1 FROM sse_counters c "
+                "WHERE c.session_id = sse_events.session_id AND sse_events.event_id <= c.last_id - ?)",
+                (self._max_buffer_size,),
+            ).rowcount
+            # Counters of sessions idle past the window (their IDs need not continue)
+            db.execute(
+                "DELETE FROM sse_counters WHERE updated_at < ? "
+                "AND NOT EXISTS (SELECT 1 FROM sse_events e WHERE e.session_id = sse_counters.session_id)",
+                (cutoff,),
+            )
+            # PASSIVE: every worker compacts, and none should wait on the others' readers and writers
+            db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        self._compacted += removed
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            (events,) = self._db().execute("SELECT events FROM sse_totals WHERE id = 0").fetchone()
+        return {
+            "backend": type(self).__name__,
+            "path": self.path,
+            "events": events,
+            "sessions": len(self._counters),
+            "per_session": self._max_buffer_size,
+            "retention": self.retention,
+            "appended": self._appended,
+            "replayed": self._replayed,
+            "compacted": self._compacted,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+def create_event_buffer(
+    url: str,
+    retention: float = DEFAULT_SSE_LOG_RETENTION,
+    max_buffer_size: int = DEFAULT_SSE_BUFFER_SIZE,
+) -> SSEEventBuffer:
+    """Create an SSE replay buffer from a URL.
+
+    Args:
+        url: ``memory://`` (in-process rings) or ``sqlite:///path/to/events.db``
+        retention: Seconds a durable log keeps events
+        max_buffer_size: Events kept per session
+
+    Raises:
+        ValueError: If the URL scheme is not supported.
+    """
+    scheme, _, rest = url.partition("://")
+    if scheme == "memory":
+        return SSEEventBuffer(max_buffer_size=max_buffer_size)
+    if scheme == "sqlite":
+        if not rest.startswith("/") or rest == "/":
+            raise ValueError(f"SQLite event log needs a path: {url!r}")
+        return SQLiteEventLog(rest[1:], retention=retention, max_buffer_size=max_buffer_size)
+    raise ValueError(f"Unsupported SSE event log URL: {url!r}")
+
+
+__all__ = ["SQLiteEventLog", "create_event_buffer"]
@@ -4,18 +4,128 @@
 SSE event buffering for MCP Streamable HTTP resumability.
 
 Manages per-session SSE event IDs and buffers for Last-Event-ID replay.
+
+Each session's buffer is a fixed-capacity ring of ``(event ID, payload)``
+where the payload is the serialized JSON message - serialized once when
+sent (and shared by every session a broadcast reaches), never again on
+replay.  Event IDs only grow, so the replay start is found by bisection.
+A byte budget across all sessions trims the globally oldest events first.
 """
 
+import logging
+from collections import deque
+from collections.abc import Iterable
 from typing import Any
 
+import orjson
+
+from ..constants import DEFAULT_SSE_BUFFER_MAX_BYTES, DEFAULT_SSE_BUFFER_SIZE, SSE_EVENT_OVERHEAD
+from ..types.serialization import serialize_mcp_response
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse_frame(event_id: int, payload: bytes) -> bytes:
+    """Build the SSE frame replaying one buffered event."""
+    return b"id: %d\r\ndata: %s\r\n\r\n" % (event_id, payload)
+
+
+class EventRing:
+    """Fixed-capacity ring of one session's events, oldest first.
+
+    Indexing yields ``(event ID, payload)``; each entry also carries the
+    buffer-wide sequence number used for oldest-first trimming.
+    """
+
+    __slots__ = ("_ids", "_payloads", "_seqs", "_start", "_size", "capacity", "nbytes")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._ids = [0] * capacity
+        self._payloads: list[bytes] = [b""] * capacity
+        self._seqs = [0] * capacity
+        self._start = 0
+        self._size = 0
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> tuple[int, bytes]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("event ring index out of range")
+        slot = (self._start + index) % self.capacity
+        return self._ids[slot], self._payloads[slot]
+
+    @property
+    def head_seq(self) -> int:
+        """Sequence number of the oldest entry (only meaningful when non-empty)."""
+        return self._seqs[self._start]
+
+    def append(self, event_id: int, payload: bytes, seq: int) -> int:
+        """Add an event, overwriting the oldest when full; returns bytes freed."""
+        freed = 0
+        if self._size == self.capacity:
+            freed = self.popleft()
+        slot = (self._start + self._size) % self.capacity
+        self._ids[slot], self._payloads[slot], self._seqs[slot] = event_id, payload, seq
+        self._size += 1
+        self.nbytes += len(payload) + SSE_EVENT_OVERHEAD
+        return freed
+
+    def popleft(self) -> int:
+        """Drop the oldest event; returns bytes freed."""
+        slot = self._start
+        freed = len(self._payloads[slot]) + SSE_EVENT_OVERHEAD
+        self._payloads[slot] = b""
+        self._start = (slot + 1) % self.capacity
+        self._size -= 1
+        self.nbytes -= freed
+        return freed
+
+    def since(self, last_event_id: int) -> list[tuple[int, bytes]]:
+        """Events with IDs above ``last_event_id``, found by bisection."""
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ids[(self._start + mid) % self.capacity] <= last_event_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return [self[i] for i in range(lo, self._size)]
+
 
 class SSEEventBuffer:
     """Manages SSE event IDs and buffering for session resumability."""
 
-    def __init__(self, max_buffer_size: int = 100) -> None:
-        self._buffers: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+    #: Whether buffered events survive this process (see SQLiteEventLog)
+    durable: bool = False
+
+    def __init__(
+        self,
+        max_buffer_size: int = DEFAULT_SSE_BUFFER_SIZE,
+        max_bytes: int = DEFAULT_SSE_BUFFER_MAX_BYTES,
+    ) -> None:
+        """
+        Args:
+            max_buffer_size: Events kept per session
+            max_bytes: Byte budget across all sessions (oldest events trimmed first)
+        """
+        if max_buffer_size < 1:
+            raise ValueError("max_buffer_size must be at least 1")
+        self._buffers: dict[str, EventRing] = {}
         self._counters: dict[str, int] = {}
         self._max_buffer_size = max_buffer_size
+        self.max_bytes = max_bytes
+        self._bytes = 0
+        self._events = 0  # Live entries across all rings
+        # Buffer-wide insertion order for trimming; entries whose event has
+        # since left its ring are skipped and periodically compacted away
+        self._order: deque[tuple[int, str]] = deque()
+        self._seq = 0
+        self._trimmed = 0
 
     def next_event_id(self, session_id: str) -> int:
         """Get next SSE event ID for a session."""
@@ -23,19 +133,102 @@ class SSEEventBuffer:
         self._counters[session_id] = counter
         return counter
 
-    def buffer_event(self, session_id: str, event_id: int, data: dict[str, Any]) -> None:
-        """Buffer an SSE event for resumability."""
-        buf = self._buffers.setdefault(session_id, [])
-        buf.append((event_id, data))
-        if len(buf) > self._max_buffer_size:
-            self._buffers[session_id] = buf[-self._max_buffer_size :]
+    def append(self, session_ids: Iterable[str], payload: bytes) -> dict[str, int]:
+        """Give each session its next event ID and buffer ``payload`` under it.
+
+        Returns the event ID assigned per session.
+        """
+        event_ids: dict[str, int] = {}
+        for session_id in session_ids:
+            event_id = event_ids[session_id] = self.next_event_id(session_id)
+            self.buffer_event(session_id, event_id, payload)
+        return event_ids
+
+    def buffer_event(self, session_id: str, event_id: int, data: dict[str, Any] | bytes) -> None:
+        """Buffer an SSE event for resumability.
+
+        Args:
+            session_id: Session the event was sent to
+            event_id: Its SSE event ID (increasing per session)
+            data: The message, or its serialized JSON (shared, not copied)
+        """
+        payload = data if isinstance(data, bytes) else serialize_mcp_response(data)
+        ring = self._buffers.get(session_id)
+        if ring is None:
+            ring = self._buffers[session_id] = EventRing(self._max_buffer_size)
+        self._seq += 1
+        if len(ring) == ring.capacity:
+            self._events -= 1
+        freed = ring.append(event_id, payload, self._seq)
+        self._events += 1
+        self._bytes += len(payload) + SSE_EVENT_OVERHEAD - freed
+        self._order.append((self._seq, session_id))
+        if self._bytes > self.max_bytes:
+            self._trim()
+        if len(self._order) > 2 * self._events + 1024:
+            self._compact()
+
+    def _live(self, seq: int, session_id: str) -> bool:
+        ring = self._buffers.get(session_id)
+        return isinstance(ring, EventRing) and len(ring) > 0 and seq >= ring.head_seq
+
+    def _trim(self) -> None:
+        """Drop the oldest events across all sessions until within the byte budget."""
+        while self._bytes > self.max_bytes and self._order:
+            seq, session_id = self._order.popleft()
+            ring = self._buffers.get(session_id)
+            if not isinstance(ring, EventRing) or not len(ring) or ring.head_seq != seq:
+                continue  # Already overwritten or cleaned up
+            self._bytes -= ring.popleft()
+            self._events -= 1
+            self._trimmed += 1
+
+    def _compact(self) -> None:
+        self._order = deque(entry for entry in self._order if self._live(*entry))
 
     def get_missed_events(self, session_id: str, last_event_id: int) -> list[tuple[int, dict[str, Any]]]:
         """Get events after the given event ID for resumability."""
-        buf = self._buffers.get(session_id, [])
-        return [(eid, data) for eid, data in buf if eid > last_event_id]
+        return [(eid, orjson.loads(payload)) for eid, payload in self.get_missed_payloads(session_id, last_event_id)]
+
+    def get_missed_payloads(self, session_id: str, last_event_id: int) -> list[tuple[int, bytes]]:
+        """Get serialized events after the given event ID (no decoding)."""
+        ring = self._buffers.get(session_id)
+        return ring.since(last_event_id) if ring is not None else []
+
+    def get_missed_frames(self, session_id: str, last_event_id: int) -> list[bytes]:
+        """Get ready-to-write SSE frames for the events after the given event ID."""
+        return [format_sse_frame(eid, payload) for eid, payload in self.get_missed_payloads(session_id, last_event_id)]
 
     def cleanup_session(self, session_id: str) -> None:
         """Remove all event data for a session."""
-        self._buffers.pop(session_id, None)
+        ring = self._buffers.pop(session_id, None)
+        if isinstance(ring, EventRing):  # The handler's backward-compat view lets callers store plain lists
+            self._bytes -= ring.nbytes
+            self._events -= len(ring)
         self._counters.pop(session_id, None)
+
+    def delete_session(self, session_id: str) -> None:
+        """Remove a terminated session's events everywhere they are kept."""
+        self.cleanup_session(session_id)
+
+    def compact(self) -> int:
+        """Remove events no longer worth replaying; returns how many (rings trim as they go)."""
+        return 0
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Release connections."""
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get buffer metrics."""
+        return {
+            "backend": type(self).__name__,
+            "sessions": len(self._buffers),
+            "events": self._events,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "per_session": self._max_buffer_size,
+            "trimmed": self._trimmed,
+        }
+
+
+__all__ = ["EventRing", "SSEEventBuffer", "format_sse_frame"]
@@ -6,11 +6,22 @@ ChukMCPServer Protocol Handler - Core MCP protocol implementation with chuk_mcp
 
 import asyncio
 import logging
+import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import partial
 from typing import Any
 
+from ..bulkheads import ToolBulkhead
 from ..constants import (
+    DEFAULT_EXECUTOR_POLICY,
+    DEFAULT_MAINTENANCE_INTERVAL,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SESSION_MAX_AGE,
+    DEFAULT_TASK_RETENTION,
+    DEFAULT_TOOL_CACHE_MAX_BYTES,
+    DEFAULT_VIEW_DATA_TTL,
+    EXECUTOR_PROCESS,
     JSONRPC_KEY,
     JSONRPC_VERSION,
     KEY_CAPABILITIES,
@@ -50,20 +61,85 @@ from ..constants import (
     McpMethod,
     McpTaskMethod,
 )
+from ..context import get_outbound_channel, get_resource_links, set_session_id
+from ..directory_mounts import DirectoryMount
+from ..executors import HandlerExecutor, set_handler_executor
+from ..maintenance import MaintenanceTask
+from ..result_cache import (
+    CacheKey,
+    ToolCachePolicy,
+    ToolResultCache,
+    canonical_arguments,
+    default_scope_for,
+    has_cacheable_hints,
+)
+from ..singleflight import SingleFlight
+from ..supervisor import WorkerChannel
 from ..types import (
+    BlobContent,
     PromptHandler,
     ResourceHandler,
     ServerCapabilities,
     ServerInfo,
+    ToolBusyError,
     ToolHandler,
+    configure_resource_cache,
     format_content,
 )
-from .events import SSEEventBuffer
+from ..types.serialization import PreSerializedResponse, splice_result_response
+from ..uri_templates import UriTemplateMatcher
+from .bus import NotificationBus
+from .events import EventRing, SSEEventBuffer
+from .notifications import NotificationRouter
 from .session_manager import SessionManager
+from .session_store import SessionStore
+from .snapshots import ListSnapshot, ListSnapshotCache, VersionedRegistry
+from .subscriptions import SubscriptionIndex
 from .tasks import TaskManager
 
 logger = logging.getLogger(__name__)
 
+# Method handler signature used by the dispatch table: (params, msg_id, oauth_token)
+MethodHandler = Callable[[dict[str, Any], Any, str | None], Awaitable[tuple[dict[str, Any] | None, str | None]]]
+
+# Methods allowed before initialization when strict_init is enabled
+_PRE_INIT_METHODS = frozenset({McpMethod.INITIALIZE, McpMethod.INITIALIZED, McpMethod.PING})
+
+# Ext-apps (MCP Apps) host methods — never handled by the server
+_UI_METHOD_PREFIX = "ui/"
+
+# Per-process counts in the performance stats that add up across prefork
+# workers (section -> keys); limits, registry sizes and ratios are not summed
+_WORKER_COUNTERS: dict[str, tuple[str, ...]] = {
+    "sessions": ("active", "created", "evictions", "expirations", "adopted"),
+    "executor": ("queue_depth", "active", "completed", "failed"),
+    "process_pool": ("alive", "busy", "queue_depth", "submitted", "completed", "failed", "cancelled", "restarts"),
+    "tool_cache": ("entries", "bytes", "hits", "misses", "evictions", "expirations", "invalidations"),
+    "coalescing": ("in_flight", "executions", "coalesced", "abandoned"),
+    "resource_cache": (
+        "entries",
+        "bytes",
+        "compressed_entries",
+        "hits",
+        "stale_hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "rejected",
+    ),
+    "notifications": ("streams", "queued", "delivered", "buffered", "dropped", "unrouted", "broadcasts"),
+    "sse_replay": ("sessions", "appended", "replayed", "compacted", "trimmed"),
+    "subscriptions": ("sessions", "subscriptions"),
+    "bus": ("published", "received", "errors", "dropped"),
+}
+
+
+async def _execute_with_links(execute: Callable[[], Awaitable[Any]]) -> tuple[Any, list[Any]]:
+    """Run a coalesced tool execution, returning its result and the resource links it added."""
+    links = get_resource_links()  # The leader's list, shared with the execution task's context
+    result = await execute()
+    return result, links if links is not None else []
+
 
 # ============================================================================
 # Protocol Handler with chuk_mcp Integration
@@ -81,6 +157,20 @@ class MCPProtocolHandler:
         extra_server_info: dict[str, Any] | None = None,
         rate_limit_rps: float | None = None,
         strict_init: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        executor: str = DEFAULT_EXECUTOR_POLICY,
+        executor_workers: int | None = None,
+        process_workers: int | None = None,
+        tool_cache_ttl: float | None = None,
+        tool_cache_max_bytes: int | None = None,
+        resource_cache_max_bytes: int | None = None,
+        resource_cache_compress_min_bytes: int | None = None,
+        maintenance_interval: float = DEFAULT_MAINTENANCE_INTERVAL,
+        session_max_age: int = DEFAULT_SESSION_MAX_AGE,
+        task_retention: float = DEFAULT_TASK_RETENTION,
+        session_store: SessionStore | None = None,
+        notification_bus: NotificationBus | None = None,
+        sse_events: SSEEventBuffer | None = None,
     ):
         # Use chuk_mcp types directly - no conversion needed
         self.server_info = server_info
@@ -88,13 +178,19 @@ class MCPProtocolHandler:
         self._extra_server_info = extra_server_info
         self.session_manager = SessionManager(
             on_evict=self._cleanup_session_state,
-            protected_sessions=self._get_protected_sessions,
+            is_protected=self._is_session_protected,
+            max_age=session_max_age,
+            store=session_store,
         )
 
-        # Tool, resource, and prompt registries (now use handlers)
-        self.tools: dict[str, ToolHandler] = {}
-        self.resources: dict[str, ResourceHandler] = {}
-        self.prompts: dict[str, PromptHandler] = {}
+        # Tool, resource, and prompt registries (now use handlers).
+        # Versioned so list snapshots know when to rebuild.
+        self._tools: VersionedRegistry[ToolHandler] = VersionedRegistry()
+        self._resources: VersionedRegistry[ResourceHandler] = VersionedRegistry()
+        self._prompts: VersionedRegistry[PromptHandler] = VersionedRegistry()
+
+        # Immutable per-generation snapshots backing the paginated list methods
+        self._list_snapshots = ListSnapshotCache(page_size=page_size)
 
         # OAuth provider getter function (optional)
         self.oauth_provider_getter = oauth_provider_getter
@@ -106,10 +202,18 @@ class MCPProtocolHandler:
         self.completion_providers: dict[str, Callable[..., Any]] = {}
 
         # Resource template registry
-        self.resource_templates: dict[str, Any] = {}
+        self._resource_templates: VersionedRegistry[Any] = VersionedRegistry()
+        # Compiled URI-template router, rebuilt when the template registry's generation changes
+        self._template_matcher: tuple[int, UriTemplateMatcher[Any]] | None = None
+
+        # Directory trees served as resources (see mount_directory)
+        self._directory_mounts: list[DirectoryMount] = []
 
-        # Resource subscription tracking (session_id → set of URIs)
-        self._resource_subscriptions: dict[str, set[str]] = {}
+        # Resource subscription tracking (session_id → set of URIs); with a notification
+        # bus it also holds other workers' subscriptions, since any worker may hold a stream
+        self._resource_subscriptions = SubscriptionIndex()
+        # Sessions subscribed through another worker that this one does not serve → last event time
+        self._remote_subscribers: dict[str, float] = {}
 
         # In-flight request tracking for cancellation support
         self._in_flight_requests: dict[Any, asyncio.Task[Any]] = {}
@@ -117,8 +221,36 @@ class MCPProtocolHandler:
         # Task manager for MCP 2025-11-25 Tasks system
         self._task_manager = TaskManager()
 
-        # SSE event buffer for resumability
-        self._sse_events = SSEEventBuffer()
+        # SSE event buffer for resumability (a durable log lets any worker replay, even after a restart)
+        self._sse_events = sse_events if sse_events is not None else SSEEventBuffer()
+
+        # Per-session outbound queues of streamable-HTTP GET streams
+        self.notifications = NotificationRouter(self._sse_events)
+        self._deliveries: set[asyncio.Future[set[str]]] = set()  # Routing of bus events in progress
+
+        # Carries resource-updated / list_changed events to the other workers,
+        # whose GET streams this process cannot reach (started by the lifespan)
+        self.notification_bus = notification_bus
+
+        # Where synchronous tool/resource/prompt handlers run (server default;
+        # handlers may override with executor="thread"/"process"/"inline")
+        self._executor = HandlerExecutor(
+            default_policy=executor, max_workers=executor_workers, process_workers=process_workers
+        )
+
+        # Per-tool concurrency limits (tool name → bulkhead), built from @tool(max_concurrency=...)
+        self._tool_bulkheads: dict[str, ToolBulkhead] = {}
+
+        # Coalesces identical concurrent calls of read-only/idempotent tools
+        self._single_flight = SingleFlight()
+
+        # Opt-in tools/call result cache (per-tool cache_ttl, or server-wide for hinted tools)
+        self._tool_cache = ToolResultCache(
+            max_bytes=tool_cache_max_bytes or DEFAULT_TOOL_CACHE_MAX_BYTES, default_ttl=tool_cache_ttl
+        )
+
+        # Content of caching resources lives in the process-wide, byte-budgeted ResourceCache
+        self._resource_cache = configure_resource_cache(resource_cache_max_bytes, resource_cache_compress_min_bytes)
 
         # Pre-initialize enforcement (off by default for backward compat)
         self._strict_init = strict_init
@@ -131,13 +263,78 @@ class MCPProtocolHandler:
             burst = rate_limit_rps * 2  # Default burst = 2x rate
             self._rate_limiter = TokenBucketRateLimiter(rate=rate_limit_rps, burst=burst)
 
-        # SSR data cache: resource_uri → structuredContent from last tool call.
-        # Consumed (popped) on next resources/read so the view can be server-rendered.
-        self._view_data_cache: dict[str, Any] = {}
+        # SSR data cache: resource_uri → (structuredContent from last tool call, monotonic time stored).
+        # Consumed (popped) on next resources/read so the view can be server-rendered;
+        # entries never read are dropped by the maintenance sweep.
+        self._view_data_cache: dict[str, tuple[Any, float]] = {}
+
+        # Periodic sweep of idle sessions, rate-limit buckets, finished tasks and
+        # expired cache entries (started/stopped by the HTTP server's lifespan)
+        self._task_retention = task_retention
+        self.maintenance = self._build_maintenance(maintenance_interval)
+
+        # Link to the prefork supervisor when this process is one of several HTTP workers
+        self.worker_channel: WorkerChannel | None = None
+
+        # Precompiled method → handler dispatch table (extend via register_method)
+        self._method_handlers: dict[str, MethodHandler] = self._build_dispatch_table()
+        self._builtin_methods = frozenset(self._method_handlers)
 
         # Don't log during init to keep stdio mode clean
         logger.debug("MCP protocol handler initialized with chuk_mcp")
 
+    # ================================================================
+    # Component registries
+    # ================================================================
+
+    @staticmethod
+    def _adopt_registry(current: VersionedRegistry[Any], value: dict[str, Any]) -> VersionedRegistry[Any]:
+        """Wrap a replacement registry dict, continuing the generation sequence."""
+        registry: VersionedRegistry[Any] = VersionedRegistry(value)
+        registry.generation = current.generation + 1
+        return registry
+
+    @property
+    def tools(self) -> VersionedRegistry[ToolHandler]:
+        """Registered tool handlers by name."""
+        return self._tools
+
+    @tools.setter
+    def tools(self, value: dict[str, ToolHandler]) -> None:
+        self._tools = self._adopt_registry(self._tools, value)
+
+    @property
+    def resources(self) -> VersionedRegistry[ResourceHandler]:
+        """Registered resource handlers by URI."""
+        return self._resources
+
+    @resources.setter
+    def resources(self, value: dict[str, ResourceHandler]) -> None:
+        self._resources = self._adopt_registry(self._resources, value)
+
+    @property
+    def prompts(self) -> VersionedRegistry[PromptHandler]:
+        """Registered prompt handlers by name."""
+        return self._prompts
+
+    @prompts.setter
+    def prompts(self, value: dict[str, PromptHandler]) -> None:
+        self._prompts = self._adopt_registry(self._prompts, value)
+
+    @property
+    def resource_templates(self) -> VersionedRegistry[Any]:
+        """Registered resource template handlers by URI template."""
+        return self._resource_templates
+
+    @resource_templates.setter
+    def resource_templates(self, value: dict[str, Any]) -> None:
+        self._resource_templates = self._adopt_registry(self._resource_templates, value)
+
+    @property
+    def page_size(self) -> int:
+        """Page size used by the paginated list methods."""
+        return self._list_snapshots.page_size
+
     # ================================================================
     # Backward-compatible properties for extracted subsystems
     # ================================================================
@@ -148,7 +345,7 @@ class MCPProtocolHandler:
         return self._task_manager._task_store
 
     @property
-    def _sse_event_buffers(self) -> dict[str, list[tuple[int, dict[str, Any]]]]:
+    def _sse_event_buffers(self) -> dict[str, EventRing]:
         """Backward-compat access to SSE event buffers."""
         return self._sse_events._buffers
 
@@ -173,6 +370,9 @@ class MCPProtocolHandler:
         can ``resources/read`` the view HTML inline.
         """
         self.tools[tool.name] = tool
+        self._tool_bulkheads.pop(tool.name, None)
+        self._tool_bulkhead(tool)
+        self._tool_cache.invalidate(tool.name)
         if tool.meta and not getattr(self.capabilities, "experimental", None):
             if hasattr(self.capabilities, "enable_experimental"):
                 self.capabilities.enable_experimental()
@@ -186,6 +386,69 @@ class MCPProtocolHandler:
 
         logger.debug(f"Registered tool: {tool.name}")
 
+    def _tool_bulkhead(self, tool: ToolHandler) -> ToolBulkhead | None:
+        """Get (or build) the bulkhead enforcing a tool's concurrency limit, if it has one."""
+        max_concurrency = tool.max_concurrency
+        if not isinstance(max_concurrency, int):
+            return None
+        bulkhead = self._tool_bulkheads.get(tool.name)
+        limits = (max_concurrency, tool.queue_size, tool.queue_timeout)
+        if bulkhead is None or bulkhead.limits != limits:
+            bulkhead = ToolBulkhead(tool.name, *limits)
+            self._tool_bulkheads[tool.name] = bulkhead
+        return bulkhead
+
+    def _tool_call_keys(
+        self, tool: ToolHandler, arguments: dict[str, Any]
+    ) -> tuple[tuple[CacheKey, ToolCachePolicy] | None, CacheKey | None, dict[str, Any] | None]:
+        """Resolve the result-cache slot and single-flight key for a call.
+
+        Either is ``None`` when the tool does not use it (or the arguments do
+        not validate, in which case ``execute()`` reports the error).  The
+        validated arguments are returned too, so ``execute()`` need not
+        validate them a second time; they are ``None`` when no key was needed.
+        """
+        policy = self._tool_cache.policy_for(tool)
+        coalesce = tool.coalesce if isinstance(tool.coalesce, bool) else has_cacheable_hints(tool)
+        if policy is None and not coalesce:
+            return None, None, None
+        try:
+            validated = tool._validate_and_convert_arguments(arguments)
+        except Exception:
+            return None, None, None
+
+        cache_slot = None
+        if policy is not None:
+            key = self._tool_cache.make_key(tool.name, policy.scope, validated)
+            cache_slot = None if key is None else (key, policy)
+        flight_key = None
+        if coalesce:
+            # Only coalesce callers that could share a cached result
+            scope = policy.scope if policy is not None else default_scope_for(tool)
+            flight_key = self._tool_cache.make_key(tool.name, scope, validated)
+        return cache_slot, flight_key, validated
+
+    def invalidate_tool_cache(self, tool_name: str | None = None, arguments: dict[str, Any] | None = None) -> int:
+        """Drop cached tool results.
+
+        Args:
+            tool_name: Tool whose results to drop (None = every tool)
+            arguments: Only drop the result for these arguments (requires ``tool_name``)
+
+        Returns:
+            Number of cache entries removed
+        """
+        if arguments is None or tool_name is None:
+            return self._tool_cache.invalidate(tool_name)
+        tool = self._tools.get(tool_name)
+        if tool is None:
+            return 0
+        try:
+            encoded = canonical_arguments(tool._validate_and_convert_arguments(arguments))
+        except Exception:
+            return 0
+        return self._tool_cache.invalidate(tool_name, encoded)
+
     def _maybe_enable_ui_extension(self, meta: dict[str, Any]) -> None:
         """Enable the MCP Apps UI extension if this tool has a ``ui://`` resource."""
         if not isinstance(meta, dict):
@@ -275,7 +538,8 @@ class MCPProtocolHandler:
                 import json as _json
 
                 # Try SSR first if we have cached data from a recent tool call
-                cached_data = self._view_data_cache.pop(resource_uri, None)
+                cached_entry = self._view_data_cache.pop(resource_uri, None)
+                cached_data = cached_entry[0] if cached_entry else None
                 if cached_data:
                     try:
                         ssr_url = view_url.rstrip("/") + "/ssr"
@@ -362,6 +626,28 @@ class MCPProtocolHandler:
         self.resource_templates[template.uri_template] = template
         logger.debug(f"Registered resource template: {template.uri_template}")
 
+    def add_directory_mount(self, mount: DirectoryMount) -> None:
+        """Serve a mounted directory's files through resources/list and resources/read."""
+        self._directory_mounts.append(mount)
+        logger.debug(f"Mounted directory {mount.root} at {mount.uri_prefix}")
+
+    def match_resource_template(self, uri: str) -> tuple[Any, dict[str, Any]] | None:
+        """Find the resource template serving ``uri``.
+
+        Returns:
+            ``(template handler, template variables)``, or ``None`` if no template matches.
+        """
+        generation = self._resource_templates.generation
+        if self._template_matcher is None or self._template_matcher[0] != generation:
+            matcher: UriTemplateMatcher[Any] = UriTemplateMatcher()
+            for uri_template, template in self._resource_templates.items():
+                try:
+                    matcher.add(uri_template, template)
+                except ValueError as e:
+                    logger.warning(f"Resource template not routable: {e}")
+            self._template_matcher = (generation, matcher)
+        return self._template_matcher[1].match(uri)
+
     def get_resource_templates_list(self) -> list[dict[str, Any]]:
         """Get list of resource templates in MCP format."""
         return [t.to_mcp_format() for t in self.resource_templates.values()]
@@ -413,34 +699,206 @@ class MCPProtocolHandler:
 
         return prompts_list
 
+    def warm_up(self) -> None:
+        """Pre-start worker pools needed by the registered handlers.
+
+        Called by the server just before it starts serving, after all tools
+        are registered, so forked process workers can import every handler.
+        """
+        handlers = [
+            *self._tools.values(),
+            *self._resources.values(),
+            *self._prompts.values(),
+            *self._resource_templates.values(),
+        ]
+        if any(getattr(handler, "executor", None) == EXECUTOR_PROCESS for handler in handlers):
+            self._executor.start_process_pool()
+
     def get_performance_stats(self) -> dict[str, Any]:
         """Get performance statistics for monitoring.
 
-        Note: Cache-related metrics are not yet instrumented and return None.
+        Note: Prompt cache metrics are not yet instrumented and return None.
         """
 
         return {
             "tools": {
                 "count": len(self.tools),
-                "cache_hit_ratio": None,  # Not yet instrumented
+                "cache_hit_ratio": self._tool_cache.hit_ratio,
             },
             "resources": {
                 "count": len(self.resources),
-                "cache_hit_ratio": None,  # Not yet instrumented
+                "mounted_files": sum(len(mount) for mount in self._directory_mounts),
+                "cache_hit_ratio": self._resource_cache.hit_ratio,
             },
             "prompts": {
                 "count": len(self.prompts),
                 "cache_hit_ratio": None,  # Not yet instrumented
             },
-            "sessions": {"active": len(self.session_manager.sessions), "total": len(self.session_manager.sessions)},
+            "sessions": {
+                **self.session_manager.get_stats(),
+                "total": len(self.session_manager.sessions),
+            },
+            "executor": self._executor.get_stats(),
+            "tool_limits": {name: bulkhead.get_stats() for name, bulkhead in self._tool_bulkheads.items()},
+            "tool_cache": self._tool_cache.get_stats(),
+            "coalescing": self._single_flight.get_stats(),
+            "resource_cache": self._resource_cache.get_stats(),
+            "directory_mounts": [mount.get_stats() for mount in self._directory_mounts],
+            "notifications": self.notifications.get_stats(),
+            "sse_replay": self._sse_events.get_stats(),
+            "subscriptions": self._resource_subscriptions.get_stats(),
+            "maintenance": self.maintenance.get_stats(),
+            "bus": self.notification_bus.get_stats() if self.notification_bus is not None else None,
+            "workers": self.worker_channel.pod if self.worker_channel is not None else None,
             "cache": {
-                "tools_cached": None,  # Not yet instrumented
-                "resources_cached": None,  # Not yet instrumented
+                "tools_cached": len(self._tool_cache),
+                "resources_cached": len(self._resource_cache),
+                "resources_bytes": self._resource_cache.bytes,
                 "cache_age": None,  # Not yet instrumented
             },
             "status": "operational",
         }
 
+    def worker_snapshot(self) -> dict[str, Any]:
+        """This worker's report to the prefork supervisor.
+
+        ``counters`` holds per-process counts, which the supervisor sums
+        over the workers.  ``shared`` holds readings of backends every
+        worker sees alike (a shared session store, a durable event log),
+        which the pod reports once.
+        """
+        stats = self.get_performance_stats()
+        sections = {**stats, "process_pool": stats["executor"]["process_pool"]}
+        counters: dict[str, Any] = {"in_flight_requests": len(self._in_flight_requests)}
+        for section, keys in _WORKER_COUNTERS.items():
+            values = sections.get(section) or {}
+            counters[section] = {key: values[key] for key in keys if key in values}
+        if not self._sse_events.durable:  # The in-memory rings are this process's own
+            counters["sse_replay"].update(events=stats["sse_replay"]["events"], bytes=stats["sse_replay"]["bytes"])
+        shared: dict[str, Any] = {}
+        if self.session_manager.shared:
+            shared["session_store"] = stats["sessions"]["store"]
+        if self._sse_events.durable:
+            shared["sse_replay"] = stats["sse_replay"]
+        return {"counters": counters, "shared": shared}
+
+    # ================================================================
+    # Background maintenance
+    # ================================================================
+
+    def _build_maintenance(self, interval: float) -> MaintenanceTask:
+        maintenance = MaintenanceTask(interval)
+        maintenance.add_step("sessions", self.session_manager.expire_local)
+        if self.session_manager.store is not None:
+            maintenance.add_step("session_store", self.session_manager.expire_store, blocking=True)
+        if self._rate_limiter is not None:
+            max_idle = float(self.session_manager.max_age)
+            maintenance.add_step("rate_limiter", lambda: self._rate_limiter.cleanup_stale(max_idle))
+        maintenance.add_step("tasks", lambda: self._task_manager.collect_finished(self._task_retention))
+        maintenance.add_step("tool_cache", self._tool_cache.purge_expired)
+        maintenance.add_step("resource_cache", self._resource_cache.purge_expired)
+        maintenance.add_step("view_data", self._purge_view_data)
+        if self.notification_bus is not None:
+            maintenance.add_step("remote_subscriptions", self._purge_remote_subscriptions)
+        if self._sse_events.durable:
+            maintenance.add_step("sse_log", self._sse_events.compact, blocking=True)
+        return maintenance
+
+    def _purge_remote_subscriptions(self) -> int:
+        """Drop other workers' subscriptions of sessions idle here for ``max_age``; returns how many sessions.
+
+        A session this worker starts serving (e.g. its GET stream lands here)
+        expires with its other local state instead.
+        """
+        cutoff = time.monotonic() - self.session_manager.max_age
+        stale = [
+            sid
+            for sid, seen in self._remote_subscribers.items()
+            if seen < cutoff and sid not in self.session_manager.sessions
+        ]
+        for sid in stale:
+            del self._remote_subscribers[sid]
+            self._resource_subscriptions.remove_session(sid)
+        return len(stale)
+
+    def _purge_view_data(self, ttl: float = DEFAULT_VIEW_DATA_TTL) -> int:
+        """Drop SSR view data no resources/read consumed within ``ttl`` seconds; returns how many."""
+        cutoff = time.monotonic() - ttl
+        stale = [uri for uri, (_, stored_at) in self._view_data_cache.items() if stored_at < cutoff]
+        for uri in stale:
+            del self._view_data_cache[uri]
+        return len(stale)
+
+    # ================================================================
+    # Method dispatch
+    # ================================================================
+
+    def _build_dispatch_table(self) -> dict[str, MethodHandler]:
+        """Build the method → handler table used by ``handle_request``.
+
+        Every entry takes ``(params, msg_id, oauth_token)``.  Entries look up
+        the bound handler at call time so instance-level overrides still apply.
+        """
+        return {
+            McpMethod.INITIALIZE: lambda p, i, _t: self._handle_initialize(p, i),
+            McpMethod.INITIALIZED: lambda p, _i, _t: self._handle_initialized_notification(p),
+            McpMethod.PING: lambda _p, i, _t: self._handle_ping(i),
+            McpMethod.TOOLS_LIST: lambda p, i, _t: self._handle_tools_list(p, i),
+            McpMethod.TOOLS_CALL: lambda p, i, t: self._handle_tools_call(p, i, t),
+            McpMethod.RESOURCES_LIST: lambda p, i, _t: self._handle_resources_list(p, i),
+            McpMethod.RESOURCES_READ: lambda p, i, _t: self._handle_resources_read(p, i),
+            McpMethod.PROMPTS_LIST: lambda p, i, _t: self._handle_prompts_list(p, i),
+            McpMethod.PROMPTS_GET: lambda p, i, _t: self._handle_prompts_get(p, i),
+            McpMethod.LOGGING_SET_LEVEL: lambda p, i, _t: self._handle_logging_set_level(p, i),
+            McpMethod.COMPLETION_COMPLETE: lambda p, i, _t: self._handle_completion_complete(p, i),
+            McpMethod.RESOURCES_TEMPLATES_LIST: lambda p, i, _t: self._handle_resources_templates_list(p, i),
+            McpMethod.RESOURCES_SUBSCRIBE: lambda p, i, _t: self._handle_resources_subscribe(p, i),
+            McpMethod.RESOURCES_UNSUBSCRIBE: lambda p, i, _t: self._handle_resources_unsubscribe(p, i),
+            McpMethod.NOTIFICATIONS_CANCELLED: lambda p, _i, _t: self._handle_cancelled(p),
+            McpMethod.NOTIFICATIONS_ROOTS_LIST_CHANGED: lambda _p, _i, _t: self._handle_roots_list_changed(),
+            # Tasks system (MCP 2025-11-25)
+            McpTaskMethod.TASKS_GET: lambda p, i, _t: self._handle_tasks_get(p, i),
+            McpTaskMethod.TASKS_RESULT: lambda p, i, _t: self._handle_tasks_result(p, i),
+            McpTaskMethod.TASKS_LIST: lambda p, i, _t: self._handle_tasks_list(p, i),
+            McpTaskMethod.TASKS_CANCEL: lambda p, i, _t: self._handle_tasks_cancel(p, i),
+        }
+
+    def register_method(self, method: str, handler: Callable[[dict[str, Any]], Awaitable[Any]]) -> None:
+        """Register a handler for an additional JSON-RPC method.
+
+        The handler receives the request params and returns the JSON-RPC
+        ``result`` (``None`` becomes ``{}``).  For notifications the return
+        value is ignored and no response is sent.
+
+        Args:
+            method: JSON-RPC method name (e.g. ``"myorg/reindex"``)
+            handler: Async callable taking the params dict
+
+        Raises:
+            ValueError: If the method is already handled by the protocol itself
+        """
+        if method in self._builtin_methods or method.startswith(_UI_METHOD_PREFIX):
+            raise ValueError(f"Method '{method}' is handled by the MCP protocol and cannot be overridden")
+
+        async def _dispatch(params: dict[str, Any], msg_id: Any, oauth_token: str | None) -> tuple[Any, None]:  # noqa: ARG001
+            result = await handler(params)
+            if msg_id is None:
+                return None, None
+            return {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: {} if result is None else result}, None
+
+        self._method_handlers[method] = _dispatch
+        logger.debug("Registered method handler: %s", method)
+
+    def unregister_method(self, method: str) -> bool:
+        """Remove a handler added with ``register_method``.
+
+        Returns:
+            True if a custom handler was removed, False otherwise.
+        """
+        if method in self._builtin_methods:
+            return False
+        return self._method_handlers.pop(method, None) is not None
+
     async def handle_request(
         self, message: dict[str, Any], session_id: str | None = None, oauth_token: str | None = None
     ) -> tuple[dict[str, Any] | None, str | None]:
@@ -450,14 +908,15 @@ class MCPProtocolHandler:
             params = message.get(KEY_PARAMS, {})
             msg_id = message.get(KEY_ID)
 
-            logger.debug(f"Handling {method} (ID: {msg_id})")
+            logger.debug("Handling %s (ID: %s)", method, msg_id)
+
+            # Handlers in this request run under this server's executor policy
+            set_handler_executor(self._executor)
 
             # Set session context for this request
             if session_id:
-                from ..context import set_session_id
-
                 set_session_id(session_id)
-                self.session_manager.update_activity(session_id)
+                await self.session_manager.update_activity_async(session_id)
 
             # Rate limit check
             if self._rate_limiter is not None and session_id:
@@ -468,80 +927,36 @@ class MCPProtocolHandler:
             # Only applies when strict_init=True and session_id is provided but doesn't
             # map to a valid session (indicating the session expired or was never initialized).
             # Notifications (no msg_id) and lifecycle methods are always allowed through.
-            if self._strict_init:
-                _PRE_INIT_METHODS = {McpMethod.INITIALIZE, McpMethod.INITIALIZED, McpMethod.PING}
-                if (
-                    session_id is not None
-                    and method not in _PRE_INIT_METHODS
-                    and msg_id is not None  # Skip enforcement for notifications
-                    and self.session_manager.get_session(session_id) is None
-                ):
-                    return self._create_error_response(
-                        msg_id, JsonRpcError.INVALID_REQUEST, "Server not initialized"
-                    ), None
+            if (
+                self._strict_init
+                and session_id is not None
+                and msg_id is not None  # Skip enforcement for notifications
+                and method not in _PRE_INIT_METHODS
+                and await self.session_manager.get_session_async(session_id) is None
+            ):
+                return self._create_error_response(msg_id, JsonRpcError.INVALID_REQUEST, "Server not initialized"), None
+
+            # Route to the appropriate handler (single dict lookup)
+            handler = self._method_handlers.get(method) if isinstance(method, str) else None
+            if handler is not None:
+                return await handler(params, msg_id, oauth_token)
 
-            # Route to appropriate handler
-            if method == McpMethod.INITIALIZE:
-                return await self._handle_initialize(params, msg_id)
-            elif method == McpMethod.INITIALIZED:
-                logger.debug("✅ Initialized notification received")
-                return None, None  # Notifications don't return responses
-            elif method == McpMethod.PING:
-                return await self._handle_ping(msg_id)
-            elif method == McpMethod.TOOLS_LIST:
-                return await self._handle_tools_list(params, msg_id)
-            elif method == McpMethod.TOOLS_CALL:
-                return await self._handle_tools_call(params, msg_id, oauth_token)
-            elif method == McpMethod.RESOURCES_LIST:
-                return await self._handle_resources_list(params, msg_id)
-            elif method == McpMethod.RESOURCES_READ:
-                return await self._handle_resources_read(params, msg_id)
-            elif method == McpMethod.PROMPTS_LIST:
-                return await self._handle_prompts_list(params, msg_id)
-            elif method == McpMethod.PROMPTS_GET:
-                return await self._handle_prompts_get(params, msg_id)
-            elif method == McpMethod.LOGGING_SET_LEVEL:
-                return await self._handle_logging_set_level(params, msg_id)
-            elif method == McpMethod.COMPLETION_COMPLETE:
-                return await self._handle_completion_complete(params, msg_id)
-            elif method == McpMethod.RESOURCES_TEMPLATES_LIST:
-                return await self._handle_resources_templates_list(params, msg_id)
-            elif method == McpMethod.RESOURCES_SUBSCRIBE:
-                return await self._handle_resources_subscribe(params, msg_id)
-            elif method == McpMethod.RESOURCES_UNSUBSCRIBE:
-                return await self._handle_resources_unsubscribe(params, msg_id)
-            elif method == McpMethod.NOTIFICATIONS_CANCELLED:
-                self._handle_cancelled_notification(params)
-                return None, None  # Notification, no response
-            elif method == McpMethod.NOTIFICATIONS_ROOTS_LIST_CHANGED:
-                logger.debug("Roots list changed notification received")
-                return None, None  # Notification, no response
-            # Tasks system (MCP 2025-11-25)
-            elif method == McpTaskMethod.TASKS_GET:
-                return await self._handle_tasks_get(params, msg_id)
-            elif method == McpTaskMethod.TASKS_RESULT:
-                return await self._handle_tasks_result(params, msg_id)
-            elif method == McpTaskMethod.TASKS_LIST:
-                return await self._handle_tasks_list(params, msg_id)
-            elif method == McpTaskMethod.TASKS_CANCEL:
-                return await self._handle_tasks_cancel(params, msg_id)
             # Ext-apps protocol methods (ui/*) — handled by the host, not the server
-            elif method and isinstance(method, str) and method.startswith("ui/"):
+            if isinstance(method, str) and method.startswith(_UI_METHOD_PREFIX):
                 if msg_id is None:
                     # Notification — silently acknowledge
                     logger.debug("Received ext-apps notification %s — handled by host", method)
                     return None, None
-                else:
-                    return self._create_error_response(
-                        msg_id,
-                        JsonRpcError.METHOD_NOT_FOUND,
-                        f"Method '{method}' is an ext-apps protocol method handled by the host, not the MCP server",
-                    ), None
-            else:
                 return self._create_error_response(
-                    msg_id, JsonRpcError.METHOD_NOT_FOUND, f"Method not found: {method}"
+                    msg_id,
+                    JsonRpcError.METHOD_NOT_FOUND,
+                    f"Method '{method}' is an ext-apps protocol method handled by the host, not the MCP server",
                 ), None
 
+            return self._create_error_response(
+                msg_id, JsonRpcError.METHOD_NOT_FOUND, f"Method not found: {method}"
+            ), None
+
         except asyncio.CancelledError:
             raise  # Never swallow cancellation
         except (ValueError, TypeError, KeyError) as e:
@@ -553,19 +968,29 @@ class MCPProtocolHandler:
             logger.error(f"Error handling request: {e}", exc_info=True)
             return self._create_error_response(msg_id, JsonRpcError.INTERNAL_ERROR, "Internal server error"), None
 
+    async def _handle_initialized_notification(self, params: dict[str, Any]) -> tuple[None, None]:  # noqa: ARG002
+        """Handle notifications/initialized."""
+        logger.debug("✅ Initialized notification received")
+        return None, None  # Notifications don't return responses
+
+    async def _handle_cancelled(self, params: dict[str, Any]) -> tuple[None, None]:
+        """Handle notifications/cancelled."""
+        self._handle_cancelled_notification(params)
+        return None, None  # Notification, no response
+
+    async def _handle_roots_list_changed(self) -> tuple[None, None]:
+        """Handle notifications/roots/list_changed."""
+        logger.debug("Roots list changed notification received")
+        return None, None  # Notification, no response
+
     async def _handle_initialize(self, params: dict[str, Any], msg_id: Any) -> tuple[dict[str, Any], str]:
         """Handle initialize request using chuk_mcp."""
         client_info = params.get(KEY_CLIENT_INFO, {})
         protocol_version = params.get(KEY_PROTOCOL_VERSION, MCP_DEFAULT_PROTOCOL_VERSION)
         client_capabilities = params.get(KEY_CAPABILITIES, {})
 
-        # Create session
-        session_id = self.session_manager.create_session(client_info, protocol_version)
-
-        # Store client capabilities on the session
-        session = self.session_manager.get_session(session_id)
-        if session is not None:
-            session["client_capabilities"] = client_capabilities
+        # Create session (client capabilities are stored with it)
+        session_id = await self.session_manager.create_session_async(client_info, protocol_version, client_capabilities)
 
         # Build response using chuk_mcp types directly
         server_info_dict = self.server_info.model_dump(exclude_none=True)
@@ -593,19 +1018,20 @@ class MCPProtocolHandler:
         """Handle ping request."""
         return {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: {}}, None
 
-    async def _handle_tools_list(self, params: dict[str, Any], msg_id: Any) -> tuple[dict[str, Any], None]:
+    async def _handle_tools_list(self, params: dict[str, Any], msg_id: Any) -> tuple[PreSerializedResponse, None]:
         """Handle tools/list request with pagination support."""
-        tools_list = self.get_tools_list()
-        result = self._paginate(tools_list, "tools", params)
+        snapshot = self._list_snapshots.get("tools", self._tools.generation, self._listed_tool_bytes)
+        return self._snapshot_page_response(snapshot, params, msg_id), None
 
-        response = {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: result}
+    def _listed_tool_bytes(self) -> list[bytes]:
+        """Pre-serialized bytes of every tool shown in tools/list (app-only tools excluded)."""
+        from ..constants import MCP_APPS_VISIBILITY_APP_ONLY
 
-        logger.debug(f"Returning {len(result['tools'])} tools")
-        return response, None
+        return [tool.to_mcp_bytes() for tool in self._tools.values() if tool.visibility != MCP_APPS_VISIBILITY_APP_ONLY]
 
     async def _handle_tools_call(
         self, params: dict[str, Any], msg_id: Any, oauth_token: str | None = None
-    ) -> tuple[dict[str, Any], None]:
+    ) -> tuple[dict[str, Any] | PreSerializedResponse, None]:
         """Handle tools/call request."""
         task_id: str | None = None
         tool_name: str = params.get("name", "")
@@ -697,6 +1123,14 @@ class MCPProtocolHandler:
                         msg_id, JsonRpcError.INTERNAL_ERROR, "OAuth validation failed"
                     ), None
 
+            # Serve repeated calls of cacheable tools from the result cache
+            cache_slot, flight_key, validated_args = self._tool_call_keys(tool_handler, arguments)
+            if cache_slot is not None:
+                cached = self._tool_cache.get(cache_slot[0])
+                if cached is not None:
+                    logger.debug(f"🔧 Served tool {tool_name} from result cache")
+                    return splice_result_response(msg_id, cached), None
+
             # Set up server-to-client context if client supports it
             from ..context import (
                 set_elicitation_fn,
@@ -726,7 +1160,7 @@ class MCPProtocolHandler:
             # Extract progress token from request _meta and inject notify fn
             progress_token = params.get("_meta", {}).get("progressToken")
             set_progress_token(progress_token)
-            if progress_token and self._send_to_client:
+            if progress_token and self._outbound():
 
                 async def _progress_notify(
                     progress_token: str | int,
@@ -741,7 +1175,7 @@ class MCPProtocolHandler:
                 set_progress_notify_fn(None)
 
             # Set up log notification fn (always available if transport exists)
-            if self._send_to_client:
+            if self._outbound():
                 set_log_fn(
                     lambda level="info", data=None, logger_name=None: self.send_log_notification(
                         level=level, data=data, logger_name=logger_name
@@ -750,8 +1184,9 @@ class MCPProtocolHandler:
             else:
                 set_log_fn(None)
 
-            # Initialize resource links collection for this tool call
-            set_resource_links(None)
+            # Initialize resource links collection for this tool call. Start with a
+            # list so links added from a thread-pool handler land in the same object.
+            set_resource_links([])
 
             # Track in-flight request for cancellation support
             task = asyncio.current_task()
@@ -761,9 +1196,33 @@ class MCPProtocolHandler:
             # Create a task entry for this tool execution
             task_id = self._create_task(msg_id, tool_name)
 
+            bulkhead = self._tool_bulkhead(tool_handler)
+
+            async def _run_tool() -> Any:
+                # Arguments already validated while computing cache keys are not validated again
+                if validated_args is None:
+                    return await tool_handler.execute(arguments)
+                return await tool_handler.execute(validated_args, validated=True)
+
+            async def _execute() -> Any:
+                # Execute the tool, within its concurrency limit if it has one
+                if bulkhead is None:
+                    return await _run_tool()
+                await bulkhead.acquire()
+                try:
+                    return await _run_tool()
+                finally:
+                    bulkhead.release()
+
             try:
-                # Execute the tool
-                result = await tool_handler.execute(arguments)
+                if flight_key is None:
+                    result = await _execute()
+                else:
+                    # Identical concurrent calls share one execution (and its resource links)
+                    result, links = await self._single_flight.run(flight_key, partial(_execute_with_links, _execute))
+                    own_links = get_resource_links()
+                    if own_links is not None and own_links is not links:
+                        own_links.extend(links)
             except asyncio.CancelledError:
                 self._update_task_status(task_id, "cancelled")
                 logger.debug(f"Tool execution cancelled for {tool_name} (request {msg_id})")
@@ -805,8 +1264,6 @@ class MCPProtocolHandler:
                         tool_result["structuredContent"] = result.model_dump()
 
             # Add resource links if any were accumulated during execution
-            from ..context import get_resource_links
-
             links = get_resource_links()
             if links:
                 tool_result["_meta"] = tool_result.get("_meta", {})
@@ -815,6 +1272,7 @@ class MCPProtocolHandler:
 
             # Forward _meta.ui from tool definition to tool result so
             # clients (Claude.ai) know this result is linked to a view resource.
+            resource_uri = ""
             if "structuredContent" in tool_result:
                 ui_meta = (tool_handler.meta or {}).get(MCP_APPS_UI_KEY, {})
                 resource_uri = ui_meta.get(MCP_APPS_UI_RESOURCE_URI, "")
@@ -825,7 +1283,7 @@ class MCPProtocolHandler:
                 # Cache structuredContent for SSR: when resources/read is called
                 # for this tool's view, we can server-render with the actual data.
                 if resource_uri:
-                    self._view_data_cache[resource_uri] = tool_result["structuredContent"]
+                    self._view_data_cache[resource_uri] = (tool_result["structuredContent"], time.monotonic())
                     # Invalidate resource cache so next read triggers SSR fetch
                     resource = self.resources.get(resource_uri)
                     if resource:
@@ -834,12 +1292,26 @@ class MCPProtocolHandler:
 
             response = {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: tool_result}
 
+            # Cache successful results (view-linked results also feed SSR, so always re-run those)
+            if cache_slot is not None and not resource_uri and not tool_result.get("isError"):
+                self._tool_cache.put(cache_slot[0], cache_slot[1], tool_result)
+
             # Mark task completed
             self._update_task_status(task_id, "completed", result=tool_result)
 
             logger.debug(f"🔧 Executed tool {tool_name}")
             return response, None
 
+        except ToolBusyError as e:
+            # Concurrency limit reached: fail fast with a structured, retryable error
+            if task_id is not None:
+                self._update_task_status(task_id, "failed", error={"type": type(e).__name__, "message": str(e)})
+            return {
+                JSONRPC_KEY: JSONRPC_VERSION,
+                KEY_ID: msg_id,
+                KEY_ERROR: {"code": e.code, "message": str(e), "data": e.data},
+            }, None
+
         except Exception as e:
             # Check for URL elicitation required (MCP 2025-11-25)
             from ..types.errors import URLElicitationRequiredError
@@ -869,9 +1341,19 @@ class MCPProtocolHandler:
                 msg_id, JsonRpcError.INTERNAL_ERROR, f"Tool execution error: {type(e).__name__}: {e}"
             ), None
 
+    def _outbound(self) -> Callable[..., Any] | None:
+        """The channel for server-to-client messages of the current request.
+
+        Transports that multiplex requests (streamable HTTP) bind a channel per
+        request with ``set_outbound_channel``, so concurrent tool calls each
+        reach their own stream; otherwise the transport-wide ``_send_to_client``
+        (stdio) is used.
+        """
+        return get_outbound_channel() or self._send_to_client
+
     def _client_supports_sampling(self, tool_call_params: dict[str, Any]) -> bool:
         """Check if the current session's client supports sampling."""
-        if self._send_to_client is None:
+        if self._outbound() is None:
             return False
 
         # Find the session and check client capabilities
@@ -890,7 +1372,7 @@ class MCPProtocolHandler:
 
     def _client_supports_elicitation(self, tool_call_params: dict[str, Any]) -> bool:  # noqa: ARG002
         """Check if the current session's client supports elicitation."""
-        if self._send_to_client is None:
+        if self._outbound() is None:
             return False
 
         from ..context import get_session_id
@@ -908,7 +1390,7 @@ class MCPProtocolHandler:
 
     def _client_supports_roots(self, tool_call_params: dict[str, Any]) -> bool:  # noqa: ARG002
         """Check if the current session's client supports roots."""
-        if self._send_to_client is None:
+        if self._outbound() is None:
             return False
 
         from ..context import get_session_id
@@ -956,7 +1438,8 @@ class MCPProtocolHandler:
         Raises:
             RuntimeError: If transport callback is not available or client doesn't support sampling
         """
-        if self._send_to_client is None:
+        send = self._outbound()
+        if send is None:
             raise RuntimeError("No transport callback available for sending sampling requests")
 
         # Build the sampling/createMessage params
@@ -998,7 +1481,7 @@ class MCPProtocolHandler:
         }
 
         # Send to client and await response
-        response = await self._send_to_client(request)
+        response = await send(request)
 
         # Validate response
         if KEY_ERROR in response:
@@ -1030,7 +1513,8 @@ class MCPProtocolHandler:
         Raises:
             RuntimeError: If transport callback is not available
         """
-        if self._send_to_client is None:
+        send = self._outbound()
+        if send is None:
             raise RuntimeError("No transport callback available for sending elicitation requests")
 
         params: dict[str, Any] = {
@@ -1050,7 +1534,7 @@ class MCPProtocolHandler:
             KEY_PARAMS: params,
         }
 
-        response = await self._send_to_client(request)
+        response = await send(request)
 
         if KEY_ERROR in response:
             error = response[KEY_ERROR]
@@ -1077,7 +1561,8 @@ class MCPProtocolHandler:
             total: Optional total expected progress value
             message: Optional human-readable progress message
         """
-        if self._send_to_client is None:
+        send = self._outbound()
+        if send is None:
             return
 
         params: dict[str, Any] = {
@@ -1096,7 +1581,7 @@ class MCPProtocolHandler:
             KEY_PARAMS: params,
         }
 
-        await self._send_to_client(notification)
+        await send(notification)
 
     async def send_roots_request(self) -> list[dict[str, Any]]:
         """
@@ -1108,7 +1593,8 @@ class MCPProtocolHandler:
         Raises:
             RuntimeError: If transport callback is not available
         """
-        if self._send_to_client is None:
+        send = self._outbound()
+        if send is None:
             raise RuntimeError("No transport callback available for sending roots requests")
 
         request_id = f"roots-{uuid.uuid4().hex[:12]}"
@@ -1119,7 +1605,7 @@ class MCPProtocolHandler:
             KEY_PARAMS: {},
         }
 
-        response = await self._send_to_client(request)
+        response = await send(request)
 
         if KEY_ERROR in response:
             error = response[KEY_ERROR]
@@ -1133,63 +1619,112 @@ class MCPProtocolHandler:
         """
         Send a resource updated notification to subscribed clients.
 
+        Subscribers with a GET stream receive it on their own stream (and
+        it is buffered for replay); the transport-wide callback (stdio)
+        covers the rest.  With a notification bus, the other workers
+        notify the subscribers they hold.
+
         Args:
             uri: URI of the resource that was updated
         """
-        if self._send_to_client is None:
+        self._publish({"uri": uri})
+        subscribers = self._resource_subscriptions.subscribers(uri)
+        if not subscribers:
             return
-
-        # Find all sessions subscribed to this URI
-        for session_id, uris in self._resource_subscriptions.items():
-            if uri in uris:
-                notification = {
-                    JSONRPC_KEY: JSONRPC_VERSION,
-                    KEY_METHOD: McpMethod.NOTIFICATIONS_RESOURCES_UPDATED,
-                    KEY_PARAMS: {"uri": uri},
-                }
-                try:
-                    await self._send_to_client(notification)
-                except Exception as e:
-                    logger.debug(f"Failed to notify session {session_id[:8]}... of resource update: {e}")
-
-    async def notify_tools_list_changed(self) -> None:
-        """Send notifications/tools/list_changed to all connected clients."""
-        if self._send_to_client is None:
+        notification = self._resource_updated(uri)
+        pushed = await self.notifications.send(subscribers, notification)
+        if self._send_to_client is None or len(pushed) == len(subscribers):
             return
-        notification = {
-            JSONRPC_KEY: JSONRPC_VERSION,
-            KEY_METHOD: McpMethod.NOTIFICATIONS_TOOLS_LIST_CHANGED,
-        }
         try:
             await self._send_to_client(notification)
         except Exception as e:
-            logger.debug(f"Failed to send tools list_changed notification: {e}")
+            logger.debug(f"Failed to notify client of resource update {uri}: {e}")
 
-    async def notify_resources_list_changed(self) -> None:
-        """Send notifications/resources/list_changed to all connected clients."""
+    async def _broadcast(self, method: str) -> None:
+        """Fan a parameterless notification out to every stream (on every worker) and the transport-wide callback."""
+        self._publish({"method": method})
+        notification = {JSONRPC_KEY: JSONRPC_VERSION, KEY_METHOD: method}
+        await self.notifications.broadcast(notification)
         if self._send_to_client is None:
             return
-        notification = {
-            JSONRPC_KEY: JSONRPC_VERSION,
-            KEY_METHOD: McpMethod.NOTIFICATIONS_RESOURCES_LIST_CHANGED,
-        }
         try:
             await self._send_to_client(notification)
         except Exception as e:
-            logger.debug(f"Failed to send resources list_changed notification: {e}")
+            logger.debug(f"Failed to send {method} notification: {e}")
 
-    async def notify_prompts_list_changed(self) -> None:
-        """Send notifications/prompts/list_changed to all connected clients."""
-        if self._send_to_client is None:
-            return
-        notification = {
+    @staticmethod
+    def _resource_updated(uri: str) -> dict[str, Any]:
+        return {
             JSONRPC_KEY: JSONRPC_VERSION,
-            KEY_METHOD: McpMethod.NOTIFICATIONS_PROMPTS_LIST_CHANGED,
+            KEY_METHOD: McpMethod.NOTIFICATIONS_RESOURCES_UPDATED,
+            KEY_PARAMS: {"uri": uri},
         }
-        try:
-            await self._send_to_client(notification)
-        except Exception as e:
-            logger.debug(f"Failed to send prompts list_changed notification: {e}")
+
+    def _publish(self, event: dict[str, Any]) -> None:
+        if self.notification_bus is not None and self.notification_bus.running:
+            self.notification_bus.publish(event)
+
+    def deliver_bus_event(self, event: dict[str, Any]) -> None:
+        """Apply an event published by another worker.
+
+        Notifications are delivered to this worker's GET streams (the
+        transport-wide callback is not used since stdio never runs more than
+        one worker).  Subscription changes and terminations made on another
+        worker are mirrored here, since the session's stream may be held here.
+        """
+        session_id = event.get("session")
+        if isinstance(session_id, str):
+            self._apply_remote_session_event(session_id, event)
+            return
+        uri = event.get("uri")
+        if isinstance(uri, str):
+            subscribers = self._resource_subscriptions.subscribers(uri)
+            if subscribers:
+                self._deliver_later(self.notifications.send(subscribers, self._resource_updated(uri)))
+            return
+        method = event.get("method")
+        if isinstance(method, str) and method.startswith("notifications/"):
+            self._deliver_later(self.notifications.broadcast({JSONRPC_KEY: JSONRPC_VERSION, KEY_METHOD: method}))
+        else:
+            logger.debug(f"Ignoring notification bus event {event}")
+
+    def _deliver_later(self, delivery: Coroutine[Any, Any, set[str]]) -> None:
+        """Route a bus event as a task: the bus delivers synchronously, but routing may write the event log."""
+        task = asyncio.ensure_future(delivery)
+        self._deliveries.add(task)
+        task.add_done_callback(self._delivery_done)
+
+    def _delivery_done(self, task: "asyncio.Future[set[str]]") -> None:
+        self._deliveries.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Delivering a notification bus event failed: {task.exception()}")
+
+    def _apply_remote_session_event(self, session_id: str, event: dict[str, Any]) -> None:
+        if event.get("terminated"):
+            self._cleanup_session_state(session_id)
+            self.session_manager.discard(session_id)
+            return
+        subscribe, unsubscribe = event.get("subscribe"), event.get("unsubscribe")
+        if isinstance(subscribe, str):
+            self._resource_subscriptions.subscribe(session_id, subscribe)
+        elif isinstance(unsubscribe, str):
+            self._resource_subscriptions.unsubscribe(session_id, unsubscribe)
+        else:
+            logger.debug(f"Ignoring notification bus event {event}")
+            return
+        self._remote_subscribers[session_id] = time.monotonic()
+
+    async def notify_tools_list_changed(self) -> None:
+        """Send notifications/tools/list_changed to all connected clients."""
+        await self._broadcast(McpMethod.NOTIFICATIONS_TOOLS_LIST_CHANGED)
+
+    async def notify_resources_list_changed(self) -> None:
+        """Send notifications/resources/list_changed to all connected clients."""
+        await self._broadcast(McpMethod.NOTIFICATIONS_RESOURCES_LIST_CHANGED)
+
+    async def notify_prompts_list_changed(self) -> None:
+        """Send notifications/prompts/list_changed to all connected clients."""
+        await self._broadcast(McpMethod.NOTIFICATIONS_PROMPTS_LIST_CHANGED)
 
     async def send_log_notification(
         self,
@@ -1208,7 +1743,8 @@ class MCPProtocolHandler:
             data: Log data (any JSON-serializable value)
             logger_name: Optional logger name for filtering
         """
-        if self._send_to_client is None:
+        send = self._outbound()
+        if send is None:
             return
 
         params: dict[str, Any] = {"level": level, "data": data}
@@ -1222,7 +1758,7 @@ class MCPProtocolHandler:
         }
 
         try:
-            await self._send_to_client(notification)
+            await send(notification)
         except Exception as e:
             logger.debug(f"Failed to send log notification: {e}")
 
@@ -1283,7 +1819,8 @@ class MCPProtocolHandler:
 
         session_id = get_session_id()
         if session_id:
-            self._resource_subscriptions.setdefault(session_id, set()).add(uri)
+            self._resource_subscriptions.subscribe(session_id, uri)
+            self._publish({"session": session_id, "subscribe": uri})
             logger.debug(f"Session {session_id[:8]}... subscribed to {uri}")
 
         return {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: {}}, None
@@ -1295,35 +1832,80 @@ class MCPProtocolHandler:
         from ..context import get_session_id
 
         session_id = get_session_id()
-        if session_id and session_id in self._resource_subscriptions:
-            self._resource_subscriptions[session_id].discard(uri)
+        if session_id and self._resource_subscriptions.unsubscribe(session_id, uri):
+            self._publish({"session": session_id, "unsubscribe": uri})
             logger.debug(f"Session {session_id[:8]}... unsubscribed from {uri}")
 
         return {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: {}}, None
 
-    async def _handle_resources_list(self, params: dict[str, Any], msg_id: Any) -> tuple[dict[str, Any], None]:
+    async def _handle_resources_list(self, params: dict[str, Any], msg_id: Any) -> tuple[PreSerializedResponse, None]:
         """Handle resources/list request with pagination support."""
-        resources_list = self.get_resources_list()
-        result = self._paginate(resources_list, "resources", params)
+        for mount in self._directory_mounts:
+            await mount.refresh()
+        snapshot = self._list_snapshots.get(
+            "resources",
+            self._resources_list_generation(),
+            lambda: [
+                *(resource.to_mcp_bytes() for resource in self._resources.values()),
+                *(item for mount in self._directory_mounts for item in mount.item_bytes()),
+            ],
+        )
+        return self._snapshot_page_response(snapshot, params, msg_id), None
+
+    def _resources_list_generation(self) -> int:
+        # Strictly increases whenever the registry, the set of mounts or any mount's index changes
+        return (
+            self._resources.generation
+            + len(self._directory_mounts)
+            + sum(mount.generation for mount in self._directory_mounts)
+        )
 
-        response = {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: result}
+    async def _read_resource_content(self, uri: str) -> tuple[str, str | None] | None:
+        """Read ``uri`` from a concrete resource, a mounted directory or a template (in that order).
 
-        logger.debug(f"Returning {len(result['resources'])} resources")
-        return response, None
+        Returns:
+            ``(content, MIME type)``, or ``None`` if nothing serves ``uri``.
+        """
+        resource_handler = self.resources.get(uri)
+        if resource_handler is not None:
+            content = await resource_handler.read()
+            mime_type = resource_handler.mime_type
+        else:
+            for mount in self._directory_mounts:
+                mounted = await mount.read(uri)
+                if mounted is not None:
+                    return mounted
+            template_match = self.match_resource_template(uri)
+            if template_match is None:
+                return None
+            template, variables = template_match
+            content = await template.read(**variables)
+            mime_type = template.mime_type
+
+        if isinstance(content, BlobContent):
+            mime_type = content.mime_type or mime_type
+        return content, mime_type
 
     async def _handle_resources_read(self, params: dict[str, Any], msg_id: Any) -> tuple[dict[str, Any], None]:
         """Handle resources/read request."""
         uri = params.get("uri")
 
-        if uri not in self.resources:
-            return self._create_error_response(msg_id, JsonRpcError.INVALID_PARAMS, f"Unknown resource: {uri}"), None
-
         try:
-            resource_handler = self.resources[uri]
-            content = await resource_handler.read()
+            found = await self._read_resource_content(uri) if isinstance(uri, str) else None
+            if found is None:
+                return self._create_error_response(
+                    msg_id, JsonRpcError.INVALID_PARAMS, f"Unknown resource: {uri}"
+                ), None
+            content, mime_type = found
 
-            # Build resource content response
-            resource_content = {"uri": uri, "mimeType": resource_handler.mime_type, "text": content}
+            # Build resource content response (binary content goes in "blob", already base64)
+            resource_content: dict[str, Any] = {"uri": uri}
+            if isinstance(content, BlobContent):
+                resource_content["blob"] = content
+            else:
+                resource_content["text"] = content
+            if mime_type is not None:
+                resource_content["mimeType"] = mime_type
 
             response = {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: {"contents": [resource_content]}}
 
@@ -1338,25 +1920,21 @@ class MCPProtocolHandler:
 
     async def _handle_resources_templates_list(
         self, params: dict[str, Any], msg_id: Any
-    ) -> tuple[dict[str, Any], None]:
+    ) -> tuple[PreSerializedResponse, None]:
         """Handle resources/templates/list request with pagination support."""
-        templates_list = self.get_resource_templates_list()
-        result = self._paginate(templates_list, "resourceTemplates", params)
-
-        response = {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: result}
-
-        logger.debug(f"Returning {len(result['resourceTemplates'])} resource templates")
-        return response, None
+        snapshot = self._list_snapshots.get(
+            "resourceTemplates",
+            self._resource_templates.generation,
+            lambda: [template.to_mcp_bytes() for template in self._resource_templates.values()],
+        )
+        return self._snapshot_page_response(snapshot, params, msg_id), None
 
-    async def _handle_prompts_list(self, params: dict[str, Any], msg_id: Any) -> tuple[dict[str, Any], None]:
+    async def _handle_prompts_list(self, params: dict[str, Any], msg_id: Any) -> tuple[PreSerializedResponse, None]:
         """Handle prompts/list request with pagination support."""
-        prompts_list = self.get_prompts_list()
-        result = self._paginate(prompts_list, "prompts", params)
-
-        response = {JSONRPC_KEY: JSONRPC_VERSION, KEY_ID: msg_id, KEY_RESULT: result}
-
-        logger.info(f"Returning {len(result['prompts'])} prompts")
-        return response, None
+        snapshot = self._list_snapshots.get(
+            "prompts", self._prompts.generation, lambda: [prompt.to_mcp_bytes() for prompt in self._prompts.values()]
+        )
+        return self._snapshot_page_response(snapshot, params, msg_id), None
 
     async def _handle_prompts_get(self, params: dict[str, Any], msg_id: Any) -> tuple[dict[str, Any], None]:
         """Handle prompts/get request."""
@@ -1464,41 +2042,59 @@ class MCPProtocolHandler:
         return response, None
 
     @staticmethod
-    def _paginate(items: list[dict[str, Any]], key: str, params: dict[str, Any]) -> dict[str, Any]:
+    def _paginate(
+        items: list[dict[str, Any]], key: str, params: dict[str, Any], page_size: int = DEFAULT_PAGE_SIZE
+    ) -> dict[str, Any]:
         """Apply cursor-based pagination to a list of items.
 
+        Used for ad-hoc lists (tasks/list); registry lists are served from
+        generation-versioned snapshots instead.
+
         Args:
             items: Full list of items.
             key: Result key name (e.g., "tools", "resources", "prompts").
             params: Request params (may contain "cursor").
+            page_size: Maximum number of items per page.
 
         Returns:
             Result dict with paginated items and optional nextCursor.
         """
-        from ..constants import DEFAULT_PAGE_SIZE, KEY_CURSOR, KEY_NEXT_CURSOR
+        import base64
+
+        from ..constants import KEY_CURSOR, KEY_NEXT_CURSOR
 
         cursor = params.get(KEY_CURSOR)
         offset = 0
 
         if cursor is not None:
-            import base64
-
             try:
                 offset = int(base64.b64decode(cursor).decode())
             except (ValueError, Exception):
                 offset = 0  # Invalid cursor, start from beginning
 
-        page = items[offset : offset + DEFAULT_PAGE_SIZE]
+        page = items[offset : offset + page_size]
         result: dict[str, Any] = {key: page}
 
-        if offset + DEFAULT_PAGE_SIZE < len(items):
-            import base64
-
-            next_offset = offset + DEFAULT_PAGE_SIZE
+        if offset + page_size < len(items):
+            next_offset = offset + page_size
             result[KEY_NEXT_CURSOR] = base64.b64encode(str(next_offset).encode()).decode()
 
         return result
 
+    def _snapshot_page_response(
+        self, snapshot: ListSnapshot, params: dict[str, Any], msg_id: Any
+    ) -> PreSerializedResponse:
+        """Build a list response from a snapshot's pre-built page bytes.
+
+        Page bytes are spliced straight into the JSON-RPC body; only the id
+        is serialized per request.
+        """
+        from ..constants import KEY_CURSOR
+
+        page = self._list_snapshots.resolve(snapshot.key, snapshot, params.get(KEY_CURSOR))
+        logger.debug("Returning %s page (generation %d)", snapshot.key, snapshot.generation)
+        return splice_result_response(msg_id, page)
+
     # ================================================================
     # Session lifecycle helpers
     # ================================================================
@@ -1509,31 +2105,17 @@ class MCPProtocolHandler:
         Called both by explicit terminate_session() and by SessionManager
         eviction/expiry callbacks to prevent memory leaks.
         """
-        self._resource_subscriptions.pop(session_id, None)
+        self._resource_subscriptions.remove_session(session_id)
+        self._remote_subscribers.pop(session_id, None)
+        self.notifications.forget(session_id)
         self._sse_events.cleanup_session(session_id)
         if self._rate_limiter is not None:
             self._rate_limiter.cleanup(session_id)
         logger.debug(f"Cleaned up state for session {session_id[:8]}...")
 
-    def _get_protected_sessions(self) -> set[str]:
-        """Return session IDs that should not be evicted (have in-flight requests)."""
-        protected: set[str] = set()
-        # In-flight requests are keyed by request_id, not session_id.
-        # Walk the task store to find sessions with active work.
-        for task in self._task_store.values():
-            if task.get("status") == "working":
-                request_id = task.get("requestId")
-                if request_id is not None and request_id in self._in_flight_requests:
-                    # The task doesn't store session_id directly, but we protect
-                    # any session that still has in-flight work by checking the
-                    # SSE buffers (only HTTP sessions using SSE have them).
-                    pass
-        # Simpler heuristic: protect sessions that have SSE event counters,
-        # since those are actively streaming.
-        for sid in self._sse_events._counters:
-            if sid in self.session_manager.sessions:
-                protected.add(sid)
-        return protected
+    def _is_session_protected(self, session_id: str) -> bool:
+        """Whether a session must not be evicted: sessions with SSE event counters are actively streaming."""
+        return session_id in self._sse_events._counters
 
     # ================================================================
     # Session termination (MCP 2025-11-25 Streamable HTTP)
@@ -1552,26 +2134,59 @@ class MCPProtocolHandler:
         if session is None:
             return False
 
-        # Clean up all per-session state
+        # Clean up all per-session state (and its durably logged events)
         self._cleanup_session_state(session_id)
+        self._sse_events.delete_session(session_id)
 
-        # Remove session
-        self.session_manager.sessions.pop(session_id, None)
-        logger.debug(f"Terminated session {session_id[:8]}...")
+        # Remove session (from the shared store too), and end its stream if another worker holds it
+        self.session_manager.remove_session(session_id)
+        self._terminated(session_id)
         return True
 
+    async def terminate_session_async(self, session_id: str) -> bool:
+        """:meth:`terminate_session` with the session store and durable event log calls run off the event loop."""
+        session = await self.session_manager.get_session_async(session_id)
+        if session is None:
+            return False
+        self._cleanup_session_state(session_id)
+        if self._sse_events.durable:
+            await asyncio.to_thread(self._sse_events.delete_session, session_id)
+        else:
+            self._sse_events.delete_session(session_id)
+        await self.session_manager.remove_session_async(session_id)
+        self._terminated(session_id)
+        return True
+
+    def _terminated(self, session_id: str) -> None:
+        self._publish({"session": session_id, "terminated": True})
+        logger.debug(f"Terminated session {session_id[:8]}...")
+
     def next_sse_event_id(self, session_id: str) -> int:
         """Get next SSE event ID for a session."""
         return self._sse_events.next_event_id(session_id)
 
-    def buffer_sse_event(self, session_id: str, event_id: int, data: dict[str, Any]) -> None:
-        """Buffer an SSE event for resumability."""
+    def buffer_sse_event(self, session_id: str, event_id: int, data: dict[str, Any] | bytes) -> None:
+        """Buffer an SSE event (the message or its serialized JSON) for resumability."""
         self._sse_events.buffer_event(session_id, event_id, data)
 
+    async def record_sse_event(self, session_id: str, data: bytes) -> int:
+        """Assign and buffer the ID of an event streamed in a POST response (off the loop for a durable log)."""
+        return await self.notifications.record(session_id, data)
+
     def get_missed_events(self, session_id: str, last_event_id: int) -> list[tuple[int, dict[str, Any]]]:
         """Get events after the given event ID for resumability."""
         return self._sse_events.get_missed_events(session_id, last_event_id)
 
+    def get_missed_frames(self, session_id: str, last_event_id: int) -> list[bytes]:
+        """Get the SSE frames of events after the given event ID, ready to write."""
+        return self._sse_events.get_missed_frames(session_id, last_event_id)
+
+    async def get_missed_frames_async(self, session_id: str, last_event_id: int) -> list[bytes]:
+        """:meth:`get_missed_frames`, reading a durable log off the event loop."""
+        if self._sse_events.durable:
+            return await asyncio.to_thread(self._sse_events.get_missed_frames, session_id, last_event_id)
+        return self._sse_events.get_missed_frames(session_id, last_event_id)
+
     # ================================================================
     # Tasks system (MCP 2025-11-25)
     # ================================================================
@@ -1601,7 +2216,9 @@ class MCPProtocolHandler:
 
     async def _handle_tasks_list(self, params: dict[str, Any], msg_id: Any) -> tuple[dict[str, Any], None]:
         """Handle tasks/list request with pagination."""
-        return await self._task_manager.handle_tasks_list(params, msg_id, self._paginate)
+        return await self._task_manager.handle_tasks_list(
+            params, msg_id, lambda items, key, p: self._paginate(items, key, p, self.page_size)
+        )
 
     async def _handle_tasks_cancel(self, params: dict[str, Any], msg_id: Any) -> tuple[dict[str, Any], None]:
         """Handle tasks/cancel request."""
@@ -1611,7 +2228,7 @@ class MCPProtocolHandler:
 
     async def send_task_status_notification(self, task_id: str) -> None:
         """Send a notifications/tasks/status to the client."""
-        await self._task_manager.send_task_status_notification(task_id, self._send_to_client)
+        await self._task_manager.send_task_status_notification(task_id, self._outbound())
 
     async def shutdown(self, timeout: float = 5.0) -> None:
         """Gracefully shut down the protocol handler.
@@ -1622,6 +2239,10 @@ class MCPProtocolHandler:
         Args:
             timeout: Maximum seconds to wait for in-flight requests.
         """
+        await self.maintenance.stop()
+        if self.notification_bus is not None:
+            await self.notification_bus.stop()
+
         # Wait for in-flight requests to finish
         if self._in_flight_requests:
             logger.debug(f"Waiting for {len(self._in_flight_requests)} in-flight requests (timeout={timeout}s)")
@@ -1641,6 +2262,9 @@ class MCPProtocolHandler:
         # Clear task store
         self._task_manager.clear()
 
+        # Release handler worker threads (already-running handlers finish on their own)
+        self._executor.shutdown(wait=False)
+
         logger.debug("Protocol handler shut down")
 
     def _create_error_response(self, msg_id: Any, code: int, message: str) -> dict[str, Any]:
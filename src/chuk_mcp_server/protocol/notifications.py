@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/protocol/notifications.py
+"""
+Notification routing for streamable-HTTP GET streams.
+
+Each session that opens a GET SSE stream gets a bounded outbound queue.
+Server-initiated notifications are routed to sessions rather than through
+the single transport callback:
+
+- :meth:`NotificationRouter.send` targets specific sessions (e.g. the
+  subscribers of an updated resource).
+- :meth:`NotificationRouter.broadcast` fans out to every session that has
+  opened a stream (e.g. ``list_changed`` events).
+
+A message is serialized once however many sessions receive it, assigned a
+per-session event ID and buffered in the :class:`SSEEventBuffer`, so a client
+that reconnects with ``Last-Event-ID`` replays what it missed.  A durable
+buffer is written in one batch per message from a worker thread, keeping
+database I/O off the event loop.  Queues never
+block the sender: when a slow client's queue is full the message is dropped
+from the live stream (it stays in the replay buffer).
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from ..constants import DEFAULT_NOTIFICATION_QUEUE_SIZE
+from ..types.serialization import serialize_mcp_response
+from .events import SSEEventBuffer
+
+logger = logging.getLogger(__name__)
+
+# Queue items: (event ID, serialized message), or None to close the stream
+StreamItem = tuple[int, bytes] | None
+
+
+class NotificationRouter:
+    """Routes server-initiated messages to per-session outbound queues."""
+
+    def __init__(self, events: SSEEventBuffer, queue_size: int = DEFAULT_NOTIFICATION_QUEUE_SIZE) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self._events = events
+        self.queue_size = queue_size
+        self._queues: dict[str, asyncio.Queue[StreamItem]] = {}
+        self._streaming: set[str] = set()  # Sessions that opened a stream; broadcast targets
+        self._delivered = 0
+        self._buffered = 0
+        self._dropped = 0
+        self._unrouted = 0
+        self._broadcasts = 0
+        self._append_lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Streams
+    # ------------------------------------------------------------------
+
+    def open_stream(self, session_id: str) -> asyncio.Queue[StreamItem]:
+        """Register a GET stream for ``session_id``, closing any previous one."""
+        previous = self._queues.get(session_id)
+        if previous is not None:
+            self._close(previous)
+        queue: asyncio.Queue[StreamItem] = asyncio.Queue(maxsize=self.queue_size)
+        self._queues[session_id] = queue
+        self._streaming.add(session_id)
+        return queue
+
+    def close_stream(self, session_id: str, queue: asyncio.Queue[StreamItem]) -> None:
+        """Unregister ``queue`` (a newer stream for the session is left alone).
+
+        The session stays a broadcast target, so events are buffered for
+        its reconnect.
+        """
+        if self._queues.get(session_id) is queue:
+            del self._queues[session_id]
+
+    def forget(self, session_id: str) -> None:
+        """Drop a terminated session, ending its stream."""
+        queue = self._queues.pop(session_id, None)
+        if queue is not None:
+            self._close(queue)
+        self._streaming.discard(session_id)
+
+    @staticmethod
+    def _close(queue: asyncio.Queue[StreamItem]) -> None:
+        while True:
+            try:
+                queue.put_nowait(None)
+                return
+            except asyncio.QueueFull:
+                queue.get_nowait()  # The stream is ending; make room for the sentinel
+
+    def is_connected(self, session_id: str) -> bool:
+        return session_id in self._queues
+
+    def __len__(self) -> int:
+        return len(self._queues)
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    async def send(self, session_ids: Iterable[str], message: dict[str, Any]) -> set[str]:
+        """Buffer ``message`` for each session and push it to their live streams.
+
+        Sessions that never opened a stream are skipped (they have nothing
+        to resume).  Returns the sessions it was pushed to.
+        """
+        targets: list[str] = []
+        for session_id in session_ids:
+            if session_id in self._streaming:
+                targets.append(session_id)
+            else:
+                self._unrouted += 1
+        if not targets:
+            return set()
+        body = serialize_mcp_response(message)
+        if not self._events.durable:
+            return self._push(self._events.append(targets, body), body)
+        # Streams must see each session's IDs in order, so pushes wait for earlier writes
+        async with self._append_lock:
+            event_ids = await asyncio.to_thread(self._events.append, targets, body)
+            return self._push(event_ids, body)
+
+    async def broadcast(self, message: dict[str, Any]) -> set[str]:
+        """Send ``message`` to every session that has opened a stream."""
+        self._broadcasts += 1
+        return await self.send(list(self._streaming), message)
+
+    async def record(self, session_id: str, body: bytes) -> int:
+        """Buffer an event sent outside the routed streams (e.g. a POST response stream); returns its ID."""
+        if not self._events.durable:
+            return self._events.append([session_id], body)[session_id]
+        event_ids = await asyncio.to_thread(self._events.append, [session_id], body)
+        return event_ids[session_id]
+
+    def _push(self, event_ids: dict[str, int], body: bytes) -> set[str]:
+        pushed: set[str] = set()
+        for session_id, event_id in event_ids.items():
+            queue = self._queues.get(session_id)
+            if queue is None:
+                self._buffered += 1
+                continue
+            try:
+                queue.put_nowait((event_id, body))
+            except asyncio.QueueFull:
+                self._dropped += 1
+                logger.debug(f"Stream queue full for session {session_id[:8]}...; event {event_id} left for replay")
+                continue
+            self._delivered += 1
+            pushed.add(session_id)
+        return pushed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get stream and delivery metrics."""
+        return {
+            "streams": len(self._queues),
+            "sessions": len(self._streaming),
+            "queued": sum(queue.qsize() for queue in self._queues.values()),
+            "delivered": self._delivered,
+            "buffered": self._buffered,
+            "dropped": self._dropped,
+            "unrouted": self._unrouted,
+            "broadcasts": self._broadcasts,
+        }
+
+
+__all__ = ["NotificationRouter", "StreamItem"]
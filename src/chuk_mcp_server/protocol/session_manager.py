@@ -4,17 +4,60 @@
 MCP session lifecycle management.
 
 Manages creation, eviction, and cleanup of MCP protocol sessions.
+
+Sessions are kept in an ``OrderedDict`` in least-recently-used order:
+``update_activity`` moves a session to the end, so the front is always the
+session idle the longest.  That makes both capacity eviction and expiry
+proportional to the sessions they remove rather than to all sessions:
+
+- Eviction takes the first unprotected session from the front; protected
+  sessions it passes over are moved to the back.
+- ``cleanup_expired`` pops from the front until it reaches a session that
+  was active within ``max_age`` (the order is also ``last_activity`` order,
+  so nothing behind it can be older).
+
+With a shared :class:`~.session_store.SessionStore`, ``sessions`` is this
+process's cache of the store: new sessions are written through, a session
+created elsewhere is adopted on first use, and activity is written back
+at most every ``touch_interval`` seconds.  Evicting a session only drops it
+from this process; expiry and termination also remove it from the store.
+
+Store reads and writes block (a SQLite busy wait, a Redis round trip), so
+code on the event loop uses the ``*_async`` variants of ``create_session``,
+``get_session``, ``update_activity`` and ``remove_session``: they do the
+same bookkeeping but run the store call in a thread, and skip the hop
+entirely when no store call is needed (a session already served here,
+activity within ``touch_interval``).  Background expiry is split the same
+way: :meth:`SessionManager.expire_local` on the loop,
+:meth:`SessionManager.expire_store` in a thread.
 """
 
+import asyncio
 import logging
 import time
 import uuid
+import warnings
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Any
 
+from ..constants import DEFAULT_SESSION_MAX_AGE, DEFAULT_SESSION_TOUCH_INTERVAL
+from .session_store import SessionStore
+
 logger = logging.getLogger(__name__)
 
 
+def _protected_by_set(
+    protected_sessions: Callable[[], set[str]], is_protected: Callable[[str], bool] | None
+) -> Callable[[str], bool]:
+    """Adapt the deprecated ``protected_sessions`` set builder to an ``is_protected`` check."""
+
+    def check(session_id: str) -> bool:
+        return session_id in protected_sessions() or (is_protected is not None and is_protected(session_id))
+
+    return check
+
+
 class SessionManager:
     """Manage MCP sessions."""
 
@@ -24,61 +67,256 @@ class SessionManager:
         cleanup_interval: int = 100,
         on_evict: Callable[[str], None] | None = None,
         protected_sessions: Callable[[], set[str]] | None = None,
+        is_protected: Callable[[str], bool] | None = None,
+        max_age: int = DEFAULT_SESSION_MAX_AGE,
+        store: SessionStore | None = None,
+        touch_interval: float = DEFAULT_SESSION_TOUCH_INTERVAL,
     ):
-        self.sessions: dict[str, dict[str, Any]] = {}
+        """
+        Args:
+            max_sessions: Sessions kept before the least recently used is evicted
+            cleanup_interval: Run ``cleanup_expired`` every this many creations
+            on_evict: Called with the session ID before a session is evicted or expires
+            protected_sessions: Deprecated, use ``is_protected``: returns IDs that must not
+                be evicted, rebuilt for every candidate checked
+            is_protected: Whether one session must not be evicted (checked per candidate,
+                so nothing is recomputed per eviction)
+            max_age: Default seconds of inactivity after which ``cleanup_expired`` removes a session
+            store: Where sessions are shared with other workers (None: this process only)
+            touch_interval: Min seconds between writes of one session's activity to ``store``
+        """
+        self.sessions: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self.max_sessions = max_sessions
         self.cleanup_interval = cleanup_interval
+        self.max_age = max_age
         self._creation_count = 0
         self._on_evict = on_evict
-        self._protected_sessions = protected_sessions
+        if protected_sessions is not None:
+            warnings.warn(
+                "SessionManager(protected_sessions=...) is deprecated; pass is_protected=, a per-session check",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            is_protected = _protected_by_set(protected_sessions, is_protected)
+        self._is_protected = is_protected
+        self._evictions = 0
+        self._expirations = 0
+        self.store = store
+        self.touch_interval = touch_interval
+        self._store_touched: dict[str, float] = {}  # session ID -> last activity written to the store
+        self._adopted = 0
+
+    @property
+    def shared(self) -> bool:
+        """Whether sessions are visible to other worker processes."""
+        return self.store is not None and self.store.shared
 
     def _evict_session(self, session_id: str) -> None:
         """Evict a session, calling the on_evict callback first."""
         if self._on_evict is not None:
             self._on_evict(session_id)
         del self.sessions[session_id]
+        self._store_touched.pop(session_id, None)
 
-    def create_session(self, client_info: dict[str, Any], protocol_version: str) -> str:
-        """Create a new session."""
-        self._creation_count += 1
+    def _eviction_candidate(self) -> str | None:
+        """The least recently used session that is not protected.
 
-        # Periodic cleanup of expired sessions
-        if self._creation_count % self.cleanup_interval == 0:
-            self.cleanup_expired()
+        A protected session passed over counts as in use: it is stamped and
+        moved to the back, so long-lived streams (which do not refresh their
+        activity) never pile up at the front to be rechecked on every eviction.
+        """
+        if self._is_protected is None:
+            return next(iter(self.sessions), None)
+        for _ in range(len(self.sessions)):
+            sid, session = next(iter(self.sessions.items()))
+            if not self._is_protected(sid):
+                return sid
+            session["last_activity"] = time.time()  # Keeps the front the oldest, as expiry relies on
+            self.sessions.move_to_end(sid)
+        return None
 
-        # Evict oldest session if at capacity
+    def _make_room(self) -> None:
+        """Evict the least recently used session if at capacity."""
         if len(self.sessions) >= self.max_sessions:
-            protected = self._protected_sessions() if self._protected_sessions else set()
-            candidates = [sid for sid in self.sessions if sid not in protected]
-            if candidates:
-                oldest_sid = min(candidates, key=lambda sid: self.sessions[sid]["last_activity"])
+            oldest_sid = self._eviction_candidate()
+            if oldest_sid is not None:
                 self._evict_session(oldest_sid)
+                self._evictions += 1
                 logger.debug(f"Evicted oldest session {oldest_sid[:8]}... (max_sessions reached)")
 
-        session_id = str(uuid.uuid4()).replace("-", "")
-        self.sessions[session_id] = {
-            "id": session_id,
+    def _new_session(
+        self, client_info: dict[str, Any], protocol_version: str, client_capabilities: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Build and register a session record (the store write is left to the caller)."""
+        self._make_room()
+        now = time.time()
+        session = {
+            "id": uuid.uuid4().hex,
             "client_info": client_info,
             "protocol_version": protocol_version,
-            "created_at": time.time(),
-            "last_activity": time.time(),
+            "client_capabilities": client_capabilities or {},
+            "created_at": now,
+            "last_activity": now,
         }
-        logger.debug(f"Created session {session_id[:8]}... for {client_info.get('name', 'unknown')}")
-        return session_id
+        self.sessions[session["id"]] = session
+        if self.store is not None:
+            self._store_touched[session["id"]] = now
+        logger.debug(f"Created session {session['id'][:8]}... for {client_info.get('name', 'unknown')}")
+        return session
+
+    def create_session(
+        self,
+        client_info: dict[str, Any],
+        protocol_version: str,
+        client_capabilities: dict[str, Any] | None = None,
+    ) -> str:
+        """Create a new session."""
+        self._creation_count += 1
+
+        # Periodic cleanup of expired sessions
+        if self._creation_count % self.cleanup_interval == 0:
+            self.cleanup_expired()
+
+        session = self._new_session(client_info, protocol_version, client_capabilities)
+        if self.store is not None:
+            self.store.put(session)
+        return str(session["id"])
+
+    async def create_session_async(
+        self,
+        client_info: dict[str, Any],
+        protocol_version: str,
+        client_capabilities: dict[str, Any] | None = None,
+    ) -> str:
+        """:meth:`create_session` with the store writes run off the event loop."""
+        self._creation_count += 1
+
+        if self._creation_count % self.cleanup_interval == 0:
+            cutoff = self._expire_local(None)
+            if self.store is not None:
+                await asyncio.to_thread(self.store.expire, cutoff)
+
+        session = self._new_session(client_info, protocol_version, client_capabilities)
+        if self.store is not None:
+            await asyncio.to_thread(self.store.put, dict(session))
+        return str(session["id"])
+
+    def _adopt(self, session_id: str, session: dict[str, Any]) -> dict[str, Any]:
+        """Serve a session another worker created from this process from now on."""
+        existing = self.sessions.get(session_id)
+        if existing is not None:  # Adopted meanwhile by a concurrent request
+            return existing
+        self._make_room()
+        # Stored activity may be older than sessions served here: stamp it so the front stays the oldest
+        self._store_touched[session_id] = session["last_activity"]
+        session["last_activity"] = time.time()
+        self.sessions[session_id] = session
+        self._adopted += 1
+        logger.debug(f"Adopted session {session_id[:8]}... from the session store")
+        return session
 
     def get_session(self, session_id: str) -> dict[str, Any] | None:
-        """Get session by ID."""
-        return self.sessions.get(session_id)
+        """Get session by ID, adopting it from the store if another worker created it."""
+        session = self.sessions.get(session_id)
+        if session is not None or self.store is None:
+            return session
+        session = self.store.get(session_id)
+        return None if session is None else self._adopt(session_id, session)
+
+    async def get_session_async(self, session_id: str) -> dict[str, Any] | None:
+        """:meth:`get_session` with the store lookup run off the event loop."""
+        session = self.sessions.get(session_id)
+        if session is not None or self.store is None:
+            return session
+        session = await asyncio.to_thread(self.store.get, session_id)
+        return None if session is None else self._adopt(session_id, session)
+
+    def _record_activity(self, session_id: str, session: dict[str, Any]) -> float | None:
+        """Mark a session used now; returns the time to write to the store, if a write is due."""
+        now = session["last_activity"] = time.time()
+        self.sessions.move_to_end(session_id)
+        if self.store is None or now - self._store_touched.get(session_id, 0.0) < self.touch_interval:
+            return None
+        self._store_touched[session_id] = now
+        return now
 
     def update_activity(self, session_id: str) -> None:
-        """Update session last activity."""
-        if session_id in self.sessions:
-            self.sessions[session_id]["last_activity"] = time.time()
+        """Update session last activity, making it the most recently used."""
+        session = self.get_session(session_id)
+        if session is not None and (now := self._record_activity(session_id, session)) is not None:
+            self.store.touch(session_id, now)  # type: ignore[union-attr]
 
-    def cleanup_expired(self, max_age: int = 3600) -> None:
-        """Remove expired sessions."""
-        now = time.time()
-        expired = [sid for sid, session in self.sessions.items() if now - session["last_activity"] > max_age]
-        for sid in expired:
+    async def update_activity_async(self, session_id: str) -> None:
+        """:meth:`update_activity` with store reads and writes run off the event loop."""
+        session = await self.get_session_async(session_id)
+        if session is not None and (now := self._record_activity(session_id, session)) is not None:
+            await asyncio.to_thread(self.store.touch, session_id, now)  # type: ignore[union-attr]
+
+    def discard(self, session_id: str) -> None:
+        """Forget this process's copy of a session another worker removed (the store is left alone)."""
+        self._store_touched.pop(session_id, None)
+        self.sessions.pop(session_id, None)
+
+    def remove_session(self, session_id: str) -> bool:
+        """Remove a session here and from the store; returns whether it was known here."""
+        if self.store is not None:
+            self.store.delete(session_id)
+        self._store_touched.pop(session_id, None)
+        return self.sessions.pop(session_id, None) is not None
+
+    async def remove_session_async(self, session_id: str) -> bool:
+        """:meth:`remove_session` with the store delete run off the event loop."""
+        self._store_touched.pop(session_id, None)
+        known = self.sessions.pop(session_id, None) is not None
+        if self.store is not None:
+            await asyncio.to_thread(self.store.delete, session_id)
+        return known
+
+    def cleanup_expired(self, max_age: int | None = None) -> int:
+        """Remove sessions idle longer than ``max_age`` (default: ``self.max_age``); returns how many."""
+        expirations = self._expirations
+        cutoff = self._expire_local(max_age)
+        if self.store is not None:
+            self.store.expire(cutoff)
+        return self._expirations - expirations
+
+    def expire_local(self, max_age: int | None = None) -> int:
+        """Remove this process's sessions idle longer than ``max_age``, leaving the store alone; returns how many."""
+        expirations = self._expirations
+        self._expire_local(max_age)
+        return self._expirations - expirations
+
+    def expire_store(self, max_age: int | None = None) -> int:
+        """Remove sessions idle longer than ``max_age`` from the store; returns how many.
+
+        Blocking: the maintenance task runs it in a worker thread.
+        """
+        if self.store is None:
+            return 0
+        return self.store.expire(time.time() - (self.max_age if max_age is None else max_age))
+
+    def _expire_local(self, max_age: int | None) -> float:
+        """Drop this process's sessions idle longer than ``max_age``; returns the cutoff used."""
+        cutoff = time.time() - (self.max_age if max_age is None else max_age)
+        expired = 0
+        while self.sessions:
+            sid, session = next(iter(self.sessions.items()))
+            if session["last_activity"] >= cutoff:
+                break
             self._evict_session(sid)
+            expired += 1
             logger.debug(f"Cleaned up expired session {sid[:8]}...")
+        self._expirations += expired
+        return cutoff
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get session counts and eviction metrics."""
+        return {
+            "active": len(self.sessions),
+            "max_sessions": self.max_sessions,
+            "created": self._creation_count,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "adopted": self._adopted,
+            "store": self.store.get_stats() if self.store is not None else None,
+        }
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/protocol/session_store.py
+"""
+Session stores - where session records live beyond one process.
+
+:class:`SessionManager` keeps the sessions a process is serving in its own
+LRU dict.  With a shared store behind it, a session created by one worker
+can be served by any other: a request for an unknown session ID is looked
+up in the store and the record adopted locally.
+
+A session record is the plain dict the manager builds: ``id``,
+``client_info``, ``protocol_version``, ``client_capabilities``,
+``created_at`` and ``last_activity``.  Records are written when a session
+is created and activity at most every ``touch_interval`` seconds, so the
+store is off the per-request path.
+
+Backends:
+
+- :class:`MemorySessionStore` - a dict in this process (not shared).
+- :class:`SQLiteSessionStore` - a SQLite file, shared by the processes of
+  one host (WAL mode, so readers never wait on the writer).
+- :class:`RedisSessionStore` - any server speaking the Redis protocol,
+  shared across hosts; expiry uses key TTLs.
+
+:func:`create_session_store` builds one from a URL (``memory://``,
+``sqlite:///sessions.db`` relative or ``sqlite:////var/run/sessions.db``
+absolute, ``redis://host:6379/0``).
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any
+
+import orjson
+
+from ..constants import DEFAULT_SESSION_MAX_AGE, SESSION_STORE_KEY_PREFIX
+from ..resp import RespClient
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore(ABC):
+    """Storage for session records, keyed by session ID."""
+
+    #: Whether other processes see the same sessions
+    shared: bool = True
+
+    @abstractmethod
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        """Get a session record, or None if unknown or expired."""
+
+    @abstractmethod
+    def put(self, session: dict[str, Any]) -> None:
+        """Store (or replace) a session record under ``session["id"]``."""
+
+    @abstractmethod
+    def touch(self, session_id: str, last_activity: float) -> None:
+        """Record activity on a session."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove a session."""
+
+    @abstractmethod
+    def expire(self, cutoff: float) -> int:
+        """Remove sessions last active before ``cutoff``; returns how many."""
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get backend metrics."""
+        return {"backend": type(self).__name__}
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Release connections."""
+
+
+class MemorySessionStore(SessionStore):
+    """Process-local store; sessions are not visible to other workers."""
+
+    shared = False
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, dict[str, Any]] = {}
+
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        session = self._sessions.get(session_id)
+        return dict(session) if session is not None else None
+
+    def put(self, session: dict[str, Any]) -> None:
+        self._sessions[session["id"]] = dict(session)
+
+    def touch(self, session_id: str, last_activity: float) -> None:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session["last_activity"] = last_activity
+
+    def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def expire(self, cutoff: float) -> int:
+        # A snapshot: expiry runs in a maintenance thread while the loop adds sessions
+        expired = [sid for sid, session in list(self._sessions.items()) if session["last_activity"] < cutoff]
+        for sid in expired:
+            self._sessions.pop(sid, None)
+        return len(expired)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {**super().get_stats(), "sessions": len(self._sessions)}
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions in a SQLite database shared by the workers of one host."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: Database file (created if missing)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._db()  # Create the schema now so configuration errors surface early
+
+    def _db(self) -> sqlite3.Connection:
+        """This process's connection (reopened after fork: connections must not cross it)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions "
+                "(id TEXT PRIMARY KEY, data BLOB NOT NULL, last_activity REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS sessions_last_activity ON sessions (last_activity)")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._db().execute("SELECT data, last_activity FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row is None:
+            return None
+        session: dict[str, Any] = orjson.loads(row[0])
+        session["last_activity"] = row[1]
+        return session
+
+    def put(self, session: dict[str, Any]) -> None:
+        with self._lock:
+            self._db().execute(
+                "INSERT OR REPLACE INTO sessions (id, data, last_activity) VALUES (?, ?, ?)",
+                (session["id"], orjson.dumps(session), session["last_activity"]),
+            )
+
+    def touch(self, session_id: str, last_activity: float) -> None:
+        with self._lock:
+            self._db().execute("UPDATE sessions SET last_activity = ? WHERE id = ?", (last_activity, session_id))
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._db().execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def expire(self, cutoff: float) -> int:
+        with self._lock:
+            return self._db().execute("DELETE FROM sessions WHERE last_activity < ?", (cutoff,)).rowcount
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            (count,) = self._db().execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return {**super().get_stats(), "path": self.path, "sessions": count}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+class RedisSessionStore(SessionStore):
+    """Sessions in a Redis-protocol server, shared across hosts.
+
+    Each session is a hash (``data``, ``last_activity``) whose TTL is
+    refreshed on every touch, so the server expires idle sessions itself.
+    Every command is idempotent, so each is resent after a dropped connection.
+    """
+
+    def __init__(
+        self,
+        client: RespClient,
+        ttl: int = DEFAULT_SESSION_MAX_AGE,
+        key_prefix: str = SESSION_STORE_KEY_PREFIX,
+    ) -> None:
+        """
+        Args:
+            client: Connection to the server
+            ttl: Seconds of inactivity after which the server drops a session
+            key_prefix: Prefix of every session key
+        """
+        self.client = client
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    def _key(self, session_id: str) -> str:
+        return self.key_prefix + session_id
+
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        data, last_activity = self.client.execute(
+            "HMGET", self._key(session_id), "data", "last_activity", idempotent=True
+        )
+        if data is None:
+            return None
+        session: dict[str, Any] = orjson.loads(data)
+        if last_activity is not None:
+            session["last_activity"] = float(last_activity)
+        return session
+
+    def put(self, session: dict[str, Any]) -> None:
+        key = self._key(session["id"])
+        self.client.pipeline(
+            [
+                ("HSET", key, "data", orjson.dumps(session), "last_activity", repr(session["last_activity"])),
+                ("EXPIRE", key, self.ttl),
+            ],
+            idempotent=True,
+        )
+
+    def touch(self, session_id: str, last_activity: float) -> None:
+        # One round trip; touching a deleted session leaves a data-less hash that
+        # get() treats as missing and the TTL removes
+        key = self._key(session_id)
+        self.client.pipeline(
+            [("HSET", key, "last_activity", repr(last_activity)), ("EXPIRE", key, self.ttl)], idempotent=True
+        )
+
+    def delete(self, session_id: str) -> None:
+        self.client.execute("DEL", self._key(session_id), idempotent=True)
+
+    def expire(self, cutoff: float) -> int:  # noqa: ARG002
+        return 0  # Key TTLs expire sessions server-side
+
+    def get_stats(self) -> dict[str, Any]:
+        return {**super().get_stats(), "server": f"{self.client.host}:{self.client.port}", "ttl": self.ttl}
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def create_session_store(url: str, ttl: int = DEFAULT_SESSION_MAX_AGE) -> SessionStore:
+    """Create a session store from a URL.
+
+    Args:
+        url: ``memory://``, ``sqlite:///path/to/sessions.db`` or
+            ``redis://[:password@]host[:port][/db]``
+        ttl: Session lifetime for stores that expire sessions themselves
+
+    Raises:
+        ValueError: If the URL scheme is not supported, or a SQLite URL has no path.
+    """
+    scheme, _, rest = url.partition("://")
+    if scheme == "memory":
+        return MemorySessionStore()
+    if scheme == "sqlite":
+        # An in-memory database is private to each worker, so it cannot share sessions
+        if not rest.startswith("/") or rest == "/":
+            raise ValueError(f"SQLite session store needs a path: {url!r}")
+        return SQLiteSessionStore(rest[1:])
+    if scheme == "redis":
+        return RedisSessionStore(RespClient.from_url(url), ttl=ttl)
+    raise ValueError(f"Unsupported session store URL: {url!r}")
+
+
+__all__ = [
+    "MemorySessionStore",
+    "RedisSessionStore",
+    "SQLiteSessionStore",
+    "SessionStore",
+    "create_session_store",
+]
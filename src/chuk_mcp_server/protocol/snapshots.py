@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/protocol/snapshots.py
+"""
+Generation-versioned list snapshots for paginated list methods.
+
+Registries bump a generation counter on every mutation.  The first list
+request after a change builds an immutable snapshot (item bytes plus
+pre-built page bytes) for that generation; every later page fetch is a
+lookup.  Cursors encode ``generation:offset`` so a client paging through
+a catalog keeps seeing the snapshot it started on, even if tools are
+registered mid-session.
+"""
+
+import base64
+import binascii
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from ..constants import DEFAULT_PAGE_SIZE
+from ..types.serialization import splice_list_result
+
+V = TypeVar("V")
+
+# Older snapshots kept per list so in-progress cursor chains stay consistent
+DEFAULT_SNAPSHOT_HISTORY = 4
+
+
+class VersionedRegistry(dict[str, V]):
+    """Component registry dict that bumps ``generation`` on every mutation."""
+
+    __slots__ = ("generation",)
+
+    def __init__(self, *args: object, **kwargs: V) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.generation = 0
+
+    def __setitem__(self, key: str, value: V) -> None:
+        super().__setitem__(key, value)
+        self.generation += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.generation += 1
+
+    def pop(self, key: str, *default: V) -> V:  # type: ignore[override]
+        if key in self:
+            self.generation += 1
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, V]:
+        item = super().popitem()
+        self.generation += 1
+        return item
+
+    def setdefault(self, key: str, default: V) -> V:  # type: ignore[override]
+        if key not in self:
+            self.generation += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: object, **kwargs: V) -> None:  # type: ignore[override]
+        super().update(*args, **kwargs)  # type: ignore[arg-type]
+        self.generation += 1
+
+    def __ior__(self, other: object) -> "VersionedRegistry[V]":  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.generation += 1
+
+
+# ============================================================================
+# Cursors
+# ============================================================================
+
+
+def encode_cursor(generation: int, offset: int) -> str:
+    """Encode a list position as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{generation}:{offset}".encode()).decode()
+
+
+def decode_cursor(cursor: object) -> tuple[int | None, int]:
+    """Decode a cursor into ``(generation, offset)``.
+
+    Bare-offset cursors from older servers decode with ``generation=None``.
+    Anything unparseable starts from the beginning.
+    """
+    if not isinstance(cursor, str):
+        return None, 0
+    try:
+        raw = base64.urlsafe_b64decode(cursor).decode()
+        generation, sep, offset = raw.rpartition(":")
+        if sep:
+            return int(generation), max(int(offset), 0)
+        return None, max(int(offset), 0)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None, 0
+
+
+# ============================================================================
+# Snapshots
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class ListSnapshot:
+    """Immutable view of one registry at one generation, with pre-built pages."""
+
+    key: str
+    generation: int
+    page_size: int
+    items: tuple[bytes, ...]
+    pages: tuple[bytes, ...]
+
+    @classmethod
+    def build(cls, key: str, generation: int, items: Iterable[bytes], page_size: int) -> "ListSnapshot":
+        """Build a snapshot, pre-serializing every page's result object."""
+        frozen = tuple(items)
+        pages = []
+        for start in range(0, max(len(frozen), 1), page_size):
+            end = start + page_size
+            next_cursor = encode_cursor(generation, end) if end < len(frozen) else None
+            pages.append(splice_list_result(key, frozen[start:end], next_cursor))
+        return cls(key=key, generation=generation, page_size=page_size, items=frozen, pages=tuple(pages))
+
+    def page(self, offset: int) -> bytes:
+        """Return result bytes for the page starting at ``offset``."""
+        index, remainder = divmod(offset, self.page_size)
+        if remainder == 0 and index < len(self.pages):
+            return self.pages[index]
+
+        # Off-boundary (legacy) cursor or past the end: splice on demand
+        end = offset + self.page_size
+        next_cursor = encode_cursor(self.generation, end) if end < len(self.items) else None
+        return splice_list_result(self.key, self.items[offset:end], next_cursor)
+
+
+class ListSnapshotCache:
+    """Current and recent snapshots for each list method."""
+
+    def __init__(self, page_size: int = DEFAULT_PAGE_SIZE, history: int = DEFAULT_SNAPSHOT_HISTORY) -> None:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.page_size = page_size
+        self._history = history
+        self._snapshots: dict[str, OrderedDict[int, ListSnapshot]] = {}
+        self.builds = 0
+
+    def get(self, key: str, generation: int, build_items: Callable[[], Iterable[bytes]]) -> ListSnapshot:
+        """Return the snapshot for ``generation``, building it on first use."""
+        versions = self._snapshots.setdefault(key, OrderedDict())
+        snapshot = versions.get(generation)
+        if snapshot is None:
+            snapshot = ListSnapshot.build(key, generation, build_items(), self.page_size)
+            versions[generation] = snapshot
+            self.builds += 1
+            while len(versions) > self._history:
+                versions.popitem(last=False)
+        return snapshot
+
+    def resolve(self, key: str, current: ListSnapshot, cursor: object) -> bytes:
+        """Resolve a cursor against ``current`` (or a retained older snapshot) to page bytes."""
+        generation, offset = decode_cursor(cursor)
+        snapshot = current
+        if generation is not None and generation != current.generation:
+            # Keep serving the generation the client started on while we still have it
+            snapshot = self._snapshots.get(key, {}).get(generation, current)
+        return snapshot.page(offset)
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        self._snapshots.clear()
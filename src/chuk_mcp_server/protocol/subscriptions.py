@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/protocol/subscriptions.py
+"""
+Resource subscription index.
+
+Subscriptions are indexed in both directions, so finding the subscribers of
+an updated URI does not scan every session and dropping a session costs
+O(its subscriptions):
+
+- URI -> sessions, for exact subscriptions.
+- A trie over ``/``-separated segments for prefix subscriptions: a URI
+  ending in ``*`` (``file:///docs/*``, ``db://users/4*``) subscribes to
+  every URI that starts with the text before the ``*``.  Matching walks the
+  updated URI's segments once.
+- Session -> subscribed URIs (as the client sent them, ``*`` included).
+
+The index is also a mapping of session ID to its subscribed URIs, which is
+how the protocol handler and its callers have always inspected it.
+"""
+
+from collections.abc import Iterable, Iterator, MutableMapping
+from dataclasses import dataclass, field
+from typing import Any
+
+WILDCARD = "*"
+
+
+@dataclass(eq=False)
+class _PrefixNode:
+    children: dict[str, "_PrefixNode"] = field(default_factory=dict)  # Complete path segments
+    partials: dict[str, set[str]] = field(default_factory=dict)  # Start of the next segment -> sessions
+
+
+class SubscriptionIndex(MutableMapping[str, frozenset[str]]):
+    """Bidirectional session <-> URI subscription index with prefix subscriptions."""
+
+    def __init__(self) -> None:
+        self._by_session: dict[str, set[str]] = {}
+        self._by_uri: dict[str, set[str]] = {}
+        self._prefixes = _PrefixNode()
+        self._prefix_count = 0
+        self._count = 0
+
+    # ------------------------------------------------------------------
+    # Subscribe / unsubscribe
+    # ------------------------------------------------------------------
+
+    def subscribe(self, session_id: str, uri: str) -> None:
+        """Subscribe a session to ``uri`` (a prefix subscription if it ends in ``*``)."""
+        uris = self._by_session.setdefault(session_id, set())
+        if uri in uris:
+            return
+        uris.add(uri)
+        self._count += 1
+        if uri.endswith(WILDCARD):
+            *segments, partial = uri[: -len(WILDCARD)].split("/")
+            node = self._prefixes
+            for segment in segments:
+                node = node.children.setdefault(segment, _PrefixNode())
+            node.partials.setdefault(partial, set()).add(session_id)
+            self._prefix_count += 1
+        else:
+            self._by_uri.setdefault(uri, set()).add(session_id)
+
+    def unsubscribe(self, session_id: str, uri: str) -> bool:
+        """Remove one subscription; returns whether it existed.
+
+        The session keeps its (possibly empty) entry until :meth:`remove_session`.
+        """
+        uris = self._by_session.get(session_id)
+        if uris is None or uri not in uris:
+            return False
+        uris.discard(uri)
+        self._count -= 1
+        if uri.endswith(WILDCARD):
+            self._remove_prefix(session_id, uri[: -len(WILDCARD)])
+        else:
+            sessions = self._by_uri[uri]
+            sessions.discard(session_id)
+            if not sessions:
+                del self._by_uri[uri]
+        return True
+
+    def _remove_prefix(self, session_id: str, prefix: str) -> None:
+        *segments, partial = prefix.split("/")
+        path = [self._prefixes]
+        for segment in segments:
+            path.append(path[-1].children[segment])
+        node = path[-1]
+        sessions = node.partials[partial]
+        sessions.discard(session_id)
+        if not sessions:
+            del node.partials[partial]
+        self._prefix_count -= 1
+        # Prune nodes left without subscriptions
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.children or node.partials:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+
+    def remove_session(self, session_id: str) -> int:
+        """Drop every subscription of a session; returns how many there were."""
+        uris = self._by_session.get(session_id)
+        if uris is None:
+            return 0
+        count = len(uris)
+        for uri in list(uris):
+            self.unsubscribe(session_id, uri)
+        del self._by_session[session_id]
+        return count
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def subscribers(self, uri: str) -> set[str]:
+        """Sessions subscribed to ``uri``, exactly or through a prefix."""
+        sessions = set(self._by_uri.get(uri, ()))
+        if not self._prefix_count:
+            return sessions
+        node = self._prefixes
+        for segment in uri.split("/"):
+            for partial, prefix_sessions in node.partials.items():
+                if segment.startswith(partial):
+                    sessions |= prefix_sessions
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+        return sessions
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index size metrics."""
+        return {
+            "sessions": len(self._by_session),
+            "subscriptions": self._count,
+            "uris": len(self._by_uri),
+            "prefixes": self._prefix_count,
+        }
+
+    # ------------------------------------------------------------------
+    # Mapping of session ID -> subscribed URIs
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, session_id: str) -> frozenset[str]:
+        return frozenset(self._by_session[session_id])
+
+    def __setitem__(self, session_id: str, uris: Iterable[str]) -> None:
+        """Replace a session's subscriptions."""
+        self.remove_session(session_id)
+        self._by_session[session_id] = set()
+        for uri in uris:
+            self.subscribe(session_id, uri)
+
+    def __delitem__(self, session_id: str) -> None:
+        if session_id not in self._by_session:
+            raise KeyError(session_id)
+        self.remove_session(session_id)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._by_session
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_session)
+
+    def __len__(self) -> int:
+        return len(self._by_session)
+
+
+__all__ = ["SubscriptionIndex", "WILDCARD"]
@@ -26,6 +26,8 @@ from ..constants import (
 
 logger = logging.getLogger(__name__)
 
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
 
 class TaskManager:
     """Manages the MCP tasks store and task lifecycle operations."""
@@ -123,7 +125,7 @@ class TaskManager:
         task = self._task_store.get(task_id)
         if task is None:
             return create_error(msg_id, JsonRpcError.INVALID_PARAMS, f"Unknown task: {task_id}"), None
-        if task["status"] in ("completed", "failed", "cancelled"):
+        if task["status"] in _TERMINAL_STATUSES:
             return create_error(
                 msg_id,
                 JsonRpcError.INVALID_PARAMS,
@@ -159,6 +161,18 @@ class TaskManager:
         except Exception as e:
             logger.debug(f"Failed to send task status notification: {e}")
 
+    def collect_finished(self, max_age: float) -> int:
+        """Drop completed, failed and cancelled tasks not updated for ``max_age`` seconds; returns how many."""
+        cutoff = time.time() - max_age
+        finished = [
+            task_id
+            for task_id, task in self._task_store.items()
+            if task["status"] in _TERMINAL_STATUSES and task["updatedAt"] < cutoff
+        ]
+        for task_id in finished:
+            del self._task_store[task_id]
+        return len(finished)
+
     def clear(self) -> None:
         """Clear all tasks."""
         self._task_store.clear()
@@ -45,12 +45,13 @@ class TokenBucketRateLimiter:
         """Remove bucket for a session (called on session eviction)."""
         self._buckets.pop(session_id, None)
 
-    def cleanup_stale(self, max_idle: float = 3600.0) -> None:
-        """Remove buckets for sessions idle longer than max_idle seconds."""
+    def cleanup_stale(self, max_idle: float = 3600.0) -> int:
+        """Remove buckets for sessions idle longer than max_idle seconds; returns how many."""
         now = time.monotonic()
         stale = [sid for sid, (_, last) in self._buckets.items() if now - last > max_idle]
         for sid in stale:
             del self._buckets[sid]
+        return len(stale)
 
     @property
     def session_count(self) -> int:
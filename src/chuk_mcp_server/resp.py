@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/resp.py
+"""
+RESP - a minimal blocking client for the Redis serialization protocol.
+
+Shared-state backends (session store, notification bus) talk to Redis or
+any server speaking its protocol (Valkey, KeyDB, Dragonfly, a test fake)
+through this client instead of requiring a Redis client library.  It covers
+what those backends need: single commands, pipelines (one write, one round
+trip), reconnecting once when the server drops the connection, and pub/sub
+subscriptions on a dedicated connection.  A connection opened before a fork
+is never used by the child: it reconnects on its first command.
+
+Calls block; they are meant for short key lookups on a nearby server.
+"""
+
+import contextlib
+import logging
+import os
+import socket
+import threading
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from .constants import DEFAULT_RESP_PORT, DEFAULT_RESP_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+_CRLF = b"\r\n"
+
+
+class RespError(Exception):
+    """Error reply from the server (``-ERR ...``)."""
+
+
+def encode_command(*args: Any) -> bytes:
+    """Encode one command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            data = arg
+        elif isinstance(arg, str):
+            data = arg.encode()
+        else:
+            data = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def read_reply(stream: Any) -> Any:
+    """Read one reply from a buffered binary stream.
+
+    Error replies are returned as :class:`RespError` instances (not raised),
+    so a pipeline can read every reply before reporting the first error.
+
+    Raises:
+        ConnectionError: If the server closed the connection.
+    """
+    line = stream.readline()
+    if not line.endswith(_CRLF):
+        raise ConnectionError("Connection closed by server")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        return RespError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("Connection closed by server")
+        return data[:-2]
+    if kind == b"*":
+        count = int(body)
+        if count < 0:
+            return None
+        return [read_reply(stream) for _ in range(count)]
+    raise ConnectionError(f"Invalid RESP reply type: {kind!r}")
+
+
+class RespClient:
+    """Thread-safe blocking RESP client over one connection."""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = DEFAULT_RESP_PORT,
+        db: int = 0,
+        password: str | None = None,
+        timeout: float = DEFAULT_RESP_TIMEOUT,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._stream: Any = None
+        self._pid = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = DEFAULT_RESP_TIMEOUT) -> "RespClient":
+        """Create a client from ``redis://[:password@]host[:port][/db]``.
+
+        Raises:
+            ValueError: If the URL scheme is not ``redis``.
+        """
+        parts = urlsplit(url)
+        if parts.scheme != "redis":
+            raise ValueError(f"Unsupported RESP URL scheme: {parts.scheme!r}")
+        db = parts.path.lstrip("/")
+        return cls(
+            host=parts.hostname or "localhost",
+            port=parts.port or DEFAULT_RESP_PORT,
+            db=int(db) if db else 0,
+            password=unquote(parts.password) if parts.password else None,
+            timeout=timeout,
+        )
+
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+
+    def _open(self) -> tuple[socket.socket, Any]:
+        """Open an authenticated connection with the database selected."""
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        stream = sock.makefile("rb")
+        setup: list[tuple[Any, ...]] = []
+        if self.password is not None:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            sock.sendall(b"".join(encode_command(*command) for command in setup))
+            for _ in setup:
+                reply = read_reply(stream)
+                if isinstance(reply, RespError):
+                    sock.close()
+                    raise reply
+        return sock, stream
+
+    def connect(self) -> socket.socket:
+        """Open the connection commands are sent on."""
+        self._sock, self._stream = self._open()
+        self._pid = os.getpid()
+        return self._sock
+
+    def close(self) -> None:
+        """Close the connection (the next command reconnects)."""
+        sock, self._sock, self._stream = self._sock, None, None
+        if sock is not None:
+            sock.close()
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def execute(self, *args: Any, idempotent: bool = False) -> Any:
+        """Run one command and return its reply (``idempotent`` as for :meth:`pipeline`).
+
+        Raises:
+            RespError: If the server replied with an error.
+        """
+        return self.pipeline([args], idempotent=idempotent)[0]
+
+    def pipeline(self, commands: list[tuple[Any, ...]], idempotent: bool = False) -> list[Any]:
+        """Send several commands in one write and return their replies in order.
+
+        If the connection fails before the batch is written, it is reopened
+        and the batch sent once more.  A failure after the write (a timeout or
+        a connection dropped while waiting for replies) may come after the
+        server applied the commands, so the batch is only resent when the
+        caller declares it ``idempotent``.
+
+        Raises:
+            RespError: If any command failed (the first error is raised).
+        """
+        payload = b"".join(encode_command(*command) for command in commands)
+        with self._lock:
+            if self._sock is not None and self._pid != os.getpid():
+                self.close()  # Inherited across fork: the parent owns that connection
+            for attempt in range(2):
+                sent = False
+                try:
+                    sock = self._sock or self.connect()
+                    sock.sendall(payload)
+                    sent = True
+                    replies = [read_reply(self._stream) for _ in commands]
+                    break
+                except OSError as e:  # ConnectionError and socket timeouts included
+                    self.close()
+                    if attempt or (sent and not idempotent):
+                        raise
+                    logger.debug(f"RESP connection to {self.host}:{self.port} lost ({e}), reconnecting")
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def subscribe(self, *channels: str) -> "RespSubscription":
+        """Subscribe to ``channels`` on a dedicated connection (commands keep their own).
+
+        Returns once the server has confirmed every subscription, so nothing
+        published afterwards is missed.
+
+        Raises:
+            RespError: If the server refused the subscription.
+        """
+        sock, stream = self._open()
+        try:
+            sock.sendall(encode_command("SUBSCRIBE", *channels))
+            for _ in channels:
+                reply = read_reply(stream)
+                if isinstance(reply, RespError):
+                    raise reply
+        except BaseException:
+            sock.close()
+            raise
+        sock.settimeout(None)  # Messages may be far apart
+        return RespSubscription(sock, stream)
+
+
+class RespSubscription:
+    """A subscribed connection; iterate it for ``(channel, message)`` pairs."""
+
+    def __init__(self, sock: socket.socket, stream: Any) -> None:
+        self._sock = sock
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[tuple[bytes, bytes]]:
+        """Yield published messages until the connection closes.
+
+        Raises:
+            ConnectionError: When the connection is closed (by either side).
+        """
+        while True:
+            reply = read_reply(self._stream)
+            if isinstance(reply, list) and len(reply) == 3 and reply[0] == b"message":
+                yield reply[1], reply[2]
+
+    def close(self) -> None:
+        """Close the connection, ending iteration in whichever thread is reading."""
+        with contextlib.suppress(OSError):
+            self._sock.shutdown(socket.SHUT_RDWR)
+        self._sock.close()
+
+
+__all__ = ["RespClient", "RespError", "RespSubscription", "encode_command", "read_reply"]
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/result_cache.py
+"""
+Result cache - opt-in caching of tools/call results.
+
+A tool opts in with ``@tool(cache_ttl=..., cache_max_entries=..., cache_scope=...)``,
+or the server enables caching for every tool annotated ``readOnlyHint`` or
+``idempotentHint`` (``ChukMCPServer(tool_cache_ttl=...)``); ``cache_ttl=0``
+opts a tool out again.
+
+Entries are keyed on the tool name, the scope (nothing, the session ID or the
+user ID) and the canonical orjson encoding of the *validated* arguments, so
+``{"a": 1, "b": "2"}`` and ``{"b": 2, "a": "1"}`` share an entry.  Results are
+stored as serialized ``result`` bytes and spliced straight into the response
+on a hit.  Eviction is LRU, bounded per tool by entry count and across all
+tools by a byte budget; expired entries are dropped on access or by
+:meth:`ToolResultCache.purge_expired`.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+from .constants import (
+    CACHE_SCOPE_GLOBAL,
+    CACHE_SCOPE_SESSION,
+    CACHE_SCOPE_USER,
+    CACHE_SCOPES,
+    DEFAULT_TOOL_CACHE_MAX_BYTES,
+    DEFAULT_TOOL_CACHE_MAX_ENTRIES,
+    KEY_IDEMPOTENT_HINT,
+    KEY_READ_ONLY_HINT,
+)
+from .context import get_session_id, get_user_id
+
+logger = logging.getLogger(__name__)
+
+# (tool name, scope ID or None, canonical argument bytes)
+CacheKey = tuple[str, str | None, bytes]
+
+
+def validate_cache_settings(ttl: float | None, max_entries: int | None, scope: str | None) -> None:
+    """Validate ``@tool`` cache settings.
+
+    Raises:
+        ValueError: On a negative TTL, a non-positive entry limit or an unknown scope.
+    """
+    if ttl is not None and ttl < 0:
+        raise ValueError("cache_ttl must be 0 (disabled) or positive")
+    if max_entries is not None and max_entries < 1:
+        raise ValueError("cache_max_entries must be at least 1")
+    if scope is not None and scope not in CACHE_SCOPES:
+        raise ValueError(f"Invalid cache_scope '{scope}': must be one of {sorted(CACHE_SCOPES)}")
+
+
+def canonical_arguments(arguments: Mapping[str, Any]) -> bytes:
+    """Encode validated arguments canonically (sorted keys, injected ``_`` values dropped)."""
+    return orjson.dumps(
+        {key: value for key, value in arguments.items() if not key.startswith("_")},
+        option=orjson.OPT_SORT_KEYS,
+    )
+
+
+def has_cacheable_hints(tool: Any) -> bool:
+    """Whether a tool is annotated ``readOnlyHint`` or ``idempotentHint``."""
+    annotations = tool.annotations
+    if not isinstance(annotations, dict):
+        return False
+    return bool(annotations.get(KEY_READ_ONLY_HINT) or annotations.get(KEY_IDEMPOTENT_HINT))
+
+
+def default_scope_for(tool: Any, default: str = CACHE_SCOPE_GLOBAL) -> str:
+    """Scope for sharing a tool's results when none is configured.
+
+    Results of tools that require auth are never shared between users.
+    """
+    return CACHE_SCOPE_USER if tool.requires_auth is True else default
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """Effective cache settings for one tool."""
+
+    ttl: float
+    max_entries: int
+    scope: str
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    body: bytes
+    expires_at: float
+
+
+class ToolResultCache:
+    """LRU + TTL cache of serialized tool results with a global byte budget."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_TOOL_CACHE_MAX_BYTES,
+        default_ttl: float | None = None,
+        default_max_entries: int = DEFAULT_TOOL_CACHE_MAX_ENTRIES,
+        default_scope: str = CACHE_SCOPE_GLOBAL,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        validate_cache_settings(default_ttl, default_max_entries, default_scope)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl or None
+        self.default_max_entries = default_max_entries
+        self.default_scope = default_scope
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._tool_keys: dict[str, OrderedDict[CacheKey, None]] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    # ------------------------------------------------------------------
+    # Policy and keys
+    # ------------------------------------------------------------------
+
+    def policy_for(self, tool: Any) -> ToolCachePolicy | None:
+        """Resolve a tool's cache policy (``None`` if its results are not cached)."""
+        ttl = tool.cache_ttl
+        if isinstance(ttl, int | float) and not isinstance(ttl, bool):
+            if ttl <= 0:
+                return None
+        elif self.default_ttl is not None and has_cacheable_hints(tool):
+            ttl = self.default_ttl
+        else:
+            return None
+
+        max_entries = tool.cache_max_entries
+        if not isinstance(max_entries, int):
+            max_entries = self.default_max_entries
+        scope = tool.cache_scope
+        if not isinstance(scope, str):
+            scope = default_scope_for(tool, self.default_scope)
+        return ToolCachePolicy(ttl=float(ttl), max_entries=max_entries, scope=scope)
+
+    @staticmethod
+    def make_key(tool_name: str, scope: str, validated_arguments: Mapping[str, Any]) -> CacheKey | None:
+        """Build the key for a call in ``scope``, or ``None`` if the scope is unknown here."""
+        scope_id: str | None = None
+        if scope == CACHE_SCOPE_SESSION:
+            scope_id = get_session_id()
+        elif scope == CACHE_SCOPE_USER:
+            scope_id = get_user_id()
+        if scope != CACHE_SCOPE_GLOBAL and scope_id is None:
+            return None
+        try:
+            return tool_name, scope_id, canonical_arguments(validated_arguments)
+        except TypeError:
+            return None
+
+    # ------------------------------------------------------------------
+    # Lookup and store
+    # ------------------------------------------------------------------
+
+    def get(self, key: CacheKey) -> bytes | None:
+        """Return cached result bytes, counting the hit or miss."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._expirations += 1
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._tool_keys[key[0]].move_to_end(key)
+        self._hits += 1
+        return entry.body
+
+    def put(self, key: CacheKey, policy: ToolCachePolicy, result: Mapping[str, Any]) -> bool:
+        """Store a tool result; returns False if it cannot be serialized or exceeds the budget."""
+        try:
+            body = orjson.dumps(result)
+        except TypeError:
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _CacheEntry(body=body, expires_at=time.monotonic() + policy.ttl)
+        tool_keys = self._tool_keys.setdefault(key[0], OrderedDict())
+        tool_keys[key] = None
+        self._bytes += len(body)
+
+        while len(tool_keys) > policy.max_entries:
+            self._remove(next(iter(tool_keys)))
+            self._evictions += 1
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+        return True
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
+        tool_keys = self._tool_keys[key[0]]
+        del tool_keys[key]
+        if not tool_keys:
+            del self._tool_keys[key[0]]
+
+    # ------------------------------------------------------------------
+    # Invalidation and maintenance
+    # ------------------------------------------------------------------
+
+    def invalidate(self, tool_name: str | None = None, arguments: bytes | None = None) -> int:
+        """Drop cached results: everything, one tool's, or one tool's for specific arguments.
+
+        ``arguments`` is a :func:`canonical_arguments` encoding and matches
+        entries in every scope.  Returns the number of entries removed.
+        """
+        if tool_name is None:
+            keys = list(self._entries)
+        else:
+            keys = [key for key in self._tool_keys.get(tool_name, ()) if arguments is None or key[2] == arguments]
+        for key in keys:
+            self._remove(key)
+        self._invalidations += len(keys)
+        return len(keys)
+
+    def purge_expired(self) -> int:
+        """Drop all expired entries; returns how many were removed."""
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+        self._tool_keys.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float | None:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and effectiveness metrics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self.hit_ratio,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+            "tools": {name: len(keys) for name, keys in self._tool_keys.items()},
+        }
+
+
+__all__ = [
+    "CacheKey",
+    "ToolCachePolicy",
+    "ToolResultCache",
+    "canonical_arguments",
+    "default_scope_for",
+    "has_cacheable_hints",
+    "validate_cache_settings",
+]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/singleflight.py
+"""
+Single-flight - coalesce identical concurrent tool calls into one execution.
+
+When several sessions call the same read-only tool with the same arguments
+at the same moment, the first caller (the leader) starts the execution and
+every duplicate that arrives before it finishes awaits the same result.
+
+The shared execution runs in its own task (with the leader's context), so
+cancelling any one waiter - the leader included - only detaches that waiter.
+The execution is cancelled only once *every* waiter has gone away.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _Flight:
+    task: asyncio.Future[Any]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+        self._executions = 0
+        self._coalesced = 0
+        self._abandoned = 0
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``func()``, sharing one execution with concurrent callers of the same key."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(func()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(partial(self._finished, key, flight))
+            self._executions += 1
+        else:
+            self._coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every waiter was cancelled: nobody wants the result any more
+                self._forget(key, flight)
+                flight.task.cancel()
+                self._abandoned += 1
+
+    def _finished(self, key: Hashable, flight: _Flight, task: asyncio.Future[Any]) -> None:
+        self._forget(key, flight)
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter left
+            task.exception()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescing metrics for monitoring."""
+        return {
+            "in_flight": len(self._flights),
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "abandoned": self._abandoned,
+        }
+
+
+__all__ = ["SingleFlight"]
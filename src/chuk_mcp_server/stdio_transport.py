@@ -30,6 +30,7 @@ from .constants import (
     McpMethod,
 )
 from .protocol import MCPProtocolHandler
+from .types.serialization import serialize_mcp_response
 
 logger = logging.getLogger(__name__)
 
@@ -202,7 +203,7 @@ class StdioTransport:
             if method == McpMethod.INITIALIZE:
                 client_info = params.get(KEY_CLIENT_INFO, {})
                 protocol_version = params.get(KEY_PROTOCOL_VERSION, MCP_PROTOCOL_VERSION_2025_03)
-                session_id = self.protocol.session_manager.create_session(client_info, protocol_version)
+                session_id = await self.protocol.session_manager.create_session_async(client_info, protocol_version)
                 self.session_id = session_id
 
             # Process through protocol handler
@@ -229,7 +230,7 @@ class StdioTransport:
         """
         try:
             # Serialize with orjson for performance
-            json_str = orjson.dumps(response).decode(DEFAULT_ENCODING)
+            json_str = serialize_mcp_response(response).decode(DEFAULT_ENCODING)
 
             # Write to stdout with newline
             if self.writer:
@@ -470,7 +471,7 @@ class StdioSyncTransport:
             response: Response dictionary to send
         """
         try:
-            response_line = orjson.dumps(response).decode(DEFAULT_ENCODING)
+            response_line = serialize_mcp_response(response).decode(DEFAULT_ENCODING)
             print(response_line, flush=True)
 
         except Exception as e:
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/supervisor.py
+"""
+Supervisor - prefork multi-worker HTTP serving.
+
+:class:`WorkerSupervisor` forks N worker processes and keeps them running:
+
+- Each worker listens on its own ``SO_REUSEPORT`` socket, so the kernel
+  spreads incoming connections across workers.  Where ``SO_REUSEPORT`` is
+  missing, the supervisor binds one socket that every worker accepts on.
+- A worker that exits unexpectedly is replaced; one that keeps crashing
+  within ``WORKER_MIN_UPTIME`` is restarted with exponential backoff.
+- ``SIGHUP`` rolls the workers one at a time: a replacement starts before
+  the old worker is asked to stop, so capacity never drops.
+- ``SIGTERM``/``SIGINT`` stop every worker gracefully (``SIGKILL`` after
+  the shutdown timeout).
+
+Each worker also holds one end of a socket pair to the supervisor
+(:class:`WorkerChannel`).  Every ``stats_interval`` seconds it reports its
+per-process counters and the readings of its shared backends; the
+supervisor pushes back the pod summary - counters summed over all workers,
+shared readings from one of them - which the worker then serves from
+``get_performance_stats()`` and ``/health/detailed``.
+
+Messages on the channel are newline-delimited JSON.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import selectors
+import signal
+import socket
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+from .constants import (
+    DEFAULT_WORKER_SHUTDOWN_TIMEOUT,
+    DEFAULT_WORKER_STATS_INTERVAL,
+    WORKER_MIN_UPTIME,
+    WORKER_RESTART_DELAY,
+    WORKER_RESTART_MAX_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+# Runs one worker's server on the given listening sockets until it is told to stop
+WorkerTarget = Callable[[list[socket.socket], socket.socket], None]
+
+_HANDLED_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGCHLD", "SIGHUP", "SIGTERM", "SIGINT") if hasattr(signal, name)
+)
+_CHANNEL_READ_SIZE = 65536
+_CHANNEL_LINE_LIMIT = 2**22
+
+
+def sum_counters(snapshots: list[dict[str, Any]]) -> dict[str, Any]:
+    """Sum the integer leaves of nested stats dicts.
+
+    Keys whose values are integers in every snapshot that has them are
+    summed; nested dicts are merged recursively; anything else (ratios,
+    timings, strings, lists) has no meaningful pod total and is left out.
+    """
+    totals: dict[str, Any] = {}
+    keys = {key for snapshot in snapshots for key in snapshot}
+    for key in keys:
+        values = [snapshot[key] for snapshot in snapshots if key in snapshot]
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            totals[key] = sum(values)
+        elif all(isinstance(value, dict) for value in values):
+            nested = sum_counters(values)
+            if nested:
+                totals[key] = nested
+    return totals
+
+
+def _bind(host: str, port: int, reuse_port: bool) -> socket.socket:
+    family, kind, proto, _, address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE)[
+        0
+    ]
+    sock = socket.socket(family, kind, proto)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(address)
+    return sock
+
+
+@dataclass(eq=False)
+class _Worker:
+    slot: int
+    pid: int
+    channel: socket.socket  # Supervisor's end
+    started_at: float
+    buffer: bytes = b""
+    stats: dict[str, Any] | None = None
+    retiring: bool = False
+    crashes: int = 0  # Consecutive exits within WORKER_MIN_UPTIME
+
+
+class WorkerSupervisor:
+    """Forks, restarts and rolls worker processes serving one address."""
+
+    def __init__(
+        self,
+        target: WorkerTarget,
+        workers: int,
+        host: str,
+        port: int,
+        backlog: int = 2048,
+        stats_interval: float = DEFAULT_WORKER_STATS_INTERVAL,
+        shutdown_timeout: float = DEFAULT_WORKER_SHUTDOWN_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            target: Runs in each forked worker with its listening sockets and its
+                channel socket (wrap it in :class:`WorkerChannel`); returns when the
+                worker's server stops
+            workers: Number of worker processes
+            host: Address to listen on
+            port: Port to listen on
+            backlog: Listen backlog of each socket
+            stats_interval: Seconds between pod summaries pushed to the workers
+            shutdown_timeout: Seconds a stopping worker gets before SIGKILL
+
+        Raises:
+            ValueError: If ``workers`` is less than 1.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.target = target
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.stats_interval = stats_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.reuse_port = hasattr(socket, "SO_REUSEPORT")
+        self._workers: dict[int, _Worker] = {}  # pid -> worker
+        self._pending: list[tuple[float, int, int]] = []  # (due, slot, crashes) restarts waiting out backoff
+        self._roll_queue: list[int] = []  # pids still to be replaced by the current roll
+        self._selector = selectors.DefaultSelector()
+        self._shared_socket: socket.socket | None = None
+        self._reserved_socket: socket.socket | None = None
+        self._wakeup: tuple[socket.socket, socket.socket] | None = None
+        self._stopping = False
+        self._restarts = 0
+        self._rolls = 0
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Serve until SIGTERM or SIGINT (blocks; call from the main thread)."""
+        if self.reuse_port:
+            # Bound but not listening: fails fast if the port is taken, receives no connections
+            self._reserved_socket = _bind(self.host, self.port, reuse_port=True)
+            self.port = self._reserved_socket.getsockname()[1]  # Resolves port 0
+        else:
+            self._shared_socket = _bind(self.host, self.port, reuse_port=False)
+            self._shared_socket.listen(self.backlog)
+            self.port = self._shared_socket.getsockname()[1]
+        self._install_signals()
+        logger.info(
+            f"Supervisor {os.getpid()} starting {self.workers} workers on {self.host}:{self.port}"
+            f"{' (SO_REUSEPORT)' if self.reuse_port else ''}"
+        )
+        try:
+            for slot in range(self.workers):
+                self._spawn(slot)
+            next_broadcast = time.monotonic() + self.stats_interval
+            while not self._stopping:
+                now = time.monotonic()
+                deadlines = [next_broadcast] + [due for due, _, _ in self._pending]
+                for key, _ in self._selector.select(max(0.0, min(deadlines) - now)):
+                    if key.data is None:
+                        self._handle_signals()
+                    else:
+                        self._read_channel(key.data)
+                self._reap()
+                self._start_due_restarts()
+                if time.monotonic() >= next_broadcast:
+                    self._broadcast()
+                    next_broadcast = time.monotonic() + self.stats_interval
+        finally:
+            self._stop_all()
+            self._restore_signals()
+
+    def _install_signals(self) -> None:
+        reader, writer = socket.socketpair()
+        reader.setblocking(False)
+        writer.setblocking(False)
+        self._wakeup = (reader, writer)
+        signal.set_wakeup_fd(writer.fileno())
+        for signum in _HANDLED_SIGNALS:
+            signal.signal(signum, lambda *_: None)  # Delivered through the wakeup socket
+        self._selector.register(reader, selectors.EVENT_READ, None)
+
+    def _restore_signals(self) -> None:
+        signal.set_wakeup_fd(-1)
+        for signum in _HANDLED_SIGNALS:
+            signal.signal(signum, signal.SIG_DFL if signum != signal.SIGINT else signal.default_int_handler)
+        if self._wakeup is not None:
+            for sock in self._wakeup:
+                sock.close()
+            self._wakeup = None
+
+    def _handle_signals(self) -> None:
+        assert self._wakeup is not None
+        try:
+            received = self._wakeup[0].recv(4096)
+        except BlockingIOError:
+            return
+        for signum in received:
+            if signum in (signal.SIGTERM, signal.SIGINT):
+                logger.info(f"Supervisor received {signal.Signals(signum).name}; stopping workers")
+                self._stopping = True
+            elif signum == signal.SIGHUP:
+                self.roll()
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _spawn(self, slot: int, crashes: int = 0) -> _Worker:
+        parent_end, child_end = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the forked worker
+            parent_end.close()
+            self._run_worker(child_end)
+        child_end.close()
+        parent_end.settimeout(1.0)
+        worker = _Worker(slot=slot, pid=pid, channel=parent_end, started_at=time.monotonic(), crashes=crashes)
+        self._workers[pid] = worker
+        self._selector.register(parent_end, selectors.EVENT_READ, worker)
+        logger.debug(f"Started worker {pid} (slot {slot})")
+        return worker
+
+    def _run_worker(self, channel: socket.socket) -> None:  # pragma: no cover - runs in the forked worker
+        """Body of a forked worker; never returns."""
+        status = 0
+        try:
+            # Drop the supervisor's state: signal routing, other workers' channels
+            signal.set_wakeup_fd(-1)
+            for signum in _HANDLED_SIGNALS:
+                signal.signal(signum, signal.SIG_DFL if signum != signal.SIGINT else signal.default_int_handler)
+            for key in list(self._selector.get_map().values()):
+                key.fileobj.close()  # type: ignore[union-attr]
+            self._selector.close()
+            if self._wakeup is not None:
+                for sock in self._wakeup:
+                    sock.close()
+            if self._reserved_socket is not None:
+                self._reserved_socket.close()
+            if self._shared_socket is not None:
+                sockets = [self._shared_socket]
+            else:
+                sock = _bind(self.host, self.port, reuse_port=True)
+                sock.listen(self.backlog)
+                sockets = [sock]
+            self.target(sockets, channel)
+        except BaseException as e:
+            status = 1
+            logger.error(f"Worker {os.getpid()} failed: {e}", exc_info=True)
+        finally:
+            os._exit(status)
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self._workers.pop(pid, None)
+            if worker is None:
+                continue
+            self._selector.unregister(worker.channel)
+            worker.channel.close()
+            if worker.retiring:
+                logger.debug(f"Worker {pid} retired")
+                self._roll_next()
+            elif not self._stopping:
+                self._schedule_restart(worker, os.waitstatus_to_exitcode(status))
+
+    def _schedule_restart(self, worker: _Worker, exit_code: int) -> None:
+        uptime = time.monotonic() - worker.started_at
+        crashes = worker.crashes + 1 if uptime < WORKER_MIN_UPTIME else 0
+        delay = min(WORKER_RESTART_DELAY * 2 ** (crashes - 1), WORKER_RESTART_MAX_DELAY) if crashes else 0.0
+        logger.warning(
+            f"Worker {worker.pid} (slot {worker.slot}) exited with {exit_code} after {uptime:.1f}s; "
+            f"restarting in {delay:.1f}s"
+        )
+        self._pending.append((time.monotonic() + delay, worker.slot, crashes))
+
+    def _start_due_restarts(self) -> None:
+        now = time.monotonic()
+        due = [entry for entry in self._pending if entry[0] <= now]
+        if not due:
+            return
+        self._pending = [entry for entry in self._pending if entry[0] > now]
+        for _, slot, crashes in due:
+            self._spawn(slot, crashes)
+            self._restarts += 1
+
+    def roll(self) -> None:
+        """Replace every worker, one at a time (what SIGHUP does)."""
+        if self._roll_queue:
+            logger.info("Worker roll already in progress")
+            return
+        self._rolls += 1
+        self._roll_queue = [pid for pid, worker in self._workers.items() if not worker.retiring]
+        logger.info(f"Rolling {len(self._roll_queue)} workers")
+        self._roll_next()
+
+    def _roll_next(self) -> None:
+        while self._roll_queue and not self._stopping:
+            old = self._workers.get(self._roll_queue.pop(0))
+            if old is None:
+                continue  # Exited meanwhile; its restart already replaced it
+            self._spawn(old.slot)
+            old.retiring = True
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(old.pid, signal.SIGTERM)
+            return
+
+    def _stop_all(self) -> None:
+        self._stopping = True
+        for pid in self._workers:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.shutdown_timeout
+        while self._workers and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.05)
+        for pid in list(self._workers):
+            logger.warning(f"Worker {pid} did not stop within {self.shutdown_timeout}s; killing it")
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGKILL)
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, 0)
+            self._selector.unregister(self._workers[pid].channel)
+            self._workers.pop(pid).channel.close()
+        for sock in (self._shared_socket, self._reserved_socket):
+            if sock is not None:
+                sock.close()
+        self._selector.close()
+        logger.info("Supervisor stopped")
+
+    # ------------------------------------------------------------------
+    # Stats channel
+    # ------------------------------------------------------------------
+
+    def _read_channel(self, worker: _Worker) -> None:
+        try:
+            data = worker.channel.recv(_CHANNEL_READ_SIZE)
+        except OSError:
+            return
+        if not data:
+            return  # Worker exiting; _reap cleans up
+        *lines, worker.buffer = (worker.buffer + data).split(b"\n")
+        for line in reversed(lines):
+            try:
+                worker.stats = orjson.loads(line)["stats"]
+                break
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                continue
+
+    def _broadcast(self) -> None:
+        payload = orjson.dumps(self.get_stats()) + b"\n"
+        for worker in self._workers.values():
+            try:
+                worker.channel.sendall(payload)
+            except OSError as e:
+                logger.debug(f"Could not send pod stats to worker {worker.pid}: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the pod summary: worker processes, restarts, summed counters and shared backends."""
+        live = [worker for worker in self._workers.values() if not worker.retiring]
+        reports = [worker.stats for worker in live if worker.stats is not None]
+        now = time.monotonic()
+        return {
+            "supervisor_pid": os.getpid(),
+            "count": len(live),
+            "target": self.workers,
+            "reuse_port": self.reuse_port,
+            "restarts": self._restarts,
+            "rolls": self._rolls,
+            "workers": {
+                str(worker.pid): {
+                    "slot": worker.slot,
+                    "uptime": round(now - worker.started_at, 1),
+                    "reporting": worker.stats is not None,
+                }
+                for worker in live
+            },
+            "totals": sum_counters([report.get("counters") or {} for report in reports]),
+            # Every worker reads the same shared store and log: report them once, not summed
+            "shared": next((report["shared"] for report in reports if report.get("shared")), {}),
+        }
+
+
+class WorkerChannel:
+    """A worker's end of the supervisor channel: reports stats, receives pod totals."""
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        snapshot: Callable[[], dict[str, Any]],
+        interval: float = DEFAULT_WORKER_STATS_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            sock: The channel socket handed to the worker target
+            snapshot: Returns this worker's stats to report
+            interval: Seconds between reports
+        """
+        self.sock = sock
+        self.snapshot = snapshot
+        self.interval = interval
+        self.pod: dict[str, Any] | None = None  # Latest summary from the supervisor
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start reporting (call from the worker's event loop)."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        reader, writer = await asyncio.open_connection(sock=self.sock, limit=_CHANNEL_LINE_LIMIT)
+        receiving = asyncio.get_running_loop().create_task(self._receive(reader))
+        try:
+            while not receiving.done():
+                writer.write(orjson.dumps({"stats": self.snapshot()}, default=str) + b"\n")
+                await writer.drain()
+                await asyncio.sleep(self.interval)
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"Supervisor channel closed: {e}")
+        finally:
+            receiving.cancel()
+            writer.close()
+
+    async def _receive(self, reader: asyncio.StreamReader) -> None:
+        while line := await reader.readline():
+            with contextlib.suppress(orjson.JSONDecodeError):
+                self.pod = orjson.loads(line)
+        # The supervisor is gone: nothing will restart or stop this worker, so stop now
+        logger.warning(f"Supervisor exited; stopping worker {os.getpid()}")
+        os.kill(os.getpid(), signal.SIGTERM)
+
+
+__all__ = ["WorkerChannel", "WorkerSupervisor", "sum_counters"]
@@ -53,16 +53,27 @@ from .content import format_content
 # Custom errors
 from .errors import (
     ParameterValidationError,
+    ToolBusyError,
     ToolExecutionError,
 )
 
 # Parameter types and schema generation
 from .parameters import ToolParameter
 from .prompts import MCPPrompt, PromptHandler
-from .resources import ResourceHandler
+from .resources import (
+    BlobContent,
+    ResourceCache,
+    ResourceHandler,
+    configure_resource_cache,
+    get_resource_cache,
+    read_file_blob,
+    read_file_text,
+)
 
 # Serialization utilities
 from .serialization import (
+    PreSerializedResponse,
+    serialize_mcp_response,
     serialize_resources_list,
     serialize_tools_list,
     serialize_tools_list_from_bytes,
@@ -81,17 +92,26 @@ __all__ = [
     "ToolParameter",
     "ToolHandler",
     "ResourceHandler",
+    "ResourceCache",
+    "BlobContent",
     "PromptHandler",
     "MCPPrompt",
     # Framework helpers
     "create_server_capabilities",
     "format_content",
+    "configure_resource_cache",
+    "get_resource_cache",
+    "read_file_blob",
+    "read_file_text",
     # Serialization utilities
     "serialize_tools_list",
     "serialize_resources_list",
     "serialize_tools_list_from_bytes",
+    "serialize_mcp_response",
+    "PreSerializedResponse",
     # Exception types
     "ParameterValidationError",
+    "ToolBusyError",
     "ToolExecutionError",
     # Direct chuk_mcp types (no conversion needed)
     "ServerInfo",
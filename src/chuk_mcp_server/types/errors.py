@@ -8,7 +8,7 @@ and debugging information for tool execution and parameter validation.
 
 from typing import Any
 
-from chuk_mcp_server.constants import JsonRpcError
+from chuk_mcp_server.constants import MCP_ERROR_TOOL_BUSY, JsonRpcError
 
 from .base import MCPError, ValidationError
 
@@ -43,6 +43,25 @@ class ToolExecutionError(MCPError):  # type: ignore[misc]
         super().__init__(message, code=JsonRpcError.INTERNAL_ERROR, data=data)
 
 
+class ToolBusyError(MCPError):  # type: ignore[misc]
+    """A tool is at its concurrency limit and the call could not be queued.
+
+    ``reason`` is ``"queue_full"`` when the wait queue was already full, or
+    ``"queue_timeout"`` when the call waited ``queue_timeout`` seconds without
+    getting a slot.
+    """
+
+    def __init__(self, tool_name: str, reason: str, limits: dict[str, Any]):
+        if reason == "queue_timeout":
+            message = f"Tool '{tool_name}' is busy: timed out waiting for a free slot"
+        else:
+            message = f"Tool '{tool_name}' is busy: concurrency limit reached and wait queue is full"
+        self.tool_name = tool_name
+        self.reason = reason
+        data = {"tool": tool_name, "reason": reason, **limits}
+        super().__init__(message, code=MCP_ERROR_TOOL_BUSY, data=data)
+
+
 class URLElicitationRequiredError(Exception):
     """Raised by a tool to indicate the user must visit an external URL.
 
@@ -67,4 +86,4 @@ class URLElicitationRequiredError(Exception):
         super().__init__(f"URL elicitation required: {url}")
 
 
-__all__ = ["ParameterValidationError", "ToolExecutionError", "URLElicitationRequiredError"]
+__all__ = ["ParameterValidationError", "ToolBusyError", "ToolExecutionError", "URLElicitationRequiredError"]
@@ -9,16 +9,18 @@ including caching, orjson serialization, and prompt argument validation.
 
 import inspect
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import orjson
 
 from chuk_mcp_server.constants import JsonRpcError
 
+from ..executors import run_sync_handler, validate_executor_policy
 from .base import MCPError
 from .errors import ParameterValidationError
 from .parameters import ToolParameter
+from .validation import ArgumentValidator, compile_argument_validator, compile_converter
 
 # ============================================================================
 # MCP Prompt Data Class (Since chuk_mcp doesn't provide one)
@@ -57,6 +59,8 @@ class PromptHandler:
     _cached_mcp_format: dict[str, Any] | None = None  # Cache the MCP format dict
     _cached_mcp_bytes: bytes | None = None  # 🚀 Cache orjson-serialized bytes
     icons: list[dict[str, Any]] | None = None  # MCP icons (2025-11-25)
+    executor: str | None = None  # Sync handler executor ("inline"/"thread"/"process"); None = server default
+    _validator: ArgumentValidator | None = field(default=None, repr=False, compare=False)  # Compiled once
 
     @classmethod
     def from_function(
@@ -65,6 +69,7 @@ class PromptHandler:
         name: str | None = None,
         description: str | None = None,
         icons: list[dict[str, Any]] | None = None,
+        executor: str | None = None,
     ) -> "PromptHandler":
         """Create PromptHandler from a function with orjson optimization."""
         prompt_name = name or func.__name__
@@ -112,10 +117,12 @@ class PromptHandler:
             _cached_mcp_format=None,  # Will be computed immediately
             _cached_mcp_bytes=None,  # Will be computed immediately
             icons=icons,
+            executor=validate_executor_policy(executor, func),
         )
 
         # Pre-compute and cache both formats during creation for maximum performance
         instance._ensure_cached_formats()
+        instance._compile_validator()
 
         return instance
 
@@ -166,138 +173,20 @@ class PromptHandler:
         """Invalidate all cached formats (if schema changes at runtime)."""
         self._cached_mcp_format = None
         self._cached_mcp_bytes = None
+        self._validator = None
+
+    def _compile_validator(self) -> ArgumentValidator:
+        """Compile (once) the argument validator for this prompt's parameters."""
+        self._validator = compile_argument_validator(self.parameters, lenient_booleans=False)
+        return self._validator
 
     def _validate_and_convert_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """Validate and convert arguments with specific error types."""
-        validated_args = {}
-
-        for param in self.parameters:
-            value = arguments.get(param.name)
-
-            if value is None:
-                if param.required:
-                    raise ParameterValidationError(param.name, param.type, None)
-                value = param.default
-
-            # Skip validation if value is still None after default assignment
-            if value is not None:
-                try:
-                    validated_value = self._convert_type(value, param)
-                    validated_args[param.name] = validated_value
-                except (ValueError, TypeError) as e:
-                    raise ParameterValidationError(param.name, param.type, value) from e
-
-        return validated_args
+        return (self._validator or self._compile_validator())(arguments)
 
     def _convert_type(self, value: Any, param: ToolParameter) -> Any:
-        """Convert value to the expected parameter type with orjson optimization."""
-        # Reuse the same type conversion logic from ToolHandler
-        if param.type == "integer":
-            if isinstance(value, int):
-                return value
-            elif isinstance(value, float):
-                if value.is_integer():
-                    return int(value)
-                else:
-                    raise ValueError(f"Cannot convert float {value} to integer without precision loss")
-            elif isinstance(value, str):
-                try:
-                    return int(value)
-                except ValueError:
-                    try:
-                        float_val = float(value)
-                        if float_val.is_integer():
-                            return int(float_val)
-                        else:
-                            raise ValueError(f"Cannot convert string '{value}' to integer without precision loss")
-                    except ValueError as e:
-                        raise ValueError(f"Cannot convert string '{value}' to integer") from e
-            else:
-                return int(value)
-
-        elif param.type == "number":
-            if isinstance(value, int | float):
-                return float(value)
-            elif isinstance(value, str):
-                try:
-                    return float(value)
-                except ValueError as e:
-                    raise ValueError(f"Cannot convert string '{value}' to number") from e
-            else:
-                return float(value)
-
-        elif param.type == "boolean":
-            if isinstance(value, bool):
-                return value
-            elif isinstance(value, str):
-                # Handle string representations of booleans more robustly
-                lower_val = value.lower().strip()
-                # Handle empty string and null string - use parameter default or False
-                if lower_val == "" or lower_val == "null":
-                    # For empty/null strings, use the parameter default if available, otherwise False
-                    return param.default if param.default is not None else False
-                elif lower_val in ("true", "1", "yes", "on", "t", "y"):
-                    return True
-                elif lower_val in ("false", "0", "no", "off", "f", "n"):
-                    return False
-                else:
-                    # For unrecognized strings, raise an error to ensure valid input
-                    raise ValueError(f"Cannot convert string '{value}' to boolean")
-            elif isinstance(value, int | float):
-                return bool(value)
-            elif value is None:
-                # Handle None explicitly
-                return False
-            else:
-                # Try converting to bool as last resort
-                try:
-                    return bool(value)
-                except Exception as e:
-                    raise ValueError(f"Cannot convert {type(value).__name__} '{value}' to boolean") from e
-
-        elif param.type == "string":
-            if isinstance(value, str):
-                return value
-            else:
-                return str(value)
-
-        elif param.type == "array":
-            if isinstance(value, list):
-                return value
-            elif isinstance(value, tuple | set):
-                return list(value)
-            elif isinstance(value, str):
-                try:
-                    parsed = orjson.loads(value)
-                    if isinstance(parsed, list):
-                        return parsed
-                    else:
-                        raise ValueError(f"String '{value}' does not represent an array")
-                except orjson.JSONDecodeError as e:
-                    raise ValueError(f"Cannot convert string '{value}' to array") from e
-            else:
-                raise ValueError(f"Cannot convert {type(value).__name__} to array")
-
-        elif param.type == "object":
-            if isinstance(value, dict):
-                return value
-            elif isinstance(value, str):
-                try:
-                    parsed = orjson.loads(value)
-                    if isinstance(parsed, dict):
-                        return parsed
-                    else:
-                        raise ValueError(f"String '{value}' does not represent an object")
-                except orjson.JSONDecodeError as e:
-                    raise ValueError(f"Cannot convert string '{value}' to object") from e
-            else:
-                raise ValueError(f"Cannot convert {type(value).__name__} to object")
-
-        # Check enum values if specified
-        if param.enum and value not in param.enum:
-            raise ValueError(f"Value '{value}' must be one of {param.enum}")
-
-        return value
+        """Convert a single value to the expected parameter type."""
+        return compile_converter(param, lenient_booleans=False)(value)
 
     async def get_prompt(self, arguments: dict[str, Any] | None = None) -> str | dict[str, Any]:
         """
@@ -311,7 +200,7 @@ class PromptHandler:
             if inspect.iscoroutinefunction(self.handler):
                 result = await self.handler(**validated_args)
             else:
-                result = self.handler(**validated_args)
+                result = await run_sync_handler(self.handler, self.executor, **validated_args)
 
             validated_result: str | dict[str, Any] = result
             return validated_result
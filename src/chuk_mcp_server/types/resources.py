@@ -5,11 +5,34 @@ Resources - ResourceHandler with orjson optimization and content caching
 
 This module provides the ResourceHandler class with content caching,
 orjson serialization, and MIME type-aware content formatting.
+
+Cached content is refreshed single-flight: when the TTL expires, concurrent
+readers share one handler call instead of stampeding it.  Optionally, stale
+content keeps being served for ``stale_while_revalidate`` seconds while a
+background refresh runs, and for ``stale_if_error`` seconds if a refresh fails.
+
+Content of every caching ResourceHandler lives in one process-wide
+:class:`ResourceCache` with a byte budget and LRU eviction, optionally
+zlib-compressing large entries (see :func:`configure_resource_cache`).
+
+Handlers may return binary content - ``bytes``, ``bytearray``, ``memoryview``
+or a file path (``pathlib.Path``) - which is read as :class:`BlobContent`
+and served in the ``blob`` field.  Files are stat'ed, read and base64-encoded
+(or decoded, for text) off the event loop, once per modification time.
 """
 
+import asyncio
+import base64
 import inspect
+import itertools
+import logging
+import mimetypes
+import os
 import time
-from collections.abc import Callable
+import weakref
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -21,11 +44,305 @@ from chuk_mcp_server.constants import (
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_MARKDOWN,
     CONTENT_TYPE_PLAIN,
+    DEFAULT_RESOURCE_CACHE_MAX_BYTES,
+    EXECUTOR_THREAD,
+    RESOURCE_CACHE_COMPRESS_LEVEL,
     JsonRpcError,
 )
 
+from ..executors import run_sync_handler, validate_executor_policy
+from ..singleflight import SingleFlight
+from ..uri_templates import compile_uri_template
 from .base import MCPError, MCPResource
 
+logger = logging.getLogger(__name__)
+
+
+class BlobContent(str):
+    """Base64-encoded binary resource content, served in the ``blob`` field.
+
+    A ``str`` subclass, so it flows through caches and ``read() -> str``
+    unchanged and orjson serializes it without another copy.
+    """
+
+    mime_type: str | None  # Guessed from the file name for file-backed blobs
+    source_path: str | None  # File the content was read from, if any
+
+    def __new__(cls, encoded: str, mime_type: str | None = None, source_path: str | None = None) -> "BlobContent":
+        blob = super().__new__(cls, encoded)
+        blob.mime_type = mime_type
+        blob.source_path = source_path
+        return blob
+
+
+# ============================================================================
+# Shared Resource Content Cache
+# ============================================================================
+
+
+@dataclass(slots=True)
+class _CachedResource:
+    uri: str
+    content: str | bytes  # bytes when zlib-compressed
+    size: int  # Bytes charged against the budget
+    stored_at: float | None  # time.time() of the load that produced the content
+    max_age: float | None  # Seconds after stored_at the entry may still be served (TTL + stale windows)
+    version: Hashable = None  # Source version the content was produced from (e.g. file mtime and size)
+
+
+class ResourceCache:
+    """Byte-budgeted LRU store for the content of caching resource handlers.
+
+    Freshness (TTL and stale windows) is decided by each ResourceHandler; the
+    cache only bounds memory, evicting least recently read entries once the
+    budget is exceeded and dropping entries past their maximum age in
+    :meth:`purge_expired`.  Entries of at least ``compress_min_bytes`` are held
+    zlib-compressed (0 disables compression).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_RESOURCE_CACHE_MAX_BYTES, compress_min_bytes: int = 0) -> None:
+        self._entries: OrderedDict[Hashable, _CachedResource] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejected = 0
+        self._compressed = 0
+        self.max_bytes = DEFAULT_RESOURCE_CACHE_MAX_BYTES
+        self.compress_min_bytes = 0
+        self.configure(max_bytes, compress_min_bytes)
+
+    def configure(self, max_bytes: int | None = None, compress_min_bytes: int | None = None) -> None:
+        """Change the budget and/or compression threshold (``None`` keeps the current value)."""
+        if max_bytes is not None:
+            if max_bytes < 1:
+                raise ValueError("max_bytes must be at least 1")
+            self.max_bytes = max_bytes
+            self._trim()
+        if compress_min_bytes is not None:
+            if compress_min_bytes < 0:
+                raise ValueError("compress_min_bytes must be 0 (disabled) or positive")
+            self.compress_min_bytes = compress_min_bytes
+
+    # ------------------------------------------------------------------
+    # Lookup and store
+    # ------------------------------------------------------------------
+
+    def get(self, key: Hashable, version: Hashable = None) -> tuple[str, float | None] | None:
+        """Return ``(content, stored_at)`` and mark the entry recently used.
+
+        With ``version``, an entry produced from a different version is a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None or (version is not None and entry.version != version):
+            return None
+        self._entries.move_to_end(key)
+        return self._decode(entry), entry.stored_at
+
+    def peek(self, key: Hashable) -> tuple[str, float | None] | None:
+        """Like :meth:`get`, without touching LRU order."""
+        entry = self._entries.get(key)
+        return None if entry is None else (self._decode(entry), entry.stored_at)
+
+    def put(
+        self,
+        key: Hashable,
+        uri: str,
+        content: str,
+        stored_at: float | None,
+        max_age: float | None = None,
+        version: Hashable = None,
+    ) -> bool:
+        """Store content; returns False if it is larger than the whole budget.
+
+        BlobContent is stored as-is (base64 of binary data barely compresses).
+        """
+        self.discard(key)
+        data: str | bytes = content
+        size = len(content) if content.isascii() else len(content.encode())
+        if self.compress_min_bytes and size >= self.compress_min_bytes and not isinstance(content, BlobContent):
+            compressed = zlib.compress(content.encode(), RESOURCE_CACHE_COMPRESS_LEVEL)
+            if len(compressed) < size:
+                data, size = compressed, len(compressed)
+                self._compressed += 1
+        if size > self.max_bytes:
+            self._rejected += 1
+            return False
+
+        self._entries[key] = _CachedResource(
+            uri=uri, content=data, size=size, stored_at=stored_at, max_age=max_age, version=version
+        )
+        self._bytes += size
+        self._trim()
+        return True
+
+    def set_stored_at(self, key: Hashable, stored_at: float | None) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.stored_at = stored_at
+
+    def discard(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+    def record_hit(self, stale: bool = False) -> None:
+        self._hits += 1
+        if stale:
+            self._stale_hits += 1
+
+    def record_miss(self) -> None:
+        self._misses += 1
+
+    @staticmethod
+    def _decode(entry: _CachedResource) -> str:
+        content = entry.content
+        return zlib.decompress(content).decode() if isinstance(content, bytes) else content
+
+    def _trim(self) -> None:
+        while self._bytes > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._evictions += 1
+
+    # ------------------------------------------------------------------
+    # Maintenance and metrics
+    # ------------------------------------------------------------------
+
+    def purge_expired(self) -> int:
+        """Drop entries too old to be served even as stale content; returns how many."""
+        now = time.time()
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.max_age is not None and entry.stored_at is not None and now - entry.stored_at >= entry.max_age
+        ]
+        for key in expired:
+            self.discard(key)
+        self._expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def hit_ratio(self) -> float | None:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and effectiveness metrics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "compress_min_bytes": self.compress_min_bytes,
+            "compressed_entries": sum(isinstance(entry.content, bytes) for entry in self._entries.values()),
+            "hits": self._hits,
+            "stale_hits": self._stale_hits,
+            "misses": self._misses,
+            "hit_ratio": self.hit_ratio,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "rejected": self._rejected,
+        }
+
+
+_resource_cache = ResourceCache()
+_cache_keys = itertools.count()
+
+
+def get_resource_cache() -> ResourceCache:
+    """The process-wide cache shared by all ResourceHandlers."""
+    return _resource_cache
+
+
+# ============================================================================
+# Binary Content
+# ============================================================================
+
+# Concurrent reads of the same file version share one load
+_file_reads = SingleFlight()
+
+
+FileVersion = tuple[int, int]
+
+
+def _file_version(path: str) -> FileVersion:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_file(path: str, binary: bool) -> tuple[FileVersion, str]:
+    """Read a file: base64 for binary, UTF-8 text otherwise, with the version it was read at.
+
+    A plain read rather than a memory map: encoding copies the bytes anyway,
+    and a mapped file truncated mid-read would crash the process with SIGBUS.
+    """
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+    content = base64.b64encode(data).decode("ascii") if binary else data.decode("utf-8", errors="replace")
+    return (stat.st_mtime_ns, stat.st_size), content
+
+
+async def _read_file(path: str | os.PathLike[str], binary: bool) -> str:
+    path_str = os.fspath(path)
+    version = await run_sync_handler(_file_version, EXECUTOR_THREAD, path_str)
+    key = ("file", path_str, binary)
+    cached = _resource_cache.get(key, version)
+    if cached is not None:
+        return cached[0]
+
+    async def load() -> str:
+        read_version, content = await run_sync_handler(_load_file, EXECUTOR_THREAD, path_str, binary)
+        if binary:
+            content = BlobContent(content, mimetypes.guess_type(path_str)[0], path_str)
+        _resource_cache.put(key, path_str, content, None, version=read_version)
+        return cast(str, content)
+
+    content: str = await _file_reads.run(key + version, load)
+    return content
+
+
+async def read_file_blob(path: str | os.PathLike[str]) -> BlobContent:
+    """Read a file as BlobContent, cached in the shared ResourceCache per mtime and size."""
+    return cast(BlobContent, await _read_file(path, binary=True))
+
+
+async def read_file_text(path: str | os.PathLike[str]) -> str:
+    """Read a UTF-8 text file, cached in the shared ResourceCache per mtime and size."""
+    return await _read_file(path, binary=False)
+
+
+async def to_blob_content(result: Any) -> BlobContent | None:
+    """Convert a handler's binary result to BlobContent (``None`` for anything else)."""
+    if isinstance(result, bytes | bytearray | memoryview):
+        return BlobContent(base64.b64encode(result).decode("ascii"))
+    if isinstance(result, os.PathLike):
+        return await read_file_blob(result)
+    return None
+
+
+def configure_resource_cache(max_bytes: int | None = None, compress_min_bytes: int | None = None) -> ResourceCache:
+    """Set the shared cache's byte budget and compression threshold (``None`` keeps the current value)."""
+    _resource_cache.configure(max_bytes, compress_min_bytes)
+    return _resource_cache
+
+
 # ============================================================================
 # ResourceHandler with orjson Optimization
 # ============================================================================
@@ -42,10 +359,16 @@ class ResourceHandler:
     _cached_mcp_bytes: bytes | None = None  # 🚀 Cache orjson-serialized bytes
     icons: list[dict[str, Any]] | None = None  # MCP icons (2025-11-25)
     meta: dict[str, Any] | None = None  # Resource _meta (MCP Apps prefersBorder, CSP, etc.)
+    executor: str | None = None  # Sync handler executor ("inline"/"thread"/"process"); None = server default
+    stale_while_revalidate: float | None = None  # Seconds past TTL to serve stale content while refreshing
+    stale_if_error: float | None = None  # Seconds past TTL to serve stale content if a refresh fails
 
     def __post_init__(self) -> None:
-        self._cached_content: str | None = None
-        self._cache_timestamp: float | None = None
+        self._cache = _resource_cache
+        self._cache_key = next(_cache_keys)
+        # Release this handler's cached content when the handler goes away
+        weakref.finalize(self, self._cache.discard, self._cache_key)
+        self._refresh: asyncio.Future[str] | None = None  # The single in-flight refresh, if any
         # Pre-cache both dict and orjson formats for resources
         if self._cached_mcp_format is None:
             fmt = self.mcp_resource.model_dump(exclude_none=True)
@@ -70,8 +393,15 @@ class ResourceHandler:
         cache_ttl: int | None = None,
         icons: list[dict[str, Any]] | None = None,
         meta: dict[str, Any] | None = None,
+        executor: str | None = None,
+        stale_while_revalidate: float | None = None,
+        stale_if_error: float | None = None,
     ) -> "ResourceHandler":
         """Create ResourceHandler from a function."""
+        for option, window in (("stale_while_revalidate", stale_while_revalidate), ("stale_if_error", stale_if_error)):
+            if window is not None and (window < 0 or not cache_ttl):
+                raise ValueError(f"{option} must be non-negative and requires cache_ttl")
+
         resource_name = name or func.__name__.replace("_", " ").title()
         resource_description = description or func.__doc__ or f"Resource: {uri}"
 
@@ -86,6 +416,9 @@ class ResourceHandler:
             _cached_mcp_bytes=None,  # Will be computed in __post_init__
             icons=icons,
             meta=meta,
+            executor=validate_executor_policy(executor, func),
+            stale_while_revalidate=stale_while_revalidate,
+            stale_if_error=stale_if_error,
         )
 
     @property
@@ -124,35 +457,97 @@ class ResourceHandler:
             self._cached_mcp_bytes = orjson.dumps(self._cached_mcp_format)
         return self._cached_mcp_bytes
 
-    async def read(self) -> str:
-        """Read the resource content with optional caching."""
-        now = time.time()
+    # Cached content lives in the shared ResourceCache, keyed per handler
 
-        # Check cache validity
-        if (
-            self.cache_ttl
-            and self._cached_content
-            and self._cache_timestamp
-            and now - self._cache_timestamp < self.cache_ttl
-        ):
-            return self._cached_content
+    @property
+    def _cached_content(self) -> str | None:
+        cached = self._cache.peek(self._cache_key)
+        return None if cached is None else cached[0]
+
+    @_cached_content.setter
+    def _cached_content(self, content: str | None) -> None:
+        if content is None:
+            self._cache.discard(self._cache_key)
+        else:
+            self._cache.put(self._cache_key, self.uri, content, self._cache_timestamp, self._max_cache_age())
+
+    @property
+    def _cache_timestamp(self) -> float | None:
+        cached = self._cache.peek(self._cache_key)
+        return None if cached is None else cached[1]
 
-        # Read fresh content
+    @_cache_timestamp.setter
+    def _cache_timestamp(self, stored_at: float | None) -> None:
+        self._cache.set_stored_at(self._cache_key, stored_at)
+
+    def _max_cache_age(self) -> float | None:
+        if not self.cache_ttl:
+            return None
+        return self.cache_ttl + max(self.stale_while_revalidate or 0, self.stale_if_error or 0)
+
+    async def read(self) -> str:
+        """Read the resource content with optional caching."""
+        if not self.cache_ttl:
+            return await self._load()
+
+        cached = self._cache.get(self._cache_key)
+        content, stored_at = cached if cached is not None else (None, None)
+        age = time.time() - stored_at if content and stored_at else None
+        if age is not None:
+            if age < self.cache_ttl:
+                self._cache.record_hit()
+                return cast(str, content)
+            if self.stale_while_revalidate and age < self.cache_ttl + self.stale_while_revalidate:
+                # Serve stale content now; one background refresh updates the cache
+                self._start_refresh()
+                self._cache.record_hit(stale=True)
+                return cast(str, content)
+
+        self._cache.record_miss()
+        try:
+            # Shielded so a cancelled reader does not abort the refresh other readers await
+            return await asyncio.shield(self._start_refresh())
+        except MCPError:
+            if age is not None and self.stale_if_error and age < self.cache_ttl + self.stale_if_error:
+                logger.warning(f"Refreshing resource '{self.uri}' failed; serving stale content")
+                return cast(str, content)
+            raise
+
+    def _start_refresh(self) -> "asyncio.Future[str]":
+        """Start a cache refresh unless one is already running; return it."""
+        refresh = self._refresh
+        if refresh is None or refresh.done() or refresh.get_loop() is not asyncio.get_running_loop():
+            refresh = self._refresh = asyncio.ensure_future(self._refresh_content())
+            refresh.add_done_callback(self._refresh_done)
+        return refresh
+
+    async def _refresh_content(self) -> str:
+        started = time.time()
+        content = await self._load()
+        # File-backed blobs are already cached per file version; don't hold them twice
+        if not (isinstance(content, BlobContent) and content.source_path):
+            self._cache.put(self._cache_key, self.uri, content, started, self._max_cache_age())
+        return content
+
+    def _refresh_done(self, refresh: "asyncio.Future[str]") -> None:
+        # Retrieve the outcome so background failures are logged, not reported as unhandled
+        if not refresh.cancelled() and refresh.exception() is not None:
+            logger.debug(f"Refresh of resource '{self.uri}' failed: {refresh.exception()}")
+
+    async def _load(self) -> str:
+        """Call the handler and format its result."""
         try:
             if inspect.iscoroutinefunction(self.handler):
                 result = await self.handler()
             else:
-                result = self.handler()
+                result = await run_sync_handler(self.handler, self.executor)
 
-            # Format content based on MIME type
-            content = self._format_content(result)
-
-            # Cache if TTL is set
-            if self.cache_ttl:
-                self._cached_content = content
-                self._cache_timestamp = now
+            blob = await to_blob_content(result)
+            if blob is not None:
+                return blob
 
-            return content
+            # Format content based on MIME type
+            return self._format_content(result)
 
         except Exception as e:
             # Fix: MCPError requires a code parameter
@@ -224,6 +619,9 @@ class ResourceHandler:
             "age_seconds": round(age, 2),
             "remaining_seconds": round(remaining, 2),
             "content_length": len(self._cached_content) if self._cached_content else 0,
+            "stale_while_revalidate": self.stale_while_revalidate,
+            "stale_if_error": self.stale_if_error,
+            "refreshing": self._refresh is not None and not self._refresh.done(),
         }
 
 
@@ -248,6 +646,7 @@ class ResourceTemplateHandler:
     _cached_mcp_format: dict[str, Any] | None = None
     _cached_mcp_bytes: bytes | None = None
     icons: list[dict[str, Any]] | None = None  # MCP icons (2025-11-25)
+    executor: str | None = None  # Sync handler executor ("inline"/"thread"/"process"); None = server default
 
     def __post_init__(self) -> None:
         if self._cached_mcp_format is None:
@@ -275,8 +674,14 @@ class ResourceTemplateHandler:
         description: str | None = None,
         mime_type: str | None = None,
         icons: list[dict[str, Any]] | None = None,
+        executor: str | None = None,
     ) -> "ResourceTemplateHandler":
-        """Create ResourceTemplateHandler from a function."""
+        """Create ResourceTemplateHandler from a function.
+
+        Raises:
+            ValueError: If ``uri_template`` is not a valid RFC 6570 template.
+        """
+        compile_uri_template(uri_template)  # Fail at registration, not on first resources/read
         template_name = name or func.__name__.replace("_", " ").title()
         template_description = description or func.__doc__ or f"Resource template: {uri_template}"
 
@@ -287,6 +692,7 @@ class ResourceTemplateHandler:
             description=template_description,
             mime_type=mime_type,
             icons=icons,
+            executor=validate_executor_policy(executor, func),
         )
 
     def to_mcp_format(self) -> dict[str, Any]:
@@ -309,7 +715,11 @@ class ResourceTemplateHandler:
             if inspect.iscoroutinefunction(self.handler):
                 result = await self.handler(**kwargs)
             else:
-                result = self.handler(**kwargs)
+                result = await run_sync_handler(self.handler, self.executor, **kwargs)
+
+            blob = await to_blob_content(result)
+            if blob is not None:
+                return blob
 
             # Format result
             if isinstance(result, BaseModel):
@@ -374,9 +784,15 @@ def create_markdown_resource(
 # ============================================================================
 
 __all__ = [
+    "BlobContent",
+    "ResourceCache",
     "ResourceHandler",
     "ResourceTemplateHandler",
     "create_resource_from_function",
     "create_json_resource",
     "create_markdown_resource",
+    "configure_resource_cache",
+    "get_resource_cache",
+    "read_file_blob",
+    "read_file_text",
 ]
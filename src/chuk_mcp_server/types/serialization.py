@@ -6,6 +6,8 @@ This module provides high-performance serialization utilities using orjson
 for tools list, resources list, and other MCP protocol operations.
 """
 
+from collections.abc import Iterable, Iterator, Mapping
+
 # Import type annotations only
 from typing import TYPE_CHECKING, Any
 
@@ -32,20 +34,73 @@ def serialize_resources_list(resources: list["ResourceHandler"]) -> bytes:
 
 def serialize_tools_list_from_bytes(tools: list["ToolHandler"]) -> bytes:
     """🚀 Maximum performance tools list using pre-serialized bytes."""
-    # Combine pre-serialized tool bytes directly
-    tool_bytes = [tool.to_mcp_bytes() for tool in tools]
+    # Splice pre-serialized tool bytes directly - no decode/re-encode
+    return splice_list_result("tools", [tool.to_mcp_bytes() for tool in tools])
 
-    # Build the final structure
-    tools_list = []
-    for tool_byte in tool_bytes:
-        tools_list.append(orjson.loads(tool_byte))
 
-    result: bytes = orjson.dumps({"tools": tools_list})
-    return result
+# ============================================================================
+# Byte-spliced JSON-RPC responses
+# ============================================================================
+
+
+class PreSerializedResponse(Mapping[str, Any]):
+    """JSON-RPC response whose wire bytes were assembled ahead of time.
+
+    Transports write ``body`` as-is (see ``serialize_mcp_response``).  Mapping
+    access decodes the body lazily, so callers that inspect the response as a
+    dict keep working; the decode only happens if somebody actually looks.
+    """
+
+    __slots__ = ("body", "_decoded")
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self._decoded: dict[str, Any] | None = None
+
+    def _data(self) -> dict[str, Any]:
+        if self._decoded is None:
+            self._decoded = orjson.loads(self.body)
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._data())
+
+    def __bool__(self) -> bool:
+        # A response always exists; avoid decoding just for a truthiness check
+        return True
+
+    def __repr__(self) -> str:
+        return f"PreSerializedResponse({self.body!r})"
+
+
+def splice_list_result(key: str, item_bytes: Iterable[bytes], next_cursor: str | None = None) -> bytes:
+    """Join pre-serialized item bytes into a ``{key: [...], "nextCursor": ...}`` result."""
+    parts = [b'{"', key.encode(), b'":[', b",".join(item_bytes), b"]"]
+    if next_cursor is not None:
+        parts.append(b',"nextCursor":')
+        parts.append(orjson.dumps(next_cursor))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def splice_result_response(msg_id: Any, result_bytes: bytes) -> PreSerializedResponse:
+    """Wrap pre-serialized result bytes in a JSON-RPC envelope, splicing in only the id."""
+    return PreSerializedResponse(b'{"jsonrpc":"2.0","id":' + orjson.dumps(msg_id) + b',"result":' + result_bytes + b"}")
+
 
+def serialize_mcp_response(response_data: Mapping[str, Any]) -> bytes:
+    """Serialize MCP response with orjson for maximum performance.
 
-def serialize_mcp_response(response_data: dict[str, Any]) -> bytes:
-    """Serialize MCP response with orjson for maximum performance."""
+    Pre-serialized responses are returned as-is without touching orjson.
+    """
+    if isinstance(response_data, PreSerializedResponse):
+        return response_data.body
     result: bytes = orjson.dumps(response_data)
     return result
 
@@ -60,6 +115,9 @@ __all__ = [
     "serialize_tools_list",
     "serialize_resources_list",
     "serialize_tools_list_from_bytes",
+    "PreSerializedResponse",
+    "splice_list_result",
+    "splice_result_response",
     "serialize_mcp_response",
     "deserialize_mcp_request",
 ]
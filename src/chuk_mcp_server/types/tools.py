@@ -5,24 +5,59 @@ Tools - ToolHandler with orjson optimization and schema caching
 
 This module provides the ToolHandler class with aggressive performance optimizations
 including schema caching, orjson serialization, and type-safe parameter validation.
+
+Async-generator tools (``async def report(...): yield chunk``) stream: each
+chunk is sent to the client as a progress notification (when the request
+carries a progress token and the transport can push messages) and the
+``tools/call`` result holds the assembled content.  Without a push channel
+the chunks are simply buffered into that result.
 """
 
 import inspect
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from typing import Any
 
 import orjson
 
+from ..bulkheads import validate_concurrency_limits
 from ..constants import (
     MCP_APPS_LEGACY_META_KEY,
     MCP_APPS_UI_KEY,
     MCP_APPS_UI_RESOURCE_URI,
     MCP_APPS_UI_VISIBILITY,
 )
+from ..context import send_progress
+from ..executors import run_sync_handler, validate_executor_policy
+from ..result_cache import validate_cache_settings
 from .base import MCPTool, MCPToolInputSchema, ValidationError
+from .content import format_content_as_text
 from .errors import ParameterValidationError, ToolExecutionError
 from .parameters import ToolParameter
+from .validation import ArgumentValidator, compile_argument_validator, compile_converter
+
+# ============================================================================
+# Streaming
+# ============================================================================
+
+
+async def collect_stream(stream: AsyncGenerator[Any, Any]) -> Any:
+    """Drain an async-generator tool, streaming each chunk as a progress notification.
+
+    Returns the assembled result: string chunks are concatenated, anything
+    else becomes a list that ``format_content`` turns into one content item
+    per chunk.
+    """
+    chunks: list[Any] = []
+    async with aclosing(stream):
+        async for chunk in stream:
+            chunks.append(chunk)
+            await send_progress(len(chunks), message=format_content_as_text(chunk))
+    if all(isinstance(chunk, str) for chunk in chunks):
+        return "".join(chunks)
+    return chunks
+
 
 # ============================================================================
 # ToolHandler with Maximum Performance Optimization
@@ -45,6 +80,15 @@ class ToolHandler:
     icons: list[dict[str, Any]] | None = None  # MCP icons (2025-11-25)
     meta: dict[str, Any] | None = None  # Tool _meta (MCP Apps ui, etc.)
     visibility: list[str] | None = None  # MCP Apps visibility (["model"], ["app"], ["model", "app"])
+    executor: str | None = None  # Sync handler executor ("inline"/"thread"/"process"); None = server default
+    max_concurrency: int | None = None  # Max simultaneous calls (None = unlimited)
+    queue_size: int | None = None  # Calls allowed to wait for a slot (None = unbounded)
+    queue_timeout: float | None = None  # Seconds a call may wait for a slot (None = no limit)
+    cache_ttl: float | None = None  # Result cache TTL in seconds (None = server policy, 0 = never cache)
+    cache_max_entries: int | None = None  # Cached results kept for this tool (None = server default)
+    cache_scope: str | None = None  # "global", "session" or "user" (None = server default)
+    coalesce: bool | None = None  # Share identical concurrent calls (None = on for read-only/idempotent hints)
+    _validator: ArgumentValidator | None = field(default=None, repr=False, compare=False)  # Compiled once
 
     @classmethod
     def from_function(
@@ -60,6 +104,14 @@ class ToolHandler:
         icons: list[dict[str, Any]] | None = None,
         meta: dict[str, Any] | None = None,
         visibility: list[str] | None = None,
+        executor: str | None = None,
+        max_concurrency: int | None = None,
+        queue_size: int | None = None,
+        queue_timeout: float | None = None,
+        cache_ttl: float | None = None,
+        cache_max_entries: int | None = None,
+        cache_scope: str | None = None,
+        coalesce: bool | None = None,
     ) -> "ToolHandler":
         """Create ToolHandler from a function with orjson optimization."""
         from chuk_mcp_server.constants import TOOL_NAME_PATTERN
@@ -71,6 +123,9 @@ class ToolHandler:
         if not TOOL_NAME_PATTERN.match(tool_name):
             raise ValueError(f"Invalid tool name '{tool_name}': must match ^[a-zA-Z0-9_\\-.]{{1,128}}$")
 
+        validate_concurrency_limits(max_concurrency, queue_size, queue_timeout)
+        validate_cache_settings(cache_ttl, cache_max_entries, cache_scope)
+
         # Check for authorization metadata (set by @requires_auth decorator)
         requires_auth = getattr(func, "_requires_auth", False)
         auth_scopes = getattr(func, "_auth_scopes", None)
@@ -133,10 +188,19 @@ class ToolHandler:
             icons=icons,
             meta=meta,
             visibility=visibility,
+            executor=validate_executor_policy(executor, func),
+            max_concurrency=max_concurrency,
+            queue_size=queue_size,
+            queue_timeout=queue_timeout,
+            cache_ttl=cache_ttl,
+            cache_max_entries=cache_max_entries,
+            cache_scope=cache_scope,
+            coalesce=coalesce,
         )
 
         # Pre-compute and cache both formats during creation for maximum performance
         instance._ensure_cached_formats()
+        instance._compile_validator()
 
         return instance
 
@@ -213,165 +277,39 @@ class ToolHandler:
         """Invalidate all cached formats (if schema changes at runtime)."""
         self._cached_mcp_format = None
         self._cached_mcp_bytes = None
+        self._validator = None
+
+    def _compile_validator(self) -> ArgumentValidator:
+        """Compile (once) the argument validator for this tool's parameters."""
+        self._validator = compile_argument_validator(self.parameters, self.handler)
+        return self._validator
 
     def _validate_and_convert_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """Validate and convert arguments with specific error types."""
-        validated_args = {}
-
-        for param in self.parameters:
-            value = arguments.get(param.name)
-
-            if value is None:
-                if param.required:
-                    raise ParameterValidationError(param.name, param.type, None)
-                value = param.default
-
-            # Skip validation if value is still None after default assignment
-            if value is not None:
-                try:
-                    validated_value = self._convert_type(value, param)
-                    validated_args[param.name] = validated_value
-                except (ValueError, TypeError) as e:
-                    raise ParameterValidationError(param.name, param.type, value) from e
-
-        # Pass through internal parameters (like _external_access_token, _user_id) if the function accepts them
-        # These are injected by the protocol handler and not part of the tool schema
-        sig = inspect.signature(self.handler)
-        for key, value in arguments.items():
-            if key.startswith("_") and key not in validated_args and key in sig.parameters:
-                validated_args[key] = value
-
-        return validated_args
+        return (self._validator or self._compile_validator())(arguments)
 
     def _convert_type(self, value: Any, param: ToolParameter) -> Any:
-        """Convert value to the expected parameter type with orjson optimization."""
-        # If value is already the correct type, return as-is
-        if param.type == "integer":
-            if isinstance(value, int):
-                return value
-            elif isinstance(value, float):
-                # Handle float-to-int conversion (e.g., 5.0 -> 5)
-                if value.is_integer():
-                    return int(value)
-                else:
-                    raise ValueError(f"Cannot convert float {value} to integer without precision loss")
-            elif isinstance(value, str):
-                # Handle string-to-int conversion
-                try:
-                    # First try direct int conversion
-                    return int(value)
-                except ValueError:
-                    try:
-                        # Try float first then int (handles "5.0" strings)
-                        float_val = float(value)
-                        if float_val.is_integer():
-                            return int(float_val)
-                        else:
-                            raise ValueError(f"Cannot convert string '{value}' to integer without precision loss")
-                    except ValueError as exc:
-                        raise ValueError(f"Cannot convert string '{value}' to integer") from exc
-            else:
-                # Try direct int conversion for other types
-                return int(value)
-
-        elif param.type == "number":
-            if isinstance(value, int | float):
-                return float(value)
-            elif isinstance(value, str):
-                try:
-                    return float(value)
-                except ValueError as exc:
-                    raise ValueError(f"Cannot convert string '{value}' to number") from exc
-            else:
-                return float(value)
-
-        elif param.type == "boolean":
-            if isinstance(value, bool):
-                return value
-            elif isinstance(value, str):
-                # Handle string boolean conversion with enhanced edge case handling
-                lower_val = value.lower().strip()
-                # Handle empty string and null string - use parameter default or False
-                if lower_val == "" or lower_val == "null":
-                    # For empty/null strings, use the parameter default if available, otherwise False
-                    return param.default if param.default is not None else False
-                elif lower_val in ("true", "1", "yes", "on", "t", "y"):
-                    return True
-                elif lower_val in ("false", "0", "no", "off", "f", "n"):
-                    return False
-                else:
-                    # For unrecognized strings, use parameter default if available, otherwise False
-                    # This handles cases where UI allows free-form text input for boolean params
-                    return param.default if param.default is not None else False
-            elif isinstance(value, int | float):
-                # Handle numeric boolean conversion
-                return bool(value)
-            elif value is None:
-                # Handle None explicitly - use parameter default or False
-                return param.default if param.default is not None else False
-            else:
-                # Try converting to bool as last resort
-                try:
-                    return bool(value)
-                except Exception as e:
-                    raise ValueError(f"Cannot convert {type(value).__name__} '{value}' to boolean") from e
-
-        elif param.type == "string":
-            if isinstance(value, str):
-                return value
-            else:
-                # Convert other types to string
-                return str(value)
-
-        elif param.type == "array":
-            if isinstance(value, list):
-                return value
-            elif isinstance(value, tuple | set):
-                return list(value)
-            elif isinstance(value, str):
-                # 🚀 Use orjson for 2x faster JSON parsing
-                try:
-                    parsed = orjson.loads(value)
-                    if isinstance(parsed, list):
-                        return parsed
-                    else:
-                        raise ValueError(f"String '{value}' does not represent an array")
-                except orjson.JSONDecodeError as exc:
-                    raise ValueError(f"Cannot convert string '{value}' to array") from exc
-            else:
-                raise ValueError(f"Cannot convert {type(value).__name__} to array")
-
-        elif param.type == "object":
-            if isinstance(value, dict):
-                return value
-            elif isinstance(value, str):
-                # 🚀 Use orjson for 2x faster JSON parsing
-                try:
-                    parsed = orjson.loads(value)
-                    if isinstance(parsed, dict):
-                        return parsed
-                    else:
-                        raise ValueError(f"String '{value}' does not represent an object")
-                except orjson.JSONDecodeError as exc:
-                    raise ValueError(f"Cannot convert string '{value}' to object") from exc
-            else:
-                raise ValueError(f"Cannot convert {type(value).__name__} to object")
-
-        # Check enum values if specified
-        if param.enum and value not in param.enum:
-            raise ValueError(f"Value '{value}' must be one of {param.enum}")
+        """Convert a single value to the expected parameter type."""
+        return compile_converter(param)(value)
 
-        return value
+    async def execute(self, arguments: dict[str, Any], *, validated: bool = False) -> Any:
+        """Execute the tool with enhanced error handling.
 
-    async def execute(self, arguments: dict[str, Any]) -> Any:
-        """Execute the tool with enhanced error handling."""
+        ``validated=True`` means ``arguments`` already came out of
+        ``_validate_and_convert_arguments`` and are used as-is.
+        """
         try:
-            validated_args = self._validate_and_convert_arguments(arguments)
+            validated_args = arguments if validated else self._validate_and_convert_arguments(arguments)
 
             if inspect.iscoroutinefunction(self.handler):
-                return await self.handler(**validated_args)
+                result = await self.handler(**validated_args)
+            elif inspect.isasyncgenfunction(self.handler):
+                result = self.handler(**validated_args)
             else:
-                return self.handler(**validated_args)
+                result = await run_sync_handler(self.handler, self.executor, **validated_args)
+            if inspect.isasyncgen(result):
+                return await collect_stream(result)
+            return result
 
         except (ParameterValidationError, ValidationError):
             # Re-raise validation errors as-is
@@ -407,5 +345,6 @@ def create_tool_from_function(
 
 __all__ = [
     "ToolHandler",
+    "collect_stream",
     "create_tool_from_function",
 ]
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/types/validation.py
+"""
+Validation - compiled argument validators shared by tools and prompts
+
+Each handler compiles its parameter list once into a validator closure:
+one converter function per parameter (chosen by JSON Schema type up front,
+not re-dispatched on every value), the accepted pass-through underscore
+keys resolved from the handler signature, and required/default handling
+folded in.  ``tools/call`` and ``prompts/get`` then only run the closures.
+"""
+
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+from .errors import ParameterValidationError
+from .parameters import ToolParameter
+
+Converter = Callable[[Any], Any]
+ArgumentValidator = Callable[[dict[str, Any]], dict[str, Any]]
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on", "t", "y"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off", "f", "n"})
+
+# ============================================================================
+# Per-type Converters
+# ============================================================================
+
+
+def _to_integer(value: Any) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        # Handle float-to-int conversion (e.g., 5.0 -> 5)
+        if value.is_integer():
+            return int(value)
+        raise ValueError(f"Cannot convert float {value} to integer without precision loss")
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                # Try float first then int (handles "5.0" strings)
+                float_val = float(value)
+                if float_val.is_integer():
+                    return int(float_val)
+                raise ValueError(f"Cannot convert string '{value}' to integer without precision loss")
+            except ValueError as exc:
+                raise ValueError(f"Cannot convert string '{value}' to integer") from exc
+    return int(value)
+
+
+def _to_number(value: Any) -> float:
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError as exc:
+            raise ValueError(f"Cannot convert string '{value}' to number") from exc
+    return float(value)
+
+
+def _to_string(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _to_array(value: Any) -> list[Any]:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple | set):
+        return list(value)
+    if isinstance(value, str):
+        try:
+            parsed = orjson.loads(value)
+        except orjson.JSONDecodeError as exc:
+            raise ValueError(f"Cannot convert string '{value}' to array") from exc
+        if isinstance(parsed, list):
+            return parsed
+        raise ValueError(f"String '{value}' does not represent an array")
+    raise ValueError(f"Cannot convert {type(value).__name__} to array")
+
+
+def _to_object(value: Any) -> dict[str, Any]:
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str):
+        try:
+            parsed = orjson.loads(value)
+        except orjson.JSONDecodeError as exc:
+            raise ValueError(f"Cannot convert string '{value}' to object") from exc
+        if isinstance(parsed, dict):
+            return parsed
+        raise ValueError(f"String '{value}' does not represent an object")
+    raise ValueError(f"Cannot convert {type(value).__name__} to object")
+
+
+def _boolean_converter(default: Any, lenient: bool) -> Converter:
+    """Build a boolean converter.
+
+    Empty/"null" strings fall back to the parameter default (or False).  Lenient
+    converters (tools) do the same for unrecognized strings, since UIs often
+    allow free-form text for boolean params; strict ones (prompts) reject them.
+    """
+    fallback = default if default is not None else False
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            lower_val = value.lower().strip()
+            if lower_val == "" or lower_val == "null":
+                return fallback
+            if lower_val in _TRUE_STRINGS:
+                return True
+            if lower_val in _FALSE_STRINGS:
+                return False
+            if lenient:
+                return fallback
+            raise ValueError(f"Cannot convert string '{value}' to boolean")
+        if isinstance(value, int | float):
+            return bool(value)
+        if value is None:
+            return fallback if lenient else False
+        try:
+            return bool(value)
+        except Exception as e:
+            raise ValueError(f"Cannot convert {type(value).__name__} '{value}' to boolean") from e
+
+    return convert
+
+
+def _enum_converter(enum: list[Any]) -> Converter:
+    def convert(value: Any) -> Any:
+        if value not in enum:
+            raise ValueError(f"Value '{value}' must be one of {enum}")
+        return value
+
+    return convert
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_SIMPLE_CONVERTERS: dict[str, Converter] = {
+    "integer": _to_integer,
+    "number": _to_number,
+    "string": _to_string,
+    "array": _to_array,
+    "object": _to_object,
+}
+
+
+def compile_converter(param: ToolParameter, *, lenient_booleans: bool = True) -> Converter:
+    """Select the value converter for a parameter once, by its JSON Schema type."""
+    if param.type == "boolean":
+        return _boolean_converter(param.default, lenient_booleans)
+    simple = _SIMPLE_CONVERTERS.get(param.type)
+    if simple is not None:
+        return simple
+    # Unknown types pass through, subject only to their enum
+    return _enum_converter(param.enum) if param.enum else _identity
+
+
+# ============================================================================
+# Argument Validators
+# ============================================================================
+
+
+def passthrough_keys(handler: Callable[..., Any] | None) -> frozenset[str]:
+    """Underscore-prefixed parameter names the handler accepts.
+
+    Internal values like ``_external_access_token`` or ``_user_id`` are injected
+    by the protocol handler rather than declared in the schema; they are passed
+    through only if the function signature names them.
+    """
+    if handler is None:
+        return frozenset()
+    try:
+        params = inspect.signature(handler).parameters
+    except (TypeError, ValueError):
+        return frozenset()
+    return frozenset(name for name in params if name.startswith("_"))
+
+
+def compile_argument_validator(
+    parameters: list[ToolParameter],
+    handler: Callable[..., Any] | None = None,
+    *,
+    lenient_booleans: bool = True,
+) -> ArgumentValidator:
+    """Compile a parameter list into a single ``validate(arguments) -> kwargs`` closure.
+
+    Raises:
+        ParameterValidationError: (from the closure) when a required argument is
+            missing or a value cannot be converted to its declared type.
+    """
+    plan = tuple(
+        (
+            param.name,
+            param.type,
+            param.required,
+            param.default,
+            compile_converter(param, lenient_booleans=lenient_booleans),
+        )
+        for param in parameters
+    )
+    underscore_keys = passthrough_keys(handler)
+
+    def validate(arguments: dict[str, Any]) -> dict[str, Any]:
+        validated_args: dict[str, Any] = {}
+
+        for name, type_name, required, default, convert in plan:
+            value = arguments.get(name)
+
+            if value is None:
+                if required:
+                    raise ParameterValidationError(name, type_name, None)
+                value = default
+                # Skip validation if value is still None after default assignment
+                if value is None:
+                    continue
+
+            try:
+                validated_args[name] = convert(value)
+            except (ValueError, TypeError) as e:
+                raise ParameterValidationError(name, type_name, value) from e
+
+        for key in underscore_keys:
+            if key in arguments and key not in validated_args:
+                validated_args[key] = arguments[key]
+
+        return validated_args
+
+    return validate
+
+
+__all__ = [
+    "ArgumentValidator",
+    "Converter",
+    "compile_argument_validator",
+    "compile_converter",
+    "passthrough_keys",
+]
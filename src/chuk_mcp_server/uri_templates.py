@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_server/uri_templates.py
+"""
+URI templates - compiled RFC 6570 matching for resource templates.
+
+Each template is compiled once into a regex plus a recipe for turning the
+captured groups back into variables, so ``users://{user_id}/posts{?limit}``
+matches ``users://42/posts?limit=5`` as ``{"user_id": "42", "limit": "5"}``.
+
+Supported expressions (the RFC's level 1-4 operators):
+
+======================  ========================  ==========================
+Expression              Matches                   Variable value
+======================  ========================  ==========================
+``{var}``, ``{x,y}``    one path segment          percent-decoded string
+``{+var}``              anything up to ``?``/``#``  string (may contain ``/``)
+``{#var}``              ``#`` fragment            string
+``{/var}``, ``{/var*}``  ``/seg``, ``/a/b/c``       string, or list when exploded
+``{.var}``, ``{.var*}``  ``.ext``, ``.tar.gz``      string, or list when exploded
+``{;var}``              ``;var=value``            string
+``{?x,y}``, ``{&x}``    query parameters          string (in any order)
+``{var:3}``             at most 3 characters      string
+======================  ========================  ==========================
+
+Optional expressions (``/ . ; ? &`` operators) that are absent from a URI
+leave their variables unset, so handler defaults apply.
+
+:class:`UriTemplateMatcher` routes a URI among many templates: a trie over
+the templates' leading path segments (literal segments, plus one wildcard
+edge for whole-segment ``{var}`` expressions) narrows the candidates in one
+pass over the URI's segments, and only those candidates' regexes are tried,
+deepest and most literal first.
+"""
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+from urllib.parse import parse_qsl, unquote
+
+V = TypeVar("V")
+
+_EXPRESSION = re.compile(r"\{([^{}]*)\}")
+_VARSPEC = re.compile(r"^([A-Za-z0-9_]|%[0-9A-Fa-f]{2})(?:\.?(?:[A-Za-z0-9_]|%[0-9A-Fa-f]{2}))*(\*|:[1-9][0-9]{0,3})?$")
+_OPERATORS = "+#./;?&"
+_SEGMENT_SPLIT = re.compile(r"/(?![^{]*\})")  # "/" outside of braces
+_SIMPLE_SEGMENT = re.compile(r"\{[A-Za-z0-9_.%]+\}")
+
+# Characters a single value may span, per operator (besides the operator's own separators)
+_VALUE_CHARS = {"": r"[^/?#,]", "+": r"[^?#,]", "#": r"[^,]", ".": r"[^/?#.]", "/": r"[^/?#]", ";": r"[^/?#;]"}
+
+
+@dataclass(frozen=True)
+class _Capture:
+    """How one regex group becomes a variable."""
+
+    name: str
+    explode_on: str | None = None  # Split exploded values on this separator
+    query: bool = False  # The group holds the query string for all query variables
+
+
+@dataclass(frozen=True)
+class CompiledUriTemplate:
+    """An RFC 6570 template compiled for matching."""
+
+    template: str
+    route: tuple[str | None, ...]  # Leading "/" segments: literal text, or None for a whole-segment variable
+    pattern: re.Pattern[str]
+    captures: tuple[_Capture, ...]
+    query_names: tuple[str, ...]  # Variables read from the query string
+    specificity: int  # Literal characters in the template; more wins ties
+
+    def match(self, uri: str) -> dict[str, Any] | None:
+        """Extract the variables of ``uri``, or ``None`` if it does not match."""
+        m = self.pattern.fullmatch(uri)
+        if m is None:
+            return None
+        variables: dict[str, Any] = {}
+        for capture, value in zip(self.captures, m.groups(), strict=True):
+            if value is None:
+                continue
+            if capture.query:
+                params = dict(parse_qsl(value, keep_blank_values=True))
+                variables.update((name, params[name]) for name in self.query_names if name in params)
+            elif capture.explode_on is not None:
+                variables[capture.name] = [unquote(part) for part in value.split(capture.explode_on)[1:]]
+            else:
+                variables[capture.name] = unquote(value)
+        return variables
+
+
+def _route(template: str) -> tuple[str | None, ...]:
+    """The template's leading path segments usable for trie routing.
+
+    Stops at the first segment that is neither literal nor a lone simple
+    variable (``{id}``); the regex checks everything after it.
+    """
+    route: list[str | None] = []
+    for segment in _SEGMENT_SPLIT.split(template):
+        if "{" not in segment:
+            route.append(segment)
+        elif _SIMPLE_SEGMENT.fullmatch(segment):
+            route.append(None)
+        else:
+            break
+    return tuple(route)
+
+
+def compile_uri_template(template: str) -> CompiledUriTemplate:
+    """Compile an RFC 6570 URI template.
+
+    Raises:
+        ValueError: If the template has unbalanced braces, an empty or
+            malformed variable, or a variable used twice.
+    """
+    parts: list[str] = []
+    captures: list[_Capture] = []
+    query_names: list[str] = []
+    names: set[str] = set()
+    literal_chars = 0
+    position = 0
+
+    def literal(text: str) -> None:
+        nonlocal literal_chars
+        if "{" in text or "}" in text:
+            raise ValueError(f"Invalid URI template '{template}': unbalanced braces")
+        parts.append(re.escape(text))
+        literal_chars += len(text)
+
+    for expression in _EXPRESSION.finditer(template):
+        literal(template[position : expression.start()])
+        position = expression.end()
+
+        body = expression.group(1)
+        operator = body[:1] if body[:1] in _OPERATORS else ""
+        varspecs = body[len(operator) :].split(",")
+        specs: list[tuple[str, bool, int | None]] = []
+        for varspec in varspecs:
+            m = _VARSPEC.match(varspec)
+            if m is None:
+                raise ValueError(f"Invalid URI template '{template}': bad variable '{varspec}'")
+            modifier = m.group(2) or ""
+            name = varspec[: len(varspec) - len(modifier)]
+            if name in names:
+                raise ValueError(f"Invalid URI template '{template}': variable '{name}' used twice")
+            names.add(name)
+            specs.append((name, modifier == "*", int(modifier[1:]) if modifier.startswith(":") else None))
+
+        if operator in ("?", "&"):
+            if not query_names:
+                # One group holds the whole query string ('?' form, or '&' after a literal '?')
+                parts.append(r"(?:[?&]([^#]*))?")
+                captures.append(_Capture("", query=True))
+            query_names.extend(name for name, _, _ in specs)
+            continue
+
+        for index, (name, explode, max_length) in enumerate(specs):
+            chars = _VALUE_CHARS[operator]
+            # Lazy, so a following expression ("{name}{.ext}") gets its share
+            value = f"{chars}{{1,{max_length}}}?" if max_length else f"{chars}*?"
+            if operator in (".", "/"):
+                sep = re.escape(operator)
+                if explode:
+                    parts.append(f"((?:{sep}{chars}*)*)")
+                    captures.append(_Capture(name, explode_on=operator))
+                else:
+                    parts.append(f"(?:{sep}({value}))?")
+                    captures.append(_Capture(name))
+            elif operator == ";":
+                parts.append(f"(?:;{re.escape(name)}(?:=({value}))?)?")
+                captures.append(_Capture(name))
+            elif index > 0:
+                parts.append(f"(?:,({value}))?")
+                captures.append(_Capture(name))
+            elif operator == "#":
+                parts.append(f"(?:#({value}))?")
+                captures.append(_Capture(name))
+            elif len(specs) == 1 and not max_length:
+                # A lone value must not be empty (so "a://{x}" does not match "a://"),
+                # and a lone reserved value may contain commas
+                parts.append(r"([^?#]+?)" if operator == "+" else f"({chars}+?)")
+                captures.append(_Capture(name))
+            else:
+                parts.append(f"({value})")
+                captures.append(_Capture(name))
+
+    literal(template[position:])
+
+    return CompiledUriTemplate(
+        template=template,
+        route=_route(template),
+        pattern=re.compile("".join(parts)),
+        captures=tuple(captures),
+        query_names=tuple(query_names),
+        specificity=literal_chars,
+    )
+
+
+# ============================================================================
+# Matcher
+# ============================================================================
+
+
+@dataclass(eq=False)
+class _TrieNode(Generic[V]):
+    children: dict[str, "_TrieNode[V]"] = field(default_factory=dict)  # Literal path segments
+    wildcard: "_TrieNode[V] | None" = None  # A whole-segment simple variable
+    entries: list[tuple[CompiledUriTemplate, V]] = field(default_factory=list)
+
+
+class UriTemplateMatcher(Generic[V]):
+    """Routes URIs to values registered under URI templates."""
+
+    def __init__(self) -> None:
+        self._root: _TrieNode[V] = _TrieNode()
+        self._count = 0
+
+    def add(self, template: str | CompiledUriTemplate, value: V) -> None:
+        """Register ``value`` under ``template`` (compiled if given as a string).
+
+        Raises:
+            ValueError: If the template is malformed.
+        """
+        compiled = compile_uri_template(template) if isinstance(template, str) else template
+        node = self._root
+        for segment in compiled.route:
+            if segment is None:
+                if node.wildcard is None:
+                    node.wildcard = _TrieNode()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(segment, _TrieNode())
+        node.entries.append((compiled, value))
+        # Most specific first; sort is stable, so registration order breaks remaining ties
+        node.entries.sort(key=lambda entry: -entry[0].specificity)
+        self._count += 1
+
+    def _candidates(
+        self, node: _TrieNode[V], segments: list[str], index: int
+    ) -> Iterator[tuple[CompiledUriTemplate, V]]:
+        """Templates whose route fits ``segments``: deeper first, literal before wildcard."""
+        if index < len(segments):
+            segment = segments[index]
+            child = node.children.get(segment)
+            if child is not None:
+                yield from self._candidates(child, segments, index + 1)
+            if segment and node.wildcard is not None:
+                yield from self._candidates(node.wildcard, segments, index + 1)
+        yield from node.entries
+
+    def match(self, uri: str) -> tuple[V, dict[str, Any]] | None:
+        """Return ``(value, variables)`` for the best matching template, or ``None``."""
+        for compiled, value in self._candidates(self._root, uri.split("/"), 0):
+            variables = compiled.match(uri)
+            if variables is not None:
+                return value, variables
+        return None
+
+    def __len__(self) -> int:
+        return self._count
+
+
+__all__ = ["CompiledUriTemplate", "UriTemplateMatcher", "compile_uri_template"]
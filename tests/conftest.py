@@ -45,3 +45,145 @@ def isolate_cloud_tests(request):
     else:
         # For cloud tests, don't isolate
         yield
+
+
+class FakeRespServer:
+    """In-process server speaking enough of the Redis protocol for the RESP-backed stores and bus."""
+
+    def __init__(self):
+        import socketserver
+        import threading
+
+        self.data = {}  # key -> bytes or dict[bytes, bytes]
+        self.ttls = {}  # key -> seconds set by EXPIRE
+        self.commands = []
+        self.subscribers = {}  # channel -> list of subscribed connections' writers
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                from chuk_mcp_server.resp import read_reply
+
+                try:
+                    while True:
+                        try:
+                            command = read_reply(self.rfile)
+                        except (ConnectionError, OSError):
+                            return
+                        self.wfile.write(fake.dispatch(command, self.wfile))
+                finally:
+                    fake.unsubscribe(self.wfile)
+
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.url = f"redis://127.0.0.1:{self.port}/0"
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def dispatch(self, command, writer=None):
+        name, args = command[0].decode().upper(), command[1:]
+        with self.lock:
+            self.commands.append(name)
+            if name in ("PING", "SELECT", "AUTH"):
+                return b"+OK\r\n"
+            if name == "SUBSCRIBE":
+                replies = []
+                for count, channel in enumerate(args, 1):
+                    self.subscribers.setdefault(channel, []).append(writer)
+                    replies.append(b"*3\r\n" + _bulk(b"subscribe") + _bulk(channel) + b":%d\r\n" % count)
+                return b"".join(replies)
+            if name == "PUBLISH":
+                message = b"*3\r\n" + _bulk(b"message") + _bulk(args[0]) + _bulk(args[1])
+                delivered = 0
+                for subscriber in list(self.subscribers.get(args[0], [])):
+                    try:
+                        subscriber.write(message)
+                        delivered += 1
+                    except OSError:
+                        self.subscribers[args[0]].remove(subscriber)
+                return b":%d\r\n" % delivered
+            if name == "HSET":
+                fields = self.data.setdefault(args[0], {})
+                added = 0
+                for field, value in zip(args[1::2], args[2::2], strict=True):
+                    added += field not in fields
+                    fields[field] = value
+                return b":%d\r\n" % added
+            if name == "HMGET":
+                fields = self.data.get(args[0], {})
+                values = [fields.get(field) for field in args[1:]]
+                return b"*%d\r\n" % len(values) + b"".join(_bulk(value) for value in values)
+            if name == "EXPIRE":
+                if args[0] not in self.data:
+                    return b":0\r\n"
+                self.ttls[args[0]] = int(args[1])
+                return b":1\r\n"
+            if name == "DEL":
+                removed = sum(self.data.pop(key, None) is not None for key in args)
+                return b":%d\r\n" % removed
+        return b"-ERR unknown command '%s'\r\n" % name.encode()
+
+    def unsubscribe(self, writer):
+        with self.lock:
+            for subscribers in self.subscribers.values():
+                if writer in subscribers:
+                    subscribers.remove(writer)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _bulk(value):
+    return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+@pytest.fixture
+def fake_resp_server():
+    """A running FakeRespServer, shut down after the test."""
+    server = FakeRespServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def make_handler():
+    """Build MCPProtocolHandlers with the given options; their executors are shut down after the test."""
+    from chuk_mcp_server.protocol import MCPProtocolHandler
+    from chuk_mcp_server.types import ServerCapabilities, ServerInfo
+
+    handlers = []
+
+    def make(**kwargs):
+        protocol = MCPProtocolHandler(ServerInfo(name="test", version="1.0"), ServerCapabilities(), **kwargs)
+        handlers.append(protocol)
+        return protocol
+
+    yield make
+    for protocol in handlers:
+        protocol._executor.shutdown()
+
+
+@pytest.fixture
+def handler(make_handler):
+    """A protocol handler with default options."""
+    return make_handler()
+
+
+@pytest.fixture
+def call_tool():
+    """Send a tools/call request through a protocol handler and return the JSON-RPC response."""
+
+    async def call(handler, name, arguments=None, msg_id=1):
+        response, _ = await handler.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": msg_id,
+                "method": "tools/call",
+                "params": {"name": name, "arguments": arguments or {}},
+            }
+        )
+        return response
+
+    return call
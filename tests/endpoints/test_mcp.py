@@ -45,6 +45,8 @@ class TestMCPEndpoint:
         self.mock_protocol.session_manager = MagicMock()
         self.mock_protocol.session_manager.create_session.return_value = "test-session-123"
         self.mock_protocol.session_manager.get_session.return_value = None
+        self.mock_protocol.session_manager.create_session_async = AsyncMock(return_value="test-session-123")
+        self.mock_protocol.session_manager.get_session_async = AsyncMock(return_value=None)
 
         # Mock handle_request
         self.mock_protocol.handle_request = AsyncMock()
@@ -52,15 +54,14 @@ class TestMCPEndpoint:
         # Mock SSE event ID methods (MCP 2025-11-25)
         self._sse_counter = 0
 
-        def _next_sse_event_id(session_id):
+        async def _record_sse_event(session_id, data):
             self._sse_counter += 1
             return self._sse_counter
 
-        self.mock_protocol.next_sse_event_id = MagicMock(side_effect=_next_sse_event_id)
-        self.mock_protocol.buffer_sse_event = MagicMock()
+        self.mock_protocol.record_sse_event = AsyncMock(side_effect=_record_sse_event)
 
-        # Mock terminate_session
-        self.mock_protocol.terminate_session = MagicMock(return_value=True)
+        # Mock terminate_session_async
+        self.mock_protocol.terminate_session_async = AsyncMock(return_value=True)
 
         self.endpoint = MCPEndpoint(self.mock_protocol)
 
@@ -268,7 +269,7 @@ class TestMCPEndpoint:
         assert response.headers["Mcp-Session-Id"] == "test-session-123"
 
         # Verify session was created
-        self.mock_protocol.session_manager.create_session.assert_called_once_with(
+        self.mock_protocol.session_manager.create_session_async.assert_awaited_once_with(
             {"name": "Test Client", "version": "1.0"}, "2025-03-26"
         )
 
@@ -292,7 +293,7 @@ class TestMCPEndpoint:
         assert response.headers["Content-Type"] == "text/event-stream"
 
         # Should use existing session, not create new one
-        self.mock_protocol.session_manager.create_session.assert_not_called()
+        self.mock_protocol.session_manager.create_session_async.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_sse_stream_generator_success(self):
@@ -487,7 +488,7 @@ class TestMCPEndpoint:
         assert response.status_code == 200
         assert "Access-Control-Allow-Origin" in response.headers
         assert "MCP-Protocol-Version" in response.headers
-        self.mock_protocol.terminate_session.assert_called_once_with("test-session-123")
+        self.mock_protocol.terminate_session_async.assert_awaited_once_with("test-session-123")
 
     @pytest.mark.asyncio
     async def test_handle_delete_missing_session_id(self):
@@ -504,7 +505,7 @@ class TestMCPEndpoint:
     @pytest.mark.asyncio
     async def test_handle_delete_unknown_session(self):
         """Test DELETE with unknown session ID returns error."""
-        self.mock_protocol.terminate_session.return_value = False
+        self.mock_protocol.terminate_session_async.return_value = False
         request = MockRequest(method="DELETE", headers={"mcp-session-id": "unknown-session"})
 
         response = await self.endpoint.handle_request(request)
@@ -550,7 +551,7 @@ class TestMCPEndpoint:
     @pytest.mark.asyncio
     async def test_handle_get_sse_stream_with_valid_session(self):
         """Test GET with Accept: text/event-stream and valid session opens SSE stream."""
-        self.mock_protocol.session_manager.get_session.return_value = {
+        self.mock_protocol.session_manager.get_session_async.return_value = {
             "id": "test-session-123",
             "protocol_version": "2025-03-26",
         }
@@ -569,7 +570,7 @@ class TestMCPEndpoint:
     @pytest.mark.asyncio
     async def test_handle_get_sse_stream_unknown_session(self):
         """Test GET with Accept: text/event-stream and unknown session returns error."""
-        self.mock_protocol.session_manager.get_session.return_value = None
+        self.mock_protocol.session_manager.get_session_async.return_value = None
         request = MockRequest(
             method="GET",
             headers={"accept": "text/event-stream", "mcp-session-id": "unknown-session"},
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Tests for binary (blob) resources: bytes, memoryview and files."""
+
+import base64
+import os
+
+import orjson
+import pytest
+
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.types import BlobContent, ResourceHandler, ServerCapabilities, ServerInfo, read_file_blob
+from chuk_mcp_server.types.resources import ResourceTemplateHandler
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+
+
+@pytest.fixture
+def handler():
+    return MCPProtocolHandler(ServerInfo(name="test", version="1.0"), ServerCapabilities())
+
+
+async def _read(handler, uri):
+    response, _ = await handler.handle_request(
+        {"jsonrpc": "2.0", "id": 1, "method": "resources/read", "params": {"uri": uri}}
+    )
+    return response["result"]["contents"][0]
+
+
+class TestBlobContent:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("payload", [PNG, bytearray(PNG), memoryview(PNG)])
+    async def test_binary_results_become_blobs(self, payload):
+        resource = ResourceHandler.from_function("img://logo", lambda: payload, mime_type="image/png")
+        content = await resource.read()
+        assert isinstance(content, BlobContent)
+        assert base64.b64decode(content) == PNG
+
+    def test_serializes_as_plain_string(self):
+        blob = BlobContent("AAEC", "image/png")
+        assert orjson.loads(orjson.dumps({"blob": blob})) == {"blob": "AAEC"}
+
+    @pytest.mark.asyncio
+    async def test_text_results_unchanged(self):
+        resource = ResourceHandler.from_function("t://x", lambda: "hello", mime_type="text/plain")
+        content = await resource.read()
+        assert content == "hello"
+        assert not isinstance(content, BlobContent)
+
+
+class TestFileBlobs:
+    @pytest.mark.asyncio
+    async def test_encoded_once_per_mtime(self, tmp_path, monkeypatch):
+        import chuk_mcp_server.types.resources as resources_module
+
+        path = tmp_path / "logo.png"
+        path.write_bytes(PNG)
+        encodes = []
+        original = resources_module._load_file
+        monkeypatch.setattr(resources_module, "_load_file", lambda *a: encodes.append(a) or original(*a))
+
+        first = await read_file_blob(path)
+        second = await read_file_blob(path)
+        assert first is second
+        assert first.mime_type == "image/png"
+        assert base64.b64decode(first) == PNG
+        assert len(encodes) == 1
+
+        path.write_bytes(b"changed")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert base64.b64decode(await read_file_blob(path)) == b"changed"
+        assert len(encodes) == 2
+
+    @pytest.mark.asyncio
+    async def test_file_read_off_event_loop(self, tmp_path, monkeypatch):
+        import threading
+
+        import chuk_mcp_server.types.resources as resources_module
+
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"abc")
+        threads = []
+        for name in ("_file_version", "_load_file"):
+            original = getattr(resources_module, name)
+            monkeypatch.setattr(
+                resources_module,
+                name,
+                lambda *a, _original=original: threads.append(threading.current_thread()) or _original(*a),
+            )
+
+        assert base64.b64decode(await read_file_blob(path)) == b"abc"
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        assert await read_file_blob(path) == ""
+
+    @pytest.mark.asyncio
+    async def test_resources_read_emits_blob(self, handler, tmp_path):
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.7 fake")
+        handler.register_resource(ResourceHandler.from_function("docs://report", lambda: path))
+
+        content = await _read(handler, "docs://report")
+        assert "text" not in content
+        assert content["mimeType"] == "application/pdf"
+        assert base64.b64decode(content["blob"]) == b"%PDF-1.7 fake"
+
+    @pytest.mark.asyncio
+    async def test_template_can_serve_files(self, handler, tmp_path):
+        (tmp_path / "a.png").write_bytes(PNG)
+        handler.register_resource_template(
+            ResourceTemplateHandler.from_function("img://{name}", lambda name: tmp_path / f"{name}.png")
+        )
+        content = await _read(handler, "img://a")
+        assert content["mimeType"] == "image/png"
+        assert base64.b64decode(content["blob"]) == PNG
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_read_error(self, handler, tmp_path):
+        handler.register_resource(ResourceHandler.from_function("docs://gone", lambda: tmp_path / "gone.bin"))
+        response, _ = await handler.handle_request(
+            {"jsonrpc": "2.0", "id": 1, "method": "resources/read", "params": {"uri": "docs://gone"}}
+        )
+        assert "error" in response
+
+    @pytest.mark.asyncio
+    async def test_bytes_blob_keeps_declared_mime_type(self, handler):
+        handler.register_resource(ResourceHandler.from_function("img://raw", lambda: PNG, mime_type="image/png"))
+        content = await _read(handler, "img://raw")
+        assert content["mimeType"] == "image/png"
+        assert base64.b64decode(content["blob"]) == PNG
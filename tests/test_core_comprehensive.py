@@ -345,7 +345,12 @@ class TestChukMCPServerComprehensive:
                 # When debug=True, log_level is automatically set to 'debug'
                 mock_print.assert_called_with("custom.host", 9999, True, actual_log_level="DEBUG")
                 mock_http_server.run.assert_called_with(
-                    host="custom.host", port=9999, debug=True, log_level="debug", reload=False
+                    host="custom.host",
+                    port=9999,
+                    debug=True,
+                    log_level="debug",
+                    reload=False,
+                    workers=server.smart_workers,
                 )
 
     def test_run_method_with_exception(self):
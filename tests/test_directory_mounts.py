@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Tests for directory-mounted static resources."""
+
+import base64
+import os
+
+import orjson
+import pytest
+
+from chuk_mcp_server import ChukMCPServer
+from chuk_mcp_server.directory_mounts import DirectoryMount, glob_to_regex
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.types import ServerCapabilities, ServerInfo
+
+
+@pytest.fixture
+def docs(tmp_path):
+    (tmp_path / "guides").mkdir()
+    (tmp_path / "guides" / "intro.md").write_text("# Intro")
+    (tmp_path / "guides" / "setup guide.md").write_text("# Setup")
+    (tmp_path / "index.md").write_text("# Home")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG fake")
+    (tmp_path / "notes.txt").write_text("not markdown")
+    return tmp_path
+
+
+@pytest.fixture
+def handler():
+    return MCPProtocolHandler(ServerInfo(name="test", version="1.0"), ServerCapabilities(), page_size=2)
+
+
+async def _request(handler, method, params):
+    response, _ = await handler.handle_request({"jsonrpc": "2.0", "id": 1, "method": method, "params": params})
+    if hasattr(response, "body"):
+        return orjson.loads(response.body)
+    return response
+
+
+async def _list_all(handler):
+    uris, cursor = [], None
+    while True:
+        result = (await _request(handler, "resources/list", {"cursor": cursor} if cursor else {}))["result"]
+        uris.extend(item["uri"] for item in result["resources"])
+        cursor = result.get("nextCursor")
+        if not cursor:
+            return uris
+
+
+def _touch_dir(path):
+    # Directory mtime granularity can be coarse; make the change visible deterministically
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestGlob:
+    @pytest.mark.parametrize(
+        ("pattern", "path", "matches"),
+        [
+            ("**/*.md", "index.md", True),
+            ("**/*.md", "a/b/c.md", True),
+            ("*.md", "a/b.md", False),
+            ("guides/*", "guides/x.md", True),
+            ("**", "any/thing", True),
+            ("data/[ab].csv", "data/a.csv", True),
+            ("data/[!ab].csv", "data/a.csv", False),
+            ("file?.txt", "file1.txt", True),
+            ("[a-c].txt", "b.txt", True),
+            ("[a-c].txt", "-.txt", False),
+            ("[!a-c].txt", "d.txt", True),
+            ("[!a-c].txt", "b.txt", False),
+            ("x[!a]y", "x/y", False),
+            ("[\\^]", "^", True),
+        ],
+    )
+    def test_glob(self, pattern, path, matches):
+        assert bool(glob_to_regex(pattern).fullmatch(path)) is matches
+
+
+class TestDirectoryMount:
+    def test_rejects_missing_directory(self, tmp_path):
+        with pytest.raises(ValueError):
+            DirectoryMount("file:///x", tmp_path / "missing")
+
+    @pytest.mark.asyncio
+    async def test_index_is_lazy(self, docs):
+        mount = DirectoryMount("file:///docs", docs, pattern="**/*.md")
+        assert mount.get_stats()["scans"] == 0
+        await mount.refresh()
+        assert len(mount) == 3
+        assert mount.get_stats()["scans"] == 1
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh(self, docs):
+        mount = DirectoryMount("file:///docs", docs, pattern="**/*.md", refresh_interval=0)
+        await mount.refresh()
+        generation = mount.generation
+
+        assert await mount.refresh() is False
+        assert mount.generation == generation
+
+        (docs / "guides" / "faq.md").write_text("# FAQ")
+        _touch_dir(docs / "guides")
+        assert await mount.refresh() is True
+        assert len(mount) == 4
+
+        (docs / "index.md").unlink()
+        _touch_dir(docs)
+        await mount.refresh()
+        assert len(mount) == 3
+        assert mount.generation == generation + 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_interval_limits_scans(self, docs):
+        mount = DirectoryMount("file:///docs", docs, refresh_interval=3600)
+        await mount.refresh()
+        await mount.refresh()
+        assert mount.get_stats()["scans"] == 1
+        await mount.refresh(force=True)
+        assert mount.get_stats()["scans"] == 2
+
+    @pytest.mark.asyncio
+    async def test_read_outside_index(self, docs):
+        mount = DirectoryMount("file:///docs", docs, pattern="**/*.md")
+        assert await mount.read("file:///docs/notes.txt") is None
+        assert await mount.read("file:///docs/../secret.md") is None
+        assert await mount.read("file:///other/index.md") is None
+
+    @pytest.mark.asyncio
+    async def test_symlinks_not_served(self, docs, tmp_path_factory):
+        secret = tmp_path_factory.mktemp("outside") / "secret.txt"
+        secret.write_text("top secret")
+        (docs / "leak.txt").symlink_to(secret)
+        (docs / "linked").symlink_to(secret.parent, target_is_directory=True)
+
+        mount = DirectoryMount("file:///docs", docs)
+        await mount.refresh()
+        assert "leak.txt" not in mount._items
+        assert not any(rel.startswith("linked/") for rel in mount._items)
+        assert await mount.read("file:///docs/leak.txt") is None
+        assert await mount.read("file:///docs/linked/secret.txt") is None
+
+    @pytest.mark.asyncio
+    async def test_file_swapped_for_symlink_after_scan_refused(self, docs, tmp_path_factory):
+        secret = tmp_path_factory.mktemp("outside") / "secret.txt"
+        secret.write_text("top secret")
+        mount = DirectoryMount("file:///docs", docs, refresh_interval=3600)
+        await mount.refresh()
+
+        (docs / "notes.txt").unlink()
+        (docs / "notes.txt").symlink_to(secret)
+        assert await mount.read("file:///docs/notes.txt") is None
+
+
+class TestProtocolIntegration:
+    @pytest.mark.asyncio
+    async def test_list_pages_through_index(self, handler, docs):
+        handler.add_directory_mount(DirectoryMount("file:///docs", docs, pattern="**/*.md"))
+        uris = await _list_all(handler)
+        assert uris == [
+            "file:///docs/guides/intro.md",
+            "file:///docs/guides/setup%20guide.md",
+            "file:///docs/index.md",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_text_and_blob(self, handler, docs):
+        handler.add_directory_mount(DirectoryMount("file:///docs", docs, mime_map={".md": "text/markdown"}))
+
+        text = (await _request(handler, "resources/read", {"uri": "file:///docs/guides/setup%20guide.md"}))["result"]
+        assert text["contents"][0] == {
+            "uri": "file:///docs/guides/setup%20guide.md",
+            "text": "# Setup",
+            "mimeType": "text/markdown",
+        }
+
+        blob = (await _request(handler, "resources/read", {"uri": "file:///docs/logo.png"}))["result"]
+        assert blob["contents"][0]["mimeType"] == "image/png"
+        assert base64.b64decode(blob["contents"][0]["blob"]) == b"\x89PNG fake"
+
+    @pytest.mark.asyncio
+    async def test_content_change_seen_on_read(self, handler, docs):
+        handler.add_directory_mount(DirectoryMount("file:///docs", docs))
+        await _request(handler, "resources/read", {"uri": "file:///docs/index.md"})
+        (docs / "index.md").write_text("# Home v2")
+        stat = (docs / "index.md").stat()
+        os.utime(docs / "index.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        result = (await _request(handler, "resources/read", {"uri": "file:///docs/index.md"}))["result"]
+        assert result["contents"][0]["text"] == "# Home v2"
+
+    def test_server_mount_directory(self, docs):
+        mcp = ChukMCPServer(name="docs-server")
+        mount = mcp.mount_directory("file:///docs", docs, pattern="**/*.md")
+        assert mount in mcp.protocol._directory_mounts
+        assert mcp.protocol.get_performance_stats()["directory_mounts"][0]["pattern"] == "**/*.md"
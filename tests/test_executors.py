@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Tests for sync handler executor policies (inline / thread pool offload)."""
+
+import asyncio
+import threading
+
+import pytest
+
+from chuk_mcp_server.constants import THREAD_POOL_NAME_PREFIX
+from chuk_mcp_server.context import add_resource_link, get_session_id, set_session_id
+from chuk_mcp_server.executors import HandlerExecutor, get_handler_executor, validate_executor_policy
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.types import PromptHandler, ResourceHandler, ToolHandler
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+async def call_tool(handler: MCPProtocolHandler, name: str, arguments: dict | None = None) -> dict:
+    response, _ = await handler.handle_request(
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": name, "arguments": arguments or {}}}
+    )
+    return response
+
+
+class TestHandlerExecutor:
+    """Test the executor itself."""
+
+    def test_invalid_policy_rejected(self):
+        with pytest.raises(ValueError):
+            validate_executor_policy("fiber")
+        with pytest.raises(ValueError):
+            HandlerExecutor(default_policy="fiber")
+        with pytest.raises(ValueError):
+            ToolHandler.from_function(_thread_name, executor="fiber")
+
+    @pytest.mark.asyncio
+    async def test_inline_runs_on_loop_thread(self):
+        executor = HandlerExecutor()
+        assert await executor.run(_thread_name, None) == _thread_name()
+        assert executor.get_stats()["started"] is False
+
+    @pytest.mark.asyncio
+    async def test_thread_runs_on_named_pool_with_context(self):
+        executor = HandlerExecutor(default_policy="thread", max_workers=2)
+        set_session_id("session-abc")
+        try:
+            name, session = await executor.run(lambda: (_thread_name(), get_session_id()), None)
+        finally:
+            set_session_id(None)
+            executor.shutdown()
+
+        assert name.startswith(THREAD_POOL_NAME_PREFIX)
+        assert session == "session-abc"
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_metrics(self):
+        executor = HandlerExecutor(max_workers=1)
+        release = threading.Event()
+
+        first = asyncio.create_task(executor.run_in_thread(release.wait, 5))
+        second = asyncio.create_task(executor.run_in_thread(lambda: "done"))
+        await asyncio.sleep(0.05)
+
+        stats = executor.get_stats()
+        assert stats["active"] == 1
+        assert stats["queue_depth"] == 1
+
+        release.set()
+        assert await second == "done"
+        await first
+
+        stats = executor.get_stats()
+        assert stats == {**stats, "active": 0, "queue_depth": 0, "peak_queue_depth": 1, "completed": 2}
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failures_not_counted_as_completed(self):
+        executor = HandlerExecutor(max_workers=1)
+
+        def boom() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await executor.run_in_thread(boom)
+        assert await executor.run_in_thread(lambda: "ok") == "ok"
+
+        stats = executor.get_stats()
+        assert stats == {**stats, "active": 0, "completed": 1, "failed": 1}
+        executor.shutdown()
+
+
+class TestExecutorPolicies:
+    """Test server default and per-handler overrides through the protocol handler."""
+
+    @pytest.mark.asyncio
+    async def test_per_tool_override(self, make_handler, call_tool):
+        handler = make_handler()
+        handler.register_tool(ToolHandler.from_function(_thread_name, name="inline_tool"))
+        handler.register_tool(ToolHandler.from_function(_thread_name, name="thread_tool", executor="thread"))
+
+        inline = await call_tool(handler, "inline_tool")
+        offloaded = await call_tool(handler, "thread_tool")
+
+        assert inline["result"]["content"][0]["text"] == _thread_name()
+        assert offloaded["result"]["content"][0]["text"].startswith(THREAD_POOL_NAME_PREFIX)
+        await handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_server_default_and_inline_override(self, make_handler, call_tool):
+        handler = make_handler(executor="thread", executor_workers=2)
+        handler.register_tool(ToolHandler.from_function(_thread_name, name="default_tool"))
+        handler.register_tool(ToolHandler.from_function(_thread_name, name="pinned_tool", executor="inline"))
+
+        offloaded = await call_tool(handler, "default_tool")
+        inline = await call_tool(handler, "pinned_tool")
+
+        assert offloaded["result"]["content"][0]["text"].startswith(THREAD_POOL_NAME_PREFIX)
+        assert inline["result"]["content"][0]["text"] == _thread_name()
+        stats = handler.get_performance_stats()["executor"]
+        assert stats["default_policy"] == "thread"
+        assert stats["max_workers"] == 2
+        assert stats["completed"] == 1
+        await handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_resource_links_from_thread(self, make_handler, call_tool):
+        def linker() -> str:
+            add_resource_link("file:///report.csv", name="report")
+            return "ok"
+
+        handler = make_handler(executor="thread")
+        handler.register_tool(ToolHandler.from_function(linker))
+
+        response = await call_tool(handler, "linker")
+        assert response["result"]["_meta"]["links"] == [{"uri": "file:///report.csv", "name": "report"}]
+        await handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_resource_and_prompt_offload(self, make_handler):
+        def greet(name: str) -> str:
+            return f"{name} from {_thread_name()}"
+
+        handler = make_handler()
+        handler.register_resource(ResourceHandler.from_function("test://thread", _thread_name, executor="thread"))
+        handler.register_prompt(PromptHandler.from_function(greet, executor="thread"))
+
+        resource, _ = await handler.handle_request(
+            {"jsonrpc": "2.0", "id": 1, "method": "resources/read", "params": {"uri": "test://thread"}}
+        )
+        prompt, _ = await handler.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "prompts/get",
+                "params": {"name": "greet", "arguments": {"name": "a"}},
+            }
+        )
+
+        assert resource["result"]["contents"][0]["text"].startswith(THREAD_POOL_NAME_PREFIX)
+        assert THREAD_POOL_NAME_PREFIX in str(prompt["result"])
+        await handler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_outside_request_uses_shared_default(self):
+        tool = ToolHandler.from_function(_thread_name, executor="thread")
+        assert get_handler_executor().default_policy == "inline"
+        assert (await tool.execute({})).startswith(THREAD_POOL_NAME_PREFIX)
@@ -220,6 +220,8 @@ class TestHealthDetailedEndpoint:
         assert data["prompts"] == 1
         assert data["sessions"] == 1
         assert data["in_flight_requests"] == 0
+        assert data["process_pool"]["started"] is False
+        assert data["process_pool"]["alive"] == 0
         assert "uptime" in data
         assert "timestamp" in data
         assert data["server"] == "ChukMCPServer"
@@ -240,6 +242,7 @@ class TestHealthDetailedEndpoint:
         assert data["prompts"] == 0
         assert data["sessions"] == 0
         assert data["in_flight_requests"] == 0
+        assert data["process_pool"] is None
 
     @pytest.mark.asyncio
     async def test_detailed_json_content_type(self):
@@ -342,3 +342,75 @@ class TestMCPEndpointBidirectional:
         # Response should still work
         body = json.loads(response.body.decode())
         assert "result" in body
+
+
+class TestPerRequestOutboundChannel:
+    """Server-to-client messages stay on the stream of the request that sent them."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tool_calls_keep_their_own_streams(self):
+        gate = asyncio.Event()
+
+        async def tagged(tag: str) -> str:
+            """Log, wait for the other call, log again."""
+            from chuk_mcp_server.context import send_log, send_progress
+
+            await send_log("info", f"start {tag}")
+            await gate.wait()
+            await send_progress(1, message=tag)
+            return tag
+
+        protocol = _make_protocol_with_tool(tagged, "tagged")
+        session_id = await _create_session(protocol)
+        endpoint = MCPEndpoint(protocol)
+
+        async def consume(tag: str) -> list[dict]:
+            request_data = {
+                "jsonrpc": "2.0",
+                "id": f"call-{tag}",
+                "method": "tools/call",
+                "params": {"name": "tagged", "arguments": {"tag": tag}, "_meta": {"progressToken": tag}},
+            }
+            messages = []
+            async for chunk in endpoint._sse_stream_generator(request_data, session_id, "tools/call"):
+                if chunk.startswith("data: "):
+                    messages.append(json.loads(chunk[len("data: ") :]))
+            return messages
+
+        streams = [asyncio.create_task(consume(tag)) for tag in ("a", "b")]
+        await asyncio.sleep(0.01)
+        gate.set()
+        a, b = await asyncio.gather(*streams)
+
+        for tag, messages in (("a", a), ("b", b)):
+            assert [m.get("method") for m in messages] == ["notifications/message", "notifications/progress", None]
+            assert messages[0]["params"]["data"] == f"start {tag}"
+            assert messages[1]["params"]["progressToken"] == tag
+            assert messages[2]["id"] == f"call-{tag}"
+        assert protocol._send_to_client is None
+
+    @pytest.mark.asyncio
+    async def test_bound_channel_takes_precedence(self):
+        from chuk_mcp_server.context import set_outbound_channel
+
+        protocol = _make_protocol_with_tool()
+        shared, bound = [], []
+
+        async def send_shared(message):
+            shared.append(message)
+            return {}
+
+        async def send_bound(message):
+            bound.append(message)
+            return {}
+
+        protocol._send_to_client = send_shared
+        await protocol.send_log_notification(data="transport-wide")
+
+        async def in_request():
+            set_outbound_channel(send_bound)
+            await protocol.send_log_notification(data="per-request")
+
+        await asyncio.create_task(in_request())
+        assert [m["params"]["data"] for m in shared] == ["transport-wide"]
+        assert [m["params"]["data"] for m in bound] == ["per-request"]
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Tests for generation-versioned list snapshots and stable pagination cursors."""
+
+import base64
+
+import pytest
+
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.protocol.snapshots import (
+    ListSnapshotCache,
+    VersionedRegistry,
+    decode_cursor,
+    encode_cursor,
+)
+from chuk_mcp_server.types import ServerCapabilities, ServerInfo, ToolHandler
+
+
+def _make_tool(name: str) -> ToolHandler:
+    def fn(x: str) -> str:
+        return x
+
+    fn.__name__ = name
+    return ToolHandler.from_function(fn)
+
+
+@pytest.fixture
+def handler():
+    return MCPProtocolHandler(ServerInfo(name="test", version="1.0"), ServerCapabilities(), page_size=3)
+
+
+class TestVersionedRegistry:
+    """Test generation bumping on registry mutation."""
+
+    def test_mutations_bump_generation(self):
+        registry: VersionedRegistry[int] = VersionedRegistry()
+        assert registry.generation == 0
+
+        registry["a"] = 1
+        registry.update(b=2)
+        registry.setdefault("a", 9)  # existing key: no change
+        assert registry.generation == 2
+
+        registry.pop("a")
+        registry.pop("missing", None)  # absent key: no change
+        del registry["b"]
+        registry.clear()
+        assert registry.generation == 5
+
+    def test_reassigned_registry_continues_generation(self, handler):
+        handler.register_tool(_make_tool("t1"))
+        before = handler.tools.generation
+
+        handler.tools = {}
+        assert isinstance(handler.tools, VersionedRegistry)
+        assert handler.tools.generation > before
+
+
+class TestCursors:
+    """Test cursor encoding."""
+
+    def test_roundtrip(self):
+        assert decode_cursor(encode_cursor(7, 300)) == (7, 300)
+
+    def test_legacy_offset_cursor(self):
+        assert decode_cursor(base64.b64encode(b"100").decode()) == (None, 100)
+
+    @pytest.mark.parametrize("cursor", ["invalid!!", None, 42, base64.b64encode(b"x:y").decode()])
+    def test_invalid_cursor_starts_at_zero(self, cursor):
+        assert decode_cursor(cursor) == (None, 0)
+
+
+class TestListSnapshotCache:
+    """Test snapshot building and retention."""
+
+    def test_pages_prebuilt_and_reused(self):
+        cache = ListSnapshotCache(page_size=2)
+        items = [b'{"n":1}', b'{"n":2}', b'{"n":3}']
+
+        snapshot = cache.get("tools", 1, lambda: items)
+        assert cache.get("tools", 1, lambda: pytest.fail("rebuilt")) is snapshot
+        assert cache.builds == 1
+        assert snapshot.pages == (
+            b'{"tools":[{"n":1},{"n":2}],"nextCursor":"' + encode_cursor(1, 2).encode() + b'"}',
+            b'{"tools":[{"n":3}]}',
+        )
+
+    def test_empty_list_has_single_page(self):
+        snapshot = ListSnapshotCache().get("prompts", 0, list)
+        assert snapshot.page(0) == b'{"prompts":[]}'
+
+    def test_history_is_bounded(self):
+        cache = ListSnapshotCache(history=2)
+        first = cache.get("tools", 1, lambda: [b"1"])
+        current = cache.get("tools", 3, lambda: [b"3"])
+        cache.get("tools", 2, lambda: [b"2"])
+
+        # Generation 1 was evicted: its cursor falls back to the current snapshot
+        assert cache.resolve("tools", current, encode_cursor(first.generation, 0)) == current.page(0)
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            ListSnapshotCache(page_size=0)
+
+
+class TestStablePagination:
+    """Test cursors stay consistent while the registry changes."""
+
+    async def _page(self, handler, cursor=None):
+        params = {"cursor": cursor} if cursor else {}
+        response, _ = await handler._handle_tools_list(params, "req")
+        result = response["result"]
+        return [t["name"] for t in result["tools"]], result.get("nextCursor")
+
+    @pytest.mark.asyncio
+    async def test_configured_page_size(self, handler):
+        for i in range(7):
+            handler.register_tool(_make_tool(f"t{i}"))
+
+        names, cursor = await self._page(handler)
+        assert names == ["t0", "t1", "t2"]
+        assert decode_cursor(cursor) == (handler.tools.generation, 3)
+
+    @pytest.mark.asyncio
+    async def test_registration_mid_pagination_does_not_shift_items(self, handler):
+        for i in range(5):
+            handler.register_tool(_make_tool(f"t{i}"))
+
+        first, cursor = await self._page(handler)
+
+        # A new tool sorts first in a fresh listing, but the in-flight chain keeps its snapshot
+        handler.tools = {"a_new": _make_tool("a_new"), **handler.tools}
+        second, cursor = await self._page(handler, cursor)
+
+        assert first + second == ["t0", "t1", "t2", "t3", "t4"]
+        assert cursor is None
+
+        fresh, _ = await self._page(handler)
+        assert fresh == ["a_new", "t0", "t1"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_rebuilt_only_on_change(self, handler):
+        handler.register_tool(_make_tool("t0"))
+        await self._page(handler)
+        await self._page(handler)
+        assert handler._list_snapshots.builds == 1
+
+        handler.register_tool(_make_tool("t1"))
+        names, _ = await self._page(handler)
+        assert names == ["t0", "t1"]
+        assert handler._list_snapshots.builds == 2
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Tests for the background maintenance task."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from starlette.testclient import TestClient
+
+from chuk_mcp_server.context import clear_all
+from chuk_mcp_server.endpoint_registry import http_endpoint_registry
+from chuk_mcp_server.http_server import HTTPServer
+from chuk_mcp_server.maintenance import MaintenanceTask
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.types import ServerInfo, create_server_capabilities
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    clear_all()
+    yield
+    clear_all()
+
+
+def _handler(**kwargs):
+    return MCPProtocolHandler(ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), **kwargs)
+
+
+class TestMaintenanceTask:
+    def test_run_once_reports_removed_per_step(self):
+        maintenance = MaintenanceTask(interval=0)
+        maintenance.add_step("a", lambda: 3)
+        maintenance.add_step("b", lambda: 0)
+
+        assert maintenance.run_once() == {"a": 3, "b": 0}
+        maintenance.run_once()
+
+        stats = maintenance.get_stats()
+        assert stats["runs"] == 2
+        assert stats["steps"]["a"]["removed"] == 6
+        assert stats["steps"]["a"]["last_removed"] == 3
+        assert stats["steps"]["b"]["runs"] == 2
+
+    def test_failing_step_does_not_stop_others(self):
+        maintenance = MaintenanceTask(interval=0)
+
+        def broken():
+            raise RuntimeError("boom")
+
+        maintenance.add_step("broken", broken)
+        maintenance.add_step("ok", lambda: 1)
+
+        assert maintenance.run_once() == {"broken": 0, "ok": 1}
+        assert maintenance.get_stats()["steps"]["broken"]["errors"] == 1
+
+    def test_negative_interval_rejected(self):
+        with pytest.raises(ValueError):
+            MaintenanceTask(interval=-1)
+
+    @pytest.mark.asyncio
+    async def test_background_loop_runs_until_stopped(self):
+        maintenance = MaintenanceTask(interval=0.01)
+        maintenance.add_step("tick", lambda: 1)
+
+        maintenance.start()
+        assert maintenance.running
+        await asyncio.sleep(0.05)
+        await maintenance.stop()
+
+        assert not maintenance.running
+        runs = maintenance.get_stats()["runs"]
+        assert runs >= 1
+        await asyncio.sleep(0.03)
+        assert maintenance.get_stats()["runs"] == runs
+
+    @pytest.mark.asyncio
+    async def test_blocking_steps_run_off_the_loop(self):
+        maintenance = MaintenanceTask(interval=0)
+        threads: dict[str, int] = {}
+        maintenance.add_step(
+            "compact", lambda: threads.setdefault("compact", threading.get_ident()) and 2, blocking=True
+        )
+        maintenance.add_step("sweep", lambda: threads.setdefault("sweep", threading.get_ident()) and 1)
+
+        assert await maintenance.run_once_async() == {"compact": 2, "sweep": 1}
+        assert threads["compact"] != threading.get_ident()
+        assert threads["sweep"] == threading.get_ident()
+        assert maintenance.get_stats()["steps"]["compact"]["removed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_never_starts(self):
+        maintenance = MaintenanceTask(interval=0)
+        maintenance.start()
+        assert not maintenance.running
+
+
+class TestHandlerMaintenance:
+    @pytest.mark.asyncio
+    async def test_expires_idle_sessions(self):
+        handler = _handler(session_max_age=60)
+        stale = handler.session_manager.create_session({"name": "old"}, "2025-06-18")
+        fresh = handler.session_manager.create_session({"name": "new"}, "2025-06-18")
+        handler.session_manager.sessions[stale]["last_activity"] = time.time() - 120
+
+        assert handler.maintenance.run_once()["sessions"] == 1
+        assert list(handler.session_manager.sessions) == [fresh]
+
+    def test_prunes_idle_rate_limit_buckets(self):
+        handler = _handler(rate_limit_rps=10, session_max_age=60)
+        limiter = handler._rate_limiter
+        limiter.allow("idle")
+        limiter.allow("busy")
+        tokens, _ = limiter._buckets["idle"]
+        limiter._buckets["idle"] = (tokens, time.monotonic() - 120)
+
+        assert handler.maintenance.run_once()["rate_limiter"] == 1
+        assert list(limiter._buckets) == ["busy"]
+
+    def test_rate_limiter_step_only_when_enabled(self):
+        assert "rate_limiter" not in _handler().maintenance.get_stats()["steps"]
+
+    def test_collects_finished_tasks(self):
+        handler = _handler(task_retention=60)
+        tasks = handler._task_manager
+        done = tasks.create_task("r1", "echo")
+        running = tasks.create_task("r2", "echo")
+        tasks.update_task_status(done, "completed")
+        tasks._task_store[done]["updatedAt"] = time.time() - 120
+        tasks._task_store[running]["updatedAt"] = time.time() - 120
+
+        assert handler.maintenance.run_once()["tasks"] == 1
+        assert list(tasks._task_store) == [running]
+
+    def test_drops_unread_view_data(self):
+        handler = _handler()
+        handler._view_data_cache["ui://old"] = ({"x": 1}, time.monotonic() - 1000)
+        handler._view_data_cache["ui://new"] = ({"x": 2}, time.monotonic())
+
+        assert handler.maintenance.run_once()["view_data"] == 1
+        assert list(handler._view_data_cache) == ["ui://new"]
+
+    def test_stats_exposed(self):
+        handler = _handler(maintenance_interval=5)
+        handler.maintenance.run_once()
+
+        stats = handler.get_performance_stats()["maintenance"]
+        assert stats["interval"] == 5
+        assert stats["runs"] == 1
+        assert {"sessions", "tasks", "tool_cache", "resource_cache", "view_data"} <= set(stats["steps"])
+
+    @pytest.mark.asyncio
+    async def test_shutdown_stops_maintenance(self):
+        handler = _handler(maintenance_interval=30)
+        handler.maintenance.start()
+
+        await handler.shutdown()
+        assert not handler.maintenance.running
+
+
+class TestLifespan:
+    def test_http_lifespan_runs_maintenance(self):
+        http_endpoint_registry.clear_middleware()
+        handler = _handler(maintenance_interval=30)
+        server = HTTPServer(handler)
+
+        with TestClient(server.app):
+            assert handler.maintenance.running
+        assert not handler.maintenance.running
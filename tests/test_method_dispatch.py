@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for the precompiled method dispatch table in MCPProtocolHandler."""
+
+import pytest
+
+from chuk_mcp_server.constants import JsonRpcError, McpMethod, McpTaskMethod
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.types import ServerCapabilities, ServerInfo, ToolHandler
+
+
+@pytest.fixture
+def handler():
+    return MCPProtocolHandler(ServerInfo(name="test", version="1.0"), ServerCapabilities())
+
+
+class TestDispatchTable:
+    """Test the built-in dispatch table."""
+
+    def test_all_builtin_methods_registered(self, handler):
+        for method in (
+            McpMethod.INITIALIZE,
+            McpMethod.INITIALIZED,
+            McpMethod.PING,
+            McpMethod.TOOLS_LIST,
+            McpMethod.TOOLS_CALL,
+            McpMethod.RESOURCES_LIST,
+            McpMethod.RESOURCES_READ,
+            McpMethod.PROMPTS_LIST,
+            McpMethod.PROMPTS_GET,
+            McpMethod.NOTIFICATIONS_CANCELLED,
+            McpTaskMethod.TASKS_CANCEL,
+        ):
+            assert method in handler._method_handlers
+
+    @pytest.mark.asyncio
+    async def test_tools_call_routed(self, handler):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        handler.register_tool(ToolHandler.from_function(add))
+        response, _ = await handler.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": "add", "arguments": {"a": 1, "b": 2}},
+            }
+        )
+        assert response["result"]["content"][0]["text"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_notifications_return_no_response(self, handler):
+        for method in (McpMethod.INITIALIZED, McpMethod.NOTIFICATIONS_ROOTS_LIST_CHANGED):
+            response, session_id = await handler.handle_request({"jsonrpc": "2.0", "method": method})
+            assert response is None
+            assert session_id is None
+
+    @pytest.mark.asyncio
+    async def test_instance_override_still_dispatched(self, handler):
+        async def _custom_ping(msg_id):
+            return {"jsonrpc": "2.0", "id": msg_id, "result": {"custom": True}}, None
+
+        handler._handle_ping = _custom_ping
+        response, _ = await handler.handle_request({"jsonrpc": "2.0", "id": 7, "method": "ping"})
+        assert response["result"] == {"custom": True}
+
+    @pytest.mark.asyncio
+    async def test_non_string_method_not_found(self, handler):
+        response, _ = await handler.handle_request({"jsonrpc": "2.0", "id": 1, "method": ["ping"]})
+        assert response["error"]["code"] == JsonRpcError.METHOD_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_ui_prefix_request_and_notification(self, handler):
+        response, _ = await handler.handle_request({"jsonrpc": "2.0", "id": 1, "method": "ui/initialize"})
+        assert response["error"]["code"] == JsonRpcError.METHOD_NOT_FOUND
+        assert "ext-apps" in response["error"]["message"]
+
+        response, _ = await handler.handle_request({"jsonrpc": "2.0", "method": "ui/notifications/size-changed"})
+        assert response is None
+
+
+class TestRegisterMethod:
+    """Test pluggable method registration."""
+
+    @pytest.mark.asyncio
+    async def test_custom_method_wraps_result(self, handler):
+        async def reindex(params):
+            return {"reindexed": params.get("scope")}
+
+        handler.register_method("myorg/reindex", reindex)
+        response, _ = await handler.handle_request(
+            {"jsonrpc": "2.0", "id": "r1", "method": "myorg/reindex", "params": {"scope": "all"}}
+        )
+        assert response == {"jsonrpc": "2.0", "id": "r1", "result": {"reindexed": "all"}}
+
+    @pytest.mark.asyncio
+    async def test_custom_method_none_result_is_empty_object(self, handler):
+        async def noop(params):
+            return None
+
+        handler.register_method("myorg/noop", noop)
+        response, _ = await handler.handle_request({"jsonrpc": "2.0", "id": 1, "method": "myorg/noop"})
+        assert response["result"] == {}
+
+    @pytest.mark.asyncio
+    async def test_custom_notification_has_no_response(self, handler):
+        seen = []
+
+        async def on_event(params):
+            seen.append(params)
+            return {"ignored": True}
+
+        handler.register_method("notifications/myorg/event", on_event)
+        response, _ = await handler.handle_request(
+            {"jsonrpc": "2.0", "method": "notifications/myorg/event", "params": {"x": 1}}
+        )
+        assert response is None
+        assert seen == [{"x": 1}]
+
+    @pytest.mark.asyncio
+    async def test_custom_method_errors_use_standard_handling(self, handler):
+        async def bad(params):
+            raise ValueError("nope")
+
+        handler.register_method("myorg/bad", bad)
+        response, _ = await handler.handle_request({"jsonrpc": "2.0", "id": 1, "method": "myorg/bad"})
+        assert response["error"]["code"] == JsonRpcError.INVALID_PARAMS
+
+    def test_cannot_override_builtin(self, handler):
+        async def fake(params):
+            return {}
+
+        with pytest.raises(ValueError):
+            handler.register_method(McpMethod.TOOLS_CALL, fake)
+        with pytest.raises(ValueError):
+            handler.register_method("ui/initialize", fake)
+
+    @pytest.mark.asyncio
+    async def test_unregister_method(self, handler):
+        async def temp(params):
+            return {}
+
+        handler.register_method("myorg/temp", temp)
+        assert handler.unregister_method("myorg/temp") is True
+        assert handler.unregister_method("myorg/temp") is False
+        assert handler.unregister_method(McpMethod.PING) is False
+
+        response, _ = await handler.handle_request({"jsonrpc": "2.0", "id": 1, "method": "myorg/temp"})
+        assert response["error"]["code"] == JsonRpcError.METHOD_NOT_FOUND
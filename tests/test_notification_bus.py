@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Tests for the cross-worker notification bus."""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import orjson
+import pytest
+
+from chuk_mcp_server.context import clear_all
+from chuk_mcp_server.protocol import (
+    InProcessBus,
+    MCPProtocolHandler,
+    RedisBus,
+    UnixSocketBus,
+    create_notification_bus,
+)
+from chuk_mcp_server.resp import RespClient
+from chuk_mcp_server.types import ServerInfo, create_server_capabilities
+
+INIT = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "c", "version": "1"}},
+}
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    clear_all()
+    yield
+    clear_all()
+
+
+@pytest.fixture
+def bus_dir():
+    # Socket paths are limited to ~100 bytes; pytest's tmp_path can exceed that
+    directory = tempfile.mkdtemp(prefix="mcp-bus-", dir="/tmp" if os.path.isdir("/tmp") else None)
+    yield directory
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture(params=["memory", "unix", "redis"])
+def make_bus(request, bus_dir, fake_resp_server):
+    name = f"test-{os.getpid()}-{id(request)}"
+
+    def make():
+        if request.param == "memory":
+            return InProcessBus(name)
+        if request.param == "unix":
+            return UnixSocketBus(bus_dir)
+        return RedisBus(RespClient.from_url(fake_resp_server.url))
+
+    return make
+
+
+async def _wait_for(predicate, timeout=2.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition never became true")
+
+
+def _subscribe(method, uri):
+    return {"jsonrpc": "2.0", "id": 2, "method": method, "params": {"uri": uri}}
+
+
+def _drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(orjson.loads(queue.get_nowait()[1]))
+    return items
+
+
+class TestBuses:
+    @pytest.mark.asyncio
+    async def test_events_reach_other_members_only(self, make_bus):
+        first, second = make_bus(), make_bus()
+        first_got, second_got = [], []
+        await first.start(first_got.append)
+        await second.start(second_got.append)
+        try:
+            first.publish({"uri": "file:///a"})
+            await _wait_for(lambda: second_got)
+            await asyncio.sleep(0.05)
+
+            assert second_got == [{"uri": "file:///a"}]
+            assert first_got == []
+            assert first.get_stats()["published"] == 1
+            assert second.get_stats()["received"] == 1
+        finally:
+            await first.stop()
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_stopped_bus_receives_nothing(self, make_bus):
+        first, second = make_bus(), make_bus()
+        got = []
+        await first.start([].append)
+        await second.start(got.append)
+        await second.stop()
+
+        first.publish({"method": "notifications/tools/list_changed"})
+        await asyncio.sleep(0.05)
+        await first.stop()
+        assert got == []
+        assert not second.running
+
+    @pytest.mark.asyncio
+    async def test_unix_bus_removes_stale_sockets(self, bus_dir):
+        directory = os.path.join(bus_dir, "bus")
+        dead = UnixSocketBus(directory)
+        await dead.start([].append)
+        dead._sock.close()  # Worker died without cleaning up
+        dead._sock = None
+
+        live = UnixSocketBus(directory)
+        await live.start([].append)
+        live.publish({"uri": "file:///a"})
+
+        assert live.get_stats()["stale_removed"] == 1
+        assert os.listdir(directory) == [os.path.basename(live._path)]
+        await live.stop()
+        assert os.listdir(directory) == []
+
+    @pytest.mark.asyncio
+    async def test_redis_publish_does_not_wait_for_server(self, fake_resp_server):
+        bus = RedisBus(RespClient.from_url(fake_resp_server.url))
+        await bus.start([].append)
+        release, sent = threading.Event(), []
+
+        def slow_execute(*args, **kwargs):
+            release.wait(2)
+            sent.append(args)
+
+        bus.client.execute = slow_execute
+        try:
+            started = time.monotonic()
+            bus.publish({"uri": "file:///a"})
+            bus.publish({"uri": "file:///b"})
+            assert time.monotonic() - started < 0.1
+            assert sent == []
+
+            release.set()
+            await _wait_for(lambda: len(sent) == 2)
+            assert [args[0] for args in sent] == ["PUBLISH", "PUBLISH"]
+            assert bus.get_stats()["publish_backlog"] == 0
+        finally:
+            release.set()
+            await bus.stop()
+
+    def test_create_from_url(self, tmp_path, fake_resp_server):
+        assert isinstance(create_notification_bus("memory://"), InProcessBus)
+        assert isinstance(create_notification_bus(f"unix://{tmp_path}"), UnixSocketBus)
+        assert isinstance(create_notification_bus(fake_resp_server.url), RedisBus)
+        for url in ("unix://relative/dir", "amqp://broker"):
+            with pytest.raises(ValueError):
+                create_notification_bus(url)
+
+
+class TestHandlerFanOut:
+    @pytest.mark.asyncio
+    async def test_resource_update_reaches_subscriber_on_other_worker(self, make_bus):
+        workers = [
+            MCPProtocolHandler(
+                ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), notification_bus=make_bus()
+            )
+            for _ in range(2)
+        ]
+        for worker in workers:
+            await worker.notification_bus.start(worker.deliver_bus_event)
+        try:
+            _, session_id = await workers[1].handle_request(INIT)
+            workers[1]._resource_subscriptions.subscribe(session_id, "config://settings")
+            stream = workers[1].notifications.open_stream(session_id)
+
+            await workers[0].notify_resource_updated("config://settings")
+            await workers[0].notify_tools_list_changed()
+            await _wait_for(lambda: stream.qsize() == 2)
+
+            assert _drain(stream) == [
+                {
+                    "jsonrpc": "2.0",
+                    "method": "notifications/resources/updated",
+                    "params": {"uri": "config://settings"},
+                },
+                {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"},
+            ]
+            assert workers[0].get_performance_stats()["bus"]["published"] == 2
+        finally:
+            for worker in workers:
+                await worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_subscription_on_one_worker_reaches_stream_on_another(self, make_bus):
+        workers = [
+            MCPProtocolHandler(
+                ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), notification_bus=make_bus()
+            )
+            for _ in range(3)
+        ]
+        for worker in workers:
+            await worker.notification_bus.start(worker.deliver_bus_event)
+        try:
+            _, session_id = await workers[0].handle_request(INIT)
+            await workers[0].handle_request(_subscribe("resources/subscribe", "config://*"), session_id)
+            stream = workers[1].notifications.open_stream(session_id)
+            await _wait_for(lambda: session_id in workers[1]._resource_subscriptions)
+
+            # Updated on the subscribing worker, then on one that has nothing to do with the session
+            await workers[0].notify_resource_updated("config://settings")
+            await _wait_for(lambda: stream.qsize() == 1)  # Publishers on different workers are not ordered
+            await workers[2].notify_resource_updated("config://limits")
+            await _wait_for(lambda: stream.qsize() == 2)
+            assert [event["params"]["uri"] for event in _drain(stream)] == ["config://settings", "config://limits"]
+
+            await workers[0].handle_request(_subscribe("resources/unsubscribe", "config://*"), session_id)
+            await _wait_for(lambda: not workers[1]._resource_subscriptions.subscribers("config://x"))
+            await workers[2].notify_resource_updated("config://settings")
+            await asyncio.sleep(0.05)
+            assert stream.empty()
+        finally:
+            for worker in workers:
+                await worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_termination_ends_stream_on_other_worker(self, make_bus):
+        workers = [
+            MCPProtocolHandler(
+                ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), notification_bus=make_bus()
+            )
+            for _ in range(2)
+        ]
+        for worker in workers:
+            await worker.notification_bus.start(worker.deliver_bus_event)
+        try:
+            _, session_id = await workers[0].handle_request(INIT)
+            await workers[0].handle_request(_subscribe("resources/subscribe", "config://settings"), session_id)
+            stream = workers[1].notifications.open_stream(session_id)
+            await _wait_for(lambda: session_id in workers[1]._resource_subscriptions)
+
+            assert workers[0].terminate_session(session_id)
+            await _wait_for(lambda: not stream.empty())
+            assert stream.get_nowait() is None
+            assert session_id not in workers[1]._resource_subscriptions
+        finally:
+            for worker in workers:
+                await worker.shutdown()
+
+    def test_stale_remote_subscriptions_purged(self):
+        handler = MCPProtocolHandler(
+            ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), notification_bus=InProcessBus()
+        )
+        handler.deliver_bus_event({"session": "remote", "subscribe": "config://settings"})
+        assert handler._resource_subscriptions.subscribers("config://settings") == {"remote"}
+
+        assert handler._purge_remote_subscriptions() == 0
+        handler._remote_subscribers["remote"] -= handler.session_manager.max_age + 1
+        assert handler._purge_remote_subscriptions() == 1
+        assert "remote" not in handler._resource_subscriptions
+
+    def test_unknown_events_ignored(self):
+        handler = MCPProtocolHandler(ServerInfo(name="test", version="1.0.0"), create_server_capabilities())
+        stream = handler.notifications.open_stream("s")
+
+        handler.deliver_bus_event({"method": "tools/call"})
+        handler.deliver_bus_event({"other": 1})
+
+        assert stream.empty()
+        assert handler.get_performance_stats()["bus"] is None
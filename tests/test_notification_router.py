@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Tests for routing server notifications to per-session GET streams."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from chuk_mcp_server.context import clear_all
+from chuk_mcp_server.endpoints.mcp import MCPEndpoint
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.protocol.events import SSEEventBuffer
+from chuk_mcp_server.protocol.notifications import NotificationRouter
+from chuk_mcp_server.types import ServerInfo, create_server_capabilities
+
+LIST_CHANGED = {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"}
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    clear_all()
+    yield
+    clear_all()
+
+
+@pytest.fixture
+def handler():
+    return MCPProtocolHandler(ServerInfo(name="test", version="1.0.0"), create_server_capabilities())
+
+
+async def _session(handler):
+    init = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "c", "version": "1"}},
+    }
+    _, session_id = await handler.handle_request(init)
+    return session_id
+
+
+async def _subscribe(handler, session_id, uri):
+    msg = {"jsonrpc": "2.0", "id": 2, "method": "resources/subscribe", "params": {"uri": uri}}
+    await handler.handle_request(msg, session_id)
+
+
+def _drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+class TestNotificationRouter:
+    async def test_send_pushes_to_open_streams_only(self):
+        router = NotificationRouter(SSEEventBuffer())
+        a = router.open_stream("a")
+        router.open_stream("b")
+
+        assert await router.send(["a", "never-streamed"], LIST_CHANGED) == {"a"}
+        assert [event_id for event_id, _ in _drain(a)] == [1]
+        assert router.get_stats()["unrouted"] == 1
+
+    async def test_broadcast_serializes_once(self):
+        router = NotificationRouter(SSEEventBuffer())
+        queues = [router.open_stream(f"s{i}") for i in range(3)]
+
+        assert await router.broadcast(LIST_CHANGED) == {"s0", "s1", "s2"}
+        bodies = [_drain(queue)[0][1] for queue in queues]
+        assert all(body is bodies[0] for body in bodies)
+        assert orjson.loads(bodies[0]) == LIST_CHANGED
+
+    async def test_disconnected_session_buffered_for_replay(self):
+        events = SSEEventBuffer()
+        router = NotificationRouter(events)
+        queue = router.open_stream("a")
+        router.close_stream("a", queue)
+
+        assert await router.broadcast(LIST_CHANGED) == set()
+        assert events.get_missed_events("a", 0) == [(1, LIST_CHANGED)]
+        assert router.get_stats()["buffered"] == 1
+
+    async def test_full_queue_drops_but_keeps_buffer(self):
+        events = SSEEventBuffer()
+        router = NotificationRouter(events, queue_size=1)
+        router.open_stream("a")
+
+        await router.send(["a"], LIST_CHANGED)
+        assert await router.send(["a"], LIST_CHANGED) == set()
+        assert router.get_stats()["dropped"] == 1
+        assert [event_id for event_id, _ in events.get_missed_events("a", 0)] == [1, 2]
+
+    def test_reopen_closes_previous_stream(self):
+        router = NotificationRouter(SSEEventBuffer())
+        old = router.open_stream("a")
+        new = router.open_stream("a")
+
+        assert old.get_nowait() is None
+        router.close_stream("a", old)  # A late close of the old stream leaves the new one registered
+        assert router.is_connected("a")
+        router.close_stream("a", new)
+        assert not router.is_connected("a")
+
+    async def test_forget_ends_stream(self):
+        router = NotificationRouter(SSEEventBuffer(), queue_size=1)
+        queue = router.open_stream("a")
+        await router.send(["a"], LIST_CHANGED)
+
+        router.forget("a")
+        assert queue.get_nowait() is None
+        assert await router.broadcast(LIST_CHANGED) == set()
+
+    def test_invalid_queue_size(self):
+        with pytest.raises(ValueError):
+            NotificationRouter(SSEEventBuffer(), queue_size=0)
+
+
+class TestProtocolRouting:
+    @pytest.mark.asyncio
+    async def test_resource_update_reaches_subscribers_only(self, handler):
+        subscriber, other = await _session(handler), await _session(handler)
+        await _subscribe(handler, subscriber, "config://settings")
+        sub_queue = handler.notifications.open_stream(subscriber)
+        other_queue = handler.notifications.open_stream(other)
+
+        await handler.notify_resource_updated("config://settings")
+
+        [(_, body)] = _drain(sub_queue)
+        assert orjson.loads(body)["params"] == {"uri": "config://settings"}
+        assert _drain(other_queue) == []
+
+    @pytest.mark.asyncio
+    async def test_list_changed_fans_out_to_every_stream(self, handler):
+        sessions = [await _session(handler) for _ in range(3)]
+        queues = [handler.notifications.open_stream(sid) for sid in sessions]
+
+        await handler.notify_prompts_list_changed()
+
+        for queue in queues:
+            [(_, body)] = _drain(queue)
+            assert orjson.loads(body)["method"] == "notifications/prompts/list_changed"
+        assert handler.get_performance_stats()["notifications"]["delivered"] == 3
+
+    @pytest.mark.asyncio
+    async def test_missed_notifications_replayed(self, handler):
+        session_id = await _session(handler)
+        queue = handler.notifications.open_stream(session_id)
+        await handler.notify_tools_list_changed()
+        handler.notifications.close_stream(session_id, queue)
+        await handler.notify_resources_list_changed()
+
+        missed = handler.get_missed_events(session_id, 1)
+        assert [data["method"] for _, data in missed] == ["notifications/resources/list_changed"]
+
+    @pytest.mark.asyncio
+    async def test_terminate_session_ends_stream(self, handler):
+        session_id = await _session(handler)
+        queue = handler.notifications.open_stream(session_id)
+
+        handler.terminate_session(session_id)
+        assert queue.get_nowait() is None
+        assert handler.notifications.get_stats()["sessions"] == 0
+
+
+class TestGetStream:
+    @pytest.mark.asyncio
+    async def test_get_stream_emits_routed_notifications(self, handler):
+        session_id = await _session(handler)
+        endpoint = MCPEndpoint(handler)
+        stream = endpoint._get_stream_generator(session_id)
+
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        await handler.notify_tools_list_changed()
+        lines = [await first] + [await stream.__anext__() for _ in range(3)]
+
+        assert lines[0] == "event: message\r\n"
+        assert lines[1] == "id: 1\r\n"
+        assert orjson.loads(lines[2][len("data: ") :]) == LIST_CHANGED
+        assert lines[3] == "\r\n"
+
+        handler.terminate_session(session_id)
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+        assert not handler.notifications.is_connected(session_id)
@@ -3,6 +3,7 @@
 
 import base64
 
+import orjson
 import pytest
 
 from chuk_mcp_server.constants import DEFAULT_PAGE_SIZE
@@ -141,6 +142,24 @@ class TestToolsListPagination:
         assert len(result["tools"]) == 10
         assert "nextCursor" not in result
 
+    @pytest.mark.asyncio
+    async def test_tools_list_body_is_spliced_from_item_bytes(self, handler):
+        def visible(x: str) -> str:
+            return x
+
+        def hidden(x: str) -> str:
+            return x
+
+        handler.register_tool(ToolHandler.from_function(visible))
+        handler.register_tool(ToolHandler.from_function(hidden, visibility=["app"]))
+
+        response, _ = await handler._handle_tools_list({}, 42)
+
+        assert response.body == (
+            b'{"jsonrpc":"2.0","id":42,"result":{"tools":[' + handler.tools["visible"].to_mcp_bytes() + b"]}}"
+        )
+        assert orjson.loads(response.body)["result"]["tools"] == handler.get_tools_list()
+
 
 class TestResourcesListPagination:
     """Test pagination through the resources/list protocol handler."""
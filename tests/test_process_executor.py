@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Tests for the process-pool executor (executor="process")."""
+
+import asyncio
+import multiprocessing
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.reduction import ForkingPickler
+
+import pytest
+
+from chuk_mcp_server.executors import HandlerExecutor, ProcessWorkerPool, function_reference
+from chuk_mcp_server.types import ToolHandler
+
+# Worker processes resolve handlers by module and qualified name, so they live at module level
+
+
+def worker_pid() -> int:
+    return os.getpid()
+
+
+def checksum(data: str, rounds: int = 1) -> int:
+    total = 0
+    for _ in range(rounds):
+        for ch in data:
+            total = (total * 31 + ord(ch)) % 1_000_003
+    return total
+
+
+def payload_size(data: bytes) -> int:
+    return len(data)
+
+
+def make_payload(size: int) -> bytes:
+    return b"x" * size
+
+
+def sleepy(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+def explode(message: str) -> None:
+    raise ValueError(message)
+
+
+async def async_handler() -> int:
+    return 1
+
+
+@pytest.fixture
+def handler(make_handler):
+    return make_handler(process_workers=1)
+
+
+class TestProcessPolicyValidation:
+    def test_closure_rejected(self):
+        def local(x: int) -> int:
+            return x
+
+        with pytest.raises(ValueError, match="module-level"):
+            ToolHandler.from_function(local, executor="process")
+
+    def test_lambda_rejected(self):
+        with pytest.raises(ValueError, match="module-level"):
+            function_reference(lambda: None)
+
+    def test_async_rejected(self):
+        with pytest.raises(ValueError, match="synchronous"):
+            ToolHandler.from_function(async_handler, executor="process")
+
+    def test_not_a_server_default(self):
+        with pytest.raises(ValueError, match="per handler"):
+            HandlerExecutor(default_policy="process")
+
+    def test_module_level_function_accepted(self):
+        tool = ToolHandler.from_function(checksum, executor="process")
+        assert tool.executor == "process"
+        assert function_reference(checksum) == (__name__, "checksum")
+
+
+class TestProcessWorkerPool:
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self):
+        pool = ProcessWorkerPool(max_workers=1)
+        try:
+            pid = await pool.run(worker_pid)
+            assert pid != os.getpid()
+            # The worker is kept warm between calls
+            assert await pool.run(worker_pid) == pid
+            assert await pool.run(checksum, "abc", rounds=2) == checksum("abc", rounds=2)
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_and_worker_survives(self):
+        pool = ProcessWorkerPool(max_workers=1)
+        try:
+            with pytest.raises(ValueError, match="bad input"):
+                await pool.run(explode, "bad input")
+            assert await pool.run(checksum, "x") == checksum("x")
+            stats = pool.get_stats()
+            assert stats["failed"] == 1
+            assert stats["completed"] == 1
+            assert stats["restarts"] == 0
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_calls_queue_beyond_max_workers(self):
+        pool = ProcessWorkerPool(max_workers=1)
+        try:
+            results = await asyncio.gather(*(pool.run(checksum, str(i)) for i in range(4)))
+            assert results == [checksum(str(i)) for i in range(4)]
+            assert pool.get_stats()["peak_queue_depth"] >= 1
+            assert pool.get_stats()["queue_depth"] == 0
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_running_calls_leave_default_thread_pool_free(self):
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        pool = ProcessWorkerPool(max_workers=2)
+        try:
+            running = [asyncio.create_task(pool.run(sleepy, 0.5)) for _ in range(2)]
+            while pool.get_stats()["busy"] < 2:
+                await asyncio.sleep(0.01)
+            assert await asyncio.wait_for(asyncio.to_thread(lambda: "free"), 0.3) == "free"
+            assert await asyncio.gather(*running) == ["done", "done"]
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_payloads_larger_than_the_pipe_buffer(self):
+        pool = ProcessWorkerPool(max_workers=1)
+        size = 8 * 1024 * 1024
+        try:
+            assert await pool.run(payload_size, b"x" * size) == size
+            assert len(await pool.run(make_payload, size)) == size
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="Windows pipes are read on a thread")
+    async def test_partly_written_outcome_read_without_blocking_the_loop(self):
+        parent, child = multiprocessing.Pipe()
+        os.set_blocking(parent.fileno(), False)
+        body = bytes(ForkingPickler.dumps((True, "x" * 10_000)))
+        frame = struct.pack("!i", len(body)) + body
+        os.write(child.fileno(), frame[:1000])
+        # The rest is written by the loop itself, which a blocking read would never let run
+        asyncio.get_running_loop().call_later(0.05, os.write, child.fileno(), frame[1000:])
+
+        assert await asyncio.wait_for(ProcessWorkerPool._receive(parent), 5) == (True, "x" * 10_000)
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_call_replaces_worker(self):
+        pool = ProcessWorkerPool(max_workers=1)
+        try:
+            first_pid = await pool.run(worker_pid)
+            task = asyncio.create_task(pool.run(sleepy, 30))
+            while pool.get_stats()["busy"] == 0:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            stats = pool.get_stats()
+            assert stats["cancelled"] == 1
+            assert stats["restarts"] == 1
+            assert stats["alive"] == 1
+            assert first_pid not in stats["pids"]
+            assert await pool.run(worker_pid) != first_pid
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_call_leaves_queue(self):
+        pool = ProcessWorkerPool(max_workers=1)
+        try:
+            running = asyncio.create_task(pool.run(sleepy, 0.3))
+            while pool.get_stats()["busy"] == 0:
+                await asyncio.sleep(0.01)
+            queued = asyncio.create_task(pool.run(checksum, "q"))
+            await asyncio.sleep(0.01)
+            assert pool.get_stats()["queue_depth"] == 1
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            assert pool.get_stats()["queue_depth"] == 0
+            assert await running == "done"
+            assert pool.get_stats()["restarts"] == 0
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_dead_idle_worker_replaced(self):
+        pool = ProcessWorkerPool(max_workers=1)
+        try:
+            pool.start()
+            pid = pool.get_stats()["pids"][0]
+            pool._workers[0].process.kill()
+            pool._workers[0].process.join(2)
+            assert await pool.run(worker_pid) != pid
+            assert pool.get_stats()["restarts"] == 1
+        finally:
+            pool.shutdown()
+
+
+class TestProcessToolsThroughProtocol:
+    @pytest.mark.asyncio
+    async def test_tools_call_uses_process_pool(self, handler, call_tool):
+        handler.register_tool(ToolHandler.from_function(worker_pid, executor="process"))
+        handler.warm_up()
+        assert handler._executor.process_pool.started
+
+        response = await call_tool(handler, "worker_pid", {})
+        assert response["result"]["content"][0]["text"] != str(os.getpid())
+        assert handler.get_performance_stats()["executor"]["process_pool"]["completed"] == 1
+
+    def test_warm_up_skips_pool_without_process_handlers(self, handler):
+        handler.register_tool(ToolHandler.from_function(checksum))
+        handler.warm_up()
+        assert not handler._executor.process_pool.started
+
+    @pytest.mark.asyncio
+    async def test_notifications_cancelled_stops_worker(self, handler, call_tool):
+        handler.register_tool(ToolHandler.from_function(sleepy, executor="process"))
+        call = asyncio.create_task(call_tool(handler, "sleepy", {"seconds": 30}, msg_id="slow-1"))
+        while "slow-1" not in handler._in_flight_requests:
+            await asyncio.sleep(0.01)
+        while handler._executor.process_pool.get_stats()["busy"] == 0:
+            await asyncio.sleep(0.01)
+
+        await handler.handle_request(
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": "slow-1"}}
+        )
+        response = await asyncio.wait_for(call, timeout=5)
+        assert "cancelled" in response["error"]["message"].lower()
+        assert handler._executor.process_pool.get_stats()["restarts"] == 1
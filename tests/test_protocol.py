@@ -258,6 +258,7 @@ class TestMCPProtocolHandler:
         tool = Mock(spec=ToolHandler)
         tool.name = "test_tool"
         tool.to_mcp_format.return_value = {"name": "test_tool"}
+        tool.to_mcp_bytes.return_value = b'{"name":"test_tool"}'
         handler.register_tool(tool)
 
         message = {"jsonrpc": "2.0", "id": 3, "method": "tools/list"}
@@ -318,6 +319,7 @@ class TestMCPProtocolHandler:
         resource = Mock(spec=ResourceHandler)
         resource.uri = "test://res"
         resource.to_mcp_format.return_value = {"uri": "test://res"}
+        resource.to_mcp_bytes.return_value = b'{"uri":"test://res"}'
         handler.register_resource(resource)
 
         message = {"jsonrpc": "2.0", "id": 6, "method": "resources/list"}
@@ -356,6 +358,7 @@ class TestMCPProtocolHandler:
         prompt = Mock(spec=PromptHandler)
         prompt.name = "test_prompt"
         prompt.to_mcp_format.return_value = {"name": "test_prompt"}
+        prompt.to_mcp_bytes.return_value = b'{"name":"test_prompt"}'
         handler.register_prompt(prompt)
 
         message = {"jsonrpc": "2.0", "id": 8, "method": "prompts/list"}
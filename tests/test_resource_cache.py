@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for the shared, byte-budgeted resource content cache."""
+
+import gc
+import time
+
+import pytest
+
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.types import ResourceCache, ResourceHandler, ServerCapabilities, ServerInfo, get_resource_cache
+
+
+def _resource(uri="data://r", body="x" * 100, **kwargs):
+    calls = []
+
+    def load() -> str:
+        calls.append(1)
+        return body
+
+    return ResourceHandler.from_function(uri, load, mime_type="text/plain", **kwargs), calls
+
+
+class TestResourceCache:
+    def test_lru_eviction_within_budget(self):
+        cache = ResourceCache(max_bytes=250)
+        for key in range(3):
+            cache.put(key, f"data://{key}", "x" * 100, stored_at=1.0)
+        assert len(cache) == 2
+        assert cache.bytes == 200
+        assert cache.get(0) is None
+
+        cache.get(1)  # 2 becomes least recently used
+        cache.put(3, "data://3", "y" * 100, stored_at=1.0)
+        assert cache.get(2) is None
+        assert cache.get(1) == ("x" * 100, 1.0)
+        assert cache.get_stats()["evictions"] == 2
+
+    def test_oversized_entry_rejected(self):
+        cache = ResourceCache(max_bytes=10)
+        assert cache.put(0, "data://big", "x" * 11, stored_at=1.0) is False
+        assert len(cache) == 0
+        assert cache.get_stats()["rejected"] == 1
+
+    def test_compression_round_trip(self):
+        cache = ResourceCache(compress_min_bytes=1024)
+        body = '{"rows": [' + ", ".join(['{"id": 1, "name": "row"}'] * 500) + "]}"
+        cache.put(0, "data://big", body, stored_at=1.0)
+        cache.put(1, "data://small", "tiny", stored_at=1.0)
+        stats = cache.get_stats()
+        assert stats["compressed_entries"] == 1
+        assert stats["bytes"] < len(body) // 10
+        assert cache.get(0) == (body, 1.0)
+        assert cache.peek(1) == ("tiny", 1.0)
+
+    def test_purge_expired_uses_max_age(self):
+        cache = ResourceCache()
+        now = time.time()
+        cache.put(0, "data://old", "a", stored_at=now - 100, max_age=60)
+        cache.put(1, "data://new", "b", stored_at=now, max_age=60)
+        cache.put(2, "data://forever", "c", stored_at=now - 100)
+        assert cache.purge_expired() == 1
+        assert len(cache) == 2
+
+    def test_shrinking_budget_trims(self):
+        cache = ResourceCache()
+        for key in range(4):
+            cache.put(key, "data://r", "x" * 100, stored_at=1.0)
+        cache.configure(max_bytes=200)
+        assert len(cache) == 2
+        with pytest.raises(ValueError):
+            cache.configure(max_bytes=0)
+        with pytest.raises(ValueError):
+            cache.configure(compress_min_bytes=-1)
+
+
+class TestResourceHandlerIntegration:
+    @pytest.mark.asyncio
+    async def test_handlers_share_the_global_budget(self):
+        cache = get_resource_cache()
+        before = cache.bytes
+        first, _ = _resource("data://a", cache_ttl=60)
+        second, _ = _resource("data://b", cache_ttl=60)
+        await first.read()
+        await second.read()
+        assert cache.bytes == before + 200
+
+        first.invalidate_cache()
+        assert cache.bytes == before + 100
+
+    @pytest.mark.asyncio
+    async def test_evicted_content_reloaded(self):
+        resource, calls = _resource(cache_ttl=60)
+        await resource.read()
+        get_resource_cache().discard(resource._cache_key)  # as if evicted under memory pressure
+        assert resource.is_cached() is False
+        await resource.read()
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_released_with_handler(self):
+        cache = get_resource_cache()
+        resource, _ = _resource(cache_ttl=60)
+        await resource.read()
+        entries = len(cache)
+        del resource
+        gc.collect()
+        assert len(cache) == entries - 1
+
+    @pytest.mark.asyncio
+    async def test_performance_stats(self):
+        handler = MCPProtocolHandler(ServerInfo(name="test", version="1.0"), ServerCapabilities())
+        resource, calls = _resource("data://stats", cache_ttl=60)
+        handler.register_resource(resource)
+        for msg_id in range(3):
+            await handler.handle_request(
+                {"jsonrpc": "2.0", "id": msg_id, "method": "resources/read", "params": {"uri": "data://stats"}}
+            )
+        assert len(calls) == 1
+
+        stats = handler.get_performance_stats()
+        assert stats["resources"]["cache_hit_ratio"] is not None
+        assert stats["resource_cache"]["hits"] >= 2
+        assert stats["cache"]["resources_cached"] >= 1
+        assert stats["cache"]["resources_bytes"] >= 100
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Tests for single-flight resource refresh, stale-while-revalidate and stale-if-error."""
+
+import asyncio
+import time
+
+import pytest
+
+from chuk_mcp_server.types import MCPError, ResourceHandler
+
+
+def _resource(gate=None, fail=None, **kwargs):
+    calls = []
+
+    async def report() -> str:
+        calls.append(len(calls) + 1)
+        if gate is not None:
+            await gate.wait()
+        if fail is not None and fail[0]:
+            raise RuntimeError("backend down")
+        return f"version {len(calls)}"
+
+    return ResourceHandler.from_function("data://report", report, mime_type="text/plain", **kwargs), calls
+
+
+def _age(resource, seconds):
+    resource._cache_timestamp = time.time() - seconds
+
+
+class TestValidation:
+    def test_windows_require_cache_ttl(self):
+        with pytest.raises(ValueError):
+            _resource(stale_while_revalidate=10)
+        with pytest.raises(ValueError):
+            _resource(cache_ttl=10, stale_if_error=-1)
+        resource, _ = _resource(cache_ttl=10, stale_while_revalidate=5, stale_if_error=60)
+        assert (resource.stale_while_revalidate, resource.stale_if_error) == (5, 60)
+
+
+class TestSingleFlightRefresh:
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_reads_share_one_call(self):
+        gate = asyncio.Event()
+        resource, calls = _resource(gate, cache_ttl=60)
+        readers = [asyncio.create_task(resource.read()) for _ in range(10)]
+        await asyncio.sleep(0)
+        gate.set()
+        assert await asyncio.gather(*readers) == ["version 1"] * 10
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refreshed_once(self):
+        gate = asyncio.Event()
+        resource, calls = _resource(gate, cache_ttl=60)
+        gate.set()
+        await resource.read()
+        _age(resource, 61)
+        gate.clear()
+
+        readers = [asyncio.create_task(resource.read()) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.set()
+        assert await asyncio.gather(*readers) == ["version 2"] * 5
+        assert calls == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_does_not_abort_refresh(self):
+        gate = asyncio.Event()
+        resource, _ = _resource(gate, cache_ttl=60)
+        first = asyncio.create_task(resource.read())
+        second = asyncio.create_task(resource.read())
+        await asyncio.sleep(0)
+        first.cancel()
+        gate.set()
+        assert await second == "version 1"
+
+    @pytest.mark.asyncio
+    async def test_uncached_resource_calls_every_time(self):
+        resource, calls = _resource()
+        await asyncio.gather(resource.read(), resource.read())
+        assert calls == [1, 2]
+
+
+class TestStaleWhileRevalidate:
+    @pytest.mark.asyncio
+    async def test_serves_stale_and_refreshes_in_background(self):
+        gate = asyncio.Event()
+        gate.set()
+        resource, calls = _resource(gate, cache_ttl=60, stale_while_revalidate=30)
+        await resource.read()
+        _age(resource, 70)
+        gate.clear()
+
+        assert await resource.read() == "version 1"
+        assert await resource.read() == "version 1"
+        await asyncio.sleep(0)
+        assert calls == [1, 2]  # a single background refresh
+        assert resource.get_cache_info()["refreshing"] is True
+
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert await resource.read() == "version 2"
+
+    @pytest.mark.asyncio
+    async def test_beyond_window_blocks_on_refresh(self):
+        resource, calls = _resource(cache_ttl=60, stale_while_revalidate=30)
+        await resource.read()
+        _age(resource, 100)
+        assert await resource.read() == "version 2"
+        assert calls == [1, 2]
+
+
+class TestStaleIfError:
+    @pytest.mark.asyncio
+    async def test_serves_stale_content_when_refresh_fails(self):
+        fail = [False]
+        resource, _ = _resource(fail=fail, cache_ttl=60, stale_if_error=300)
+        await resource.read()
+        _age(resource, 120)
+        fail[0] = True
+        assert await resource.read() == "version 1"
+
+        _age(resource, 400)
+        with pytest.raises(MCPError):
+            await resource.read()
+
+    @pytest.mark.asyncio
+    async def test_background_failure_keeps_stale_content(self):
+        fail = [False]
+        resource, calls = _resource(fail=fail, cache_ttl=60, stale_while_revalidate=30, stale_if_error=300)
+        await resource.read()
+        _age(resource, 70)
+        fail[0] = True
+        assert await resource.read() == "version 1"
+        await asyncio.sleep(0.01)
+        assert resource.is_cached() is False
+        assert await resource.read() == "version 1"
+        await asyncio.sleep(0.01)
+        assert len(calls) == 3
@@ -3,6 +3,8 @@
 
 import time
 
+import pytest
+
 from chuk_mcp_server.protocol import MCPProtocolHandler, SessionManager
 from chuk_mcp_server.types import ServerInfo, create_server_capabilities
 
@@ -115,10 +117,11 @@ class TestSessionManagerProtectedSessions:
         evicted: list[str] = []
         protected: set[str] = set()
 
-        mgr = _make_manager(
-            on_evict=lambda sid: evicted.append(sid),
-            protected_sessions=lambda: protected,
-        )
+        with pytest.warns(DeprecationWarning):
+            mgr = _make_manager(
+                on_evict=lambda sid: evicted.append(sid),
+                protected_sessions=lambda: protected,
+            )
 
         s1 = mgr.create_session({"name": "c1"}, "2025-06-18")
         s2 = mgr.create_session({"name": "c2"}, "2025-06-18")
@@ -139,9 +142,10 @@ class TestSessionManagerProtectedSessions:
     def test_all_protected_no_eviction(self):
         """If all sessions are protected, no eviction occurs (exceeds max)."""
         protected: set[str] = set()
-        mgr = _make_manager(
-            protected_sessions=lambda: protected,
-        )
+        with pytest.warns(DeprecationWarning):
+            mgr = _make_manager(
+                protected_sessions=lambda: protected,
+            )
 
         s1 = mgr.create_session({"name": "c1"}, "2025-06-18")
         s2 = mgr.create_session({"name": "c2"}, "2025-06-18")
@@ -295,29 +299,21 @@ class TestEvictionIntegration:
 
 
 # ============================================================================
-# _get_protected_sessions
+# _is_session_protected
 # ============================================================================
 
 
-class TestGetProtectedSessions:
-    """Verify _get_protected_sessions logic."""
+class TestIsSessionProtected:
+    """Verify _is_session_protected logic."""
 
-    def test_no_sse_counters_returns_empty(self):
+    def test_no_sse_counters_not_protected(self):
         handler = _make_handler()
-        assert handler._get_protected_sessions() == set()
+        sid = handler.session_manager.create_session({"name": "c1"}, "2025-06-18")
+        assert not handler._is_session_protected(sid)
 
     def test_sessions_with_sse_counters_are_protected(self):
         handler = _make_handler()
         sid = handler.session_manager.create_session({"name": "c1"}, "2025-06-18")
         handler._sse_event_counters[sid] = 5
 
-        protected = handler._get_protected_sessions()
-        assert sid in protected
-
-    def test_stale_sse_counter_not_protected(self):
-        """SSE counter for a session no longer in session_manager is not returned."""
-        handler = _make_handler()
-        handler._sse_event_counters["stale-sid"] = 3
-
-        protected = handler._get_protected_sessions()
-        assert "stale-sid" not in protected
+        assert handler._is_session_protected(sid)
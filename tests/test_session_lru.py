@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Tests for LRU-ordered session eviction and expiry in SessionManager."""
+
+import time
+
+from chuk_mcp_server.protocol import SessionManager
+
+
+def _fill(manager, count):
+    return [manager.create_session({"name": f"c{i}"}, "2025-06-18") for i in range(count)]
+
+
+class TestSessionLRU:
+    def test_recent_activity_protects_from_eviction(self):
+        evicted: list[str] = []
+        manager = SessionManager(max_sessions=3, on_evict=evicted.append)
+        s1, s2, _ = _fill(manager, 3)
+
+        manager.update_activity(s1)
+        manager.create_session({"name": "c4"}, "2025-06-18")
+
+        assert evicted == [s2]
+        assert list(manager.sessions)[0] != s1
+
+    def test_update_activity_unknown_session_ignored(self):
+        manager = SessionManager()
+        manager.update_activity("missing")
+        assert len(manager.sessions) == 0
+
+    def test_created_at_matches_last_activity(self):
+        manager = SessionManager()
+        session = manager.get_session(manager.create_session({"name": "c"}, "2025-06-18"))
+        assert session["created_at"] == session["last_activity"]
+
+    def test_eviction_checks_protection_per_candidate(self):
+        checked: list[str] = []
+        protected: set[str] = set()
+
+        def is_protected(sid):
+            checked.append(sid)
+            return sid in protected
+
+        manager = SessionManager(max_sessions=1000, is_protected=is_protected)
+        ids = _fill(manager, 1000)
+        protected.update(ids[:2])
+
+        manager.create_session({"name": "new"}, "2025-06-18")
+
+        assert checked == ids[:3]
+        assert ids[2] not in manager.sessions
+        assert ids[0] in manager.sessions
+
+    def test_protected_sessions_are_not_rechecked_every_eviction(self):
+        checked: list[str] = []
+        manager = SessionManager(max_sessions=100, is_protected=lambda sid: checked.append(sid) or sid in streaming)
+        ids = _fill(manager, 100)
+        streaming = set(ids[:50])
+
+        manager.create_session({"name": "first"}, "2025-06-18")
+        checked.clear()
+        manager.create_session({"name": "second"}, "2025-06-18")
+
+        assert checked == [ids[51]]  # The streams passed over once now sit at the back
+        assert all(sid in manager.sessions for sid in streaming)
+
+    def test_expiry_stops_at_first_active_session(self):
+        expired: list[str] = []
+        manager = SessionManager(on_evict=expired.append)
+        ids = _fill(manager, 5)
+        for sid in ids[:2]:
+            manager.sessions[sid]["last_activity"] = time.time() - 7200
+
+        manager.cleanup_expired(max_age=3600)
+
+        assert expired == ids[:2]
+        assert list(manager.sessions) == ids[2:]
+
+    def test_stats(self):
+        manager = SessionManager(max_sessions=2)
+        ids = _fill(manager, 3)
+        manager.sessions[ids[1]]["last_activity"] = time.time() - 7200
+        manager.cleanup_expired(max_age=3600)
+
+        assert manager.get_stats() == {
+            "active": 1,
+            "max_sessions": 2,
+            "created": 3,
+            "evictions": 1,
+            "expirations": 1,
+            "adopted": 0,
+            "store": None,
+        }
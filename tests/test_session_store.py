@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""Tests for shared session stores and multi-worker session handling."""
+
+import contextlib
+import socket
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from chuk_mcp_server.context import clear_all
+from chuk_mcp_server.http_server import HTTPServer
+from chuk_mcp_server.protocol import (
+    MCPProtocolHandler,
+    MemorySessionStore,
+    RedisSessionStore,
+    SessionManager,
+    SQLiteSessionStore,
+    create_session_store,
+)
+from chuk_mcp_server.resp import RespClient, RespError
+from chuk_mcp_server.types import ServerInfo, create_server_capabilities
+
+INIT = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {"sampling": {}},
+        "clientInfo": {"name": "c", "version": "1"},
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    clear_all()
+    yield
+    clear_all()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def store(request, tmp_path, fake_resp_server):
+    if request.param == "memory":
+        store = MemorySessionStore()
+    elif request.param == "sqlite":
+        store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    else:
+        store = RedisSessionStore(RespClient.from_url(fake_resp_server.url), ttl=60)
+    yield store
+    store.close()
+
+
+def _record(session_id, last_activity):
+    return {
+        "id": session_id,
+        "client_info": {"name": "c"},
+        "protocol_version": "2025-06-18",
+        "client_capabilities": {"roots": {}},
+        "created_at": last_activity,
+        "last_activity": last_activity,
+    }
+
+
+def _handler(store):
+    return MCPProtocolHandler(
+        ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), session_store=store
+    )
+
+
+class TestSessionStores:
+    def test_put_get_delete(self, store):
+        now = time.time()
+        store.put(_record("a", now))
+
+        assert store.get("a") == _record("a", now)
+        assert store.get("missing") is None
+        store.delete("a")
+        assert store.get("a") is None
+
+    def test_touch_updates_activity(self, store):
+        store.put(_record("a", 100.0))
+        store.touch("a", 200.0)
+        assert store.get("a")["last_activity"] == 200.0
+
+    def test_touch_of_deleted_session_does_not_revive_it(self, store):
+        store.put(_record("a", 100.0))
+        store.delete("a")
+        store.touch("a", 200.0)
+        assert store.get("a") is None
+
+    def test_expire(self, tmp_path):
+        for store in (MemorySessionStore(), SQLiteSessionStore(str(tmp_path / "s.db"))):
+            store.put(_record("old", 100.0))
+            store.put(_record("new", 300.0))
+            assert store.expire(200.0) == 1
+            assert store.get("old") is None
+            assert store.get("new") is not None
+
+    def test_redis_expiry_uses_key_ttl(self, fake_resp_server):
+        store = RedisSessionStore(RespClient.from_url(fake_resp_server.url), ttl=90)
+        store.put(_record("a", time.time()))
+
+        assert fake_resp_server.ttls == {b"chuk-mcp:session:a": 90}
+        assert store.expire(time.time()) == 0
+
+    def test_create_from_url(self, tmp_path, fake_resp_server):
+        assert isinstance(create_session_store("memory://"), MemorySessionStore)
+        assert isinstance(create_session_store(f"sqlite:///{tmp_path}/s.db"), SQLiteSessionStore)
+        redis_store = create_session_store(fake_resp_server.url, ttl=30)
+        assert isinstance(redis_store, RedisSessionStore) and redis_store.ttl == 30
+        for url in ("postgres://db", "sqlite:///", "sqlite://"):
+            with pytest.raises(ValueError):
+                create_session_store(url)
+
+    def test_sqlite_reconnects_after_fork(self, tmp_path, monkeypatch):
+        store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+        store.put(_record("s1", time.time()))
+        inherited = store._conn
+        monkeypatch.setattr("chuk_mcp_server.protocol.session_store.os.getpid", lambda: -1)
+
+        assert store.get("s1")["id"] == "s1"
+        assert store._conn is not inherited
+        store.close()
+        inherited.close()
+
+    def test_memory_store_is_not_shared(self, tmp_path):
+        assert not SessionManager(store=MemorySessionStore()).shared
+        assert SessionManager(store=SQLiteSessionStore(str(tmp_path / "s.db"))).shared
+        assert not SessionManager().shared
+
+
+class TestSharedSessions:
+    @pytest.mark.asyncio
+    async def test_session_from_another_worker_is_adopted(self, tmp_path):
+        path = str(tmp_path / "sessions.db")
+        first, second = _handler(SQLiteSessionStore(path)), _handler(SQLiteSessionStore(path))
+
+        _, session_id = await first.handle_request(INIT)
+        response, _ = await second.handle_request({"jsonrpc": "2.0", "id": 2, "method": "ping"}, session_id)
+
+        assert response["result"] == {}
+        session = second.session_manager.get_session(session_id)
+        assert session["protocol_version"] == "2025-06-18"
+        assert session["client_capabilities"] == {"sampling": {}}
+        assert second.session_manager.get_stats()["adopted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_store_calls_run_off_event_loop(self, tmp_path):
+        class RecordingStore(SQLiteSessionStore):
+            def __init__(self, path):
+                super().__init__(path)
+                self.threads = []
+
+            def get(self, session_id):
+                self.threads.append(threading.current_thread())
+                return super().get(session_id)
+
+            def put(self, session):
+                self.threads.append(threading.current_thread())
+                super().put(session)
+
+            def touch(self, session_id, last_activity):
+                self.threads.append(threading.current_thread())
+                super().touch(session_id, last_activity)
+
+            def delete(self, session_id):
+                self.threads.append(threading.current_thread())
+                super().delete(session_id)
+
+            def expire(self, cutoff):
+                self.threads.append(threading.current_thread())
+                return super().expire(cutoff)
+
+        path = str(tmp_path / "sessions.db")
+        first, second = _handler(RecordingStore(path)), _handler(RecordingStore(path))
+        second.session_manager.touch_interval = 0
+
+        _, session_id = await first.handle_request(INIT)
+        response, _ = await second.handle_request({"jsonrpc": "2.0", "id": 2, "method": "ping"}, session_id)
+        assert await second.terminate_session_async(session_id)
+        await first.maintenance.run_once_async()
+
+        assert response["result"] == {}
+        assert len(first.session_manager.store.threads) == 2  # put and expire
+        assert len(second.session_manager.store.threads) == 3  # get (adopt), touch and delete
+        assert threading.main_thread() not in first.session_manager.store.threads
+        assert threading.main_thread() not in second.session_manager.store.threads
+
+    @pytest.mark.asyncio
+    async def test_terminate_removes_from_store(self, fake_resp_server):
+        first = _handler(RedisSessionStore(RespClient.from_url(fake_resp_server.url)))
+        second = _handler(RedisSessionStore(RespClient.from_url(fake_resp_server.url)))
+        _, session_id = await first.handle_request(INIT)
+
+        assert second.terminate_session(session_id)
+        assert first.session_manager.store.get(session_id) is None
+
+    def test_activity_writes_are_throttled(self):
+        store = Mock(wraps=MemorySessionStore())
+        manager = SessionManager(store=store, touch_interval=60)
+        session_id = manager.create_session({"name": "c"}, "2025-06-18")
+
+        for _ in range(10):
+            manager.update_activity(session_id)
+        store.touch.assert_not_called()
+
+        manager._store_touched[session_id] -= 61
+        manager.update_activity(session_id)
+        store.touch.assert_called_once()
+
+    def test_local_eviction_keeps_store_record(self):
+        store = MemorySessionStore()
+        manager = SessionManager(max_sessions=1, store=store)
+        first = manager.create_session({"name": "a"}, "2025-06-18")
+        manager.create_session({"name": "b"}, "2025-06-18")
+
+        assert first not in manager.sessions
+        assert manager.get_session(first) is not None  # Re-adopted from the store
+
+    def test_adopted_session_keeps_front_oldest(self):
+        store = MemorySessionStore()
+        other = SessionManager(store=store)
+        adopted = other.create_session({"name": "elsewhere"}, "2025-06-18")
+        store._sessions[adopted]["last_activity"] -= 90  # Last used on the other worker before max_age
+        manager = SessionManager(store=store, max_age=60)
+        stale = manager.create_session({"name": "idle"}, "2025-06-18")
+        manager.sessions[stale]["last_activity"] -= 120
+
+        manager.get_session(adopted)
+        assert list(manager.sessions) == [stale, adopted]
+        assert manager.expire_local() == 1  # The adopted session is in use now
+        assert list(manager.sessions) == [adopted]
+        assert manager._store_touched[adopted] < manager.sessions[adopted]["last_activity"]  # Touch still due
+
+    def test_expiry_also_expires_store(self):
+        store = MemorySessionStore()
+        manager = SessionManager(store=store, max_age=60)
+        session_id = manager.create_session({"name": "c"}, "2025-06-18")
+        manager.sessions[session_id]["last_activity"] -= 120
+        store._sessions[session_id]["last_activity"] -= 120
+
+        assert manager.cleanup_expired() == 1
+        assert store.get(session_id) is None
+
+
+class TestRespClient:
+    def test_error_reply_raised(self, fake_resp_server):
+        client = RespClient.from_url(fake_resp_server.url)
+        with pytest.raises(RespError):
+            client.execute("NOPE")
+        assert client.execute("PING") == "OK"
+
+    def test_reconnects_after_drop(self, fake_resp_server):
+        client = RespClient.from_url(fake_resp_server.url)
+        client.execute("PING")
+        client._sock.close()  # Simulate the server dropping the connection
+        assert client.execute("PING") == "OK"
+
+    @pytest.mark.parametrize(("idempotent", "connections"), [(False, 1), (True, 2)])
+    def test_batch_resent_after_write_only_if_idempotent(self, idempotent, connections):
+        # A server that accepts but never replies: the write succeeds, the read times out
+        listener = socket.create_server(("127.0.0.1", 0))
+        client = RespClient(port=listener.getsockname()[1], timeout=0.1)
+        try:
+            with pytest.raises(OSError):
+                client.execute("PUBLISH", "events", "payload", idempotent=idempotent)
+            listener.settimeout(0.1)
+            accepted = []
+            with contextlib.suppress(TimeoutError):
+                while True:
+                    accepted.append(listener.accept()[0])
+            assert len(accepted) == connections
+            for conn in accepted:
+                conn.close()
+        finally:
+            client.close()
+            listener.close()
+
+    def test_connection_not_shared_across_fork(self, fake_resp_server, monkeypatch):
+        client = RespClient.from_url(fake_resp_server.url)
+        client.execute("PING")
+        inherited = client._sock
+        monkeypatch.setattr("chuk_mcp_server.resp.os.getpid", lambda: -1)
+        assert client.execute("PING") == "OK"
+        assert client._sock is not inherited
+        assert inherited.fileno() == -1
+
+    def test_url_parsing(self):
+        client = RespClient.from_url("redis://:s3cret@cache.internal:6380/2")
+        assert (client.host, client.port, client.db, client.password) == ("cache.internal", 6380, 2, "s3cret")
+        with pytest.raises(ValueError):
+            RespClient.from_url("http://localhost")
+
+
+class TestWorkerCount:
+    def _server(self, shared):
+        protocol = Mock()
+        protocol.session_manager.shared = shared
+        with patch.object(HTTPServer, "_register_endpoints"), patch.object(HTTPServer, "_create_app"):
+            return HTTPServer(protocol)
+
+    def test_process_local_sessions_run_one_worker(self):
+        assert self._server(shared=False)._resolve_workers(4, reload=False) == 1
+
+    def test_shared_sessions_run_requested_workers(self):
+        assert self._server(shared=True)._resolve_workers(4, reload=False) == 4
+        assert self._server(shared=True)._resolve_workers(4, reload=True) == 1
+
+    @patch("chuk_mcp_server.http_server.uvicorn")
+    def test_single_worker_runs_uvicorn_directly(self, mock_uvicorn):
+        server = self._server(shared=False)
+        server.run(workers=8)
+        mock_uvicorn.run.assert_called_once()
+        server.protocol.warm_up.assert_called_once()
+
+    @patch("chuk_mcp_server.http_server.uvicorn")
+    def test_multiple_workers_skip_warm_up_in_parent(self, mock_uvicorn):
+        server = self._server(shared=True)
+        with patch.object(HTTPServer, "_run_workers") as run_workers:
+            server.run(workers=4)
+        run_workers.assert_called_once()
+        server.protocol.warm_up.assert_not_called()
+        mock_uvicorn.run.assert_not_called()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Tests for single-flight coalescing of identical concurrent tool calls."""
+
+import asyncio
+
+import pytest
+
+from chuk_mcp_server.context import add_resource_link, set_session_id
+from chuk_mcp_server.singleflight import SingleFlight
+from chuk_mcp_server.types import ToolHandler
+
+
+def _gated_tool(gate, **tool_kwargs):
+    calls = []
+
+    async def search(query: str) -> str:
+        calls.append(query)
+        await gate.wait()
+        return f"results for {query}"
+
+    return ToolHandler.from_function(search, **tool_kwargs), calls
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_execution(self):
+        flight = SingleFlight()
+        gate = asyncio.Event()
+        runs = []
+
+        async def work():
+            runs.append(1)
+            await gate.wait()
+            return "value"
+
+        waiters = [asyncio.create_task(flight.run("k", work)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+        gate.set()
+        assert await asyncio.gather(*waiters) == ["value"] * 5
+        assert len(runs) == 1
+        assert flight.get_stats() == {"in_flight": 0, "executions": 1, "coalesced": 4, "abandoned": 0}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_execute_again(self):
+        flight = SingleFlight()
+        runs = []
+
+        async def work():
+            runs.append(1)
+            return len(runs)
+
+        assert await flight.run("k", work) == 1
+        assert await flight.run("k", work) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_shared_execution(self):
+        flight = SingleFlight()
+        gate = asyncio.Event()
+        finished = []
+
+        async def work():
+            await gate.wait()
+            finished.append(True)
+            return "value"
+
+        leader = asyncio.create_task(flight.run("k", work))
+        follower = asyncio.create_task(flight.run("k", work))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        gate.set()
+        assert await follower == "value"
+        assert finished == [True]
+
+    @pytest.mark.asyncio
+    async def test_execution_cancelled_when_every_waiter_leaves(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = []
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        waiter = asyncio.create_task(flight.run("k", work))
+        await started.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+
+        assert cancelled == [True]
+        assert len(flight) == 0
+        assert flight.get_stats()["abandoned"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exception_shared_by_all_waiters(self):
+        flight = SingleFlight()
+        gate = asyncio.Event()
+
+        async def work():
+            await gate.wait()
+            raise RuntimeError("backend down")
+
+        waiters = [asyncio.create_task(flight.run("k", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class TestToolsCallCoalescing:
+    @pytest.mark.asyncio
+    async def test_read_only_tool_coalesced_across_sessions(self, handler, call_tool):
+        gate = asyncio.Event()
+        tool, calls = _gated_tool(gate, read_only_hint=True)
+        handler.register_tool(tool)
+
+        async def call_as(session_id, msg_id, arguments):
+            set_session_id(session_id)
+            return await call_tool(handler, "search", arguments, msg_id=msg_id)
+
+        tasks = [
+            asyncio.create_task(call_as("s1", 1, {"query": "mcp"})),
+            asyncio.create_task(call_as("s2", 2, {"query": "mcp"})),
+            asyncio.create_task(call_as("s3", 3, {"query": "other"})),
+        ]
+        await asyncio.sleep(0.01)
+        gate.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert sorted(calls) == ["mcp", "other"]
+        assert [r["id"] for r in responses] == [1, 2, 3]
+        assert responses[0]["result"] == responses[1]["result"]
+        assert handler.get_performance_stats()["coalescing"]["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unhinted_tool_not_coalesced(self, handler, call_tool):
+        gate = asyncio.Event()
+        tool, calls = _gated_tool(gate)
+        handler.register_tool(tool)
+        tasks = [asyncio.create_task(call_tool(handler, "search", {"query": "q"}, msg_id=i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_per_tool_override(self, handler, call_tool):
+        gate = asyncio.Event()
+        opted_out, out_calls = _gated_tool(gate, read_only_hint=True, coalesce=False)
+        handler.register_tool(opted_out)
+        tasks = [asyncio.create_task(call_tool(handler, "search", {"query": "q"}, msg_id=i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert len(out_calls) == 2
+
+        gate.clear()
+        opted_in, in_calls = _gated_tool(gate, coalesce=True)
+        handler.register_tool(opted_in)
+        tasks = [asyncio.create_task(call_tool(handler, "search", {"query": "q"}, msg_id=10 + i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert len(in_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self, handler, call_tool):
+        gate = asyncio.Event()
+        tool, calls = _gated_tool(gate, read_only_hint=True)
+        handler.register_tool(tool)
+
+        leader = asyncio.create_task(call_tool(handler, "search", {"query": "q"}, msg_id="lead"))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(call_tool(handler, "search", {"query": "q"}, msg_id="follow"))
+        await asyncio.sleep(0.01)
+
+        await handler.handle_request(
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": "lead"}}
+        )
+        assert "cancelled" in (await leader)["error"]["message"].lower()
+
+        gate.set()
+        assert (await follower)["result"]["content"][0]["text"] == "results for q"
+        assert calls == ["q"]
+
+    @pytest.mark.asyncio
+    async def test_followers_receive_resource_links(self, handler, call_tool):
+        gate = asyncio.Event()
+
+        async def report(name: str) -> str:
+            add_resource_link(f"file:///reports/{name}", name=name)
+            await gate.wait()
+            return "ok"
+
+        handler.register_tool(ToolHandler.from_function(report, read_only_hint=True))
+        tasks = [asyncio.create_task(call_tool(handler, "report", {"name": "q1"}, msg_id=i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        gate.set()
+        for response in await asyncio.gather(*tasks):
+            assert response["result"]["_meta"]["links"][0]["uri"] == "file:///reports/q1"
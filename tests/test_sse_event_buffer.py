@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Tests for the ring-buffered SSE replay store."""
+
+import orjson
+import pytest
+from starlette.requests import Request
+
+from chuk_mcp_server.constants import SSE_EVENT_OVERHEAD
+from chuk_mcp_server.context import clear_all
+from chuk_mcp_server.endpoints.mcp import MCPEndpoint
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.protocol.events import EventRing, SSEEventBuffer, format_sse_frame
+from chuk_mcp_server.types import ServerInfo, create_server_capabilities
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    clear_all()
+    yield
+    clear_all()
+
+
+def _fill(buffer, session_id, count, payload=b"{}"):
+    for _ in range(count):
+        buffer.buffer_event(session_id, buffer.next_event_id(session_id), payload)
+
+
+class TestEventRing:
+    def test_wraps_and_keeps_latest(self):
+        ring = EventRing(3)
+        for event_id in range(1, 6):
+            ring.append(event_id, b"x%d" % event_id, event_id)
+
+        assert len(ring) == 3
+        assert [ring[i][0] for i in range(3)] == [3, 4, 5]
+        assert ring[-1] == (5, b"x5")
+        with pytest.raises(IndexError):
+            ring[3]
+
+    def test_since_bisects_on_event_id(self):
+        ring = EventRing(8)
+        for event_id in range(10, 22):  # Wrapped: holds 14..21
+            ring.append(event_id, b"%d" % event_id, event_id)
+
+        assert [eid for eid, _ in ring.since(0)] == list(range(14, 22))
+        assert [eid for eid, _ in ring.since(17)] == [18, 19, 20, 21]
+        assert ring.since(21) == []
+
+    def test_byte_accounting(self):
+        ring = EventRing(2)
+        ring.append(1, b"abc", 1)
+        ring.append(2, b"de", 2)
+        assert ring.nbytes == 5 + 2 * SSE_EVENT_OVERHEAD
+        assert ring.append(3, b"f", 3) == 3 + SSE_EVENT_OVERHEAD
+        assert ring.nbytes == 3 + 2 * SSE_EVENT_OVERHEAD
+
+
+class TestSSEEventBuffer:
+    def test_payloads_stored_serialized_and_shared(self):
+        buffer = SSEEventBuffer()
+        body = orjson.dumps({"method": "notifications/tools/list_changed"})
+        buffer.buffer_event("a", 1, body)
+        buffer.buffer_event("b", 1, body)
+
+        assert buffer.get_missed_payloads("a", 0)[0][1] is body
+        assert buffer.get_missed_payloads("b", 0)[0][1] is body
+        assert buffer.get_missed_events("a", 0) == [(1, {"method": "notifications/tools/list_changed"})]
+
+    def test_dicts_serialized_once_on_buffering(self):
+        buffer = SSEEventBuffer()
+        buffer.buffer_event("a", 1, {"x": 1})
+        assert buffer.get_missed_frames("a", 0) == [b'id: 1\r\ndata: {"x":1}\r\n\r\n']
+
+    def test_byte_budget_trims_oldest_across_sessions(self):
+        per_event = 2 + SSE_EVENT_OVERHEAD
+        buffer = SSEEventBuffer(max_bytes=5 * per_event)
+        _fill(buffer, "old", 3)
+        _fill(buffer, "new", 4)
+
+        # Budget holds five events: the two oldest (both from "old") went first
+        assert [eid for eid, _ in buffer.get_missed_payloads("old", 0)] == [3]
+        assert [eid for eid, _ in buffer.get_missed_payloads("new", 0)] == [1, 2, 3, 4]
+        stats = buffer.get_stats()
+        assert stats["bytes"] == 5 * per_event
+        assert stats["events"] == 5
+        assert stats["trimmed"] == 2
+
+    def test_cleanup_releases_budget(self):
+        buffer = SSEEventBuffer()
+        _fill(buffer, "a", 4)
+        _fill(buffer, "b", 1)
+        buffer.cleanup_session("a")
+
+        assert buffer.get_stats()["events"] == 1
+        assert buffer.get_stats()["bytes"] == 2 + SSE_EVENT_OVERHEAD
+        assert buffer.get_missed_payloads("a", 0) == []
+
+    def test_order_index_stays_bounded(self):
+        buffer = SSEEventBuffer(max_buffer_size=2)
+        _fill(buffer, "a", 10_000)
+
+        assert len(buffer._order) <= 2 * 2 + 1024 + 1
+        assert buffer.get_stats()["events"] == 2
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            SSEEventBuffer(max_buffer_size=0)
+
+
+class TestReplayEndpoint:
+    @pytest.mark.asyncio
+    async def test_last_event_id_replays_frames(self):
+        handler = MCPProtocolHandler(ServerInfo(name="test", version="1.0.0"), create_server_capabilities())
+        session_id = handler.session_manager.create_session({"name": "c"}, "2025-06-18")
+        handler.notifications.open_stream(session_id)
+        await handler.notify_tools_list_changed()
+        await handler.notify_prompts_list_changed()
+
+        request = Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/mcp",
+                "query_string": b"",
+                "headers": [(b"mcp-session-id", session_id.encode()), (b"last-event-id", b"1")],
+            }
+        )
+        response = await MCPEndpoint(handler)._handle_get(request)
+        frames = [chunk async for chunk in response.body_iterator]
+
+        body = orjson.dumps({"jsonrpc": "2.0", "method": "notifications/prompts/list_changed"})
+        assert frames == [format_sse_frame(2, body)]
+        assert handler.get_performance_stats()["sse_replay"]["events"] == 2
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Tests for the durable SQLite SSE event log."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from chuk_mcp_server.context import clear_all
+from chuk_mcp_server.protocol import (
+    MCPProtocolHandler,
+    SQLiteEventLog,
+    SSEEventBuffer,
+    create_event_buffer,
+    event_log,
+)
+from chuk_mcp_server.types import ServerInfo, create_server_capabilities
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    clear_all()
+    yield
+    clear_all()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "events.db")
+
+
+def _log(log, session_id, count):
+    for i in range(count):
+        log.buffer_event(session_id, log.next_event_id(session_id), {"n": i})
+
+
+class TestSQLiteEventLog:
+    def test_replay_after_restart(self, path):
+        before = SQLiteEventLog(path)
+        _log(before, "s", 3)
+        before.close()
+
+        after = SQLiteEventLog(path)
+        assert after.get_missed_events("s", 1) == [(2, {"n": 1}), (3, {"n": 2})]
+        assert after.next_event_id("s") == 4  # IDs continue where the old process stopped
+
+    def test_workers_share_ids_and_events(self, path):
+        first, second = SQLiteEventLog(path), SQLiteEventLog(path)
+        first.buffer_event("s", first.next_event_id("s"), {"from": "first"})
+        second.buffer_event("s", second.next_event_id("s"), {"from": "second"})
+
+        assert first.get_missed_events("s", 0) == [(1, {"from": "first"}), (2, {"from": "second"})]
+        assert second.get_missed_frames("s", 1) == [b'id: 2\r\ndata: {"from":"second"}\r\n\r\n']
+
+    def test_local_cleanup_keeps_events_terminate_deletes(self, path):
+        log = SQLiteEventLog(path)
+        _log(log, "s", 2)
+
+        log.cleanup_session("s")
+        assert len(log.get_missed_payloads("s", 0)) == 2
+        log.delete_session("s")
+        assert log.get_missed_payloads("s", 0) == []
+        assert log.next_event_id("s") == 1
+
+    def test_broadcast_logged_in_one_transaction(self, path, monkeypatch):
+        monkeypatch.setattr(event_log, "_ALLOCATE_ROWS", 2)  # Several upserts within the transaction
+        log = SQLiteEventLog(path)
+        log.next_event_id("a")
+        statements: list[str] = []
+        log._db().set_trace_callback(statements.append)
+
+        event_ids = log.append(["a", "b", "c", "a", "d", "e"], b'{"n":1}')
+        assert event_ids == {"a": 2, "b": 1, "c": 1, "d": 1, "e": 1}
+        assert sum(statement.startswith("BEGIN") for statement in statements) == 1
+        assert log.get_missed_payloads("a", 1) == [(2, b'{"n":1}')]
+        assert log.get_stats()["events"] == 5
+
+    def test_compact_applies_retention_and_per_session_limit(self, path):
+        log = SQLiteEventLog(path, retention=60, max_buffer_size=3)
+        _log(log, "busy", 5)
+        _log(log, "stale", 2)
+        with log._lock:
+            log._db().execute("UPDATE sse_events SET created_at = ? WHERE session_id = 'stale'", (time.time() - 120,))
+
+        assert log.get_missed_payloads("stale", 0) == []  # Past retention even before compaction
+        assert log.compact() == 4
+        assert [eid for eid, _ in log.get_missed_payloads("busy", 0)] == [3, 4, 5]
+        assert log.get_stats()["events"] == 3
+
+    def test_event_count_kept_without_scanning(self, path):
+        first, second = SQLiteEventLog(path, retention=60), SQLiteEventLog(path)
+        first.append(["a", "b"], b"{}")
+        second.buffer_event("a", 1, {"replaced": True})  # Replaces, does not add
+        _log(second, "c", 2)
+        assert first.get_stats()["events"] == second.get_stats()["events"] == 4
+
+        first.delete_session("c")
+        with first._lock:
+            first._db().execute("UPDATE sse_events SET created_at = 0 WHERE session_id = 'b'")
+        first.compact()
+        assert second.get_stats()["events"] == 1
+
+        with first._lock:  # A log written before the count existed is counted once
+            first._db().execute("DROP TABLE sse_totals")
+        assert SQLiteEventLog(path).get_stats()["events"] == 1
+
+    def test_connection_reopened_after_fork(self, path):
+        log = SQLiteEventLog(path)
+        inherited = log._db()
+        log._pid = -1  # As seen from a forked child
+        assert log._db() is not inherited
+
+
+class TestHandlerWithEventLog:
+    @pytest.mark.asyncio
+    async def test_other_worker_replays_and_terminate_deletes(self, path):
+        workers = [
+            MCPProtocolHandler(
+                ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), sse_events=SQLiteEventLog(path)
+            )
+            for _ in range(2)
+        ]
+        session_id = workers[0].session_manager.create_session({"name": "c"}, "2025-06-18")
+        workers[0].notifications.open_stream(session_id)
+        await workers[0].notify_tools_list_changed()
+
+        assert workers[1].get_missed_events(session_id, 0) == [
+            (1, {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+        ]
+        assert "sse_log" in workers[1].maintenance.get_stats()["steps"]
+        assert workers[1].get_performance_stats()["sse_replay"]["backend"] == "SQLiteEventLog"
+
+        workers[0].terminate_session(session_id)
+        assert workers[1].get_missed_events(session_id, 0) == []
+
+    @pytest.mark.asyncio
+    async def test_routed_events_logged_off_the_loop_in_order(self, path):
+        log = SQLiteEventLog(path)
+        writers: set[int] = set()
+        append = log.append
+
+        def recording_append(session_ids, payload):
+            writers.add(threading.get_ident())
+            return append(session_ids, payload)
+
+        log.append = recording_append  # type: ignore[method-assign]
+        handler = MCPProtocolHandler(
+            ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), sse_events=log
+        )
+        session_id = handler.session_manager.create_session({"name": "c"}, "2025-06-18")
+        queue = handler.notifications.open_stream(session_id)
+
+        await asyncio.gather(*(handler.notify_tools_list_changed() for _ in range(5)))
+        assert [queue.get_nowait()[0] for _ in range(5)] == [1, 2, 3, 4, 5]
+        assert writers and threading.get_ident() not in writers
+
+    @pytest.mark.asyncio
+    async def test_replay_and_terminate_read_the_log_off_the_loop(self, path):
+        log = SQLiteEventLog(path)
+        callers: list[int] = []
+        get_missed_payloads, delete_session = log.get_missed_payloads, log.delete_session
+
+        def recording_get_missed_payloads(session_id, last_event_id):
+            callers.append(threading.get_ident())
+            return get_missed_payloads(session_id, last_event_id)
+
+        def recording_delete_session(session_id):
+            callers.append(threading.get_ident())
+            delete_session(session_id)
+
+        log.get_missed_payloads = recording_get_missed_payloads  # type: ignore[method-assign]
+        log.delete_session = recording_delete_session  # type: ignore[method-assign]
+        handler = MCPProtocolHandler(
+            ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), sse_events=log
+        )
+        session_id = handler.session_manager.create_session({"name": "c"}, "2025-06-18")
+        handler.notifications.open_stream(session_id)
+        await handler.notify_tools_list_changed()
+
+        assert len(await handler.get_missed_frames_async(session_id, 0)) == 1
+        assert await handler.terminate_session_async(session_id)
+        assert len(callers) == 2 and threading.get_ident() not in callers
+        assert log.get_missed_payloads(session_id, 0) == []
+
+    def test_memory_buffer_has_no_compaction_step(self):
+        handler = MCPProtocolHandler(ServerInfo(name="test", version="1.0.0"), create_server_capabilities())
+        assert "sse_log" not in handler.maintenance.get_stats()["steps"]
+
+    def test_create_from_url(self, path):
+        assert type(create_event_buffer("memory://")) is SSEEventBuffer
+        log = create_event_buffer(f"sqlite:///{path}", retention=30)
+        assert isinstance(log, SQLiteEventLog) and log.retention == 30
+        for url in ("sqlite://", "postgres://db"):
+            with pytest.raises(ValueError):
+                create_event_buffer(url)
@@ -36,7 +36,7 @@ def _make_mock_handler() -> Mock:
     handler = Mock()
     handler.handle_request = AsyncMock(return_value=({}, None))
     handler.session_manager = Mock()
-    handler.session_manager.create_session = Mock(return_value="session123")
+    handler.session_manager.create_session_async = AsyncMock(return_value="session123")
     return handler
 
 
@@ -50,7 +50,7 @@ def mock_protocol():
     """Create a mock protocol handler."""
     protocol = MagicMock(spec=MCPProtocolHandler)
     protocol.session_manager = MagicMock()
-    protocol.session_manager.create_session = MagicMock(return_value="test-session-123")
+    protocol.session_manager.create_session_async = AsyncMock(return_value="test-session-123")
     protocol.handle_request = AsyncMock(
         return_value=({"jsonrpc": "2.0", "id": 1, "result": {"test": "response"}}, None)
     )
@@ -94,7 +94,9 @@ class TestStdioTransport:
             await stdio_transport._handle_message(message)
 
             # Verify session creation
-            mock_protocol.session_manager.create_session.assert_called_once_with({"name": "test-client"}, "2025-03-26")
+            mock_protocol.session_manager.create_session_async.assert_awaited_once_with(
+                {"name": "test-client"}, "2025-03-26"
+            )
 
             # Verify request handling
             mock_protocol.handle_request.assert_called_once()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Tests for streaming results from async-generator tools."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import orjson
+import pytest
+
+from chuk_mcp_server.endpoints.mcp import MCPEndpoint
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.types import ServerCapabilities, ServerInfo, ToolHandler
+from chuk_mcp_server.types.tools import collect_stream
+
+
+async def report(sections: int) -> AsyncIterator[str]:
+    """Generate a report section by section."""
+    for i in range(sections):
+        await asyncio.sleep(0)
+        yield f"section {i}\n"
+
+
+def _handler(tool=report):
+    handler = MCPProtocolHandler(ServerInfo(name="test", version="1.0"), ServerCapabilities())
+    handler.register_tool(ToolHandler.from_function(tool))
+    return handler
+
+
+def _call(name, arguments, progress_token=None, msg_id=1):
+    params = {"name": name, "arguments": arguments}
+    if progress_token is not None:
+        params["_meta"] = {"progressToken": progress_token}
+    return {"jsonrpc": "2.0", "id": msg_id, "method": "tools/call", "params": params}
+
+
+class TestCollectStream:
+    @pytest.mark.asyncio
+    async def test_string_chunks_concatenated(self):
+        assert await collect_stream(report(3)) == "section 0\nsection 1\nsection 2\n"
+
+    @pytest.mark.asyncio
+    async def test_mixed_chunks_kept_as_list(self):
+        async def rows():
+            yield "header"
+            yield {"row": 1}
+
+        assert await collect_stream(rows()) == ["header", {"row": 1}]
+
+    @pytest.mark.asyncio
+    async def test_generator_closed_on_error(self):
+        closed = []
+
+        async def failing():
+            try:
+                yield "partial"
+                raise RuntimeError("backend down")
+            finally:
+                closed.append(True)
+
+        with pytest.raises(RuntimeError):
+            await collect_stream(failing())
+        assert closed == [True]
+
+
+class TestStreamingToolsCall:
+    @pytest.mark.asyncio
+    async def test_buffered_without_push_channel(self):
+        handler = _handler()
+        response, _ = await handler.handle_request(_call("report", {"sections": 2}, progress_token="t"))
+        assert response["result"]["content"] == [{"type": "text", "text": "section 0\nsection 1\n"}]
+
+    @pytest.mark.asyncio
+    async def test_chunks_sent_as_progress_notifications(self):
+        handler = _handler()
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+            return {}
+
+        handler._send_to_client = send
+        response, _ = await handler.handle_request(_call("report", {"sections": 3}, progress_token="tok"))
+
+        assert [m["method"] for m in sent] == ["notifications/progress"] * 3
+        assert [m["params"]["progress"] for m in sent] == [1, 2, 3]
+        assert [m["params"]["message"] for m in sent] == ["section 0\n", "section 1\n", "section 2\n"]
+        assert all(m["params"]["progressToken"] == "tok" for m in sent)
+        assert response["result"]["content"][0]["text"] == "section 0\nsection 1\nsection 2\n"
+
+    @pytest.mark.asyncio
+    async def test_no_notifications_without_progress_token(self):
+        handler = _handler()
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+            return {}
+
+        handler._send_to_client = send
+        response, _ = await handler.handle_request(_call("report", {"sections": 2}))
+        assert sent == []
+        assert response["result"]["content"][0]["text"] == "section 0\nsection 1\n"
+
+    @pytest.mark.asyncio
+    async def test_non_text_chunks_become_content_items(self):
+        async def rows(count: int):
+            for i in range(count):
+                yield {"row": i}
+
+        handler = _handler(rows)
+        response, _ = await handler.handle_request(_call("rows", {"count": 2}))
+        content = response["result"]["content"]
+        assert [orjson.loads(item["text"]) for item in content] == [{"row": 0}, {"row": 1}]
+
+    @pytest.mark.asyncio
+    async def test_error_mid_stream_is_tool_error(self):
+        async def flaky(n: int):
+            yield "first"
+            raise RuntimeError("backend down")
+
+        handler = _handler(flaky)
+        response, _ = await handler.handle_request(_call("flaky", {"n": 1}))
+        assert "backend down" in response["error"]["message"]
+
+    def test_process_executor_rejected(self):
+        with pytest.raises(ValueError, match="synchronous"):
+            ToolHandler.from_function(report, executor="process")
+
+
+class TestStreamingOverSSE:
+    @pytest.mark.asyncio
+    async def test_chunks_precede_final_result(self):
+        handler = _handler()
+        endpoint = MCPEndpoint(handler)
+        request = _call("report", {"sections": 2}, progress_token="tok")
+
+        events = [chunk async for chunk in endpoint._sse_stream_generator(request, None, "tools/call")]
+        data = [orjson.loads(line[len("data: ") :]) for line in events if line.startswith("data: ")]
+
+        assert [d.get("method") for d in data] == ["notifications/progress", "notifications/progress", None]
+        assert [d["params"]["message"] for d in data[:2]] == ["section 0\n", "section 1\n"]
+        assert data[-1]["result"]["content"][0]["text"] == "section 0\nsection 1\n"
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for the bidirectional resource subscription index."""
+
+import orjson
+import pytest
+
+from chuk_mcp_server.context import clear_all
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.protocol.subscriptions import SubscriptionIndex
+from chuk_mcp_server.types import ServerInfo, create_server_capabilities
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    clear_all()
+    yield
+    clear_all()
+
+
+class TestSubscriptionIndex:
+    def test_exact_subscribers(self):
+        index = SubscriptionIndex()
+        index.subscribe("a", "config://settings")
+        index.subscribe("b", "config://settings")
+        index.subscribe("b", "file:///data.json")
+
+        assert index.subscribers("config://settings") == {"a", "b"}
+        assert index.subscribers("file:///data.json") == {"b"}
+        assert index.subscribers("config://other") == set()
+
+    def test_prefix_subscriptions(self):
+        index = SubscriptionIndex()
+        index.subscribe("dir", "file:///docs/*")
+        index.subscribe("partial", "db://users/4*")
+        index.subscribe("all", "*")
+
+        assert index.subscribers("file:///docs/a.md") == {"dir", "all"}
+        assert index.subscribers("file:///docs/guides/b.md") == {"dir", "all"}
+        assert index.subscribers("file:///docs") == {"all"}
+        assert index.subscribers("db://users/42") == {"partial", "all"}
+        assert index.subscribers("db://users/5") == {"all"}
+
+    def test_unsubscribe_prunes_prefix_trie(self):
+        index = SubscriptionIndex()
+        index.subscribe("a", "file:///docs/guides/*")
+        assert index.unsubscribe("a", "file:///docs/guides/*")
+        assert not index.unsubscribe("a", "file:///docs/guides/*")
+
+        assert index.subscribers("file:///docs/guides/x") == set()
+        assert index._prefixes.children == {}
+        assert index["a"] == frozenset()
+
+    def test_remove_session_drops_every_direction(self):
+        index = SubscriptionIndex()
+        index.subscribe("a", "res://x")
+        index.subscribe("a", "res://*")
+        index.subscribe("b", "res://x")
+
+        assert index.remove_session("a") == 2
+        assert "a" not in index
+        assert index.subscribers("res://x") == {"b"}
+        assert index.get_stats() == {"sessions": 1, "subscriptions": 1, "uris": 1, "prefixes": 0}
+
+    def test_mapping_view(self):
+        index = SubscriptionIndex()
+        index["a"] = {"res://1", "res://2*"}
+        assert index["a"] == {"res://1", "res://2*"}
+        assert index.subscribers("res://2/x") == {"a"}
+
+        index["a"] = {"res://3"}
+        assert index.subscribers("res://1") == set()
+        assert dict(index) == {"a": frozenset({"res://3"})}
+
+        del index["a"]
+        assert len(index) == 0
+        with pytest.raises(KeyError):
+            del index["a"]
+
+
+class TestPrefixNotifications:
+    @pytest.mark.asyncio
+    async def test_prefix_subscriber_notified(self):
+        handler = MCPProtocolHandler(ServerInfo(name="test", version="1.0.0"), create_server_capabilities())
+        init = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "c", "version": "1"},
+            },
+        }
+        _, session_id = await handler.handle_request(init)
+        await handler.handle_request(
+            {"jsonrpc": "2.0", "id": 2, "method": "resources/subscribe", "params": {"uri": "file:///docs/*"}},
+            session_id,
+        )
+        queue = handler.notifications.open_stream(session_id)
+
+        await handler.notify_resource_updated("file:///docs/readme.md")
+        await handler.notify_resource_updated("file:///src/main.py")
+
+        [(_, body)] = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert orjson.loads(body)["params"]["uri"] == "file:///docs/readme.md"
+        assert handler.get_performance_stats()["subscriptions"]["prefixes"] == 1
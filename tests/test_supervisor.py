@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Tests for the prefork worker supervisor and its stats channel."""
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+
+import orjson
+import pytest
+
+from chuk_mcp_server.context import clear_all
+from chuk_mcp_server.protocol import MCPProtocolHandler, SQLiteSessionStore
+from chuk_mcp_server.supervisor import WorkerChannel, WorkerSupervisor, sum_counters
+from chuk_mcp_server.types import ServerInfo, create_server_capabilities
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    clear_all()
+    yield
+    clear_all()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _echo_worker(sockets, channel):
+    """Worker target: answers each connection with its pid and the latest pod summary."""
+
+    async def main():
+        served = 0
+        reporter = WorkerChannel(
+            channel, lambda: {"counters": {"served": served}, "shared": {"log": {"events": 5}}}, interval=0.05
+        )
+
+        async def handle(reader, writer):  # noqa: ARG001
+            nonlocal served
+            served += 1
+            writer.write(orjson.dumps({"pid": os.getpid(), "pod": reporter.pod}) + b"\n")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, sock=sockets[0])
+        reporter.start()
+        stop = asyncio.Event()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+        await stop.wait()
+        await reporter.stop()
+        server.close()
+
+    asyncio.run(main())
+
+
+def _ask(port, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1.0) as sock:
+                return orjson.loads(sock.makefile("rb").readline())
+        except (OSError, orjson.JSONDecodeError):
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def _wait_for_pod(port, predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        pod = _ask(port)["pod"]
+        if pod is not None and predicate(pod):
+            return pod
+        time.sleep(0.05)
+    raise AssertionError("pod never reached the expected state")
+
+
+class TestSumCounters:
+    def test_sums_integer_leaves_only(self):
+        totals = sum_counters(
+            [
+                {"sessions": {"active": 2, "created": 4}, "hit_ratio": 0.5, "status": "ok", "ready": True},
+                {"sessions": {"active": 3, "created": 6}, "hit_ratio": 0.7, "status": "ok", "ready": True},
+            ]
+        )
+        assert totals == {"sessions": {"active": 5, "created": 10}}
+
+    def test_keys_missing_from_some_workers(self):
+        assert sum_counters([{"a": 1}, {"a": 2, "b": 5}, {}]) == {"a": 3, "b": 5}
+
+    def test_mixed_types_dropped(self):
+        assert sum_counters([{"a": 1}, {"a": None}]) == {}
+
+
+class TestWorkerChannel:
+    @pytest.mark.asyncio
+    async def test_reports_stats_and_receives_pod(self):
+        worker_end, supervisor_end = socket.socketpair()
+        channel = WorkerChannel(worker_end, lambda: {"served": 7}, interval=0.01)
+        channel.start()
+        reader, writer = await asyncio.open_connection(sock=supervisor_end)
+
+        report = orjson.loads(await reader.readline())
+        writer.write(orjson.dumps({"count": 2, "totals": {"served": 9}}) + b"\n")
+        await writer.drain()
+        for _ in range(100):
+            if channel.pod is not None:
+                break
+            await asyncio.sleep(0.01)
+
+        assert report == {"stats": {"served": 7}}
+        assert channel.pod == {"count": 2, "totals": {"served": 9}}
+        await channel.stop()
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_handler_serves_pod_summary(self):
+        handler = MCPProtocolHandler(ServerInfo(name="test", version="1.0.0"), create_server_capabilities())
+        assert handler.get_performance_stats()["workers"] is None
+
+        handler.worker_channel = WorkerChannel(socket.socketpair()[0], handler.worker_snapshot)
+        handler.worker_channel.pod = {"count": 4, "totals": {"sessions": {"active": 12}}}
+
+        assert handler.get_performance_stats()["workers"]["totals"]["sessions"]["active"] == 12
+        snapshot = handler.worker_snapshot()
+        assert snapshot["counters"]["in_flight_requests"] == 0
+        assert snapshot["shared"] == {}
+
+    def test_snapshot_sums_only_per_process_counters(self, tmp_path):
+        store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+        workers = [
+            MCPProtocolHandler(
+                ServerInfo(name="test", version="1.0.0"), create_server_capabilities(), session_store=store
+            )
+            for _ in range(4)
+        ]
+        workers[0].session_manager.create_session({"name": "c"}, "2025-06-18")
+        snapshots = [worker.worker_snapshot() for worker in workers]
+
+        totals = sum_counters([snapshot["counters"] for snapshot in snapshots])
+        assert totals["sessions"] == {"active": 1, "created": 1, "evictions": 0, "expirations": 0, "adopted": 0}
+        assert "max_bytes" not in totals["tool_cache"] and "tools" not in totals
+        assert snapshots[0]["shared"]["session_store"]["sessions"] == 1
+
+
+class TestWorkerSupervisor:
+    def test_rejects_zero_workers(self):
+        with pytest.raises(ValueError):
+            WorkerSupervisor(_echo_worker, 0, "127.0.0.1", 0)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="prefork needs os.fork")
+    @pytest.mark.skipif(sys.platform != "linux", reason="relies on Linux SO_REUSEPORT balancing")
+    def test_restarts_rolls_and_aggregates(self):
+        port = _free_port()
+        supervisor = WorkerSupervisor(_echo_worker, 2, "127.0.0.1", port, stats_interval=0.05, shutdown_timeout=5)
+        process = multiprocessing.get_context("fork").Process(target=supervisor.run)
+        process.start()
+        try:
+            # Both workers report and their counters are summed
+            pod = _wait_for_pod(port, lambda pod: pod["count"] == 2 and pod["totals"].get("served", 0) >= 3)
+            first = set(pod["workers"])
+            assert pod["reuse_port"]
+            assert pod["shared"] == {"log": {"events": 5}}  # Shared readings are not summed
+
+            # A crashed worker is replaced
+            os.kill(int(next(iter(first))), signal.SIGKILL)
+            pod = _wait_for_pod(port, lambda pod: pod["restarts"] == 1 and pod["count"] == 2)
+            second = set(pod["workers"])
+            assert len(second & first) == 1
+
+            # SIGHUP replaces every worker
+            os.kill(process.pid, signal.SIGHUP)
+            pod = _wait_for_pod(port, lambda pod: pod["rolls"] == 1 and not set(pod["workers"]) & second)
+            assert pod["count"] == 2
+
+            os.kill(process.pid, signal.SIGTERM)
+            process.join(10)
+            assert process.exitcode == 0
+            with pytest.raises(OSError):
+                socket.create_connection(("127.0.0.1", port), timeout=1.0).close()
+        finally:
+            if process.is_alive():
+                process.kill()
+                process.join()
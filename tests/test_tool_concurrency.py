@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Tests for per-tool concurrency limits (bulkheads)."""
+
+import asyncio
+
+import pytest
+
+from chuk_mcp_server.bulkheads import ToolBulkhead, validate_concurrency_limits
+from chuk_mcp_server.constants import MCP_ERROR_TOOL_BUSY
+from chuk_mcp_server.types import ToolBusyError, ToolHandler
+
+
+class TestValidation:
+    def test_valid_limits(self):
+        validate_concurrency_limits(None, None, None)
+        validate_concurrency_limits(2, 0, 1.5)
+
+    @pytest.mark.parametrize(
+        "limits",
+        [(0, None, None), (2, -1, None), (2, None, 0), (None, 4, None), (None, None, 1.0)],
+    )
+    def test_invalid_limits(self, limits):
+        with pytest.raises(ValueError):
+            validate_concurrency_limits(*limits)
+
+    def test_from_function_validates(self):
+        def slow() -> str:
+            return "ok"
+
+        with pytest.raises(ValueError):
+            ToolHandler.from_function(slow, max_concurrency=0)
+        tool = ToolHandler.from_function(slow, max_concurrency=2, queue_size=3, queue_timeout=1.0)
+        assert (tool.max_concurrency, tool.queue_size, tool.queue_timeout) == (2, 3, 1.0)
+
+
+class TestToolBulkhead:
+    @pytest.mark.asyncio
+    async def test_limits_active_calls(self):
+        bulkhead = ToolBulkhead("t", max_concurrency=2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            await bulkhead.acquire()
+            try:
+                peak = max(peak, bulkhead.active)
+                await asyncio.sleep(0.01)
+            finally:
+                bulkhead.release()
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
+        stats = bulkhead.get_stats()
+        assert stats["admitted"] == 6
+        assert stats["active"] == 0
+        assert stats["waiting"] == 0
+        assert stats["peak_waiting"] == 4
+
+    @pytest.mark.asyncio
+    async def test_full_queue_fails_fast(self):
+        bulkhead = ToolBulkhead("t", max_concurrency=1, queue_size=1)
+        await bulkhead.acquire()
+        queued = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(ToolBusyError) as exc_info:
+            await bulkhead.acquire()
+        assert exc_info.value.reason == "queue_full"
+        assert exc_info.value.data["max_concurrency"] == 1
+        assert exc_info.value.data["waiting"] == 1
+
+        bulkhead.release()
+        await queued
+        assert bulkhead.active == 1
+        assert bulkhead.get_stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_queue_rejects_when_busy(self):
+        bulkhead = ToolBulkhead("t", max_concurrency=1, queue_size=0)
+        await bulkhead.acquire()
+        with pytest.raises(ToolBusyError):
+            await bulkhead.acquire()
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        bulkhead = ToolBulkhead("t", max_concurrency=1, queue_timeout=0.02)
+        await bulkhead.acquire()
+        with pytest.raises(ToolBusyError) as exc_info:
+            await bulkhead.acquire()
+        assert exc_info.value.reason == "queue_timeout"
+        assert bulkhead.waiting == 0
+        assert bulkhead.get_stats()["timed_out"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        bulkhead = ToolBulkhead("t", max_concurrency=1)
+        await bulkhead.acquire()
+        waiter = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        bulkhead.release()
+        assert bulkhead.active == 0
+        await bulkhead.acquire()
+        assert bulkhead.active == 1
+
+    @pytest.mark.asyncio
+    async def test_fifo_order(self):
+        bulkhead = ToolBulkhead("t", max_concurrency=1)
+        order = []
+        await bulkhead.acquire()
+
+        async def work(i):
+            await bulkhead.acquire()
+            order.append(i)
+            bulkhead.release()
+
+        tasks = [asyncio.create_task(work(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        bulkhead.release()
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2]
+
+
+class TestToolsCallLimits:
+    @pytest.mark.asyncio
+    async def test_busy_tool_returns_structured_error(self, handler, call_tool):
+        gate = asyncio.Event()
+
+        async def search_index() -> str:
+            await gate.wait()
+            return "results"
+
+        async def cheap() -> str:
+            return "fast"
+
+        handler.register_tool(ToolHandler.from_function(search_index, max_concurrency=1, queue_size=1))
+        handler.register_tool(ToolHandler.from_function(cheap))
+
+        running = asyncio.create_task(call_tool(handler, "search_index"))
+        queued = asyncio.create_task(call_tool(handler, "search_index", msg_id=2))
+        await asyncio.sleep(0.01)
+
+        rejected = await call_tool(handler, "search_index", msg_id=3)
+        assert rejected["error"]["code"] == MCP_ERROR_TOOL_BUSY
+        assert rejected["error"]["data"]["tool"] == "search_index"
+        assert rejected["error"]["data"]["reason"] == "queue_full"
+
+        # Other tools are unaffected by the saturated one
+        assert (await call_tool(handler, "cheap", msg_id=4))["result"]["content"][0]["text"] == "fast"
+
+        gate.set()
+        for task in (running, queued):
+            assert (await task)["result"]["content"][0]["text"] == "results"
+
+    @pytest.mark.asyncio
+    async def test_limits_in_performance_stats(self, handler, call_tool):
+        def lookup() -> str:
+            return "x"
+
+        handler.register_tool(ToolHandler.from_function(lookup, max_concurrency=3, queue_size=10, queue_timeout=2.0))
+        await call_tool(handler, "lookup")
+
+        limits = handler.get_performance_stats()["tool_limits"]
+        assert limits["lookup"]["max_concurrency"] == 3
+        assert limits["lookup"]["queue_size"] == 10
+        assert limits["lookup"]["queue_timeout"] == 2.0
+        assert limits["lookup"]["admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_queued(self, handler, call_tool):
+        gate = asyncio.Event()
+
+        async def slow() -> str:
+            await gate.wait()
+            return "done"
+
+        handler.register_tool(ToolHandler.from_function(slow, max_concurrency=1))
+        running = asyncio.create_task(call_tool(handler, "slow", msg_id="a"))
+        queued = asyncio.create_task(call_tool(handler, "slow", msg_id="b"))
+        await asyncio.sleep(0.01)
+
+        await handler.handle_request(
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": "b"}}
+        )
+        assert "cancelled" in (await queued)["error"]["message"].lower()
+
+        gate.set()
+        assert (await running)["result"]["content"][0]["text"] == "done"
+        assert handler.get_performance_stats()["tool_limits"]["slow"]["active"] == 0
+
+    def test_unlimited_tools_have_no_bulkhead(self, handler):
+        def free() -> str:
+            return "x"
+
+        handler.register_tool(ToolHandler.from_function(free))
+        assert handler.get_performance_stats()["tool_limits"] == {}
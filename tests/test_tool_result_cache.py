@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Tests for the opt-in tools/call result cache."""
+
+import orjson
+import pytest
+
+import chuk_mcp_server.result_cache as result_cache_module
+from chuk_mcp_server.context import set_session_id
+from chuk_mcp_server.result_cache import (
+    ToolCachePolicy,
+    ToolResultCache,
+    canonical_arguments,
+    validate_cache_settings,
+)
+from chuk_mcp_server.types import ToolHandler
+
+POLICY = ToolCachePolicy(ttl=60.0, max_entries=100, scope="global")
+
+
+async def call_tool(handler, name, arguments, msg_id=1):
+    response, _ = await handler.handle_request(
+        {"jsonrpc": "2.0", "id": msg_id, "method": "tools/call", "params": {"name": name, "arguments": arguments}}
+    )
+    return response
+
+
+def _counting_tool(**tool_kwargs):
+    calls = []
+
+    def lookup(key: str, limit: int = 10) -> str:
+        calls.append((key, limit))
+        return f"{key}:{limit}:{len(calls)}"
+
+    return ToolHandler.from_function(lookup, **tool_kwargs), calls
+
+
+class TestSettings:
+    def test_validation(self):
+        validate_cache_settings(0, None, None)
+        validate_cache_settings(30, 10, "user")
+        for bad in ((-1, None, None), (10, 0, None), (10, None, "tenant")):
+            with pytest.raises(ValueError):
+                validate_cache_settings(*bad)
+
+    def test_canonical_arguments_sorted_and_strip_injected(self):
+        assert canonical_arguments({"b": 1, "a": 2}) == canonical_arguments({"a": 2, "b": 1})
+        assert canonical_arguments({"a": 1, "_external_access_token": "secret"}) == b'{"a":1}'
+
+    def test_policy_resolution(self):
+        cache = ToolResultCache(default_ttl=5)
+        explicit, _ = _counting_tool(cache_ttl=30, cache_scope="session")
+        hinted, _ = _counting_tool(read_only_hint=True)
+        plain, _ = _counting_tool()
+        opted_out, _ = _counting_tool(read_only_hint=True, cache_ttl=0)
+
+        assert cache.policy_for(explicit) == ToolCachePolicy(30.0, cache.default_max_entries, "session")
+        assert cache.policy_for(hinted).ttl == 5.0
+        assert cache.policy_for(plain) is None
+        assert cache.policy_for(opted_out) is None
+        assert ToolResultCache().policy_for(hinted) is None
+
+
+class TestToolResultCache:
+    def test_hit_and_miss_counters(self):
+        cache = ToolResultCache()
+        key = ("t", None, b"{}")
+        assert cache.get(key) is None
+        cache.put(key, POLICY, {"content": []})
+        assert orjson.loads(cache.get(key)) == {"content": []}
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(result_cache_module.time, "monotonic", lambda: now[0])
+        cache = ToolResultCache()
+        key = ("t", None, b"{}")
+        cache.put(key, ToolCachePolicy(ttl=10, max_entries=10, scope="global"), {"x": 1})
+        now[0] += 9
+        assert cache.get(key) is not None
+        now[0] += 2
+        assert cache.get(key) is None
+        assert cache.get_stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_purge_expired(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(result_cache_module.time, "monotonic", lambda: now[0])
+        cache = ToolResultCache()
+        cache.put(("a", None, b"1"), ToolCachePolicy(ttl=1, max_entries=10, scope="global"), {"x": 1})
+        cache.put(("a", None, b"2"), ToolCachePolicy(ttl=100, max_entries=10, scope="global"), {"x": 2})
+        now[0] = 50
+        assert cache.purge_expired() == 1
+        assert len(cache) == 1
+
+    def test_per_tool_lru_limit(self):
+        cache = ToolResultCache()
+        policy = ToolCachePolicy(ttl=60, max_entries=2, scope="global")
+        cache.put(("a", None, b"1"), policy, {"n": 1})
+        cache.put(("a", None, b"2"), policy, {"n": 2})
+        cache.get(("a", None, b"1"))  # refresh 1, so 2 is least recently used
+        cache.put(("a", None, b"3"), policy, {"n": 3})
+        cache.put(("b", None, b"1"), policy, {"n": 4})
+
+        assert cache.get(("a", None, b"2")) is None
+        assert cache.get(("a", None, b"1")) is not None
+        assert cache.get_stats()["tools"] == {"a": 2, "b": 1}
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_budget(self):
+        body_size = len(orjson.dumps({"v": "x" * 50}))
+        cache = ToolResultCache(max_bytes=body_size * 2)
+        for i in range(3):
+            cache.put(("t", None, str(i).encode()), POLICY, {"v": "x" * 50})
+        assert len(cache) == 2
+        assert cache.get_stats()["bytes"] == body_size * 2
+        assert cache.get(("t", None, b"0")) is None
+        # Results larger than the whole budget are never stored
+        assert cache.put(("t", None, b"big"), POLICY, {"v": "x" * 500}) is False
+
+    def test_invalidate(self):
+        cache = ToolResultCache()
+        cache.put(("a", "s1", b"1"), POLICY, {})
+        cache.put(("a", "s2", b"1"), POLICY, {})
+        cache.put(("a", None, b"2"), POLICY, {})
+        cache.put(("b", None, b"1"), POLICY, {})
+        assert cache.invalidate("a", b"1") == 2
+        assert cache.invalidate("a") == 1
+        assert cache.invalidate() == 1
+        assert len(cache) == 0
+        assert cache.get_stats()["invalidations"] == 4
+
+
+class TestToolsCallCaching:
+    @pytest.mark.asyncio
+    async def test_repeated_call_served_from_cache(self, make_handler, call_tool):
+        handler = make_handler()
+        tool, calls = _counting_tool(cache_ttl=60)
+        handler.register_tool(tool)
+
+        first = await call_tool(handler, "lookup", {"key": "k", "limit": 5}, msg_id=1)
+        # Same validated arguments in a different order and representation
+        second = await call_tool(handler, "lookup", {"limit": "5", "key": "k"}, msg_id=2)
+
+        assert len(calls) == 1
+        assert second["id"] == 2
+        assert second["result"] == first["result"]
+        assert handler.get_performance_stats()["tools"]["cache_hit_ratio"] == 0.5
+        assert handler.get_performance_stats()["cache"]["tools_cached"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_tool_arguments_validated_once(self, monkeypatch, make_handler, call_tool):
+        handler = make_handler()
+        tool, calls = _counting_tool(cache_ttl=60)
+        handler.register_tool(tool)
+        validations = []
+        validate = tool._validate_and_convert_arguments
+
+        def counting_validate(arguments):
+            validations.append(arguments)
+            return validate(arguments)
+
+        monkeypatch.setattr(tool, "_validate_and_convert_arguments", counting_validate)
+        response = await call_tool(handler, "lookup", {"key": "k", "limit": "5"})
+
+        assert calls == [("k", 5)]
+        assert len(validations) == 1
+        assert response["result"]["content"][0]["text"] == "k:5:1"
+
+    @pytest.mark.asyncio
+    async def test_uncached_tool_always_executes(self, make_handler, call_tool):
+        handler = make_handler()
+        tool, calls = _counting_tool()
+        handler.register_tool(tool)
+        await call_tool(handler, "lookup", {"key": "k"})
+        await call_tool(handler, "lookup", {"key": "k"})
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_server_policy_uses_hints(self, make_handler, call_tool):
+        handler = make_handler(tool_cache_ttl=60)
+        hinted, hinted_calls = _counting_tool(idempotent_hint=True)
+        handler.register_tool(hinted)
+        await call_tool(handler, "lookup", {"key": "k"})
+        await call_tool(handler, "lookup", {"key": "k"})
+        assert len(hinted_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_session_scope(self, make_handler, call_tool):
+        handler = make_handler()
+        tool, calls = _counting_tool(cache_ttl=60, cache_scope="session")
+        handler.register_tool(tool)
+
+        set_session_id("session-a")
+        await call_tool(handler, "lookup", {"key": "k"})
+        await call_tool(handler, "lookup", {"key": "k"})
+        set_session_id("session-b")
+        await call_tool(handler, "lookup", {"key": "k"})
+        set_session_id(None)
+        # No session: scope unknown, so never cached
+        await call_tool(handler, "lookup", {"key": "k"})
+        await call_tool(handler, "lookup", {"key": "k"})
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, make_handler, call_tool):
+        handler = make_handler()
+        attempts = []
+
+        def flaky(key: str) -> str:
+            attempts.append(key)
+            if len(attempts) == 1:
+                raise RuntimeError("backend down")
+            return "ok"
+
+        handler.register_tool(ToolHandler.from_function(flaky, cache_ttl=60))
+        assert "error" in await call_tool(handler, "flaky", {"key": "k"})
+        assert (await call_tool(handler, "flaky", {"key": "k"}))["result"]["content"][0]["text"] == "ok"
+        assert (await call_tool(handler, "flaky", {"key": "k"}))["result"]["content"][0]["text"] == "ok"
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_api(self, make_handler, call_tool):
+        handler = make_handler()
+        tool, calls = _counting_tool(cache_ttl=60)
+        handler.register_tool(tool)
+        await call_tool(handler, "lookup", {"key": "a"})
+        await call_tool(handler, "lookup", {"key": "b"})
+
+        assert handler.invalidate_tool_cache("lookup", {"key": "a", "limit": "10"}) == 1
+        await call_tool(handler, "lookup", {"key": "a"})
+        await call_tool(handler, "lookup", {"key": "b"})
+        assert len(calls) == 3
+
+        assert handler.invalidate_tool_cache() == 2
+        await call_tool(handler, "lookup", {"key": "b"})
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_reregistering_tool_drops_its_results(self, make_handler, call_tool):
+        handler = make_handler()
+        tool, calls = _counting_tool(cache_ttl=60)
+        handler.register_tool(tool)
+        await call_tool(handler, "lookup", {"key": "a"})
+        handler.register_tool(tool)
+        await call_tool(handler, "lookup", {"key": "a"})
+        assert len(calls) == 2
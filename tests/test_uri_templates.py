@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Tests for compiled RFC 6570 URI-template matching and templated resources/read."""
+
+import pytest
+
+from chuk_mcp_server.protocol import MCPProtocolHandler
+from chuk_mcp_server.types import ResourceHandler, ServerCapabilities, ServerInfo
+from chuk_mcp_server.types.resources import ResourceTemplateHandler
+from chuk_mcp_server.uri_templates import UriTemplateMatcher, compile_uri_template
+
+
+class TestCompiledTemplate:
+    @pytest.mark.parametrize(
+        ("template", "uri", "expected"),
+        [
+            ("users://{user_id}/profile", "users://42/profile", {"user_id": "42"}),
+            ("users://{id}", "users://hello%20world", {"id": "hello world"}),
+            ("file:///{+path}", "file:///docs/a/b.md", {"path": "docs/a/b.md"}),
+            ("img://{name}{.ext}", "img://cat.png", {"name": "cat", "ext": "png"}),
+            ("repo://{owner}{/path*}", "repo://me/src/app.py", {"owner": "me", "path": ["src", "app.py"]}),
+            ("docs://{id}{?lang,fmt}", "docs://7?fmt=md&x=1&lang=en", {"id": "7", "lang": "en", "fmt": "md"}),
+            ("docs://{id}{?lang,fmt}", "docs://7", {"id": "7"}),
+            ("search?v=1{&q}", "search?v=1&q=mcp", {"q": "mcp"}),
+            ("grid://{x,y}", "grid://3,4", {"x": "3", "y": "4"}),
+            ("code://{lang:2}", "code://en", {"lang": "en"}),
+            ("m://x{;v}", "m://x;v=5", {"v": "5"}),
+            ("page://x{#section}", "page://x#intro", {"section": "intro"}),
+        ],
+    )
+    def test_match(self, template, uri, expected):
+        assert compile_uri_template(template).match(uri) == expected
+
+    @pytest.mark.parametrize(
+        ("template", "uri"),
+        [
+            ("users://{id}/profile", "users:///profile"),
+            ("users://{id}", "users://a/b"),
+            ("code://{lang:2}", "code://eng"),
+            ("users://{id}", "posts://1"),
+        ],
+    )
+    def test_no_match(self, template, uri):
+        assert compile_uri_template(template).match(uri) is None
+
+    @pytest.mark.parametrize("template", ["a://{", "a://}", "a://{}", "a://{x y}", "a://{x}/{x}"])
+    def test_malformed(self, template):
+        with pytest.raises(ValueError):
+            compile_uri_template(template)
+
+
+class TestMatcher:
+    def test_routes_to_most_specific(self):
+        matcher = UriTemplateMatcher()
+        matcher.add("users://{id}", "user")
+        matcher.add("users://{id}/profile", "profile")
+        matcher.add("users://admin/{section}", "admin")
+        matcher.add("docs://{+path}", "docs")
+
+        assert matcher.match("users://7") == ("user", {"id": "7"})
+        assert matcher.match("users://7/profile") == ("profile", {"id": "7"})
+        assert matcher.match("users://admin/audit") == ("admin", {"section": "audit"})
+        assert matcher.match("docs://guides/intro.md") == ("docs", {"path": "guides/intro.md"})
+        assert matcher.match("posts://1") is None
+        assert len(matcher) == 4
+
+    def test_thousands_of_templates(self):
+        matcher = UriTemplateMatcher()
+        for i in range(3000):
+            matcher.add(f"tenant{i}://items/{{item_id}}", i)
+        assert matcher.match("tenant2999://items/abc") == (2999, {"item_id": "abc"})
+        assert matcher.match("tenant3000://items/abc") is None
+
+
+class TestResourcesReadTemplates:
+    @pytest.fixture
+    def handler(self):
+        handler = MCPProtocolHandler(ServerInfo(name="test", version="1.0"), ServerCapabilities())
+
+        def user_profile(user_id: str, fields: str = "all") -> dict:
+            return {"id": user_id, "fields": fields}
+
+        handler.register_resource_template(
+            ResourceTemplateHandler.from_function(
+                "users://{user_id}/profile{?fields}", user_profile, mime_type="application/json"
+            )
+        )
+        return handler
+
+    async def _read(self, handler, uri):
+        response, _ = await handler.handle_request(
+            {"jsonrpc": "2.0", "id": 1, "method": "resources/read", "params": {"uri": uri}}
+        )
+        return response
+
+    @pytest.mark.asyncio
+    async def test_template_read(self, handler):
+        response = await self._read(handler, "users://42/profile?fields=name")
+        content = response["result"]["contents"][0]
+        assert content["uri"] == "users://42/profile?fields=name"
+        assert content["mimeType"] == "application/json"
+        assert '"id": "42"' in content["text"]
+        assert '"fields": "name"' in content["text"]
+
+    @pytest.mark.asyncio
+    async def test_absent_optional_variable_uses_default(self, handler):
+        response = await self._read(handler, "users://42/profile")
+        assert '"fields": "all"' in response["result"]["contents"][0]["text"]
+
+    @pytest.mark.asyncio
+    async def test_concrete_resource_wins(self, handler):
+        handler.register_resource(
+            ResourceHandler.from_function("users://me/profile", lambda: "self", mime_type="text/plain")
+        )
+        response = await self._read(handler, "users://me/profile")
+        assert response["result"]["contents"][0]["text"] == "self"
+
+    @pytest.mark.asyncio
+    async def test_unmatched_uri_still_unknown(self, handler):
+        response = await self._read(handler, "users://42/settings")
+        assert "Unknown resource" in response["error"]["message"]
+
+    @pytest.mark.asyncio
+    async def test_templates_registered_later_are_routed(self, handler):
+        handler.register_resource_template(
+            ResourceTemplateHandler.from_function("orders://{order_id}", lambda order_id: order_id)
+        )
+        response = await self._read(handler, "orders://A-1")
+        assert response["result"]["contents"][0]["text"] == "A-1"
+
+    def test_from_function_rejects_malformed_template(self):
+        with pytest.raises(ValueError):
+            ResourceTemplateHandler.from_function("users://{user_id", lambda user_id: user_id)
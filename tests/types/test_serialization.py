@@ -176,6 +176,37 @@ def test_serialize_mcp_response():
     assert data["id"] == 1
 
 
+def test_splice_list_result():
+    """Test joining pre-serialized items into a list result."""
+    from chuk_mcp_server.types.serialization import splice_list_result
+
+    items = [orjson.dumps({"name": "a"}), orjson.dumps({"name": "b"})]
+
+    assert orjson.loads(splice_list_result("tools", items)) == {"tools": [{"name": "a"}, {"name": "b"}]}
+    assert orjson.loads(splice_list_result("prompts", [], "Mg==")) == {"prompts": [], "nextCursor": "Mg=="}
+
+
+def test_pre_serialized_response():
+    """Test spliced responses serialize verbatim and decode lazily on access."""
+    from chuk_mcp_server.types.serialization import (
+        PreSerializedResponse,
+        serialize_mcp_response,
+        splice_result_response,
+    )
+
+    response = splice_result_response("req-1", b'{"tools":[{"name":"t"}]}')
+
+    assert isinstance(response, PreSerializedResponse)
+    assert response._decoded is None
+    assert bool(response) is True
+    assert response._decoded is None  # truthiness must not decode
+    assert serialize_mcp_response(response) is response.body
+
+    assert response["id"] == "req-1"
+    assert response.get("error") is None
+    assert response == {"jsonrpc": "2.0", "id": "req-1", "result": {"tools": [{"name": "t"}]}}
+
+
 def test_deserialize_mcp_request():
     """Test deserializing MCP request data."""
     from chuk_mcp_server.types.serialization import deserialize_mcp_request
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# tests/types/test_validation.py
+"""
+Unit tests for chuk_mcp_server.types.validation module
+
+Tests compiled argument validators shared by tools and prompts.
+"""
+
+import pytest
+
+from chuk_mcp_server.types.errors import ParameterValidationError
+from chuk_mcp_server.types.parameters import ToolParameter
+from chuk_mcp_server.types.prompts import PromptHandler
+from chuk_mcp_server.types.tools import ToolHandler
+from chuk_mcp_server.types.validation import compile_argument_validator, compile_converter, passthrough_keys
+
+
+def test_compile_converter_selects_by_type():
+    assert compile_converter(ToolParameter(name="n", type="integer"))("5.0") == 5
+    assert compile_converter(ToolParameter(name="n", type="number"))(2) == 2.0
+    assert compile_converter(ToolParameter(name="s", type="string"))(3) == "3"
+    assert compile_converter(ToolParameter(name="a", type="array"))("[1]") == [1]
+    assert compile_converter(ToolParameter(name="o", type="object"))('{"k": 1}') == {"k": 1}
+
+
+def test_boolean_leniency():
+    param = ToolParameter(name="flag", type="boolean", required=False, default=True)
+
+    assert compile_converter(param)("maybe") is True  # tools fall back to the default
+    with pytest.raises(ValueError):
+        compile_converter(param, lenient_booleans=False)("maybe")  # prompts reject
+
+
+def test_validator_required_defaults_and_errors():
+    validate = compile_argument_validator(
+        [
+            ToolParameter(name="count", type="integer"),
+            ToolParameter(name="label", type="string", required=False, default="x"),
+            ToolParameter(name="extra", type="string", required=False),
+        ]
+    )
+
+    assert validate({"count": "3"}) == {"count": 3, "label": "x"}
+
+    with pytest.raises(ParameterValidationError):
+        validate({})
+    with pytest.raises(ParameterValidationError):
+        validate({"count": "three"})
+
+
+def test_passthrough_keys_resolved_from_signature():
+    def handler(query: str, _user_id: str | None = None, _external_access_token: str | None = None):
+        return query
+
+    assert passthrough_keys(handler) == {"_user_id", "_external_access_token"}
+    assert passthrough_keys(len) == frozenset()
+
+    validate = compile_argument_validator([ToolParameter(name="query", type="string")], handler)
+    assert validate({"query": "q", "_external_access_token": "tok", "_other": 1}) == {
+        "query": "q",
+        "_external_access_token": "tok",
+    }
+
+
+def test_handlers_compile_validator_once():
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    def greet(name: str) -> str:
+        return f"Hello {name}"
+
+    tool = ToolHandler.from_function(add)
+    prompt = PromptHandler.from_function(greet)
+    tool_validator, prompt_validator = tool._validator, prompt._validator
+
+    assert tool_validator is not None and prompt_validator is not None
+    assert tool._validate_and_convert_arguments({"a": "1", "b": 2}) == {"a": 1, "b": 2}
+    assert prompt._validate_and_convert_arguments({"name": 7}) == {"name": "7"}
+    assert tool._validator is tool_validator
+    assert prompt._validator is prompt_validator
+
+    tool.invalidate_cache()
+    assert tool._validator is None
+    assert tool._validate_and_convert_arguments({"a": 1, "b": 2}) == {"a": 1, "b": 2}